@@ -0,0 +1,3 @@
+# delivery_api_project/application/carregadores/__init__.py
+from.carregador_por_id import CarregadorPorId
+from.repositorio_com_carregador import RepositorioComCarregador
@@ -0,0 +1,100 @@
+# delivery_api_project/application/carregadores/carregador_por_id.py
+
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+
+class CarregadorPorId(Generic[K, T]):
+    """
+    Agrupa buscas por ID no estilo DataLoader.
+
+    Todas as chamadas a `carregar` feitas no mesmo ciclo do event loop (ex.: dentro de um
+    `asyncio.gather`) viram uma única chamada a `buscar_lote` (o `buscar_por_ids` do
+    repositório), e chaves iguais em andamento compartilham o mesmo resultado
+    (single-flight).
+
+    Com `manter_cache=True` (padrão), os resultados ficam guardados enquanto o carregador
+    existir: crie um por requisição. Com `manter_cache=False`, só as buscas em andamento são
+    compartilhadas, e o carregador pode ser único para toda a aplicação, coalescendo
+    requisições concorrentes pelo mesmo restaurante sem servir dados antigos.
+    """
+
+    def __init__(self,
+                 buscar_lote: Callable[[List[K]], Awaitable[Iterable[T]]],
+                 chave: Callable[[T], K] = lambda entidade: entidade.id,
+                 tamanho_maximo_lote: int = 500,
+                 manter_cache: bool = True):
+        if tamanho_maximo_lote <= 0:
+            raise ValueError("Tamanho máximo do lote deve ser positivo.")
+        self._buscar_lote = buscar_lote
+        self._chave = chave
+        self.tamanho_maximo_lote = tamanho_maximo_lote
+        self.manter_cache = manter_cache
+        self._futuros: Dict[K, "asyncio.Future[Optional[T]]"] = {} # Em andamento (e, com cache, concluídos)
+        self._pendentes: List[Tuple[K, "asyncio.Future[Optional[T]]"]] = [] # Aguardando o despacho deste ciclo
+        self._tarefas: Set[asyncio.Task] = set() # O loop guarda só referências fracas às tarefas
+        self.lotes_despachados = 0
+
+    async def carregar(self, chave: K) -> Optional[T]:
+        futuro = self._futuros.get(chave)
+        if futuro is None:
+            loop = asyncio.get_running_loop()
+            futuro = self._futuros[chave] = loop.create_future()
+            if not self._pendentes:
+                # Despacha depois que as demais tarefas prontas deste ciclo registrarem suas chaves
+                loop.call_soon(self._despachar)
+            self._pendentes.append((chave, futuro))
+        return await asyncio.shield(futuro)
+
+    async def carregar_varios(self, chaves: Iterable[K]) -> List[Optional[T]]:
+        return list(await asyncio.gather(*(self.carregar(chave) for chave in chaves)))
+
+    def limpar(self, chave: K):
+        """
+        Esquece o resultado guardado ou em andamento (ex.: após salvar a entidade nesta mesma
+        requisição): a próxima chamada a `carregar` faz uma nova busca. Quem já aguardava a
+        busca em andamento recebe o resultado dela.
+        """
+        self._futuros.pop(chave, None)
+
+    def _despachar(self):
+        pendentes, self._pendentes = self._pendentes, []
+        for inicio in range(0, len(pendentes), self.tamanho_maximo_lote):
+            lote = pendentes[inicio:inicio + self.tamanho_maximo_lote]
+            self.lotes_despachados += 1
+            tarefa = asyncio.get_running_loop().create_task(self._resolver(lote))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(partial(self._apos_resolver, lote))
+
+    async def _resolver(self, lote: List[Tuple[K, "asyncio.Future[Optional[T]]"]]):
+        try:
+            entidades = await self._buscar_lote([chave for chave, _ in lote])
+            encontrados = {self._chave(entidade): entidade for entidade in entidades}
+        except Exception as erro:
+            for chave, futuro in lote:
+                self._esquecer(chave, futuro) # Falhas não ficam guardadas; a próxima chamada busca de novo
+                if not futuro.done():
+                    futuro.set_exception(erro)
+            return
+        for chave, futuro in lote:
+            if not self.manter_cache:
+                self._esquecer(chave, futuro)
+            if not futuro.done():
+                futuro.set_result(encontrados.get(chave))
+
+    def _apos_resolver(self, lote: List[Tuple[K, "asyncio.Future[Optional[T]]"]], tarefa: asyncio.Task):
+        self._tarefas.discard(tarefa)
+        # Tarefa cancelada (mesmo antes de começar): ninguém pode ficar aguardando para sempre
+        for chave, futuro in lote:
+            if not futuro.done():
+                self._esquecer(chave, futuro)
+                futuro.cancel()
+
+    def _esquecer(self, chave: K, futuro: "asyncio.Future[Optional[T]]"):
+        # Após um `limpar`, a chave pode já apontar para uma busca mais nova
+        if self._futuros.get(chave) is futuro:
+            del self._futuros[chave]
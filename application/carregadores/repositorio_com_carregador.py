@@ -0,0 +1,47 @@
+# delivery_api_project/application/carregadores/repositorio_com_carregador.py
+
+from typing import Any, Hashable, List, Optional
+
+from application.carregadores.carregador_por_id import CarregadorPorId
+
+
+class RepositorioComCarregador:
+    """
+    Envolve qualquer repositório que tenha `buscar_por_ids`, fazendo `buscar_por_id` e
+    `buscar_por_ids` passarem por um CarregadorPorId. Os demais métodos são repassados.
+
+    Uso típico, por requisição:
+        restaurantes = RepositorioComCarregador(restaurante_repository)
+        uc = AdicionarProdutoUseCase(produto_repository, restaurantes, categorias)
+
+    `salvar` e `deletar` descartam o resultado guardado da entidade afetada.
+    """
+
+    def __init__(self, repositorio: Any, manter_cache: bool = True, tamanho_maximo_lote: int = 500):
+        self._repositorio = repositorio
+        self.carregador: CarregadorPorId = CarregadorPorId(
+            repositorio.buscar_por_ids, tamanho_maximo_lote=tamanho_maximo_lote, manter_cache=manter_cache
+        )
+
+    def __getattr__(self, atributo: str):
+        return getattr(self._repositorio, atributo)
+
+    def __len__(self) -> int:
+        return len(self._repositorio)
+
+    async def buscar_por_id(self, entidade_id: Hashable) -> Optional[Any]:
+        return await self.carregador.carregar(entidade_id)
+
+    async def buscar_por_ids(self, entidade_ids: List[Hashable]) -> List[Any]:
+        entidades = await self.carregador.carregar_varios(dict.fromkeys(entidade_ids))
+        return [entidade for entidade in entidades if entidade is not None]
+
+    async def salvar(self, entidade: Any) -> Any:
+        entidade_salva = await self._repositorio.salvar(entidade)
+        self.carregador.limpar(entidade_salva.id)
+        return entidade_salva
+
+    async def deletar(self, entidade_id: Hashable) -> bool:
+        deletado = await self._repositorio.deletar(entidade_id)
+        self.carregador.limpar(entidade_id)
+        return deletado
@@ -1,2 +1,4 @@
 from.adicionar_produto_request_dto import AdicionarProdutoRequestDTO
 from.produto_response_dto import ProdutoResponseDTO
+from.importar_cardapio_response_dto import ImportarCardapioResponseDTO, ErroImportacaoProdutoDTO
+from.resumo_pedido_dto import ResumoPedidoDTO
@@ -9,6 +9,6 @@ class AdicionarProdutoRequestDTO:
     nome:str
     descricao: str
     preco: Decimal
-    categoria_produto_id:Optional[int] = None
+    categoria_produto_id:Optional[uuid.UUID] = None
     imagem_url: Optional[str] = None
     disponivel: bool = True
\ No newline at end of file
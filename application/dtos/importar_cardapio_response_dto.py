@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from application.dtos.produto_response_dto import ProdutoResponseDTO
+
+@dataclass(frozen=True)
+class ErroImportacaoProdutoDTO:
+    indice: int # Posição da linha na lista enviada
+    nome: str
+    mensagem: str
+
+@dataclass(frozen=True)
+class ImportarCardapioResponseDTO:
+    produtos_criados: List[ProdutoResponseDTO] = field(default_factory=list)
+    erros: List[ErroImportacaoProdutoDTO] = field(default_factory=list)
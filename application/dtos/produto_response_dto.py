@@ -4,14 +4,14 @@ from typing import Optional
 import uuid
 from datetime import datetime
 
-@dataclass(froze=True)
+@dataclass(frozen=True)
 class ProdutoResponseDTO:
     id: uuid.UUID
     restaurante_id: uuid.UUID
     nome:str
     descricao: str
     preco: Decimal
-    categoria_produto_id: Optional[int]
+    categoria_produto_id: Optional[uuid.UUID]
     imagem_url: Optional[str]
     disponivel: bool
     data_criacao:datetime
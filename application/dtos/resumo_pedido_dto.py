@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+import uuid
+from datetime import datetime
+
+@dataclass(frozen=True)
+class ResumoPedidoDTO:
+    """Cabeçalho de um pedido, sem os itens: status, totais já calculados e datas."""
+    id: uuid.UUID
+    cliente_id: uuid.UUID
+    restaurante_id: uuid.UUID
+    status_pedido: str
+    valor_subtotal_itens: Decimal
+    taxa_entrega: Decimal
+    valor_total_pedido: Decimal
+    entregador_id: Optional[uuid.UUID]
+    data_criacao: datetime
+    data_ultima_atualizacao: datetime
@@ -3,4 +3,6 @@ from.i_cliente_repository import IClienteRepository
 from.i_restaurante_repository import IRestauranteRepository
 from.i_categoria_produto_repository import ICategoriaProdutoRepository
 from.i_produto_repository import IProdutoRepository
-from.i_pedido_repository import IPedidoRepository
\ No newline at end of file
+from.i_pedido_repository import IPedidoRepository
+from.i_notificacao_service import INotificacaoService
+from.i_outbox_repository import IOutboxRepository, RegistroOutbox
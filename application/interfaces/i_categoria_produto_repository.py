@@ -15,6 +15,11 @@ class ICategoriaProdutoRepository(ABC):
     async def buscar_por_id(self, categoria_id: uuid.UUID) -> Optional[CategoriaProduto]:
         """Busca uma categoria de um produto pelo seu ID."""
     pass
+
+    @abstractmethod
+    async def buscar_por_ids(self, categoria_ids: List[uuid.UUID]) -> List[CategoriaProduto]:
+        """Busca várias categorias em uma única consulta. IDs inexistentes são ignorados."""
+    pass
         
     @abstractmethod
     async def listar_por_restaurante_id(
@@ -27,12 +32,19 @@ class ICategoriaProdutoRepository(ABC):
     pass
         
     @abstractmethod
-    async def buscar_por_nome_e_restaurande_id(
+    async def buscar_por_nome_e_restaurante_id(
         self,
         nome: str,
-        restaurante_id= uuid.UUID) -> Optional[CategoriaProduto]:
+        restaurante_id: uuid.UUID) -> Optional[CategoriaProduto]:
         """Buscar uma categoria pelo nome dentro de um restaurante específico"""
         pass
+
+    async def buscar_por_nome_e_restaurande_id(
+        self,
+        nome: str,
+        restaurante_id: uuid.UUID) -> Optional[CategoriaProduto]:
+        """Nome antigo de buscar_por_nome_e_restaurante_id, mantido por compatibilidade."""
+        return await self.buscar_por_nome_e_restaurante_id(nome, restaurante_id)
         
     @abstractmethod
     async def deleter(self, categoria_id: uuid.UUID) -> bool:
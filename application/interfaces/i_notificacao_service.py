@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from domain.entities.pedido import Pedido
+
+class INotificacaoService(ABC):
+
+    @abstractmethod
+    async def notificar_mudanca_status(self, pedido: Pedido) -> None:
+        """Avisa o cliente e o restaurante sobre o status atual do pedido. Não deve aguardar a entrega da mensagem."""
+        pass
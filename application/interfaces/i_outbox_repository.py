@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import uuid
+from typing import Collection, List
+
+from domain.eventos.evento_status_pedido import EventoStatusPedido
+
+@dataclass(frozen=True)
+class RegistroOutbox:
+    """Linha da tabela de outbox: o evento e sua posição (crescente na ordem de gravação)."""
+    posicao: int
+    evento: EventoStatusPedido
+
+class IOutboxRepository(ABC):
+
+    @abstractmethod
+    async def adicionar(self, eventos: List[EventoStatusPedido]) -> None:
+        """Grava eventos no outbox. Deve ser chamado na mesma transação que grava o agregado."""
+        pass
+
+    @abstractmethod
+    async def buscar_pendentes(self,
+                               limite: int = 500,
+                               ignorar_pedidos: Collection[uuid.UUID] = ()) -> List[RegistroOutbox]:
+        """Eventos ainda não entregues, em ordem de posição, exceto os dos pedidos em `ignorar_pedidos`."""
+        pass
+
+    @abstractmethod
+    async def marcar_entregues(self, posicoes: List[int]) -> None:
+        """Remove (ou marca como entregues) os registros informados."""
+        pass
+
+    @abstractmethod
+    async def mover_para_falhas(self, posicoes: List[int]) -> None:
+        """Tira os registros dos pendentes e os guarda como falhas definitivas (dead-letter)."""
+        pass
+
+    @abstractmethod
+    async def listar_falhas(self, limite: int = 500) -> List[RegistroOutbox]:
+        """Registros movidos para falhas, em ordem de posição."""
+        pass
@@ -1,14 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from datetime import datetime
 import uuid
 
 from domain.entities.pedido import Pedido, StatusPedido
+from application.interfaces.paginacao import Pagina
+from application.dtos.resumo_pedido_dto import ResumoPedidoDTO
+from application.mappers.pedido_mapper import pedido_para_resumo_dto
 
-class IPedidoRepository:
+class IPedidoRepository(ABC):
     @abstractmethod
     async def salvar(self, pedido: Pedido) -> Pedido:
-        """Salva um novo pedido ou atualiza um existente(incluindo seus itens)."""
+        """
+        Salva um novo pedido ou atualiza um existente(incluindo seus itens). Os eventos de
+        status pendentes (`pedido.retirar_eventos()`) vão para o outbox na mesma transação.
+        Depois de gravar, limpa o rastreamento (`pedido.limpar_alteracoes()`): o pedido está
+        inteiro no armazenamento e não deve ser regravado por `salvar_alteracoes`.
+        """
         pass
     
     @abstractmethod
@@ -41,6 +49,138 @@ class IPedidoRepository:
         """Lista pedidos filtrando por uma lista de status"""
         pass
     
+    @abstractmethod
+    async def listar_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[Pedido]:
+        """Lista pedidos de um cliente com paginação por cursor (keyset em data_criacao, id)"""
+        pass
+    
+    @abstractmethod
+    async def listar_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[Pedido]:
+        """Lista pedidos por status com paginação por cursor (keyset em data_criacao, id)"""
+        pass
+    
+    async def iterar_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        tamanho_lote: int = 500,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> AsyncIterator[List[Pedido]]:
+        """Percorre (async for) os pedidos de um cliente em lotes de tamanho limitado"""
+        cursor = None
+        while True:
+            pagina = await self.listar_por_cliente_id_cursor(
+                cliente_id, tamanho_lote, cursor, data_inicio, data_fim, status
+            )
+            if pagina.itens:
+                yield pagina.itens
+            if pagina.proximo_cursor is None:
+                return
+            cursor = pagina.proximo_cursor
+    
+    async def iterar_por_status(
+        self,
+        status_lista: list[str],
+        tamanho_lote: int = 500,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> AsyncIterator[List[Pedido]]:
+        """Percorre (async for) os pedidos com os status informados em lotes de tamanho limitado"""
+        cursor = None
+        while True:
+            pagina = await self.listar_por_status_cursor(status_lista, tamanho_lote, cursor, data_inicio, data_fim)
+            if pagina.itens:
+                yield pagina.itens
+            if pagina.proximo_cursor is None:
+                return
+            cursor = pagina.proximo_cursor
+    
+    # Projeções: só o cabeçalho de cada pedido, com os totais já calculados, para telas que
+    # não exibem os itens. Implementações com banco devem sobrescrever, lendo apenas as
+    # colunas do cabeçalho e o subtotal persistido; as versões padrão derivam do pedido completo.
+    async def buscar_resumo_por_id(self, pedido_id: uuid.UUID) -> Optional[ResumoPedidoDTO]:
+        """Busca o cabeçalho de um pedido pelo seu ID, sem os itens"""
+        pedido = await self.buscar_por_id(pedido_id)
+        return pedido_para_resumo_dto(pedido) if pedido is not None else None
+    
+    async def listar_resumos_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> List[ResumoPedidoDTO]:
+        """Como listar_por_cliente_id, mas retorna apenas os cabeçalhos"""
+        pedidos = await self.listar_por_cliente_id(cliente_id, skip, limit, data_inicio, data_fim, status)
+        return [pedido_para_resumo_dto(pedido) for pedido in pedidos]
+    
+    async def listar_resumos_por_status(
+        self,
+        status_lista: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> List[ResumoPedidoDTO]:
+        """Como listar_por_status, mas retorna apenas os cabeçalhos"""
+        pedidos = await self.listar_por_status(status_lista, skip, limit, data_inicio, data_fim)
+        return [pedido_para_resumo_dto(pedido) for pedido in pedidos]
+    
+    async def listar_resumos_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        """Como listar_por_cliente_id_cursor, mas retorna apenas os cabeçalhos"""
+        pagina = await self.listar_por_cliente_id_cursor(cliente_id, limit, cursor, data_inicio, data_fim, status)
+        return Pagina([pedido_para_resumo_dto(pedido) for pedido in pagina.itens], pagina.proximo_cursor)
+    
+    async def listar_resumos_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        """Como listar_por_status_cursor, mas retorna apenas os cabeçalhos"""
+        pagina = await self.listar_por_status_cursor(status_lista, limit, cursor, data_inicio, data_fim)
+        return Pagina([pedido_para_resumo_dto(pedido) for pedido in pagina.itens], pagina.proximo_cursor)
+    
+    async def salvar_alteracoes(self, novos: List[Pedido], alterados: List[Pedido]) -> None:
+        """
+        Grava numa única transação os pedidos novos (por inteiro) e, dos pedidos alterados,
+        apenas o que consta em `pedido.alteracoes` (campos do cabeçalho e itens adicionados,
+        removidos ou alterados). Implementações com banco devem sobrescrever; esta versão
+        padrão apenas chama `salvar` para cada pedido.
+        """
+        for pedido in novos:
+            await self.salvar(pedido)
+        for pedido in alterados:
+            await self.salvar(pedido)
+    
     # Não incluiremos um método 'deletar' para Pedido por enquanto,
     # pois pedidos geralmente são arquivados ou cancelados (mudança de status),
     # mas não fisicamente deletados devido a registros históricos e financeiros.
@@ -11,33 +11,53 @@ class IProdutoRepository(ABC):
         """Saçvar um novo produto ou atualiza um existente"""
     pass
 
+    @abstractmethod
+    async def salvar_em_lote(self, produtos: List[Produto]) -> List[Produto]:
+        """Salva vários produtos de uma só vez (uma única ida ao banco)."""
+    pass
+
     @abstractmethod
     async def buscar_por_id(self, produto_id: uuid.UUID) -> Optional[Produto]:
         """Busca um produto pelo seu ID."""
     pass
 
     @abstractmethod
-    
-    async def listar_por_restaurande_id(
+    async def buscar_por_ids(self, produto_ids: List[uuid.UUID]) -> List[Produto]:
+        """Busca vários produtos em uma única consulta. IDs inexistentes são ignorados."""
+    pass
+
+    @abstractmethod
+    async def listar_por_restaurante_id(
         self,
         restaurante_id: uuid.UUID,
         disponivel_apenas: bool = False, #Opção para filtrar por disponibilidade
         skip: int = 0,
         limit: int = 100
-    ) -> Optional[Produto]:
+    ) -> List[Produto]:
         """Lista todos os produtos de um restaurante específicos"""
-        
-        @abstractmethod
-        async def listar_por_categoria_id_e_restaurante_id(
-            self,
-            categoria_id: uuid.UUID,
-            restaurante_id: uuid.UUID,
-            disponivel_apenas: bool = False,
-            skip: int = 0,
-            limit: int = 100
-        ) ->List[Produto]:
-            """Lista todos os produtos de uma categoria específica em um restaurante"""
-        pass
+    pass
+
+    async def listar_por_restaurande_id(
+        self,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Produto]:
+        """Nome antigo de listar_por_restaurante_id, mantido por compatibilidade."""
+        return await self.listar_por_restaurante_id(restaurante_id, disponivel_apenas, skip, limit)
+
+    @abstractmethod
+    async def listar_por_categoria_id_e_restaurante_id(
+        self,
+        categoria_id: uuid.UUID,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) ->List[Produto]:
+        """Lista todos os produtos de uma categoria específica em um restaurante"""
+    pass
     
     
     @abstractmethod
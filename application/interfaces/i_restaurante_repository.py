@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List, Optional
 import uuid
 
 from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
 
 class IRestauranteRepository(ABC):
     
@@ -12,12 +14,17 @@ class IRestauranteRepository(ABC):
         pass
     
     @abstractmethod
-    async def buscar_por_id(self, restaurande_id: uuid.UUID) -> Optional[int]:
+    async def buscar_por_id(self, restaurante_id: uuid.UUID) -> Optional[Restaurante]:
         """Busca um restaurante pelo seu ID."""
         pass
     
     @abstractmethod
-    async def buscar_por_cnpj(self, cnpj: str) -> Optional[str]:
+    async def buscar_por_ids(self, restaurante_ids: List[uuid.UUID]) -> List[Restaurante]:
+        """Busca vários restaurantes em uma única consulta. IDs inexistentes são ignorados."""
+        pass
+    
+    @abstractmethod
+    async def buscar_por_cnpj(self, cnpj: str) -> Optional[Restaurante]:
         """Buscar um restaurante pelo seu CNPJ"""
         pass
     
@@ -32,11 +39,35 @@ class IRestauranteRepository(ABC):
         termo_busca: Optional[str] = None,
         categoria_busca: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        aberto_em: Optional[datetime] = None
         ) -> List:
-        """Lista restaurantes ativos filtrando por nome ou categoria"""
+        """Lista restaurantes ativos filtrando por nome ou categoria e, com `aberto_em`, apenas os abertos naquele momento"""
         pass
     
+    @abstractmethod
+    async def listar_ativos_proximos(
+        self,
+        coordenadas: CoordenadaGeo,
+        raio_km: float = 10.0,
+        limit: int = 20
+        ) -> List[Restaurante]:
+        """Lista os restaurantes ativos mais próximos das coordenadas, até o raio informado"""
+        pass
+    
+    async def listar_ativos_proximos_em_lote(
+        self,
+        coordenadas_lista: List[CoordenadaGeo],
+        raio_km: float = 10.0,
+        limit: int = 20
+        ) -> List[List[Restaurante]]:
+        """
+        Como listar_ativos_proximos, para várias coordenadas (ex.: os endereços de entrega de
+        um lote de pedidos) numa única chamada; uma lista de resultados por coordenada, na
+        mesma ordem. Esta versão padrão consulta uma coordenada por vez.
+        """
+        return [await self.listar_ativos_proximos(coordenadas, raio_km, limit) for coordenadas in coordenadas_lista]
+    
     @abstractmethod
     async def deletar(self, restaurante_id: uuid.UUID) -> bool:
         "Deleta um restaurante pelo seu ID"
@@ -0,0 +1,27 @@
+import base64
+import binascii
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+@dataclass(frozen=True)
+class Pagina(Generic[T]):
+    """Página de uma listagem por cursor (keyset). `proximo_cursor` é None na última página."""
+    itens: List[T] = field(default_factory=list)
+    proximo_cursor: Optional[str] = None
+
+def codificar_cursor(data: datetime, entidade_id: uuid.UUID) -> str:
+    """Gera o token opaco de continuação a partir da chave (data, id) do último item da página."""
+    bruto = f"{data.isoformat()}|{entidade_id.hex}".encode()
+    return base64.urlsafe_b64encode(bruto).decode().rstrip("=")
+
+def decodificar_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        bruto = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        data, entidade_id = bruto.split("|")
+        return datetime.fromisoformat(data), uuid.UUID(hex=entidade_id)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        raise ValueError("Cursor de paginação inválido.")
@@ -0,0 +1,2 @@
+from.produto_mapper import produto_para_response_dto
+from.pedido_mapper import pedido_para_resumo_dto
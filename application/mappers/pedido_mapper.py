@@ -0,0 +1,17 @@
+from domain.entities.pedido import Pedido
+from application.dtos.resumo_pedido_dto import ResumoPedidoDTO
+
+def pedido_para_resumo_dto(pedido: Pedido) -> ResumoPedidoDTO:
+    """Converte o cabeçalho do Pedido no DTO de resumo; usa o subtotal mantido pelo Pedido, sem carregar os itens."""
+    return ResumoPedidoDTO(
+        id=pedido.id,
+        cliente_id=pedido.cliente_id,
+        restaurante_id=pedido.restaurante_id,
+        status_pedido=pedido.status_pedido,
+        valor_subtotal_itens=pedido.valor_subtotal_itens.para_decimal(),
+        taxa_entrega=pedido.taxa_entrega.para_decimal(),
+        valor_total_pedido=pedido.valor_total_pedido.para_decimal(),
+        entregador_id=pedido.entregador_id,
+        data_criacao=pedido.data_criacao,
+        data_ultima_atualizacao=pedido.data_ultima_atualizacao
+    )
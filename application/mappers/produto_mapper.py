@@ -0,0 +1,17 @@
+from domain.entities.produto import Produto
+from application.dtos.produto_response_dto import ProdutoResponseDTO
+
+def produto_para_response_dto(produto: Produto) -> ProdutoResponseDTO:
+    """Converte a entidade Produto no DTO de resposta."""
+    return ProdutoResponseDTO(
+        id=produto.id,
+        restaurante_id=produto.restaurante_id,
+        nome=produto.nome,
+        descricao=produto.descricao,
+        preco=produto.preco.para_decimal(), # DTOs continuam expondo Decimal
+        categoria_produto_id=produto.categoria_produto_id,
+        imagem_url=produto.imagem_url,
+        disponivel=produto.disponivel,
+        data_criacao=produto.data_criacao,
+        data_atualizacao=produto.data_atualizacao
+    )
@@ -0,0 +1,2 @@
+# delivery_api_project/application/relatorios/__init__.py
+from.analise_pedidos import ProjecaoPedidos, STATUS_CANCELADOS
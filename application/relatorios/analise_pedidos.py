@@ -0,0 +1,194 @@
+# delivery_api_project/application/relatorios/analise_pedidos.py
+
+import uuid
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from domain.entities.pedido import Pedido, StatusPedido
+
+# Status codificado como o índice em StatusPedido.TODOS_OS_STATUS (cabe em um int8)
+_CODIGO_STATUS: Dict[str, int] = {status: codigo for codigo, status in enumerate(StatusPedido.TODOS_OS_STATUS)}
+
+STATUS_CANCELADOS = [StatusPedido.CANCELADO_PELO_CLIENTE, StatusPedido.CANCELADO_PELO_RESTAURANTE]
+
+_CENTAVO = Decimal('0.01')
+
+
+def _de_centavos(centavos: int) -> Decimal:
+    return Decimal(int(centavos)).scaleb(-2)
+
+
+class ProjecaoPedidos:
+    """
+    Projeção colunar (NumPy) de um histórico de pedidos para relatórios.
+
+    Valores monetários são guardados em centavos (int64), o status como int8 e
+    `data_criacao` como datetime64[us]. O subtotal de cada pedido vem do valor mantido
+    pelo próprio Pedido, sem percorrer (nem carregar, nos pedidos restaurados de snapshot)
+    os itens. Com `incluir_itens`, as linhas de ItemPedido também ficam em colunas
+    próprias, ligadas ao pedido por `item_pedido_idx`; sem ele, essas colunas são None.
+    Todas as somas são feitas em inteiros, de modo que os totais coincidem exatamente com
+    `Pedido.valor_total_pedido`.
+    """
+
+    def __init__(self,
+                 restaurantes: List[uuid.UUID],
+                 restaurante_idx: np.ndarray,
+                 status: np.ndarray,
+                 taxa_entrega_centavos: np.ndarray,
+                 data_criacao: np.ndarray,
+                 subtotal_centavos: np.ndarray,
+                 item_pedido_idx: Optional[np.ndarray] = None,
+                 item_quantidade: Optional[np.ndarray] = None,
+                 item_preco_unitario_centavos: Optional[np.ndarray] = None):
+        self.restaurantes = restaurantes
+        self.restaurante_idx = restaurante_idx
+        self.status = status
+        self.taxa_entrega_centavos = taxa_entrega_centavos
+        self.data_criacao = data_criacao
+        self.subtotal_centavos = subtotal_centavos
+        self.total_centavos = self.subtotal_centavos + taxa_entrega_centavos
+
+        self.item_pedido_idx = item_pedido_idx
+        self.item_quantidade = item_quantidade
+        self.item_preco_unitario_centavos = item_preco_unitario_centavos
+        self.item_total_centavos: Optional[np.ndarray] = None
+        if item_pedido_idx is not None:
+            self.item_total_centavos = item_quantidade.astype(np.int64) * item_preco_unitario_centavos
+
+    @property
+    def possui_itens(self) -> bool:
+        return self.item_pedido_idx is not None
+
+    def __len__(self) -> int:
+        return len(self.status)
+
+    @classmethod
+    def de_pedidos(cls, pedidos: Iterable[Pedido], incluir_itens: bool = False) -> "ProjecaoPedidos":
+        """
+        Projeta os cabeçalhos dos pedidos em colunas, numa única passada. Só com
+        `incluir_itens` os itens são percorridos (e carregados, se ainda não estiverem).
+        """
+        codigos_restaurante: Dict[uuid.UUID, int] = {}
+        restaurante_idx: List[int] = []
+        status: List[int] = []
+        taxas: List[int] = []
+        datas: List[datetime] = []
+        subtotais: List[int] = []
+        item_pedido_idx: List[int] = []
+        item_quantidade: List[int] = []
+        item_preco: List[int] = []
+
+        for posicao, pedido in enumerate(pedidos):
+            restaurante_idx.append(codigos_restaurante.setdefault(pedido.restaurante_id, len(codigos_restaurante)))
+            status.append(_CODIGO_STATUS[pedido.status_pedido])
+            taxas.append(pedido.taxa_entrega.centavos)
+            datas.append(pedido.data_criacao)
+            subtotais.append(pedido.valor_subtotal_itens.centavos)
+            if incluir_itens:
+                for item in pedido.itens:
+                    item_pedido_idx.append(posicao)
+                    item_quantidade.append(item.quantidade)
+                    item_preco.append(item.preco_unitario_compra.centavos)
+
+        colunas_itens = {}
+        if incluir_itens:
+            colunas_itens = dict(
+                item_pedido_idx=np.array(item_pedido_idx, dtype=np.int64),
+                item_quantidade=np.array(item_quantidade, dtype=np.int32),
+                item_preco_unitario_centavos=np.array(item_preco, dtype=np.int64),
+            )
+        return cls(
+            restaurantes=list(codigos_restaurante),
+            restaurante_idx=np.array(restaurante_idx, dtype=np.int32),
+            status=np.array(status, dtype=np.int8),
+            taxa_entrega_centavos=np.array(taxas, dtype=np.int64),
+            data_criacao=np.array(datas, dtype="datetime64[us]"),
+            subtotal_centavos=np.array(subtotais, dtype=np.int64),
+            **colunas_itens,
+        )
+
+    def filtrar(self,
+                status: Optional[Iterable[str]] = None,
+                excluir_status: Optional[Iterable[str]] = None,
+                data_inicio: Optional[datetime] = None,
+                data_fim: Optional[datetime] = None) -> "ProjecaoPedidos":
+        """Retorna uma nova projeção apenas com os pedidos que atendem aos filtros (limites de data inclusivos)."""
+        mascara = np.ones(len(self), dtype=bool)
+        if status is not None:
+            mascara &= np.isin(self.status, [_CODIGO_STATUS[s] for s in status])
+        if excluir_status is not None:
+            mascara &= ~np.isin(self.status, [_CODIGO_STATUS[s] for s in excluir_status])
+        if data_inicio is not None:
+            mascara &= self.data_criacao >= np.datetime64(data_inicio, "us")
+        if data_fim is not None:
+            mascara &= self.data_criacao <= np.datetime64(data_fim, "us")
+
+        colunas_itens = {}
+        if self.possui_itens:
+            # Renumera os pedidos mantidos para que os itens continuem apontando para a posição correta
+            nova_posicao = np.cumsum(mascara) - 1
+            mascara_itens = mascara[self.item_pedido_idx]
+            colunas_itens = dict(
+                item_pedido_idx=nova_posicao[self.item_pedido_idx[mascara_itens]],
+                item_quantidade=self.item_quantidade[mascara_itens],
+                item_preco_unitario_centavos=self.item_preco_unitario_centavos[mascara_itens],
+            )
+        return ProjecaoPedidos(
+            restaurantes=self.restaurantes,
+            restaurante_idx=self.restaurante_idx[mascara],
+            status=self.status[mascara],
+            taxa_entrega_centavos=self.taxa_entrega_centavos[mascara],
+            data_criacao=self.data_criacao[mascara],
+            subtotal_centavos=self.subtotal_centavos[mascara],
+            **colunas_itens,
+        )
+
+    def receita_por_restaurante(self) -> Dict[uuid.UUID, Decimal]:
+        """Soma de `valor_total_pedido` por restaurante."""
+        somas = np.zeros(len(self.restaurantes), dtype=np.int64)
+        np.add.at(somas, self.restaurante_idx, self.total_centavos)
+        presentes = np.bincount(self.restaurante_idx, minlength=len(self.restaurantes)) > 0
+        return {
+            self.restaurantes[codigo]: _de_centavos(somas[codigo])
+            for codigo in np.flatnonzero(presentes)
+        }
+
+    def contagem_por_status(self) -> Dict[str, int]:
+        contagens = np.bincount(self.status, minlength=len(StatusPedido.TODOS_OS_STATUS))
+        return {status: int(contagens[codigo]) for status, codigo in _CODIGO_STATUS.items()}
+
+    def receita_total(self) -> Decimal:
+        return _de_centavos(self.total_centavos.sum())
+
+    def total_taxas_entrega(self) -> Decimal:
+        return _de_centavos(self.taxa_entrega_centavos.sum())
+
+    def ticket_medio(self) -> Decimal:
+        """Valor médio por pedido, arredondado ao centavo (ROUND_HALF_UP)."""
+        if len(self) == 0:
+            return Decimal('0.00')
+        media = Decimal(int(self.total_centavos.sum())) / len(self) / 100
+        return media.quantize(_CENTAVO, rounding=ROUND_HALF_UP)
+
+    def receita_por_periodo(self, unidade: str = "D") -> List[Tuple[datetime, Decimal, int]]:
+        """
+        Agrupa os pedidos em intervalos de tempo e retorna (início do intervalo, receita, quantidade).
+
+        `unidade` é uma unidade de datetime64 do NumPy: "Y", "M", "D", "h" ou "m".
+        """
+        if unidade not in ("Y", "M", "D", "h", "m"):
+            raise ValueError(f"Unidade de agrupamento inválida: {unidade}")
+        if len(self) == 0:
+            return []
+        baldes, grupo = np.unique(self.data_criacao.astype(f"datetime64[{unidade}]"), return_inverse=True)
+        somas = np.zeros(len(baldes), dtype=np.int64)
+        np.add.at(somas, grupo, self.total_centavos)
+        contagens = np.bincount(grupo, minlength=len(baldes))
+        return [
+            (balde.astype("datetime64[us]").astype(datetime), _de_centavos(soma), int(contagem))
+            for balde, soma, contagem in zip(baldes, somas, contagens)
+        ]
@@ -0,0 +1,2 @@
+# delivery_api_project/application/unidade_de_trabalho/__init__.py
+from.unidade_de_trabalho_pedidos import UnidadeDeTrabalhoPedidos, EstatisticasGravacao
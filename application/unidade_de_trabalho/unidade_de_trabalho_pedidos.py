@@ -0,0 +1,126 @@
+# delivery_api_project/application/unidade_de_trabalho/unidade_de_trabalho_pedidos.py
+
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from domain.entities.pedido import Pedido
+
+
+@dataclass(frozen=True)
+class EstatisticasGravacao:
+    """Resultado de um `confirmar`: quanto foi escrito e quanto uma gravação completa escreveria."""
+    pedidos_novos: int = 0
+    pedidos_alterados: int = 0
+    linhas_escritas: int = 0
+    linhas_sem_rastreamento: int = 0 # Cabeçalho + todos os itens de cada pedido gravado
+
+    @property
+    def linhas_economizadas(self) -> int:
+        return self.linhas_sem_rastreamento - self.linhas_escritas
+
+
+class UnidadeDeTrabalhoPedidos:
+    """
+    Unidade de trabalho para o agregado Pedido, uma por requisição.
+
+    Os pedidos buscados por ela ficam num mapa de identidade (a mesma instância em todas as
+    buscas) e suas alterações são rastreadas pelo próprio Pedido. `confirmar` grava tudo numa
+    única chamada a `salvar_alteracoes`, somente os pedidos modificados e, deles, só os campos
+    e itens que mudaram. Usada com `async with`, confirma ao sair sem erro e descarta se
+    houver exceção. Se a gravação falhar (ou a unidade for descartada), os pedidos voltam ao
+    estado em que foram registrados ou da última confirmação bem-sucedida.
+
+        async with UnidadeDeTrabalhoPedidos(pedido_repository) as uow:
+            pedido = await uow.buscar_por_id(pedido_id)
+            pedido.confirmar_pelo_restaurante()
+    """
+
+    def __init__(self, pedido_repository: IPedidoRepository):
+        self.pedido_repository = pedido_repository
+        self._rastreados: Dict[uuid.UUID, Pedido] = {}
+        self._novos: Dict[uuid.UUID, Pedido] = {}
+        # Estado de cada pedido quando foi registrado (ou na última confirmação), para desfazer
+        self._estados: Dict[uuid.UUID, Tuple] = {}
+        self.ultima_gravacao: Optional[EstatisticasGravacao] = None
+
+    async def __aenter__(self) -> "UnidadeDeTrabalhoPedidos":
+        return self
+
+    async def __aexit__(self, tipo_excecao, excecao, traceback) -> bool:
+        if tipo_excecao is None:
+            await self.confirmar()
+        else:
+            self.descartar()
+        return False
+
+    async def buscar_por_id(self, pedido_id: uuid.UUID) -> Optional[Pedido]:
+        pedido = self._novos.get(pedido_id) or self._rastreados.get(pedido_id)
+        if pedido is None:
+            pedido = await self.pedido_repository.buscar_por_id(pedido_id)
+            if pedido is not None:
+                self.registrar(pedido)
+        return pedido
+
+    def registrar_novo(self, pedido: Pedido) -> Pedido:
+        """Pedido ainda não persistido: será gravado por inteiro no `confirmar`."""
+        self._novos[pedido.id] = pedido
+        self._rastreados.pop(pedido.id, None)
+        self._estados.setdefault(pedido.id, pedido.capturar_estado())
+        return pedido
+
+    def registrar(self, pedido: Pedido) -> Pedido:
+        """Passa a rastrear um pedido já persistido (ex.: obtido por uma listagem)."""
+        if pedido.id not in self._novos and pedido.id not in self._rastreados:
+            self._rastreados[pedido.id] = pedido
+            self._estados[pedido.id] = pedido.capturar_estado()
+        return pedido
+
+    async def confirmar(self) -> EstatisticasGravacao:
+        novos = list(self._novos.values())
+        alterados = [p for p in self._rastreados.values() if p.possui_alteracoes]
+
+        linhas_novos = sum(1 + p.quantidade_itens for p in novos)
+        estatisticas = EstatisticasGravacao(
+            pedidos_novos=len(novos),
+            pedidos_alterados=len(alterados),
+            linhas_escritas=linhas_novos + sum(p.alteracoes.linhas for p in alterados),
+            linhas_sem_rastreamento=linhas_novos + sum(1 + p.quantidade_itens for p in alterados),
+        )
+        if novos or alterados:
+            try:
+                await self.pedido_repository.salvar_alteracoes(novos, alterados)
+            except BaseException:
+                # Nada foi gravado: desfaz em memória para que pedido e índices continuem de acordo
+                self._restaurar()
+                raise
+        for pedido in novos:
+            pedido.limpar_alteracoes()
+            self._estados[pedido.id] = pedido.capturar_estado()
+        for pedido in alterados:
+            pedido.limpar_alteracoes()
+            self._estados[pedido.id] = pedido.capturar_estado()
+
+        # Os novos passam a ser rastreados como persistidos
+        self._rastreados.update(self._novos)
+        self._novos.clear()
+        self.ultima_gravacao = estatisticas
+        return estatisticas
+
+    def descartar(self):
+        """
+        Esquece todos os pedidos rastreados sem gravar, desfazendo nas instâncias em memória as
+        alterações feitas desde o registro (ou desde a última confirmação).
+        """
+        self._restaurar()
+        self._rastreados.clear()
+        self._novos.clear()
+        self._estados.clear()
+
+    def _restaurar(self):
+        for pedidos in (self._rastreados, self._novos):
+            for pedido_id, pedido in pedidos.items():
+                estado = self._estados.get(pedido_id)
+                if estado is not None:
+                    pedido.restaurar_estado(estado)
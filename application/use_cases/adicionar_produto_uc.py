@@ -1,4 +1,5 @@
 
+import asyncio
 import uuid
 from decimal import Decimal
 
@@ -8,6 +9,10 @@ from application.interfaces.i_restaurante_repository import IRestauranteReposito
 from application.interfaces.i_categoria_produto_repository import ICategoriaProdutoRepository
 from application.dtos.adicionar_produto_request_dto import AdicionarProdutoRequestDTO
 from application.dtos.produto_response_dto import ProdutoResponseDTO
+from application.mappers.produto_mapper import produto_para_response_dto
+
+async def _nenhum():
+    return None
 
 class AdicionarProdutoUseCase:
     def __init__(self,
@@ -19,16 +24,21 @@ class AdicionarProdutoUseCase:
         self.categoria_produto_repository = categoria_produto_repository
 
     async def executar(self, request_dto: AdicionarProdutoRequestDTO) -> ProdutoResponseDTO:
-        # 1. Validar se o restaurante existe
-        restaurante = await self.restaurante_repository.buscar_por_id(request_dto.restaurante_id)
+        # 1. Buscar restaurante e categoria (se fornecida) ao mesmo tempo: as consultas são independentes
+        restaurante, categoria = await asyncio.gather(
+            self.restaurante_repository.buscar_por_id(request_dto.restaurante_id),
+            self.categoria_produto_repository.buscar_por_id(request_dto.categoria_produto_id)
+            if request_dto.categoria_produto_id else _nenhum()
+        )
+
+        # 2. Validar se o restaurante existe
         if not restaurante:
             # Lançar uma exceção específica da camada de aplicação ou domínio
             raise ValueError(f"Restaurante com ID {request_dto.restaurante_id} não encontrado.")
             # idealmente: raise RestauranteNaoEncontradoError(request_dto.restaurante_id)
 
-        # 2. Validar se a categoria do produto existe (se fornecida) e pertence ao restaurante
+        # 2.1 Validar se a categoria do produto existe (se fornecida) e pertence ao restaurante
         if request_dto.categoria_produto_id:
-            categoria = await self.categoria_produto_repository.buscar_por_id(request_dto.categoria_produto_id)
             if not categoria or categoria.restaurante_id!= restaurante.id:
                 raise ValueError(
                     f"Categoria de produto com ID {request_dto.categoria_produto_id} "
@@ -56,15 +66,4 @@ class AdicionarProdutoUseCase:
         # 4. Salvar o novo produto usando o repositório
         produto_salvo = await self.produto_repository.salvar(novo_produto)
 
-        return ProdutoResponseDTO(
-            id=produto_salvo.id,
-            restaurante_id=produto_salvo.restaurante_id,
-            nome=produto_salvo.nome,
-            descricao=produto_salvo.descricao,
-            preco=produto_salvo.preco,
-            categoria_produto_id=produto_salvo.categoria_produto_id,
-            imagem_url=produto_salvo.imagem_url,
-            disponivel=produto_salvo.disponivel,
-            data_criacao=produto_salvo.data_criacao,
-            data_atualizacao=produto_salvo.data_atualizacao
-        )
+        return produto_para_response_dto(produto_salvo)
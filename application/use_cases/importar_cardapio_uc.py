@@ -0,0 +1,90 @@
+
+import asyncio
+import uuid
+from typing import Dict, List
+
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.produto import Produto
+from domain.entities.restaurante import Restaurante
+from application.interfaces.i_produto_repository import IProdutoRepository
+from application.interfaces.i_restaurante_repository import IRestauranteRepository
+from application.interfaces.i_categoria_produto_repository import ICategoriaProdutoRepository
+from application.dtos.adicionar_produto_request_dto import AdicionarProdutoRequestDTO
+from application.dtos.importar_cardapio_response_dto import ErroImportacaoProdutoDTO, ImportarCardapioResponseDTO
+from application.mappers.produto_mapper import produto_para_response_dto
+
+async def _nenhuma() -> List:
+    return []
+
+class ImportarCardapioUseCase:
+    """
+    Versão em lote de AdicionarProdutoUseCase para o cadastro de cardápios inteiros.
+
+    Restaurantes e categorias referenciados são carregados com uma consulta por grupo,
+    feitas em paralelo, e todas as linhas são validadas antes da gravação, feita com um único
+    `salvar_em_lote`. Linhas inválidas são reportadas sem impedir a importação das demais.
+    """
+
+    def __init__(self,
+                 produto_repository: IProdutoRepository,
+                 restaurante_repository: IRestauranteRepository,
+                 categoria_produto_repository: ICategoriaProdutoRepository):
+        self.produto_repository = produto_repository
+        self.restaurante_repository = restaurante_repository
+        self.categoria_produto_repository = categoria_produto_repository
+
+    async def executar(self, requests_dto: List[AdicionarProdutoRequestDTO]) -> ImportarCardapioResponseDTO:
+        # 1. Carregar restaurantes e categorias referenciados, cada grupo numa única consulta
+        #    e os dois grupos ao mesmo tempo
+        restaurante_ids = list(dict.fromkeys(dto.restaurante_id for dto in requests_dto))
+        categoria_ids = list(dict.fromkeys(
+            dto.categoria_produto_id for dto in requests_dto if dto.categoria_produto_id
+        ))
+        restaurantes_encontrados, categorias_encontradas = await asyncio.gather(
+            self.restaurante_repository.buscar_por_ids(restaurante_ids),
+            self.categoria_produto_repository.buscar_por_ids(categoria_ids) if categoria_ids else _nenhuma()
+        )
+        restaurantes: Dict[uuid.UUID, Restaurante] = {r.id: r for r in restaurantes_encontrados}
+        categorias: Dict[uuid.UUID, CategoriaProduto] = {c.id: c for c in categorias_encontradas}
+
+        # 2. Validar todas as linhas antes de gravar qualquer coisa
+        novos_produtos: List[Produto] = []
+        erros: List[ErroImportacaoProdutoDTO] = []
+        for indice, dto in enumerate(requests_dto):
+            restaurante = restaurantes.get(dto.restaurante_id)
+            if not restaurante:
+                erros.append(ErroImportacaoProdutoDTO(
+                    indice, dto.nome, f"Restaurante com ID {dto.restaurante_id} não encontrado."
+                ))
+                continue
+
+            if dto.categoria_produto_id:
+                categoria = categorias.get(dto.categoria_produto_id)
+                if not categoria or categoria.restaurante_id != restaurante.id:
+                    erros.append(ErroImportacaoProdutoDTO(
+                        indice, dto.nome,
+                        f"Categoria de produto com ID {dto.categoria_produto_id} "
+                        f"não encontrada ou não pertence ao restaurante {restaurante.id}."
+                    ))
+                    continue
+
+            try:
+                novos_produtos.append(Produto(
+                    restaurante_id=restaurante.id,
+                    nome=dto.nome,
+                    descricao=dto.descricao,
+                    preco=dto.preco,
+                    categoria_produto_id=dto.categoria_produto_id,
+                    imagem_url=dto.imagem_url,
+                    disponivel=dto.disponivel
+                ))
+            except (ValueError, TypeError, AttributeError) as e: # Regras da entidade ou linha malformada (ex.: nome None)
+                erros.append(ErroImportacaoProdutoDTO(indice, dto.nome, f"Erro ao criar produto: {str(e)}"))
+
+        # 3. Gravar todos os produtos válidos de uma só vez
+        produtos_salvos = await self.produto_repository.salvar_em_lote(novos_produtos) if novos_produtos else []
+
+        return ImportarCardapioResponseDTO(
+            produtos_criados=[produto_para_response_dto(p) for p in produtos_salvos],
+            erros=erros
+        )
@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class MetricasApiConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.metricas_api"
@@ -0,0 +1,12 @@
+# delivery_api_project/apps/metricas_api/controllers.py
+
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+
+from infrastructure.instrumentacao.instrumentacao import registro_padrao
+
+
+@require_GET
+def listar_metricas(request):
+    """Instantâneo das métricas de repositórios e use cases instrumentados (chamadas, erros, latência)."""
+    return JsonResponse(registro_padrao.instantaneo())
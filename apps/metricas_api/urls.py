@@ -0,0 +1,10 @@
+from django.urls import path
+
+from apps.metricas_api import controllers
+
+# Incluídas pelo URLconf do projeto em "metricas/". O app não tem modelos, então a rota não
+# depende de INSTALLED_APPS; ao escrever delivery_api/settings.py (hoje vazio, como o dos
+# demais apps), registre também "apps.metricas_api" lá.
+urlpatterns = [
+    path("", controllers.listar_metricas, name="listar_metricas"),
+]
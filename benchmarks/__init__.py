@@ -0,0 +1,2 @@
+# delivery_api_project/benchmarks/__init__.py
+# Scripts de benchmark executáveis com `python -m benchmarks.<nome>` a partir da raiz do projeto.
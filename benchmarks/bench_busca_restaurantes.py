@@ -0,0 +1,87 @@
+# delivery_api_project/benchmarks/bench_busca_restaurantes.py
+"""
+Mede a latência de IndiceBuscaRestaurantes com dezenas de milhares de restaurantes,
+incluindo o filtro "aberto agora" (`aberto_em`), comparado a interpretar o texto do
+horário de cada restaurante a cada consulta.
+
+Uso: python -m benchmarks.bench_busca_restaurantes [quantidade_de_restaurantes]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime
+
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.endereco import Endereco
+from domain.value_objects.horario_semanal import _de_texto
+from infrastructure.search.indice_busca_restaurantes import IndiceBuscaRestaurantes
+
+_PALAVRAS = [
+    "Pizzaria", "Cantina", "Sushi", "Bar", "Lanchonete", "Hamburgueria", "Churrascaria", "Padaria",
+    "Açaí", "Temakeria", "Pastelaria", "Sorveteria", "Doceria", "Bistrô", "Boteco", "Empório",
+    "São", "João", "Maria", "Dona", "Seu", "Zé", "Bella", "Nonna", "Sabor", "Gourmet", "Express",
+    "Paulista", "Mineiro", "Baiano", "Gaúcho", "Carioca", "Oriental", "Vegano", "Natural", "Fit",
+]
+_CATEGORIAS = ["Pizza", "Japonesa", "Lanches", "Brasileira", "Italiana", "Doces", "Saudável", "Árabe", "Bebidas"]
+_CONSULTAS = [("pizz", None), ("sao joao", None), ("hamburgueria gourmet", None), ("churascaria", None),
+              (None, "Japonesa"), ("express", "Lanches"), ("nona", None), (None, None)]
+_HORARIOS = ["08:00-22:00", "11:00-15:00,18:00-23:00", "seg-sex 11:00-15:00; sab,dom 11:00-16:00",
+             "ter-dom 18:00-02:00", "sex,sab 19:00-04:00; dom-qui 19:00-00:00", "00:00-24:00", "06:00-14:00"]
+
+
+def _medir(funcao, repeticoes: int):
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - t0)
+    tempos.sort()
+    return resultado, tempos[len(tempos) // 2] * 1e3, tempos[int(len(tempos) * 0.99)] * 1e3
+
+
+def main(quantidade: int = 30_000, repeticoes: int = 200):
+    random.seed(42)
+    endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+    indice = IndiceBuscaRestaurantes()
+    restaurantes = []
+
+    inicio = time.perf_counter()
+    for i in range(quantidade):
+        restaurante = Restaurante(
+            nome_fantasia=" ".join(random.sample(_PALAVRAS, 3)) + f" {i}",
+            cnpj=str(i), email_contato="contato@exemplo.com", endereco=endereco,
+            categorias=random.sample(_CATEGORIAS, 2), ativo=random.random() > 0.1,
+            horario_funcionamento=random.choice(_HORARIOS),
+        )
+        indice.indexar(restaurante)
+        restaurantes.append(restaurante)
+    print(f"Indexação de {quantidade} restaurantes: {time.perf_counter() - inicio:.2f}s")
+
+    for termo, categoria in _CONSULTAS:
+        resultado, p50, p99 = _medir(lambda: indice.buscar(termo, categoria, limit=20), repeticoes)
+        print(f"  termo={termo!r:24} categoria={categoria!r:12} resultados={len(resultado):3} "
+              f"p50={p50:.3f}ms p99={p99:.3f}ms")
+
+    agora = datetime(2024, 1, 5, 23, 30) # Sexta-feira
+    textos = [str(r.horario_funcionamento) for r in restaurantes]
+    ativos = [r.ativo for r in restaurantes]
+    # Referência: interpretar o texto de cada restaurante a cada consulta (sem cache)
+    por_linha, p50_linha, _ = _medir(
+        lambda: sum(1 for texto, ativo in zip(textos, ativos) if ativo and _de_texto.__wrapped__(texto).aberto_em(agora)),
+        max(1, repeticoes // 100),
+    )
+    abertos = indice.buscar(None, None, limit=quantidade, aberto_em=agora)
+    assert len(abertos) == por_linha
+    _, p50_primeira, _ = _medir(lambda: (indice._horarios._compilar(), indice.buscar(None, None, limit=20, aberto_em=agora)), 5)
+    print(f"Aberto agora ({por_linha} de {quantidade}):")
+    print(f"  texto interpretado por linha    p50={p50_linha:.1f}ms")
+    print(f"  índice (recompilado + consulta) p50={p50_primeira:.3f}ms")
+    for termo, categoria in _CONSULTAS[:3] + [(None, "Japonesa"), (None, None)]:
+        resultado, p50, p99 = _medir(lambda: indice.buscar(termo, categoria, limit=20, aberto_em=agora), repeticoes)
+        print(f"  termo={termo!r:24} categoria={categoria!r:12} resultados={len(resultado):3} "
+              f"p50={p50:.3f}ms p99={p99:.3f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30_000)
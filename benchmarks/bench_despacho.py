@@ -0,0 +1,79 @@
+# delivery_api_project/benchmarks/bench_despacho.py
+"""
+Mede a vazão de DespachoEntregadores (atribuições por segundo) num cenário de pico:
+milhares de pedidos prontos espalhados por centenas de restaurantes de uma cidade.
+
+Uso: python -m benchmarks.bench_despacho [pedidos] [entregadores]
+"""
+
+import asyncio
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.endereco import Endereco
+from infrastructure.despacho.despacho_entregadores import DespachoEntregadores
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+
+# Caixa aproximada da cidade de São Paulo
+_LAT = (-23.70, -23.45)
+_LON = (-46.80, -46.50)
+
+
+def _coordenada_aleatoria() -> CoordenadaGeo:
+    return CoordenadaGeo(random.uniform(*_LAT), random.uniform(*_LON))
+
+
+async def _montar_cenario(quantidade_pedidos: int, quantidade_entregadores: int, quantidade_restaurantes: int):
+    random.seed(11)
+    pedido_repository = PedidoRepositoryEmMemoria()
+    restaurante_repository = RestauranteRepositoryEmMemoria()
+
+    restaurantes = []
+    for i in range(quantidade_restaurantes):
+        endereco = Endereco("Rua A", str(i), "Centro", "São Paulo", "SP", "01000-000", coordenadas=_coordenada_aleatoria())
+        restaurante = Restaurante(nome_fantasia=f"Restaurante {i}", cnpj=str(i), email_contato="contato@exemplo.com",
+                                  endereco=endereco, ativo=True)
+        restaurantes.append(await restaurante_repository.salvar(restaurante))
+
+    inicio = datetime(2024, 1, 1, 19, 0)
+    entrega = Endereco("Rua B", "1", "Centro", "São Paulo", "SP", "01000-000")
+    for i in range(quantidade_pedidos):
+        pedido = Pedido(uuid.uuid4(), random.choice(restaurantes).id, entrega,
+                        status_pedido=StatusPedido.PRONTO_PARA_COLETA,
+                        data_criacao=inicio + timedelta(seconds=i), data_ultima_atualizacao=inicio + timedelta(seconds=i))
+        await pedido_repository.salvar(pedido)
+
+    despacho = DespachoEntregadores(pedido_repository, restaurante_repository, raio_maximo_km=15.0)
+    for _ in range(quantidade_entregadores):
+        despacho.atualizar_entregador(uuid.uuid4(), _coordenada_aleatoria(), capacidade=random.choice((1, 2, 3)))
+    return despacho
+
+
+async def _executar(quantidade_pedidos: int, quantidade_entregadores: int):
+    despacho = await _montar_cenario(quantidade_pedidos, quantidade_entregadores, quantidade_restaurantes=800)
+    print(f"Pedidos prontos: {quantidade_pedidos}  Entregadores: {quantidade_entregadores}")
+
+    inicio = time.perf_counter()
+    atribuicoes = await despacho.despachar(limite=quantidade_pedidos)
+    decorrido = time.perf_counter() - inicio
+
+    distancia_media = sum(a.distancia_km for a in atribuicoes) / len(atribuicoes) if atribuicoes else 0.0
+    print(f"  atribuições            : {len(atribuicoes)}")
+    print(f"  entregadores livres    : {despacho.disponiveis}")
+    print(f"  distância média        : {distancia_media:.2f} km")
+    print(f"  rodada completa        : {decorrido * 1e3:.1f} ms ({len(atribuicoes) / decorrido:,.0f} atribuições/s)")
+
+
+def main(quantidade_pedidos: int = 10_000, quantidade_entregadores: int = 1_000):
+    asyncio.run(_executar(quantidade_pedidos, quantidade_entregadores))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,128 @@
+# delivery_api_project/benchmarks/bench_dinheiro.py
+"""
+Compara Dinheiro (centavos inteiros) com o modelo anterior baseado em Decimal.
+
+Mede a conversão dos preços de entrada (feita uma única vez, na fronteira), a soma dos
+totais dos pedidos e a verificação de preços de um catálogo inteiro. A conversão é mais cara
+que `Decimal(str(x))`, mas é paga uma vez por valor; somas e comparações, repetidas a cada
+alteração de pedido e a cada consulta, passam a ser aritmética de inteiros. Antes de medir, confere que não há deriva de arredondamento:
+os totais em centavos coincidem exatamente com os mesmos cálculos feitos em Decimal, e
+rateios e multiplicações por fator fecham a soma ao centavo.
+
+Uso: python -m benchmarks.bench_dinheiro [quantidade_de_itens]
+"""
+
+import random
+import sys
+import time
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
+
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+
+_CENTAVO = Decimal("0.01")
+
+
+def _gerar_precos(quantidade: int):
+    random.seed(19)
+    return [f"{random.randint(1, 50_000) / 100:.2f}" for _ in range(quantidade)]
+
+
+def _conferir_sem_deriva(precos, quantidades):
+    endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+    pedido = Pedido(uuid.uuid4(), uuid.uuid4(), endereco, taxa_entrega=Decimal("7.99"))
+    esperado = Decimal("7.99")
+    itens = []
+    for preco, quantidade in zip(precos, quantidades):
+        item = ItemPedido(uuid.uuid4(), quantidade, Decimal(preco))
+        pedido.adicionar_item(item)
+        itens.append(item)
+        esperado += Decimal(preco) * quantidade
+    for item in itens[::3]:
+        pedido.remover_item(item.id)
+        esperado -= item.preco_unitario_compra.para_decimal() * item.quantidade
+    assert pedido.valor_total_pedido.para_decimal() == esperado, "Deriva no total do pedido"
+    assert str(pedido.valor_total_pedido) == str(esperado)
+
+    for preco in precos[:10_000]:
+        valor = Dinheiro(preco)
+        assert valor.para_decimal() == Decimal(preco)
+        for fator in ("0.15", "0.333", "1.075"):
+            exato = (Decimal(preco) * Decimal(fator)).quantize(_CENTAVO, rounding=ROUND_HALF_UP)
+            assert valor.multiplicar(fator).para_decimal() == exato, "Deriva em multiplicar"
+        for partes in (3, 7, [1, 2, 3]):
+            assert sum(valor.ratear(partes)) == valor, "Deriva em ratear"
+
+    try:
+        Dinheiro("10.005")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Frações de centavo deveriam ser recusadas")
+    assert Dinheiro("10.005", arredondamento=ROUND_HALF_UP) == Dinheiro("10.01")
+
+
+def _cronometrar(funcao, repeticoes: int = 3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return resultado, melhor
+
+
+def main(quantidade: int = 200_000):
+    precos = _gerar_precos(quantidade)
+    quantidades = [1 + i % 4 for i in range(quantidade)]
+    _conferir_sem_deriva(precos[:20_000], quantidades)
+
+    decimais = [Decimal(p) for p in precos]
+    print(f"Itens: {quantidade}")
+
+    # Conversão de entrada (uma vez, na fronteira): strings como chegam da API
+    def converter_decimal():
+        return [Decimal(str(p)) for p in precos]
+
+    def converter_dinheiro():
+        de_valor = Dinheiro.de_valor
+        return [de_valor(p) for p in precos]
+
+    _, t_conv_dec = _cronometrar(converter_decimal)
+    valores, t_conv_din = _cronometrar(converter_dinheiro)
+
+    # Totais de pedidos de 5 itens, como em Pedido.valor_total_pedido
+    def totais_decimal():
+        return [sum((decimais[i + j] * quantidades[i + j] for j in range(5)), Decimal("0.00"))
+                for i in range(0, quantidade - 4, 5)]
+
+    def totais_centavos():
+        centavos = [v.centavos for v in valores]
+        return [sum(centavos[i + j] * quantidades[i + j] for j in range(5)) for i in range(0, quantidade - 4, 5)]
+
+    soma_dec, t_soma_dec = _cronometrar(totais_decimal)
+    soma_cent, t_soma_cent = _cronometrar(totais_centavos)
+    assert [Dinheiro.de_centavos(c).para_decimal() for c in soma_cent] == soma_dec
+
+    # Verificação em lote de preços de um catálogo (positivos e dentro de um teto)
+    teto_dec, teto = Decimal("400.00"), Dinheiro("400.00").centavos
+    invalidos_dec, t_check_dec = _cronometrar(lambda: sum(1 for p in decimais if not Decimal("0") < p <= teto_dec))
+    invalidos, t_check_din = _cronometrar(lambda: sum(1 for v in valores if not 0 < v.centavos <= teto))
+    assert invalidos == invalidos_dec
+
+    print(f"  Conversão para Decimal     : {quantidade / t_conv_dec:>14,.0f} preços/s")
+    print(f"  Conversão para Dinheiro    : {quantidade / t_conv_din:>14,.0f} preços/s "
+          f"({t_conv_dec / t_conv_din:.2f}x)")
+    print(f"  Totais em Decimal          : {quantidade / t_soma_dec:>14,.0f} itens/s")
+    print(f"  Totais em centavos         : {quantidade / t_soma_cent:>14,.0f} itens/s "
+          f"({t_soma_dec / t_soma_cent:.2f}x)")
+    print(f"  Verificação em Decimal     : {quantidade / t_check_dec:>14,.0f} preços/s")
+    print(f"  Verificação em centavos    : {quantidade / t_check_din:>14,.0f} preços/s "
+          f"({t_check_dec / t_check_din:.2f}x)")
+    print("  Sem deriva de arredondamento: ok")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,119 @@
+# delivery_api_project/benchmarks/bench_entidades.py
+"""
+Compara memória e vazão das entidades com __slots__ contra o layout anterior (baseado em __dict__).
+
+O layout anterior é emulado por uma classe simples com os mesmos atributos em __dict__, e
+a vazão compara o construtor validado (`Pedido(...)`) com a reidratação em lote (`Pedido.from_rows`).
+
+Uso: python -m benchmarks.bench_entidades [quantidade_de_pedidos]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+
+
+class _PedidoLegado:
+    """Mesmo conjunto de atributos de Pedido, porém armazenados em __dict__ (layout anterior)."""
+
+
+def _gerar_linhas(quantidade: int):
+    endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+    inicio = datetime(2024, 1, 1)
+    linhas = []
+    for i in range(quantidade):
+        itens = ItemPedido.from_rows([
+            {"id": uuid.uuid4(), "produto_id": uuid.uuid4(), "quantidade": 1 + i % 3,
+             "preco_unitario_compra": Dinheiro("12.90")},
+            {"id": uuid.uuid4(), "produto_id": uuid.uuid4(), "quantidade": 1,
+             "preco_unitario_compra": Dinheiro("7.50")},
+        ])
+        linhas.append({
+            "id": uuid.uuid4(), "cliente_id": uuid.uuid4(), "restaurante_id": uuid.uuid4(),
+            "endereco_entrega": endereco, "itens": itens, "status_pedido": StatusPedido.PENDENTE,
+            "taxa_entrega": Dinheiro("5.00"), "data_criacao": inicio + timedelta(seconds=i),
+        })
+    return linhas
+
+
+def _construir_com_init(linhas):
+    return [
+        Pedido(
+            cliente_id=row["cliente_id"], restaurante_id=row["restaurante_id"],
+            endereco_entrega=row["endereco_entrega"], pedido_id=row["id"],
+            itens=row["itens"],
+            status_pedido=row["status_pedido"], taxa_entrega=row["taxa_entrega"],
+            data_criacao=row["data_criacao"],
+        )
+        for row in linhas
+    ]
+
+
+def _construir_legado(pedidos):
+    legados = []
+    for pedido in pedidos:
+        legado = _PedidoLegado()
+        for atributo in Pedido.__slots__:
+            setattr(legado, atributo, getattr(pedido, atributo))
+        # Aloca coleções próprias, como from_rows faz, para que a comparação seja justa
+        legado._itens = {}
+        legado._subtotal_itens = 0
+        legados.append(legado)
+    return legados
+
+
+def _medir_tempo(funcao, *args, repeticoes: int = 3):
+    """Melhor tempo entre as repetições, com o GC desligado para reduzir ruído."""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        gc.collect()
+        gc.disable()
+        try:
+            inicio = time.perf_counter()
+            resultado = funcao(*args)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        finally:
+            gc.enable()
+    return resultado, melhor
+
+
+def _medir_memoria(funcao, *args):
+    tracemalloc.start()
+    resultado = funcao(*args)
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, atual
+
+
+def main(quantidade: int = 100_000):
+    linhas = _gerar_linhas(quantidade)
+
+    via_init, tempo_init = _medir_tempo(_construir_com_init, linhas)
+    via_rows, tempo_rows = _medir_tempo(Pedido.from_rows, linhas)
+    assert all(a.valor_total_pedido == b.valor_total_pedido for a, b in zip(via_init, via_rows))
+    del via_init
+
+    # Memória apenas dos objetos Pedido (itens e endereço ficam fora da medição)
+    linhas_sem_itens = [{**row, "itens": ()} for row in linhas]
+    _, memoria_slots = _medir_memoria(Pedido.from_rows, linhas_sem_itens)
+    _, memoria_dict = _medir_memoria(_construir_legado, via_rows)
+
+    print(f"Pedidos: {quantidade}")
+    print(f"  Pedido(...)          : {quantidade / tempo_init:>12,.0f} pedidos/s")
+    print(f"  Pedido.from_rows     : {quantidade / tempo_rows:>12,.0f} pedidos/s "
+          f"({tempo_init / tempo_rows:.2f}x)")
+    print(f"  Memória __dict__     : {memoria_dict / quantidade:>12,.0f} bytes/pedido")
+    print(f"  Memória __slots__    : {memoria_slots / quantidade:>12,.0f} bytes/pedido "
+          f"({memoria_dict / memoria_slots:.2f}x menor)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,54 @@
+# delivery_api_project/benchmarks/bench_instrumentacao.py
+"""
+Mede o custo por chamada da instrumentação (Instrumentado) sobre um repositório em memória,
+o pior caso, já que a chamada original quase não faz trabalho.
+
+Uso: python -m benchmarks.bench_instrumentacao [chamadas]
+"""
+
+import asyncio
+import sys
+import time
+import uuid
+
+from domain.entities.cliente import Cliente
+from infrastructure.instrumentacao.instrumentacao import RegistroMetricas, instrumentar
+from infrastructure.repositories.cliente_repository_em_memoria import ClienteRepositoryEmMemoria
+
+
+async def _cronometrar(repositorio, ids, repeticoes: int = 3) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for cliente_id in ids:
+            await repositorio.buscar_por_id(cliente_id)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor / len(ids)
+
+
+async def _executar(chamadas: int):
+    repositorio = ClienteRepositoryEmMemoria()
+    ids = []
+    for i in range(1000):
+        cliente = await repositorio.salvar(Cliente(f"Cliente {i}", f"cliente{i}@exemplo.com", "hash"))
+        ids.append(cliente.id)
+    ids = (ids + [uuid.uuid4()]) * (chamadas // (len(ids) + 1))
+
+    registro = RegistroMetricas()
+    instrumentado = instrumentar(repositorio, registro=registro)
+    puro = await _cronometrar(repositorio, ids)
+    medido = await _cronometrar(instrumentado, ids)
+
+    print(f"Chamadas por rodada: {len(ids)}")
+    print(f"  sem instrumentação : {puro * 1e9:8.0f} ns/chamada")
+    print(f"  com instrumentação : {medido * 1e9:8.0f} ns/chamada")
+    print(f"  custo adicional    : {(medido - puro) * 1e9:8.0f} ns/chamada")
+    print(f"  resumo registrado  : {registro.instantaneo()['ClienteRepositoryEmMemoria']['buscar_por_id']}")
+
+
+def main(chamadas: int = 300_000):
+    asyncio.run(_executar(chamadas))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
@@ -0,0 +1,120 @@
+# delivery_api_project/benchmarks/bench_processamento_particionado.py
+"""
+Benchmark de escalabilidade do RoteadorPedidos (pedidos particionados por restaurante_id
+em vários processos).
+
+A carga é o ciclo de vida completo de cada pedido (criar, adicionar itens, confirmar,
+preparar, pronto, despachar, entregar), enviado em ondas: a onda k leva o k-ésimo comando
+de todos os pedidos, como numa API com muitos pedidos em andamento. Mede a vazão em
+comandos/s processando tudo no próprio processo (`processar_lote`, sem roteador) e com o
+roteador em 1, 2, 4... processos, até o número de CPUs (ou `max_processos`). O ganho só
+aparece com CPUs livres: numa máquina com uma CPU, todas as configurações competem por ela.
+O "teto do roteador" é a vazão que o processo principal sustentaria sozinho (comandos por
+segundo de CPU gasta nele); enquanto houver CPUs para as partições, a escala é quase linear
+até esse teto.
+
+Uso: python -m benchmarks.bench_processamento_particionado [pedidos] [max_processos]
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from typing import List, Tuple
+
+from domain.entities.pedido import AcaoPedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.processamento import ADICIONAR_ITEM, CONSULTAR, CRIAR, ComandoPedido, RoteadorPedidos, processar_lote
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+RESTAURANTES = 500
+ITENS_POR_PEDIDO = 3
+
+
+def _gerar_ondas(pedidos: int) -> List[List[ComandoPedido]]:
+    aleatorio = random.Random(7)
+    endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+    restaurantes = [uuid.UUID(int=aleatorio.getrandbits(128)) for _ in range(RESTAURANTES)]
+    produtos = [uuid.UUID(int=aleatorio.getrandbits(128)) for _ in range(50)]
+    ciclos = []
+    for _ in range(pedidos):
+        restaurante_id = aleatorio.choice(restaurantes)
+        pedido_id = uuid.UUID(int=aleatorio.getrandbits(128))
+        comandos = [ComandoPedido(restaurante_id, pedido_id, CRIAR, {
+            "cliente_id": uuid.UUID(int=aleatorio.getrandbits(128)), "endereco_entrega": endereco,
+            "taxa_entrega": Dinheiro("5.90"),
+        })]
+        for produto_id in aleatorio.sample(produtos, ITENS_POR_PEDIDO):
+            comandos.append(ComandoPedido(restaurante_id, pedido_id, ADICIONAR_ITEM, {
+                "produto_id": produto_id, "quantidade": aleatorio.randint(1, 3),
+                "preco_unitario_compra": Dinheiro.de_centavos(aleatorio.randint(500, 8_000)),
+            }))
+        for acao in (AcaoPedido.CONFIRMAR, AcaoPedido.INICIAR_PREPARO, AcaoPedido.MARCAR_PRONTO):
+            comandos.append(ComandoPedido(restaurante_id, pedido_id, acao))
+        comandos.append(ComandoPedido(restaurante_id, pedido_id, AcaoPedido.SAIR_PARA_ENTREGA,
+                                      {"entregador_id": uuid.UUID(int=aleatorio.getrandbits(128))}))
+        comandos.append(ComandoPedido(restaurante_id, pedido_id, AcaoPedido.ENTREGAR))
+        ciclos.append(comandos)
+    return [list(onda) for onda in zip(*ciclos)]
+
+
+def _conferir(resultados) -> None:
+    falhas = [r for onda in resultados for r in onda if not r.sucesso]
+    if falhas:
+        raise AssertionError(f"{len(falhas)} comandos falharam; primeiro: {falhas[0].erro}")
+
+
+async def _no_processo(ondas: List[List[ComandoPedido]]) -> float:
+    repositorio = PedidoRepositoryEmMemoria()
+    inicio = time.perf_counter()
+    _conferir([await processar_lote(repositorio, onda) for onda in ondas])
+    return time.perf_counter() - inicio
+
+
+async def _com_roteador(ondas: List[List[ComandoPedido]], processos: int) -> Tuple[float, float]:
+    """(duração, CPU gasta no processo principal: roteamento, serialização e leitura das respostas)"""
+    roteador = RoteadorPedidos(processos)
+    roteador.iniciar()
+    try:
+        # Aquecimento: um comando por partição, para não medir a subida dos processos
+        await roteador.executar_lote([ComandoPedido(uuid.UUID(int=i), uuid.UUID(int=0), CONSULTAR) for i in range(processos)])
+        inicio, inicio_cpu = time.perf_counter(), time.process_time()
+        _conferir([await roteador.executar_lote(onda) for onda in ondas])
+        return time.perf_counter() - inicio, time.process_time() - inicio_cpu
+    finally:
+        await roteador.encerrar()
+
+
+async def _medir(pedidos: int, max_processos: int):
+    ondas = _gerar_ondas(pedidos)
+    comandos = sum(map(len, ondas))
+    print(f"Pedidos: {pedidos} ({comandos} comandos, {RESTAURANTES} restaurantes, {os.cpu_count()} CPUs)")
+
+    duracao = await _no_processo(ondas)
+    print(f"  {'no próprio processo':22}: {comandos / duracao:>12,.0f} comandos/s")
+
+    base = None
+    processos = 1
+    while processos <= max_processos:
+        duracao, cpu_roteador = await _com_roteador(ondas, processos)
+        vazao = comandos / duracao
+        base = base or vazao
+        print(f"  {f'roteador, {processos} processo(s)':22}: {vazao:>12,.0f} comandos/s  ({vazao / base:.2f}x)")
+        processos *= 2
+    # O processo principal é o gargalo final: com CPUs suficientes, a vazão tende a este teto
+    print(f"  {'teto do roteador':22}: {comandos / cpu_roteador:>12,.0f} comandos/s "
+          f"(CPU do processo principal: {cpu_roteador / duracao:.0%} do tempo)")
+
+
+def main(pedidos: int = 20_000, max_processos: int = 0):
+    asyncio.run(_medir(pedidos, max_processos or os.cpu_count() or 1))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 0,
+    )
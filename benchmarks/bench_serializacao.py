@@ -0,0 +1,73 @@
+# delivery_api_project/benchmarks/bench_serializacao.py
+"""
+Compara a serialização de um cardápio de ProdutoResponseDTO com `json.dumps` padrão
+(`dataclasses.asdict` + `default=`) e com os codificadores especializados de
+infrastructure.serializacao, incluindo a versão em partes (streaming).
+
+Uso: python -m benchmarks.bench_serializacao [quantidade_de_dtos]
+"""
+
+import dataclasses
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from application.dtos.produto_response_dto import ProdutoResponseDTO
+from infrastructure.serializacao.json_dtos import serializar_em_partes, serializar_lista
+
+
+def _padrao(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    if isinstance(valor, (uuid.UUID, Decimal)):
+        return str(valor)
+    raise TypeError(type(valor).__name__)
+
+
+def _json_padrao(dtos) -> str:
+    return json.dumps([dataclasses.asdict(dto) for dto in dtos], default=_padrao, separators=(",", ":"))
+
+
+def _gerar_dtos(quantidade: int):
+    restaurante_id = uuid.uuid4()
+    inicio = datetime(2024, 1, 1, 12, 0)
+    return [
+        ProdutoResponseDTO(
+            id=uuid.uuid4(), restaurante_id=restaurante_id, nome=f"Pizza de calabresa {i}",
+            descricao="Molho de tomate, mussarela, calabresa e cebola", preco=Decimal("49.90") + i,
+            categoria_produto_id=uuid.uuid4() if i % 2 else None, imagem_url=None, disponivel=bool(i % 3),
+            data_criacao=inicio + timedelta(minutes=i), data_atualizacao=inicio + timedelta(minutes=i),
+        )
+        for i in range(quantidade)
+    ]
+
+
+def _cronometrar(funcao, repeticoes: int = 5) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main(quantidade: int = 5_000):
+    dtos = _gerar_dtos(quantidade)
+    assert json.loads(serializar_lista(dtos)) == json.loads(_json_padrao(dtos))
+
+    padrao = _cronometrar(lambda: _json_padrao(dtos))
+    especializado = _cronometrar(lambda: serializar_lista(dtos))
+    em_partes = _cronometrar(lambda: sum(len(parte) for parte in serializar_em_partes(dtos)))
+    maior_parte = max(len(parte) for parte in serializar_em_partes(dtos))
+
+    print(f"DTOs: {quantidade} ({len(serializar_lista(dtos)) / 1024:.0f} KiB de JSON)")
+    print(f"  json.dumps + asdict      : {padrao * 1e3:8.1f} ms")
+    print(f"  codificador especializado: {especializado * 1e3:8.1f} ms ({padrao / especializado:.1f}x)")
+    print(f"  em partes (500 por parte): {em_partes * 1e3:8.1f} ms, maior parte {maior_parte / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
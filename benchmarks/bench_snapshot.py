@@ -0,0 +1,167 @@
+# delivery_api_project/benchmarks/bench_snapshot.py
+"""
+Compara a subida a frio de um nó (reidratar as entidades com `from_rows` e reindexar tudo
+com `salvar`, como a partir da fonte da verdade) com a carga de um snapshot binário.
+
+Para o snapshot, mede a gravação (tempo e tamanho), a carga até o nó poder atender
+(`carregar_snapshot`: mmap, diretório e índices), a latência das primeiras leituras (cada
+uma decodifica só a entidade acessada) e a materialização completa.
+
+Uso: python -m benchmarks.bench_snapshot [restaurantes] [produtos_por_restaurante] [pedidos_em_aberto]
+"""
+
+import asyncio
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.entities.produto import Produto
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.categoria_produto_repository_em_memoria import CategoriaProdutoRepositoryEmMemoria
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from infrastructure.repositories.produto_repository_em_memoria import ProdutoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+from infrastructure.snapshots import carregar_snapshot, salvar_snapshot
+
+NOMES = ["Pizzaria", "Cantina", "Sushi", "Burger", "Padaria", "Churrascaria", "Tapiocaria", "Bistrô"]
+CATEGORIAS = ["pizza", "italiana", "japonesa", "lanches", "padaria", "carnes", "nordestina", "francesa"]
+STATUS_EM_ABERTO = [StatusPedido.PENDENTE, StatusPedido.CONFIRMADO_PELO_RESTAURANTE, StatusPedido.EM_PREPARO]
+PRIMEIRAS_LEITURAS = 1_000
+
+
+def _gerar_linhas(restaurantes: int, produtos_por_restaurante: int, pedidos: int):
+    """Linhas como viriam da fonte da verdade (restaurantes, categorias, produtos, pedidos)."""
+    aleatorio = random.Random(11)
+    inicio = datetime(2024, 1, 1)
+    linhas_restaurantes, linhas_categorias, linhas_produtos, linhas_pedidos = [], [], [], []
+    for i in range(restaurantes):
+        restaurante_id = uuid.UUID(int=aleatorio.getrandbits(128))
+        tipo = i % len(NOMES)
+        linhas_restaurantes.append({
+            "id": restaurante_id, "nome_fantasia": f"{NOMES[tipo]} {i}", "cnpj": f"{i:014d}",
+            "email_contato": f"contato{i}@exemplo.com",
+            "endereco": Endereco("Rua A", str(i), "Centro", "São Paulo", "SP", "01000-000", None,
+                                 CoordenadaGeo(-23.7 + aleatorio.random() * 0.4, -46.8 + aleatorio.random() * 0.4)),
+            "categorias": [CATEGORIAS[tipo]], "horario_funcionamento": "seg-sex 11:00-23:00; sab,dom 12:00-15:00",
+            "tempo_medio_preparo_min": 30, "ativo": True, "data_criacao": inicio + timedelta(minutes=i),
+        })
+        categoria_ids = []
+        for nome in ("Entradas", "Pratos", "Bebidas"):
+            categoria_ids.append(uuid.UUID(int=aleatorio.getrandbits(128)))
+            linhas_categorias.append({
+                "id": categoria_ids[-1], "restaurante_id": restaurante_id, "nome": nome, "descricao": None,
+                "ordem": len(categoria_ids), "data_criacao": inicio, "data_atualizacao": inicio,
+            })
+        for j in range(produtos_por_restaurante):
+            momento = inicio + timedelta(minutes=i, seconds=j)
+            linhas_produtos.append({
+                "id": uuid.UUID(int=aleatorio.getrandbits(128)), "restaurante_id": restaurante_id,
+                "nome": f"Produto {j}", "descricao": "Descrição do produto",
+                "preco": Dinheiro.de_centavos(aleatorio.randint(500, 8_000)), "imagem_url": None, "disponivel": True,
+                "categoria_produto_id": categoria_ids[j % 3], "categoria_produto_nome": None,
+                "data_criacao": momento, "data_atualizacao": momento,
+            })
+    entrega = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+    clientes = [uuid.UUID(int=aleatorio.getrandbits(128)) for _ in range(max(1, pedidos // 5))]
+    for i in range(pedidos):
+        produto = aleatorio.choice(linhas_produtos)
+        momento = inicio + timedelta(seconds=i)
+        linhas_pedidos.append({
+            "id": uuid.UUID(int=aleatorio.getrandbits(128)), "cliente_id": aleatorio.choice(clientes),
+            "restaurante_id": produto["restaurante_id"], "endereco_entrega": entrega,
+            "itens": [{
+                "id": uuid.UUID(int=aleatorio.getrandbits(128)), "produto_id": produto["id"],
+                "quantidade": aleatorio.randint(1, 3), "preco_unitario_compra": produto["preco"],
+            }],
+            "status_pedido": aleatorio.choice(STATUS_EM_ABERTO), "taxa_entrega": Dinheiro("5.90"),
+            "data_criacao": momento, "data_ultima_atualizacao": momento,
+        })
+    return linhas_restaurantes, linhas_categorias, linhas_produtos, linhas_pedidos
+
+
+async def _subida_a_frio(linhas_restaurantes, linhas_categorias, linhas_produtos, linhas_pedidos):
+    restaurantes, categorias = RestauranteRepositoryEmMemoria(), CategoriaProdutoRepositoryEmMemoria()
+    produtos, pedidos = ProdutoRepositoryEmMemoria(), PedidoRepositoryEmMemoria()
+    for restaurante in Restaurante.from_rows(linhas_restaurantes):
+        await restaurantes.salvar(restaurante)
+    for categoria in CategoriaProduto.from_rows(linhas_categorias):
+        await categorias.salvar(categoria)
+    await produtos.salvar_em_lote(Produto.from_rows(linhas_produtos))
+    for linha in linhas_pedidos:
+        (pedido,) = Pedido.from_rows([{**linha, "itens": ItemPedido.from_rows(linha["itens"])}])
+        await pedidos.salvar(pedido)
+    return restaurantes, categorias, produtos, pedidos
+
+
+async def _medir(quantidade_restaurantes: int, produtos_por_restaurante: int, quantidade_pedidos: int):
+    linhas = _gerar_linhas(quantidade_restaurantes, produtos_por_restaurante, quantidade_pedidos)
+    print(f"Restaurantes: {len(linhas[0])}, categorias: {len(linhas[1])}, produtos: {len(linhas[2])}, "
+          f"pedidos em aberto: {len(linhas[3])}")
+
+    gc.collect()
+    inicio = time.perf_counter()
+    repositorios = await _subida_a_frio(*linhas)
+    frio = time.perf_counter() - inicio
+    print(f"  {'subida a frio':28}: {frio * 1000:>10.1f} ms")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "estado.snap")
+        inicio = time.perf_counter()
+        salvar_snapshot(caminho, *repositorios, metadados={"marca": 0})
+        gravacao = time.perf_counter() - inicio
+        print(f"  {'gravação do snapshot':28}: {gravacao * 1000:>10.1f} ms  ({os.path.getsize(caminho) / 2**20:.1f} MiB)")
+
+        # Um nó reiniciando não tem as linhas nem os repositórios antigos no heap (que só
+        # deixariam as coletas do gc mais caras); ficam apenas os ids das leituras
+        aleatorio = random.Random(3)
+        amostra = [("produtos", linha["id"]) for linha in aleatorio.sample(linhas[2], PRIMEIRAS_LEITURAS // 2)]
+        amostra += [("pedidos", linha["id"]) for linha in aleatorio.sample(linhas[3], PRIMEIRAS_LEITURAS // 2)]
+        aleatorio.shuffle(amostra)
+        del linhas, repositorios
+        gc.collect()
+
+        inicio = time.perf_counter()
+        estado = carregar_snapshot(caminho)
+        carga = time.perf_counter() - inicio
+        print(f"  {'carga do snapshot':28}: {carga * 1000:>10.1f} ms  ({frio / carga:.1f}x mais rápida que a frio)")
+
+        tempos = []
+        for repositorio, entidade_id in amostra:
+            inicio = time.perf_counter_ns()
+            await getattr(estado, repositorio).buscar_por_id(entidade_id)
+            tempos.append(time.perf_counter_ns() - inicio)
+        tempos.sort()
+        # A mediana isola o custo de decodificar uma entidade; o p99 inclui a primeira coleta
+        # completa do gc, que percorre os índices recém-carregados
+        print(f"  {'primeiras leituras':28}: p50 {tempos[len(tempos) // 2] / 1000:.1f} µs, "
+              f"p99 {tempos[len(tempos) * 99 // 100] / 1000:.1f} µs  "
+              f"({estado.registros_pendentes} entidades ainda codificadas)")
+
+        inicio = time.perf_counter()
+        estado.materializar()
+        materializacao = time.perf_counter() - inicio
+        print(f"  {'materialização completa':28}: {materializacao * 1000:>10.1f} ms  "
+              f"(carga + materialização: {(carga + materializacao) * 1000:.1f} ms)")
+
+
+def main(restaurantes: int = 5_000, produtos_por_restaurante: int = 20, pedidos: int = 50_000):
+    asyncio.run(_medir(restaurantes, produtos_por_restaurante, pedidos))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 50_000,
+    )
@@ -0,0 +1,50 @@
+# delivery_api_project/benchmarks/bench_transicoes_pedido.py
+"""
+Micro-benchmark da máquina de estados de Pedido.
+
+Mede a validação individual (`pode_transicionar`), a validação em lote
+(`Pedido.validar_transicao_em_lote`) e a aplicação em lote das transições.
+
+Uso: python -m benchmarks.bench_transicoes_pedido [quantidade_de_pedidos]
+"""
+
+import random
+import sys
+import time
+import uuid
+
+from domain.entities.pedido import AcaoPedido, Pedido, StatusPedido
+from domain.value_objects.endereco import Endereco
+
+
+def _gerar_pedidos(quantidade: int):
+    random.seed(7)
+    endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+    return [
+        Pedido(uuid.uuid4(), uuid.uuid4(), endereco, status_pedido=random.choice(StatusPedido.TODOS_OS_STATUS))
+        for _ in range(quantidade)
+    ]
+
+
+def _cronometrar(descricao: str, quantidade: int, funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    decorrido = time.perf_counter() - inicio
+    print(f"  {descricao:46}: {quantidade / decorrido:>14,.0f} pedidos/s")
+    return resultado
+
+
+def main(quantidade: int = 200_000):
+    pedidos = _gerar_pedidos(quantidade)
+    print(f"Pedidos: {quantidade}")
+
+    _cronometrar("pode_transicionar (um a um)", quantidade,
+                 lambda: [p for p in pedidos if p.pode_transicionar(AcaoPedido.CANCELAR_PELO_CLIENTE)])
+    permitidos, _ = _cronometrar("validar_transicao_em_lote", quantidade,
+                                 lambda: Pedido.validar_transicao_em_lote(pedidos, AcaoPedido.CANCELAR_PELO_CLIENTE))
+    _cronometrar("transicionar_em_lote (CANCELAR_PELO_CLIENTE)", len(permitidos),
+                 lambda: Pedido.transicionar_em_lote(permitidos, AcaoPedido.CANCELAR_PELO_CLIENTE))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,341 @@
+# delivery_api_project/benchmarks/simulador_carga.py
+"""
+Simulador de carga de ponta a ponta do ciclo de vida dos pedidos.
+
+Cria clientes, restaurantes, categorias e cardápios (estes via AdicionarProdutoUseCase) e
+então conduz milhares de ciclos de vida de Pedido concorrentes: criar, adicionar_item,
+confirmar, preparar, pronto, despachar e entregar, ou cancelar (pelo cliente ou pelo
+restaurante). Cada etapa busca o pedido pelo ID, aplica a transição e salva, como faria
+uma requisição da API. O plano de cada ciclo é sorteado antes da execução, com semente
+fixa, então duas execuções com os mesmos parâmetros fazem exatamente o mesmo trabalho.
+
+Os repositórios são plugáveis (`--repositorios`, veja FABRICAS_REPOSITORIOS). O relatório
+traz vazão, p50/p99 por etapa e pico de memória; `--salvar` grava o resultado em JSON e
+`--comparar` confronta a execução com um resultado anterior, terminando com código 1 se
+houver regressão além da tolerância.
+
+Uso: python -m benchmarks.simulador_carga [--pedidos 5000] [--concorrencia 500]
+         [--repositorios memoria] [--salvar benchmarks/baselines/simulador_carga_memoria.json]
+         [--comparar benchmarks/baselines/simulador_carga_memoria.json] [--tolerancia 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from application.dtos.adicionar_produto_request_dto import AdicionarProdutoRequestDTO
+from application.interfaces.i_categoria_produto_repository import ICategoriaProdutoRepository
+from application.interfaces.i_cliente_repository import IClienteRepository
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.interfaces.i_produto_repository import IProdutoRepository
+from application.interfaces.i_restaurante_repository import IRestauranteRepository
+from application.use_cases.adicionar_produto_uc import AdicionarProdutoUseCase
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.cliente import Cliente
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.endereco import Endereco
+from infrastructure.cache.repositories_com_cache import CategoriaProdutoRepositoryComCache, ProdutoRepositoryComCache
+from infrastructure.cozinha.pedido_repository_com_fila_cozinha import PedidoRepositoryComFilaCozinha
+from infrastructure.instrumentacao.histograma import HistogramaLatencia
+from infrastructure.repositories import (
+    CategoriaProdutoRepositoryEmMemoria, ClienteRepositoryEmMemoria, OutboxEmMemoria, PedidoRepositoryEmMemoria,
+    ProdutoRepositoryEmMemoria, RestauranteRepositoryEmMemoria
+)
+
+try:
+    import resource
+except ImportError: # Windows: sem getrusage, o pico de memória não é informado
+    resource = None
+
+VERSAO_RESULTADO = 1
+
+ETAPAS = ("criar", "adicionar_item", "confirmar", "preparar", "pronto", "despachar", "entregar", "cancelar")
+
+
+@dataclass
+class ConfiguracaoSimulacao:
+    pedidos: int = 5_000
+    concorrencia: int = 500 # Ciclos de vida em andamento ao mesmo tempo
+    clientes: int = 1_000
+    restaurantes: int = 200
+    produtos_por_restaurante: int = 20
+    itens_por_pedido: int = 3
+    taxa_cancelamento: float = 0.1
+    semente: int = 42
+
+
+@dataclass
+class Repositorios:
+    clientes: IClienteRepository
+    restaurantes: IRestauranteRepository
+    categorias: ICategoriaProdutoRepository
+    produtos: IProdutoRepository
+    pedidos: IPedidoRepository
+
+
+def _repositorios_em_memoria() -> Repositorios:
+    return Repositorios(
+        ClienteRepositoryEmMemoria(), RestauranteRepositoryEmMemoria(), CategoriaProdutoRepositoryEmMemoria(),
+        ProdutoRepositoryEmMemoria(), PedidoRepositoryEmMemoria(),
+    )
+
+
+def _repositorios_decorados() -> Repositorios:
+    """Configuração próxima da produção: caches de cardápio, fila da cozinha e outbox de eventos."""
+    return Repositorios(
+        ClienteRepositoryEmMemoria(), RestauranteRepositoryEmMemoria(),
+        CategoriaProdutoRepositoryComCache(CategoriaProdutoRepositoryEmMemoria()),
+        ProdutoRepositoryComCache(ProdutoRepositoryEmMemoria()),
+        PedidoRepositoryComFilaCozinha(PedidoRepositoryEmMemoria(OutboxEmMemoria())),
+    )
+
+
+FABRICAS_REPOSITORIOS: Dict[str, Callable[[], Repositorios]] = {
+    "memoria": _repositorios_em_memoria,
+    "decorado": _repositorios_decorados,
+}
+
+
+@dataclass(frozen=True)
+class _PlanoCiclo:
+    cliente: Cliente
+    restaurante: Restaurante
+    itens: Tuple[Tuple[uuid.UUID, Decimal, int], ...] # (produto_id, preço, quantidade)
+    cancelamento: Optional[str] # None, "cliente" (ainda pendente) ou "restaurante" (após confirmar)
+
+
+class SimuladorCarga:
+    def __init__(self, configuracao: ConfiguracaoSimulacao, repositorios: Repositorios):
+        self.configuracao = configuracao
+        self.repositorios = repositorios
+        self.histogramas: Dict[str, HistogramaLatencia] = {etapa: HistogramaLatencia() for etapa in ETAPAS}
+        self._clientes: List[Cliente] = []
+        self._restaurantes: List[Restaurante] = []
+        self._cardapios: Dict[uuid.UUID, List[Tuple[uuid.UUID, Decimal]]] = {}
+
+    async def preparar(self):
+        """Cadastra clientes, restaurantes, categorias e cardápios."""
+        configuracao = self.configuracao
+        aleatorio = random.Random(configuracao.semente)
+        repositorios = self.repositorios
+        adicionar_produto = AdicionarProdutoUseCase(repositorios.produtos, repositorios.restaurantes, repositorios.categorias)
+
+        for i in range(configuracao.clientes):
+            cliente = Cliente(f"Cliente {i}", f"cliente{i}@exemplo.com", "hash", enderecos=[_endereco(aleatorio)])
+            self._clientes.append(await repositorios.clientes.salvar(cliente))
+
+        for i in range(configuracao.restaurantes):
+            restaurante = await repositorios.restaurantes.salvar(Restaurante(
+                f"Restaurante {i}", f"{i:014d}", f"r{i}@exemplo.com", _endereco(aleatorio),
+                categorias=["Lanches"], horario_funcionamento="00:00-24:00",
+            ))
+            self._restaurantes.append(restaurante)
+            categorias = [
+                await repositorios.categorias.salvar(CategoriaProduto(restaurante.id, nome, ordem=ordem))
+                for ordem, nome in enumerate(("Pratos", "Bebidas", "Sobremesas"))
+            ]
+            cardapio = self._cardapios[restaurante.id] = []
+            for j in range(configuracao.produtos_por_restaurante):
+                produto = await adicionar_produto.executar(AdicionarProdutoRequestDTO(
+                    restaurante_id=restaurante.id, nome=f"Produto {j}", descricao="",
+                    preco=Decimal(aleatorio.randint(500, 8_000)).scaleb(-2),
+                    categoria_produto_id=categorias[j % len(categorias)].id,
+                ))
+                cardapio.append((produto.id, produto.preco))
+
+    def planejar(self) -> List[_PlanoCiclo]:
+        configuracao = self.configuracao
+        aleatorio = random.Random(configuracao.semente + 1)
+        planos = []
+        for _ in range(configuracao.pedidos):
+            restaurante = aleatorio.choice(self._restaurantes)
+            cardapio = self._cardapios[restaurante.id]
+            itens = tuple(
+                (*aleatorio.choice(cardapio), aleatorio.randint(1, 3)) for _ in range(configuracao.itens_por_pedido)
+            )
+            sorteio = aleatorio.random()
+            cancelamento = None
+            if sorteio < configuracao.taxa_cancelamento / 2:
+                cancelamento = "cliente"
+            elif sorteio < configuracao.taxa_cancelamento:
+                cancelamento = "restaurante"
+            planos.append(_PlanoCiclo(aleatorio.choice(self._clientes), restaurante, itens, cancelamento))
+        return planos
+
+    async def executar(self, planos: List[_PlanoCiclo]) -> float:
+        """Executa os ciclos com no máximo `concorrencia` simultâneos. Retorna a duração em segundos."""
+        vagas = asyncio.Semaphore(self.configuracao.concorrencia)
+
+        async def com_vaga(plano: _PlanoCiclo):
+            async with vagas:
+                await self._ciclo(plano)
+
+        inicio = time.perf_counter()
+        await asyncio.gather(*(com_vaga(plano) for plano in planos))
+        return time.perf_counter() - inicio
+
+    async def _ciclo(self, plano: _PlanoCiclo):
+        pedidos = self.repositorios.pedidos
+        inicio = perf_counter_ns()
+        pedido = Pedido(plano.cliente.id, plano.restaurante.id, plano.cliente.enderecos[0], taxa_entrega=Decimal("5.90"))
+        await pedidos.salvar(pedido)
+        self.histogramas["criar"].registrar_ns(perf_counter_ns() - inicio)
+        pedido_id = pedido.id
+
+        for produto_id, preco, quantidade in plano.itens:
+            await asyncio.sleep(0) # Cede a vez: cada etapa é uma "requisição" separada
+            inicio = perf_counter_ns()
+            pedido = await pedidos.buscar_por_id(pedido_id)
+            pedido.adicionar_item(ItemPedido(produto_id, quantidade, preco))
+            await pedidos.salvar(pedido)
+            self.histogramas["adicionar_item"].registrar_ns(perf_counter_ns() - inicio)
+
+        if plano.cancelamento == "cliente":
+            await self._etapa("cancelar", pedido_id, Pedido.cancelar_pelo_cliente)
+            return
+        await self._etapa("confirmar", pedido_id, Pedido.confirmar_pelo_restaurante)
+        if plano.cancelamento == "restaurante":
+            await self._etapa("cancelar", pedido_id, lambda p: p.cancelar_pelo_restaurante("Item em falta"))
+            return
+        await self._etapa("preparar", pedido_id, Pedido.marcar_como_em_preparo)
+        await self._etapa("pronto", pedido_id, Pedido.marcar_como_pronto_para_coleta)
+        entregador_id = uuid.uuid4()
+        await self._etapa("despachar", pedido_id, lambda p: p.marcar_como_saiu_para_entrega(entregador_id))
+        await self._etapa("entregar", pedido_id, Pedido.marcar_como_entregue)
+
+    async def _etapa(self, nome: str, pedido_id: uuid.UUID, transicao: Callable[[Pedido], Any]):
+        await asyncio.sleep(0)
+        inicio = perf_counter_ns()
+        pedido = await self.repositorios.pedidos.buscar_por_id(pedido_id)
+        transicao(pedido)
+        await self.repositorios.pedidos.salvar(pedido)
+        self.histogramas[nome].registrar_ns(perf_counter_ns() - inicio)
+
+
+def _endereco(aleatorio: random.Random) -> Endereco:
+    return Endereco(
+        "Rua A", str(aleatorio.randint(1, 2_000)), "Centro", "São Paulo", "SP", "01000-000",
+        coordenadas=CoordenadaGeo(-23.55 + aleatorio.uniform(-0.1, 0.1), -46.63 + aleatorio.uniform(-0.1, 0.1)),
+    )
+
+
+def _pico_memoria_mib() -> Optional[float]:
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 1024 / (1024 if sys.platform == "darwin" else 1) # KiB no Linux, bytes no macOS
+
+
+async def simular(configuracao: ConfiguracaoSimulacao, nome_repositorios: str = "memoria") -> Dict[str, Any]:
+    simulador = SimuladorCarga(configuracao, FABRICAS_REPOSITORIOS[nome_repositorios]())
+    inicio = time.perf_counter()
+    await simulador.preparar()
+    duracao_preparo = time.perf_counter() - inicio
+    duracao = await simulador.executar(simulador.planejar())
+
+    operacoes = sum(h.contagem for h in simulador.histogramas.values())
+    return {
+        "versao": VERSAO_RESULTADO,
+        "repositorios": nome_repositorios,
+        "configuracao": asdict(configuracao),
+        "ambiente": {"python": platform.python_version(), "plataforma": platform.platform()},
+        "preparo_s": round(duracao_preparo, 4),
+        "duracao_s": round(duracao, 4),
+        "vazao_pedidos_s": round(configuracao.pedidos / duracao, 1),
+        "vazao_operacoes_s": round(operacoes / duracao, 1),
+        "memoria_pico_mib": _pico_memoria_mib(),
+        "etapas": {
+            etapa: {
+                "chamadas": histograma.contagem,
+                "p50_ms": round(histograma.percentil_ns(50) / 1e6, 4),
+                "p99_ms": round(histograma.percentil_ns(99) / 1e6, 4),
+            }
+            for etapa, histograma in simulador.histogramas.items() if histograma.contagem
+        },
+    }
+
+
+def comparar(atual: Dict[str, Any], base: Dict[str, Any], tolerancia: float = 0.25) -> List[str]:
+    """
+    Regressões de `atual` em relação a `base`: vazão menor, p50 maior ou memória maior que a
+    tolerância relativa (p99, mais ruidoso, usa o dobro). Diferenças abaixo de 5 µs são ignoradas.
+    """
+    if atual["configuracao"] != base["configuracao"] or atual["repositorios"] != base["repositorios"]:
+        return ["Configuração ou repositórios diferentes da base: resultados não são comparáveis."]
+    regressoes = []
+    if atual["vazao_pedidos_s"] < base["vazao_pedidos_s"] * (1 - tolerancia):
+        regressoes.append(f"vazão: {atual['vazao_pedidos_s']:,.0f} pedidos/s (base {base['vazao_pedidos_s']:,.0f})")
+    for etapa, medidas_base in base["etapas"].items():
+        medidas = atual["etapas"].get(etapa)
+        if medidas is None:
+            continue
+        for chave, limite in (("p50_ms", tolerancia), ("p99_ms", 2 * tolerancia)):
+            if medidas[chave] > medidas_base[chave] * (1 + limite) and medidas[chave] - medidas_base[chave] > 0.005:
+                regressoes.append(f"{etapa} {chave}: {medidas[chave]:.4f} (base {medidas_base[chave]:.4f})")
+    memoria, memoria_base = atual.get("memoria_pico_mib"), base.get("memoria_pico_mib")
+    if memoria and memoria_base and memoria > memoria_base * (1 + tolerancia):
+        regressoes.append(f"memória de pico: {memoria:.1f} MiB (base {memoria_base:.1f} MiB)")
+    return regressoes
+
+
+def _imprimir(resultado: Dict[str, Any]):
+    configuracao = resultado["configuracao"]
+    print(f"Pedidos: {configuracao['pedidos']} (concorrência {configuracao['concorrencia']}, "
+          f"repositórios {resultado['repositorios']!r})")
+    print(f"  preparo              : {resultado['preparo_s']:.2f}s")
+    print(f"  ciclos de vida       : {resultado['duracao_s']:.2f}s")
+    print(f"  vazão                : {resultado['vazao_pedidos_s']:>10,.0f} pedidos/s "
+          f"({resultado['vazao_operacoes_s']:,.0f} operações/s)")
+    if resultado["memoria_pico_mib"] is not None:
+        print(f"  memória de pico      : {resultado['memoria_pico_mib']:>10.1f} MiB")
+    for etapa, medidas in resultado["etapas"].items():
+        print(f"  {etapa:20} : {medidas['chamadas']:>7} chamadas  p50={medidas['p50_ms']:.3f}ms  "
+              f"p99={medidas['p99_ms']:.3f}ms")
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    padrao = ConfiguracaoSimulacao()
+    parser = argparse.ArgumentParser(description="Simulador de carga do ciclo de vida dos pedidos.")
+    parser.add_argument("--pedidos", type=int, default=padrao.pedidos)
+    parser.add_argument("--concorrencia", type=int, default=padrao.concorrencia)
+    parser.add_argument("--repositorios", choices=sorted(FABRICAS_REPOSITORIOS), default="memoria")
+    parser.add_argument("--semente", type=int, default=padrao.semente)
+    parser.add_argument("--salvar", help="Grava o resultado (JSON) neste arquivo")
+    parser.add_argument("--comparar", help="Compara com um resultado JSON anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.25)
+    opcoes = parser.parse_args(argumentos)
+
+    configuracao = ConfiguracaoSimulacao(pedidos=opcoes.pedidos, concorrencia=opcoes.concorrencia, semente=opcoes.semente)
+    resultado = asyncio.run(simular(configuracao, opcoes.repositorios))
+    _imprimir(resultado)
+
+    if opcoes.salvar:
+        with open(opcoes.salvar, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+            arquivo.write("\n")
+    if opcoes.comparar:
+        with open(opcoes.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultado, json.load(arquivo), opcoes.tolerancia)
+        if regressoes:
+            print("Regressões em relação à base:")
+            for regressao in regressoes:
+                print(f"  {regressao}")
+            return 1
+        print("Sem regressões em relação à base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
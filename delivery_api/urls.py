@@ -0,0 +1,5 @@
+from django.urls import include, path
+
+urlpatterns = [
+    path("metricas/", include("apps.metricas_api.urls")),
+]
@@ -3,4 +3,4 @@ from.restaurante import Restaurante
 from.produto import Produto
 from.categoria_produto import CategoriaProduto
 from.item_pedido import ItemPedido
-from.pedido import Pedido, StatusPedido 
\ No newline at end of file
+from.pedido import Pedido, StatusPedido, AcaoPedido, AlteracoesPedido 
\ No newline at end of file
@@ -1,8 +1,10 @@
 import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 class CategoriaProduto:
+    __slots__ = ("id", "restaurante_id", "nome", "descricao", "ordem", "data_criacao", "data_atualizacao")
+
     def __init__(self,
                  restaurante_id: uuid.UUID,
                  nome: str,
@@ -18,7 +20,7 @@ class CategoriaProduto:
         self.descricao: Optional[str] = descricao
         self.ordem: Optional[int] = ordem
 
-        now = datetime.utcnow()
+        now = datetime.utcnow() if data_criacao is None or data_atualizacao is None else None
         self.data_criacao: datetime = data_criacao if data_criacao is not None else now
         self.data_atualizacao: datetime = data_atualizacao if data_atualizacao is not None else now
 
@@ -28,6 +30,23 @@ class CategoriaProduto:
         if not nome.strip():
             raise ValueError("Nome da categoria não pode ser vazio.")
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["CategoriaProduto"]:
+        """Reidrata categorias em lote a partir de linhas confiáveis, sem revalidar os campos."""
+        novo = object.__new__
+        categorias = []
+        for row in rows:
+            categoria = novo(cls)
+            categoria.id = row["id"]
+            categoria.restaurante_id = row["restaurante_id"]
+            categoria.nome = row["nome"]
+            categoria.descricao = row.get("descricao")
+            categoria.ordem = row.get("ordem", 0)
+            categoria.data_criacao = row["data_criacao"]
+            categoria.data_atualizacao = row.get("data_atualizacao", row["data_criacao"])
+            categorias.append(categoria)
+        return categorias
+
     def atualizar_detalhes(self,
                            nome: Optional[str] = None,
                            descricao: Optional[str] = None,
@@ -2,11 +2,13 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 from domain.value_objects.endereco import Endereco # Importamos nosso Value Object
 
 class Cliente:
+    __slots__ = ("id", "nome", "email", "senha_hash", "telefone", "enderecos", "data_criacao")
+
     def __init__(self,
                  nome: str,
                  email: str,
@@ -24,6 +26,23 @@ class Cliente:
         self.enderecos: List[Endereco] = enderecos if enderecos is not None else []
         self.data_criacao: datetime = data_criacao if data_criacao else datetime.utcnow()
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["Cliente"]:
+        """Reidrata clientes em lote a partir de linhas confiáveis, sem revalidar os campos."""
+        novo = object.__new__
+        clientes = []
+        for row in rows:
+            cliente = novo(cls)
+            cliente.id = row["id"]
+            cliente.nome = row["nome"]
+            cliente.email = row["email"]
+            cliente.senha_hash = row["senha_hash"]
+            cliente.telefone = row.get("telefone")
+            cliente.enderecos = list(row.get("enderecos", ()))
+            cliente.data_criacao = row["data_criacao"]
+            clientes.append(cliente)
+        return clientes
+
     def adicionar_endereco(self, endereco: Endereco):
         if not isinstance(endereco, Endereco):
             raise TypeError("Apenas objetos Endereco podem ser adicionados.")
@@ -1,12 +1,16 @@
 import uuid
-from decimal import Decimal, InvalidOperation
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Iterable, List, Mapping, Optional, Union
+
+from domain.value_objects.dinheiro import Dinheiro
 
 class ItemPedido:
+    __slots__ = ("id", "produto_id", "quantidade", "preco_unitario_compra", "observacoes_item")
+
     def __init__(self,
                  produto_id: uuid.UUID,
                  quantidade: int,
-                 preco_unitario_compra: Decimal,
+                 preco_unitario_compra: Union[Dinheiro, Decimal],
                  item_pedido_id: Optional[int] = None,
                  observacoes_item: Optional[str] = None
                 ):
@@ -17,37 +21,52 @@ class ItemPedido:
             raise ValueError("Quantidade deve ser um inteiro positivo.")
         self.quantidade: int=quantidade
         
-        try: 
-            if not isinstance(preco_unitario_compra, Decimal):
-                preco_unitario_compra = Decimal(str(preco_unitario_compra))
-            if preco_unitario_compra < Decimal('0'): #Não permite preço zero
-                raise ValueError("Preço unitário no momento da compra deve ser positivo")
-            self.preco_unitario_compra: Decimal = preco_unitario_compra
-        except InvalidOperation:
-            raise ValueError("Formato de preço unitário inválido.")
+        preco_unitario_compra = Dinheiro.de_valor(preco_unitario_compra) # Recusa frações de centavo
+        if preco_unitario_compra.centavos < 0:
+            raise ValueError("Preço unitário no momento da compra deve ser positivo")
+        self.preco_unitario_compra: Dinheiro = preco_unitario_compra
         
         self.observacoes_item: Optional[str] = observacoes_item
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["ItemPedido"]:
+        """
+        Reidrata itens em lote a partir de linhas confiáveis, sem revalidar os campos.
+        `preco_unitario_compra` pode vir como Dinheiro ou como o Decimal da coluna do banco.
+        """
+        novo = object.__new__
+        de_valor = Dinheiro.de_valor
+        itens = []
+        for row in rows:
+            item = novo(cls)
+            item.id = row["id"]
+            item.produto_id = row["produto_id"]
+            item.quantidade = row["quantidade"]
+            item.preco_unitario_compra = de_valor(row["preco_unitario_compra"])
+            item.observacoes_item = row.get("observacoes_item")
+            itens.append(item)
+        return itens
         
-        @property
-        def preco_total_item(self) -> Decimal:
-            """Calcula o preço total deste item."""
-            return self.quantidade* self.preco_unitario_compra
-        
-        def atualizar_quantidade(self, nova_quantidade: int):
-            if not isinstance(nova_quantidade, int) or nova_quantidade <=0:
-                raise ValueError("Nova quantidade deve ser um inteiro positivo")
-            self.quantidade = nova_quantidade
-             # Nota: Se o item já faz parte de um pedido, o Pedido (Aggregate Root)
-        # deveria ser responsável por recalcular o valor total do pedido.
-
-        def adicionar_observacao(self, observacao: str):
-            self.observacao_item = observacao
-            
-        def __eq__(self, other):
-            if not isinstance(other, ItemPedido):
-                return False
-       
-            return self.id == other.id
-        
-        def __hash__(self):
-            return hash(self.id)       
\ No newline at end of file
+    @property
+    def preco_total_item(self) -> Dinheiro:
+        """Calcula o preço total deste item."""
+        return self.preco_unitario_compra * self.quantidade
+
+    def _definir_quantidade(self, nova_quantidade: int):
+        # Somente via Pedido.atualizar_quantidade_item: o Pedido (Aggregate Root) mantém o
+        # subtotal dos itens, que ficaria inconsistente com uma alteração direta no item.
+        if not isinstance(nova_quantidade, int) or nova_quantidade <=0:
+            raise ValueError("Nova quantidade deve ser um inteiro positivo")
+        self.quantidade = nova_quantidade
+
+    def adicionar_observacao(self, observacao: str):
+        self.observacoes_item = observacao
+
+    def __eq__(self, other):
+        if not isinstance(other, ItemPedido):
+            return False
+
+        return self.id == other.id
+
+    def __hash__(self):
+        return hash(self.id)
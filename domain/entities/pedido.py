@@ -1,11 +1,16 @@
 # delivery_api_project/domain/entities/pedido.py
 
 import uuid
+from collections.abc import Sequence
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from itertools import islice
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 from domain.entities.item_pedido import ItemPedido
+from domain.eventos.evento_status_pedido import EventoStatusPedido
+from domain.value_objects.dinheiro import ZERO, Dinheiro
 from domain.value_objects.endereco import Endereco
 
 # Definição de StatusPedido (poderia ser um Enum em Python 3.x)
@@ -22,10 +27,165 @@ class StatusPedido:
     PODE_MODIFICAR_ITENS = [PENDENTE]
     PODE_CANCELAR_PELO_CLIENTE = [PENDENTE, CONFIRMADO_PELO_RESTAURANTE, EM_PREPARO, PRONTO_PARA_COLETA, SAIU_PARA_ENTREGA]
     STATUS_QUE_NAO_PODEM_SER_CANCELADOS_PELO_RESTAURANTE = [ENTREGUE, CANCELADO_PELO_CLIENTE, CANCELADO_PELO_RESTAURANTE]
+    FINAIS = [ENTREGUE, CANCELADO_PELO_CLIENTE, CANCELADO_PELO_RESTAURANTE]
+    EM_ABERTO = [PENDENTE, CONFIRMADO_PELO_RESTAURANTE, EM_PREPARO, PRONTO_PARA_COLETA, SAIU_PARA_ENTREGA]
 
 
+class AcaoPedido:
+    CONFIRMAR = "CONFIRMAR"
+    INICIAR_PREPARO = "INICIAR_PREPARO"
+    MARCAR_PRONTO = "MARCAR_PRONTO"
+    SAIR_PARA_ENTREGA = "SAIR_PARA_ENTREGA"
+    ENTREGAR = "ENTREGAR"
+    CANCELAR_PELO_CLIENTE = "CANCELAR_PELO_CLIENTE"
+    CANCELAR_PELO_RESTAURANTE = "CANCELAR_PELO_RESTAURANTE"
+    TODAS_AS_ACOES = [CONFIRMAR, INICIAR_PREPARO, MARCAR_PRONTO, SAIR_PARA_ENTREGA, ENTREGAR, CANCELAR_PELO_CLIENTE, CANCELAR_PELO_RESTAURANTE]
+
+
+# Tabela declarativa da máquina de estados: ação -> (status de origem, status de destino, mensagem de erro).
+# É a única fonte das regras de transição; tudo abaixo é derivado dela.
+TRANSICOES_PEDIDO: Mapping[str, Tuple[Tuple[str, ...], str, str]] = MappingProxyType({
+    AcaoPedido.CONFIRMAR: (
+        (StatusPedido.PENDENTE,),
+        StatusPedido.CONFIRMADO_PELO_RESTAURANTE,
+        "Pedido só pode ser confirmado pelo restaurante se estiver PENDENTE. Status atual: {status}",
+    ),
+    AcaoPedido.INICIAR_PREPARO: (
+        (StatusPedido.CONFIRMADO_PELO_RESTAURANTE,),
+        StatusPedido.EM_PREPARO,
+        "Pedido só pode ir para EM PREPARO se estiver CONFIRMADO PELO RESTAURANTE. Status atual: {status}",
+    ),
+    AcaoPedido.MARCAR_PRONTO: (
+        (StatusPedido.EM_PREPARO,),
+        StatusPedido.PRONTO_PARA_COLETA,
+        "Pedido só pode ir para PRONTO PARA COLETA se estiver EM PREPARO. Status atual: {status}",
+    ),
+    AcaoPedido.SAIR_PARA_ENTREGA: (
+        (StatusPedido.PRONTO_PARA_COLETA,), # Ou EM_PREPARO se o restaurante mesmo entrega
+        StatusPedido.SAIU_PARA_ENTREGA,
+        "Pedido só pode SAIR PARA ENTREGA se estiver PRONTO PARA COLETA. Status atual: {status}",
+    ),
+    AcaoPedido.ENTREGAR: (
+        (StatusPedido.SAIU_PARA_ENTREGA,),
+        StatusPedido.ENTREGUE,
+        "Pedido só pode ser marcado como ENTREGUE se estiver SAIU PARA ENTREGA. Status atual: {status}",
+    ),
+    AcaoPedido.CANCELAR_PELO_CLIENTE: (
+        tuple(StatusPedido.PODE_CANCELAR_PELO_CLIENTE),
+        StatusPedido.CANCELADO_PELO_CLIENTE,
+        "Pedido com status {status} não pode ser cancelado pelo cliente.",
+    ),
+    AcaoPedido.CANCELAR_PELO_RESTAURANTE: (
+        tuple(s for s in StatusPedido.TODOS_OS_STATUS
+              if s not in StatusPedido.STATUS_QUE_NAO_PODEM_SER_CANCELADOS_PELO_RESTAURANTE),
+        StatusPedido.CANCELADO_PELO_RESTAURANTE,
+        "Pedido com status {status} não pode ser cancelado pelo restaurante.",
+    ),
+})
+
+# (status atual, ação) -> próximo status, compilado uma única vez a partir da tabela
+PROXIMO_STATUS: Mapping[Tuple[str, str], str] = MappingProxyType({
+    (origem, acao): destino
+    for acao, (origens, destino, _) in TRANSICOES_PEDIDO.items()
+    for origem in origens
+})
+
+ORIGENS_POR_ACAO: Mapping[str, FrozenSet[str]] = MappingProxyType({
+    acao: frozenset(origens) for acao, (origens, _, _) in TRANSICOES_PEDIDO.items()
+})
+
+# Mesma regra em forma de matriz de códigos: MATRIZ_TRANSICOES[status][acao] é o índice do
+# próximo status em TODOS_OS_STATUS, ou -1 se a transição não é permitida.
+MATRIZ_TRANSICOES: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        StatusPedido.TODOS_OS_STATUS.index(PROXIMO_STATUS[(status, acao)]) if (status, acao) in PROXIMO_STATUS else -1
+        for acao in AcaoPedido.TODAS_AS_ACOES
+    )
+    for status in StatusPedido.TODOS_OS_STATUS
+)
+
+
+class _VisaoItens(Sequence):
+    """Visão somente leitura dos itens de um Pedido, sem copiar a coleção interna."""
+
+    __slots__ = ("_itens",)
+
+    def __init__(self, itens: Dict[uuid.UUID, ItemPedido]):
+        self._itens = itens
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def __iter__(self) -> Iterator[ItemPedido]:
+        return iter(self._itens.values())
+
+    def __contains__(self, item) -> bool:
+        return isinstance(item, ItemPedido) and self._itens.get(item.id) is item
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return list(self._itens.values())[posicao]
+        if posicao < 0:
+            posicao += len(self._itens)
+        if not 0 <= posicao < len(self._itens):
+            raise IndexError("Índice de item fora do intervalo.")
+        return next(islice(self._itens.values(), posicao, None))
+
+    def __repr__(self) -> str:
+        return f"_VisaoItens({list(self._itens.values())!r})"
+
+
+class AlteracoesPedido:
+    """
+    Alterações de um Pedido desde a última gravação: campos do cabeçalho e itens
+    adicionados, removidos ou com quantidade alterada. Permite gravar somente o que mudou.
+    """
+
+    __slots__ = ("campos", "itens_adicionados", "itens_removidos", "itens_alterados")
+
+    def __init__(self):
+        self.campos: Set[str] = set()
+        self.itens_adicionados: Dict[uuid.UUID, ItemPedido] = {}
+        self.itens_removidos: Set[uuid.UUID] = set()
+        self.itens_alterados: Set[uuid.UUID] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.campos or self.itens_adicionados or self.itens_removidos or self.itens_alterados)
+
+    def copiar(self) -> "AlteracoesPedido":
+        copia = AlteracoesPedido()
+        copia.campos = set(self.campos)
+        copia.itens_adicionados = dict(self.itens_adicionados)
+        copia.itens_removidos = set(self.itens_removidos)
+        copia.itens_alterados = set(self.itens_alterados)
+        return copia
+
+    @property
+    def linhas(self) -> int:
+        """Escritas necessárias: o cabeçalho (se algum campo mudou) mais uma por item afetado."""
+        return ((1 if self.campos else 0) + len(self.itens_adicionados)
+                + len(self.itens_removidos) + len(self.itens_alterados))
+
+
+_CAMPOS_STATUS = ("status_pedido", "data_ultima_atualizacao")
+# Atributos guardados por Pedido.capturar_estado (os itens, mutáveis, são copiados à parte)
+_CAMPOS_ESTADO = (
+    "cliente_id", "restaurante_id", "endereco_entrega", "_carregar_itens", "_quantidade_itens", "_subtotal_itens",
+    "status_pedido", "taxa_entrega", "metodo_pagamento", "observacoes_gerais", "entregador_id",
+    "data_criacao", "data_ultima_atualizacao",
+)
+_CAMPOS_ITENS = ("data_ultima_atualizacao",)
+
 
 class Pedido:
+    # __slots__ evita um __dict__ por instância: relevante com centenas de milhares de pedidos em memória
+    __slots__ = (
+        "id", "cliente_id", "restaurante_id", "endereco_entrega", "_itens", "_carregar_itens", "_quantidade_itens",
+        "_subtotal_itens",
+        "status_pedido", "taxa_entrega", "metodo_pagamento", "observacoes_gerais", "entregador_id",
+        "data_criacao", "data_ultima_atualizacao", "_alteracoes", "_eventos",
+    )
+
     def __init__(self,
                  cliente_id: uuid.UUID,
                  restaurante_id: uuid.UUID,
@@ -33,7 +193,7 @@ class Pedido:
                  pedido_id: Optional[int] = None,
                  itens: Optional[List[ItemPedido]] = None,
                  status_pedido: str = StatusPedido.PENDENTE,
-                 taxa_entrega: Decimal = Decimal('0.00'),
+                 taxa_entrega: Union[Dinheiro, Decimal] = ZERO,
                  metodo_pagamento: Optional[str] = None,
                  observacoes_gerais: Optional[str] = None,
                  entregador_id: Optional[int] = None,
@@ -44,20 +204,32 @@ class Pedido:
         self.cliente_id: uuid.UUID = cliente_id
         self.restaurante_id: uuid.UUID = restaurante_id
         self.endereco_entrega: Endereco = endereco_entrega
-        self._itens: List[ItemPedido] = itens if itens is not None else []
+        # Itens indexados por ID (a ordem de inserção é preservada pelo dict) e subtotal, em
+        # centavos, mantido incrementalmente por adicionar_item/remover_item/atualizar_quantidade_item.
+        self._itens: Optional[Dict[uuid.UUID, ItemPedido]] = {} # None até o carregamento sob demanda
+        self._carregar_itens: Optional[Callable[[], Iterable[ItemPedido]]] = None
+        self._quantidade_itens: Optional[int] = None # Conhecida antes do carregamento sob demanda, se informada
+        self._subtotal_itens: int = 0
+        for item in itens or ():
+            if item.id in self._itens:
+                raise ValueError(f"Item com ID {item.id} duplicado no pedido.")
+            self._itens[item.id] = item
+            self._subtotal_itens += item.quantidade * item.preco_unitario_compra.centavos
 
         if status_pedido not in StatusPedido.TODOS_OS_STATUS:
             raise ValueError(f"Status do pedido inválido: {status_pedido}")
         self.status_pedido: str = status_pedido
         
-        self.taxa_entrega: Decimal = self._validar_decimal_nao_negativo(taxa_entrega, "Taxa de entrega")
+        self.taxa_entrega: Dinheiro = self._validar_dinheiro_nao_negativo(taxa_entrega, "Taxa de entrega")
         self.metodo_pagamento: Optional[str] = metodo_pagamento
         self.observacoes_gerais: Optional[str] = observacoes_gerais
         self.entregador_id: Optional[int] = entregador_id
 
-        now = datetime.utcnow()
+        now = datetime.utcnow() if data_criacao is None or data_ultima_atualizacao is None else None
         self.data_criacao: datetime = data_criacao if data_criacao is not None else now
         self.data_ultima_atualizacao: datetime = data_ultima_atualizacao if data_ultima_atualizacao is not None else now
+        self._alteracoes: Optional[AlteracoesPedido] = None # Criado na primeira alteração
+        self._eventos: Optional[List[EventoStatusPedido]] = None # Idem, na primeira transição
 
         if not cliente_id:
             raise ValueError("ID do cliente é obrigatório.")
@@ -66,105 +238,298 @@ class Pedido:
         if not isinstance(endereco_entrega, Endereco):
             raise TypeError("Endereço de entrega deve ser um objeto Endereco válido.")
 
-    def _validar_decimal_nao_negativo(self, valor: Decimal, nome_campo: str) -> Decimal:
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["Pedido"]:
+        """
+        Reidrata pedidos em lote a partir de linhas confiáveis (ex.: vindas do banco).
+
+        Cada linha usa os nomes dos atributos (`id`, `cliente_id`, ..., `itens`). As
+        validações do construtor são ignoradas, pois os dados já foram validados ao serem
+        persistidos; apenas o subtotal dos itens é recalculado. `taxa_entrega` pode vir como
+        Dinheiro ou como o Decimal da coluna do banco.
+
+        Em vez de `itens`, a linha pode trazer `carregar_itens` (função sem argumentos que
+        retorna os itens) e o `valor_subtotal_itens` já calculado (e, opcionalmente, a
+        `quantidade_itens`): os itens só são criados no primeiro acesso a eles, e os totais do
+        pedido ficam disponíveis sem carregá-los.
+        """
+        novo = object.__new__
+        de_valor = Dinheiro.de_valor
+        pedidos = []
+        for row in rows:
+            pedido = novo(cls)
+            pedido.id = row["id"]
+            pedido.cliente_id = row["cliente_id"]
+            pedido.restaurante_id = row["restaurante_id"]
+            pedido.endereco_entrega = row["endereco_entrega"]
+            carregar_itens = row.get("carregar_itens")
+            if carregar_itens is not None:
+                pedido._itens = None
+                pedido._carregar_itens = carregar_itens
+                pedido._quantidade_itens = row.get("quantidade_itens")
+                pedido._subtotal_itens = de_valor(row["valor_subtotal_itens"]).centavos
+            else:
+                itens = {}
+                subtotal = 0
+                for item in row.get("itens", ()):
+                    itens[item.id] = item
+                    subtotal += item.quantidade * item.preco_unitario_compra.centavos
+                pedido._itens = itens
+                pedido._carregar_itens = None
+                pedido._quantidade_itens = None
+                pedido._subtotal_itens = subtotal
+            pedido.status_pedido = row["status_pedido"]
+            pedido.taxa_entrega = de_valor(row["taxa_entrega"])
+            pedido.metodo_pagamento = row.get("metodo_pagamento")
+            pedido.observacoes_gerais = row.get("observacoes_gerais")
+            pedido.entregador_id = row.get("entregador_id")
+            pedido.data_criacao = row["data_criacao"]
+            pedido.data_ultima_atualizacao = row.get("data_ultima_atualizacao", row["data_criacao"])
+            pedido._alteracoes = None
+            pedido._eventos = None
+            pedidos.append(pedido)
+        return pedidos
+
+    def _validar_dinheiro_nao_negativo(self, valor: Union[Dinheiro, Decimal], nome_campo: str) -> Dinheiro:
         try:
-            if not isinstance(valor, Decimal):
-                valor = Decimal(str(valor))
-            if valor < Decimal('0'):
-                raise ValueError(f"{nome_campo} não pode ser negativo.")
-            return valor
-        except Exception: # InvalidOperation
+            valor = Dinheiro.de_valor(valor)
+        except ValueError:
             raise ValueError(f"Formato de {nome_campo} inválido.")
+        if valor.centavos < 0:
+            raise ValueError(f"{nome_campo} não pode ser negativo.")
+        return valor
 
     @property
-    def itens(self) -> List[ItemPedido]:
-        return list(self._itens)
+    def alteracoes(self) -> AlteracoesPedido:
+        """Alterações desde a última gravação (vazio se não houver)."""
+        return self._alteracoes if self._alteracoes is not None else AlteracoesPedido()
 
     @property
-    def valor_subtotal_itens(self) -> Decimal:
-        return sum(item.preco_total_item for item in self._itens) if self._itens else Decimal('0.00')
+    def possui_alteracoes(self) -> bool:
+        return self._alteracoes is not None and bool(self._alteracoes)
+
+    def limpar_alteracoes(self):
+        """Chamado pela persistência após gravar as alterações."""
+        self._alteracoes = None
+
+    def capturar_estado(self) -> Tuple:
+        """
+        Estado atual em memória (cabeçalho, itens e suas quantidades, alterações e eventos
+        pendentes), para `restaurar_estado` desfazer alterações cuja gravação falhou. Itens
+        ainda não carregados não são carregados.
+        """
+        itens = self._itens
+        return (
+            tuple(getattr(self, campo) for campo in _CAMPOS_ESTADO),
+            None if itens is None else [(item, item.quantidade) for item in itens.values()],
+            None if self._alteracoes is None else self._alteracoes.copiar(),
+            None if self._eventos is None else list(self._eventos),
+        )
+
+    def restaurar_estado(self, estado: Tuple):
+        """Volta ao estado de `capturar_estado` (a mesma instância continua válida para quem a referencia)."""
+        valores, itens, alteracoes, eventos = estado
+        for campo, valor in zip(_CAMPOS_ESTADO, valores):
+            setattr(self, campo, valor)
+        if itens is None:
+            self._itens = None
+        else:
+            for item, quantidade in itens:
+                item.quantidade = quantidade
+            self._itens = {item.id: item for item, _ in itens}
+        self._alteracoes = alteracoes
+        self._eventos = eventos
+
+    def _registrar_alteracao(self) -> AlteracoesPedido:
+        alteracoes = self._alteracoes
+        if alteracoes is None:
+            alteracoes = self._alteracoes = AlteracoesPedido()
+        return alteracoes
+
+    @property
+    def eventos_pendentes(self) -> Tuple[EventoStatusPedido, ...]:
+        """Mudanças de status ainda não gravadas, em ordem."""
+        return tuple(self._eventos) if self._eventos else ()
+
+    def retirar_eventos(self) -> List[EventoStatusPedido]:
+        """Entrega os eventos pendentes e os esquece; usado pelo repositório ao gravar (outbox)."""
+        eventos, self._eventos = self._eventos, None
+        return eventos or []
+
+    @property
+    def itens(self) -> Sequence:
+        """Visão somente leitura dos itens; use list(pedido.itens) para obter uma cópia."""
+        return _VisaoItens(self._obter_itens())
+
+    @property
+    def itens_carregados(self) -> bool:
+        """False enquanto os itens de um pedido reidratado sem eles não forem acessados."""
+        return self._itens is not None
+
+    @property
+    def quantidade_itens(self) -> int:
+        """Número de itens; não carrega os itens se a quantidade veio na reidratação."""
+        if self._itens is None and self._quantidade_itens is not None:
+            return self._quantidade_itens
+        return len(self._obter_itens())
+
+    def _obter_itens(self) -> Dict[uuid.UUID, ItemPedido]:
+        itens = self._itens
+        if itens is None:
+            itens = self._itens = {item.id: item for item in self._carregar_itens()}
+            self._carregar_itens = None
+        return itens
 
     @property
-    def valor_total_pedido(self) -> Decimal:
-        return self.valor_subtotal_itens + self.taxa_entrega
+    def valor_subtotal_itens(self) -> Dinheiro:
+        return Dinheiro.de_centavos(self._subtotal_itens)
+
+    @property
+    def valor_total_pedido(self) -> Dinheiro:
+        return Dinheiro.de_centavos(self._subtotal_itens + self.taxa_entrega.centavos)
 
     def adicionar_item(self, item: ItemPedido):
         if not isinstance(item, ItemPedido):
             raise TypeError("Apenas objetos ItemPedido podem ser adicionados.")
         if self.status_pedido not in StatusPedido.PODE_MODIFICAR_ITENS:
             raise ValueError(f"Não é possível adicionar itens a um pedido com status {self.status_pedido}")
+        itens = self._obter_itens()
+        if item.id in itens:
+            raise ValueError(f"Item com ID {item.id} já existe no pedido.")
         
-        self._itens.append(item)
+        itens[item.id] = item
+        self._subtotal_itens += item.quantidade * item.preco_unitario_compra.centavos
         self.data_ultima_atualizacao = datetime.utcnow()
+        alteracoes = self._registrar_alteracao()
+        alteracoes.campos.update(_CAMPOS_ITENS)
+        alteracoes.itens_adicionados[item.id] = item
 
     def remover_item(self, item_id: uuid.UUID):
         if self.status_pedido not in StatusPedido.PODE_MODIFICAR_ITENS:
             raise ValueError(f"Não é possível remover itens de um pedido com status {self.status_pedido}")
         
-        item_encontrado = next((i for i in self._itens if i.id == item_id), None)
+        item_encontrado = self._obter_itens().pop(item_id, None)
         if item_encontrado:
-            self._itens.remove(item_encontrado)
+            self._subtotal_itens -= item_encontrado.quantidade * item_encontrado.preco_unitario_compra.centavos
             self.data_ultima_atualizacao = datetime.utcnow()
+            alteracoes = self._registrar_alteracao()
+            alteracoes.campos.update(_CAMPOS_ITENS)
+            alteracoes.itens_alterados.discard(item_id)
+            # Um item adicionado e removido antes de gravar não gera escrita alguma
+            if alteracoes.itens_adicionados.pop(item_id, None) is None:
+                alteracoes.itens_removidos.add(item_id)
         else:
             raise ValueError(f"Item com ID {item_id} não encontrado no pedido.")
 
+    def buscar_item(self, item_id: uuid.UUID) -> Optional[ItemPedido]:
+        """Retorna o item com o ID informado, ou None (consulta O(1))."""
+        return self._obter_itens().get(item_id)
+
+    def atualizar_quantidade_item(self, item_id: uuid.UUID, nova_quantidade: int):
+        """Altera a quantidade de um item mantendo o subtotal do pedido consistente."""
+        if self.status_pedido not in StatusPedido.PODE_MODIFICAR_ITENS:
+            raise ValueError(f"Não é possível alterar itens de um pedido com status {self.status_pedido}")
+
+        item = self._obter_itens().get(item_id)
+        if item is None:
+            raise ValueError(f"Item com ID {item_id} não encontrado no pedido.")
+        quantidade_anterior = item.quantidade
+        item._definir_quantidade(nova_quantidade)
+        self._subtotal_itens += (item.quantidade - quantidade_anterior) * item.preco_unitario_compra.centavos
+        self.data_ultima_atualizacao = datetime.utcnow()
+        alteracoes = self._registrar_alteracao()
+        alteracoes.campos.update(_CAMPOS_ITENS)
+        if item_id not in alteracoes.itens_adicionados: # Item novo já será gravado por inteiro
+            alteracoes.itens_alterados.add(item_id)
+
     def _atualizar_status(self, novo_status: str):
         if novo_status not in StatusPedido.TODOS_OS_STATUS:
             raise ValueError(f"Novo status do pedido inválido: {novo_status}")
-        
-        # Aqui viria a lógica de máquina de estados para transições válidas
-        # Exemplo muito simples:
-        if self.status_pedido == StatusPedido.ENTREGUE and novo_status!= StatusPedido.ENTREGUE:
-            raise ValueError("Pedido entregue não pode ter seu status alterado (exceto para correções específicas).")
-        if self.status_pedido == StatusPedido.CANCELADO_PELO_CLIENTE and novo_status!= StatusPedido.CANCELADO_PELO_CLIENTE:
-            raise ValueError("Pedido cancelado pelo cliente não pode ter seu status alterado.")
-        if self.status_pedido == StatusPedido.CANCELADO_PELO_RESTAURANTE and novo_status!= StatusPedido.CANCELADO_PELO_RESTAURANTE:
-            raise ValueError("Pedido cancelado pelo restaurante não pode ter seu status alterado.")
-
+        evento = EventoStatusPedido(
+            self.id, self.cliente_id, self.restaurante_id, self.status_pedido, novo_status, datetime.utcnow()
+        )
         self.status_pedido = novo_status
-        self.data_ultima_atualizacao = datetime.utcnow()
+        self.data_ultima_atualizacao = evento.ocorrido_em
+        self._registrar_alteracao().campos.update(_CAMPOS_STATUS)
+        if self._eventos is None:
+            self._eventos = [evento]
+        else:
+            self._eventos.append(evento)
+
+    def _validar_transicao(self, acao: str) -> str:
+        """Retorna o status de destino da ação ou lança ValueError se ela não é permitida."""
+        novo_status = PROXIMO_STATUS.get((self.status_pedido, acao))
+        if novo_status is None:
+            if acao not in TRANSICOES_PEDIDO:
+                raise ValueError(f"Ação de pedido inválida: {acao}")
+            raise ValueError(TRANSICOES_PEDIDO[acao][2].format(status=self.status_pedido))
+        return novo_status
+
+    def pode_transicionar(self, acao: str) -> bool:
+        return (self.status_pedido, acao) in PROXIMO_STATUS
+
+    def transicionar(self, acao: str, **dados):
+        """
+        Executa a ação da máquina de estados. Ações que exigem dados recebem-nos por nome:
+        `entregador_id` para SAIR_PARA_ENTREGA e `motivo` para CANCELAR_PELO_RESTAURANTE.
+        """
+        metodo = _METODO_POR_ACAO.get(acao)
+        if metodo is None:
+            raise ValueError(f"Ação de pedido inválida: {acao}")
+        metodo(self, **dados)
+
+    @staticmethod
+    def validar_transicao_em_lote(pedidos: Iterable["Pedido"], acao: str) -> Tuple[List["Pedido"], List["Pedido"]]:
+        """Separa os pedidos em (permitidos, rejeitados) para a ação, com uma consulta por pedido."""
+        if acao not in ORIGENS_POR_ACAO:
+            raise ValueError(f"Ação de pedido inválida: {acao}")
+        origens = ORIGENS_POR_ACAO[acao]
+        permitidos: List[Pedido] = []
+        rejeitados: List[Pedido] = []
+        for pedido in pedidos:
+            (permitidos if pedido.status_pedido in origens else rejeitados).append(pedido)
+        return permitidos, rejeitados
+
+    @staticmethod
+    def transicionar_em_lote(pedidos: Iterable["Pedido"], acao: str, **dados) -> List["Pedido"]:
+        """Aplica a ação aos pedidos que a permitem e retorna os rejeitados (sem alterá-los)."""
+        permitidos, rejeitados = Pedido.validar_transicao_em_lote(pedidos, acao)
+        metodo = _METODO_POR_ACAO[acao]
+        for pedido in permitidos:
+            metodo(pedido, **dados)
+        return rejeitados
 
     def confirmar_pelo_restaurante(self):
-        if self.status_pedido!= StatusPedido.PENDENTE:
-            raise ValueError(f"Pedido só pode ser confirmado pelo restaurante se estiver PENDENTE. Status atual: {self.status_pedido}")
-        self._atualizar_status(StatusPedido.CONFIRMADO_PELO_RESTAURANTE)
+        self._atualizar_status(self._validar_transicao(AcaoPedido.CONFIRMAR))
 
     def marcar_como_em_preparo(self):
-        if self.status_pedido!= StatusPedido.CONFIRMADO_PELO_RESTAURANTE:
-            raise ValueError(f"Pedido só pode ir para EM PREPARO se estiver CONFIRMADO PELO RESTAURANTE. Status atual: {self.status_pedido}")
-        self._atualizar_status(StatusPedido.EM_PREPARO)
+        self._atualizar_status(self._validar_transicao(AcaoPedido.INICIAR_PREPARO))
     
     def marcar_como_pronto_para_coleta(self):
-        if self.status_pedido!= StatusPedido.EM_PREPARO:
-            raise ValueError(f"Pedido só pode ir para PRONTO PARA COLETA se estiver EM PREPARO. Status atual: {self.status_pedido}")
-        self._atualizar_status(StatusPedido.PRONTO_PARA_COLETA)
+        self._atualizar_status(self._validar_transicao(AcaoPedido.MARCAR_PRONTO))
 
     def marcar_como_saiu_para_entrega(self, entregador_id: uuid.UUID):
-        if self.status_pedido!= StatusPedido.PRONTO_PARA_COLETA: # Ou EM_PREPARO se o restaurante mesmo entrega
-            raise ValueError(f"Pedido só pode SAIR PARA ENTREGA se estiver PRONTO PARA COLETA. Status atual: {self.status_pedido}")
+        novo_status = self._validar_transicao(AcaoPedido.SAIR_PARA_ENTREGA)
         if not entregador_id:
             raise ValueError("ID do entregador é obrigatório para marcar como saiu para entrega.")
         self.entregador_id = entregador_id
-        self._atualizar_status(StatusPedido.SAIU_PARA_ENTREGA)
+        self._registrar_alteracao().campos.add("entregador_id")
+        self._atualizar_status(novo_status)
 
     def marcar_como_entregue(self):
-        if self.status_pedido!= StatusPedido.SAIU_PARA_ENTREGA:
-            raise ValueError(f"Pedido só pode ser marcado como ENTREGUE se estiver SAIU PARA ENTREGA. Status atual: {self.status_pedido}")
-        self._atualizar_status(StatusPedido.ENTREGUE)
+        self._atualizar_status(self._validar_transicao(AcaoPedido.ENTREGAR))
 
     def cancelar_pelo_cliente(self):
-        if self.status_pedido not in StatusPedido.PODE_CANCELAR_PELO_CLIENTE:
-            raise ValueError(f"Pedido com status {self.status_pedido} não pode ser cancelado pelo cliente.")
-        self._atualizar_status(StatusPedido.CANCELADO_PELO_CLIENTE)
+        self._atualizar_status(self._validar_transicao(AcaoPedido.CANCELAR_PELO_CLIENTE))
 
     def cancelar_pelo_restaurante(self, motivo: str): # Restaurante deve fornecer um motivo
-        if self.status_pedido in StatusPedido.STATUS_QUE_NAO_PODEM_SER_CANCELADOS_PELO_RESTAURANTE:
-            raise ValueError(f"Pedido com status {self.status_pedido} não pode ser cancelado pelo restaurante.")
+        novo_status = self._validar_transicao(AcaoPedido.CANCELAR_PELO_RESTAURANTE)
         if not motivo or not motivo.strip():
             raise ValueError("Um motivo é obrigatório para o restaurante cancelar o pedido.")
         # Poderíamos armazenar o 'motivo' em algum lugar
         self.observacoes_gerais = f"Cancelado pelo restaurante: {motivo}" + (f" | {self.observacoes_gerais}" if self.observacoes_gerais else "")
-        self._atualizar_status(StatusPedido.CANCELADO_PELO_RESTAURANTE)
+        self._registrar_alteracao().campos.add("observacoes_gerais")
+        self._atualizar_status(novo_status)
 
     def __eq__(self, other):
         if not isinstance(other, Pedido):
@@ -172,4 +537,15 @@ class Pedido:
         return self.id == other.id
 
     def __hash__(self):
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
+
+
+_METODO_POR_ACAO = {
+    AcaoPedido.CONFIRMAR: Pedido.confirmar_pelo_restaurante,
+    AcaoPedido.INICIAR_PREPARO: Pedido.marcar_como_em_preparo,
+    AcaoPedido.MARCAR_PRONTO: Pedido.marcar_como_pronto_para_coleta,
+    AcaoPedido.SAIR_PARA_ENTREGA: Pedido.marcar_como_saiu_para_entrega,
+    AcaoPedido.ENTREGAR: Pedido.marcar_como_entregue,
+    AcaoPedido.CANCELAR_PELO_CLIENTE: Pedido.cancelar_pelo_cliente,
+    AcaoPedido.CANCELAR_PELO_RESTAURANTE: Pedido.cancelar_pelo_restaurante,
+}
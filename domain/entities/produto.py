@@ -1,21 +1,28 @@
 import uuid
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Iterable, List, Mapping, Optional, Union
+
+from domain.value_objects.dinheiro import Dinheiro
 
 # Futuramente, poderíamos ter uma entidade ou VO para CategoriaProduto
 # from.categoria_produto import CategoriaProduto
 
 class Produto:
+    __slots__ = (
+        "id", "restaurante_id", "nome", "descricao", "preco", "imagem_url", "disponivel",
+        "categoria_produto_id", "categoria_produto_nome", "data_criacao", "data_atualizacao",
+    )
+
     def __init__(self,
                  restaurante_id: uuid.UUID,
                  nome: str,
                  descricao: str,
-                 preco: Decimal,
+                 preco: Union[Dinheiro, Decimal],
                  produto_id: Optional[int] = None,
                  imagem_url: Optional[str] = None,
                  disponivel: bool = True,
-                 # categoria_produto_id: Optional = None, # Se CategoriaProduto for uma entidade
+                 categoria_produto_id: Optional[uuid.UUID] = None, # FK para CategoriaProduto
                  categoria_produto_nome: Optional[str] = None, # Ou um nome de categoria simples
                  data_criacao: Optional[datetime] = None,
                  data_atualizacao: Optional[datetime] = None
@@ -25,21 +32,17 @@ class Produto:
         self.nome: str = nome
         self.descricao: str = descricao
         
-        try:
-            if not isinstance(preco, Decimal):
-                preco = Decimal(str(preco)) # Tenta converter se não for Decimal
-            if preco <= Decimal('0'):
-                raise ValueError("Preço deve ser positivo.")
-            self.preco: Decimal = preco
-        except InvalidOperation:
-            raise ValueError("Formato de preço inválido.")
+        preco = Dinheiro.de_valor(preco) # Converte sem perdas; recusa frações de centavo
+        if preco.centavos <= 0:
+            raise ValueError("Preço deve ser positivo.")
+        self.preco: Dinheiro = preco
             
         self.imagem_url: Optional[str] = imagem_url
         self.disponivel: bool = disponivel
-        # self.categoria_produto_id: Optional = categoria_produto_id
+        self.categoria_produto_id: Optional[uuid.UUID] = categoria_produto_id
         self.categoria_produto_nome: Optional[str] = categoria_produto_nome
         
-        now = datetime.utcnow()
+        now = datetime.utcnow() if data_criacao is None or data_atualizacao is None else None
         self.data_criacao: datetime = data_criacao if data_criacao is not None else now
         self.data_atualizacao: datetime = data_atualizacao if data_atualizacao is not None else now
 
@@ -50,12 +53,37 @@ class Produto:
             raise ValueError("Nome do produto não pode ser vazio.")
         # Descrição pode ser vazia, mas não None se for obrigatória (ajustar conforme regra)
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["Produto"]:
+        """
+        Reidrata produtos em lote a partir de linhas confiáveis, sem revalidar os campos.
+        `preco` pode vir como Dinheiro ou como o Decimal da coluna do banco.
+        """
+        novo = object.__new__
+        de_valor = Dinheiro.de_valor
+        produtos = []
+        for row in rows:
+            produto = novo(cls)
+            produto.id = row["id"]
+            produto.restaurante_id = row["restaurante_id"]
+            produto.nome = row["nome"]
+            produto.descricao = row["descricao"]
+            produto.preco = de_valor(row["preco"])
+            produto.imagem_url = row.get("imagem_url")
+            produto.disponivel = row.get("disponivel", True)
+            produto.categoria_produto_id = row.get("categoria_produto_id")
+            produto.categoria_produto_nome = row.get("categoria_produto_nome")
+            produto.data_criacao = row["data_criacao"]
+            produto.data_atualizacao = row.get("data_atualizacao", row["data_criacao"])
+            produtos.append(produto)
+        return produtos
+
     def atualizar_detalhes(self,
                            nome: Optional[str] = None,
                            descricao: Optional[str] = None,
-                           preco: Optional[float] = None,
+                           preco: Optional[Union[Dinheiro, Decimal]] = None,
                            imagem_url: Optional[str] = None,
-                           # categoria_produto_id: Optional = None,
+                           categoria_produto_id: Optional[uuid.UUID] = None,
                            categoria_produto_nome: Optional[str] = None
                            ):
         """Atualiza os detalhes do produto."""
@@ -66,18 +94,14 @@ class Produto:
         if descricao is not None:
             self.descricao = descricao # Permitir descrição vazia se for o caso
         if preco is not None:
-            try:
-                if not isinstance(preco, Decimal):
-                    preco = Decimal(str(preco))
-                if preco <= Decimal('0'):
-                    raise ValueError("Preço deve ser positivo ao atualizar.")
-                self.preco = preco
-            except InvalidOperation:
-                raise ValueError("Formato de preço inválido ao atualizar.")
+            preco = Dinheiro.de_valor(preco)
+            if preco.centavos <= 0:
+                raise ValueError("Preço deve ser positivo ao atualizar.")
+            self.preco = preco
         if imagem_url is not None: # Permitir definir como None para remover imagem
             self.imagem_url = imagem_url
-        # if categoria_produto_id is not None:
-        #     self.categoria_produto_id = categoria_produto_id
+        if categoria_produto_id is not None:
+            self.categoria_produto_id = categoria_produto_id
         if categoria_produto_nome is not None:
             self.categoria_produto_nome = categoria_produto_nome
             
@@ -1,13 +1,20 @@
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 from domain.value_objects.endereco import Endereco
+from domain.value_objects.horario_semanal import HorarioSemanal
 
 # Futuramente, poderíamos ter uma entidade ou VO para CategoriaRestaurante
 # from.categoria_restaurante import CategoriaRestaurante
 
 class Restaurante:
+    __slots__ = (
+        "id", "nome_fantasia", "cnpj", "email_contato", "endereco", "categorias",
+        "horario_funcionamento", "tempo_medio_preparo_min", "ativo", "data_criacao",
+        "_horario_texto", "_horario_do_texto", # Texto informado e o HorarioSemanal interpretado dele
+    )
+
     def __init__(self,
                  nome_fantasia: str,
                  cnpj: str, # Adicionar validação de formato de CNPJ posteriormente
@@ -15,7 +22,7 @@ class Restaurante:
                  endereco: Endereco,
                  restaurante_id: Optional[int] = None,
                  categorias: Optional[List[str]] = None, # Simples lista de strings por enquanto
-                 horario_funcionamento: Optional[str] = "08:00-22:00", # Exemplo simples
+                 horario_funcionamento: Optional[Union[str, HorarioSemanal]] = "08:00-22:00", # Texto ou HorarioSemanal
                  tempo_medio_preparo_min: Optional[int] = 30,
                  ativo: bool = True,
                  data_criacao: Optional[datetime] = None
@@ -26,7 +33,9 @@ class Restaurante:
         self.email_contato: str = email_contato
         self.endereco: Endereco = endereco
         self.categorias: List[str] = categorias if categorias is not None else []
-        self.horario_funcionamento: Optional[str] = horario_funcionamento
+        self.horario_funcionamento: Optional[HorarioSemanal] = self._converter_horario(horario_funcionamento)
+        self._horario_texto: Optional[str] = horario_funcionamento if isinstance(horario_funcionamento, str) else None
+        self._horario_do_texto: Optional[HorarioSemanal] = self.horario_funcionamento
         self.tempo_medio_preparo_min: Optional[int] = tempo_medio_preparo_min
         self.ativo: bool = ativo
         self.data_criacao: datetime = data_criacao if data_criacao is not None else datetime.utcnow()
@@ -41,6 +50,66 @@ class Restaurante:
         if not isinstance(endereco, Endereco):
             raise TypeError("Endereço deve ser um objeto Endereco válido.")
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]]) -> List["Restaurante"]:
+        """
+        Reidrata restaurantes em lote a partir de linhas confiáveis, sem revalidar os campos.
+        `horario_funcionamento` pode vir como texto (interpretado uma vez por texto distinto);
+        texto livre gravado antes do formato estruturado ("Seg a Sex, 8h às 18h") é mantido em
+        `horario_funcionamento_texto`, com `horario_funcionamento` None (horário desconhecido).
+        """
+        novo = object.__new__
+        converter_horario = cls._converter_horario_salvo
+        restaurantes = []
+        for row in rows:
+            restaurante = novo(cls)
+            restaurante.id = row["id"]
+            restaurante.nome_fantasia = row["nome_fantasia"]
+            restaurante.cnpj = row["cnpj"]
+            restaurante.email_contato = row["email_contato"]
+            restaurante.endereco = row["endereco"]
+            restaurante.categorias = list(row.get("categorias", ()))
+            horario = row.get("horario_funcionamento", "08:00-22:00")
+            restaurante.horario_funcionamento = converter_horario(horario)
+            restaurante._horario_texto = horario if isinstance(horario, str) else None
+            restaurante._horario_do_texto = restaurante.horario_funcionamento
+            restaurante.tempo_medio_preparo_min = row.get("tempo_medio_preparo_min", 30)
+            restaurante.ativo = row.get("ativo", True)
+            restaurante.data_criacao = row["data_criacao"]
+            restaurantes.append(restaurante)
+        return restaurantes
+
+    @staticmethod
+    def _converter_horario(horario: Optional[Union[str, HorarioSemanal]]) -> Optional[HorarioSemanal]:
+        if horario is None or isinstance(horario, HorarioSemanal):
+            return horario
+        return HorarioSemanal.de_texto(horario)
+
+    @staticmethod
+    def _converter_horario_salvo(horario: Optional[Union[str, HorarioSemanal]]) -> Optional[HorarioSemanal]:
+        # Dados já gravados não são revalidados: o que não for interpretável fica desconhecido.
+        # A validação estrita é feita na criação e na atualização (_converter_horario).
+        try:
+            return Restaurante._converter_horario(horario)
+        except ValueError:
+            return None
+
+    @property
+    def horario_funcionamento_texto(self) -> Optional[str]:
+        """
+        Horário como texto, para quem consumia `horario_funcionamento` quando era str (DTOs,
+        serialização): o texto informado (mesmo que não interpretável), ou a forma canônica
+        de um HorarioSemanal.
+        """
+        # O texto só vale enquanto horario_funcionamento for o que foi interpretado dele
+        if self._horario_texto is not None and self._horario_do_texto is self.horario_funcionamento:
+            return self._horario_texto
+        return None if self.horario_funcionamento is None else str(self.horario_funcionamento)
+
+    def aberto_em(self, momento: datetime) -> bool:
+        """Ativo e dentro do horário de funcionamento (sem horário definido, considera fechado)."""
+        return self.ativo and self.horario_funcionamento is not None and self.horario_funcionamento.aberto_em(momento)
+
     def ativar(self):
         """Ativa o restaurante para receber pedidos."""
         self.ativo = True
@@ -49,8 +118,10 @@ class Restaurante:
         """Desativa o restaurante (não recebe mais pedidos)."""
         self.ativo = False
 
-    def atualizar_horario_funcionamento(self, novo_horario: str):
-        self.horario_funcionamento = novo_horario
+    def atualizar_horario_funcionamento(self, novo_horario: Union[str, HorarioSemanal]):
+        self.horario_funcionamento = self._converter_horario(novo_horario)
+        self._horario_texto = novo_horario if isinstance(novo_horario, str) else None
+        self._horario_do_texto = self.horario_funcionamento
 
     def adicionar_categoria(self, categoria: str):
         if categoria and categoria.strip() and categoria not in self.categorias:
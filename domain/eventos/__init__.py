@@ -0,0 +1,2 @@
+# delivery_api_project/domain/eventos/__init__.py
+from.evento_status_pedido import EventoStatusPedido
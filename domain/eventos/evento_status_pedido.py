@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+class EventoStatusPedido:
+    """
+    Mudança de status de um Pedido (fato de negócio publicado após a gravação).
+
+    Criado a cada transição, por isso é uma classe com __slots__ (e não uma dataclass
+    congelada) e não gera UUID próprio: como a máquina de estados de Pedido nunca volta a
+    um status já visitado, (pedido_id, novo_status) identifica o evento e serve de chave de
+    idempotência para os consumidores.
+    """
+
+    __slots__ = ("pedido_id", "cliente_id", "restaurante_id", "status_anterior", "novo_status", "ocorrido_em")
+
+    def __init__(self,
+                 pedido_id: uuid.UUID,
+                 cliente_id: uuid.UUID,
+                 restaurante_id: uuid.UUID,
+                 status_anterior: str,
+                 novo_status: str,
+                 ocorrido_em: datetime):
+        self.pedido_id = pedido_id
+        self.cliente_id = cliente_id
+        self.restaurante_id = restaurante_id
+        self.status_anterior = status_anterior
+        self.novo_status = novo_status
+        self.ocorrido_em = ocorrido_em
+
+    @property
+    def chave(self) -> Tuple[uuid.UUID, str]:
+        return (self.pedido_id, self.novo_status)
+
+    def __eq__(self, other):
+        if not isinstance(other, EventoStatusPedido):
+            return False
+        return self.chave == other.chave
+
+    def __hash__(self):
+        return hash(self.chave)
+
+    def __repr__(self) -> str:
+        return (f"EventoStatusPedido(pedido_id={self.pedido_id}, "
+                f"{self.status_anterior} -> {self.novo_status}, ocorrido_em={self.ocorrido_em.isoformat()})")
@@ -1,3 +1,5 @@
 # delivery_api_project/domain/value_objects/__init__.py
 from.endereco import Endereco
-
+from.coordenada_geo import CoordenadaGeo
+from.dinheiro import Dinheiro
+from.horario_semanal import HorarioSemanal
@@ -0,0 +1,23 @@
+import math
+from dataclasses import dataclass
+
+RAIO_TERRA_KM = 6371.0088 # Raio médio da Terra
+
+@dataclass(frozen=True)
+class CoordenadaGeo:
+    latitude: float
+    longitude: float
+
+    def __post_init__(self):
+        if not -90.0 <= self.latitude <= 90.0:
+            raise ValueError("Latitude deve estar entre -90 e 90.")
+        if not -180.0 <= self.longitude <= 180.0:
+            raise ValueError("Longitude deve estar entre -180 e 180.")
+
+    def distancia_km(self, outra: "CoordenadaGeo") -> float:
+        """Distância em linha reta (fórmula de haversine) até outra coordenada."""
+        lat1, lon1 = math.radians(self.latitude), math.radians(self.longitude)
+        lat2, lon2 = math.radians(outra.latitude), math.radians(outra.longitude)
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+        return 2 * RAIO_TERRA_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,213 @@
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import List, Optional, Sequence, Tuple, Union
+
+ValorMonetario = Union["Dinheiro", Decimal, int, str, float]
+
+
+class Dinheiro:
+    """
+    Valor monetário em centavos inteiros (imutável).
+
+    Somas, subtrações e multiplicações por quantidade são exatas e feitas em `int`. A
+    conversão de Decimal/str/int (em reais) é sem perdas: valores com frações de centavo
+    são recusados, a menos que um modo de arredondamento seja informado explicitamente.
+    Operações que podem gerar frações de centavo (`multiplicar`, `ratear`) têm regras de
+    arredondamento definidas, de modo que nada se perde nem se cria nas somas.
+
+    Comparações, somas e subtrações também aceitam Decimal e int (em reais), para que código
+    que ainda trata valores como Decimal continue correto: `Dinheiro("5.00") == Decimal("5")`
+    é verdadeiro e `Decimal("1.50") + Dinheiro("2.00")` resulta em `Dinheiro("3.50")`. Um
+    operando com frações de centavo em soma/subtração gera ValueError em vez de arredondar.
+    """
+
+    __slots__ = ("centavos",)
+
+    def __init__(self, valor: ValorMonetario = 0, arredondamento: Optional[str] = None):
+        _atribuir(self, _centavos_de(valor, arredondamento))
+
+    @classmethod
+    def de_centavos(cls, centavos: int) -> "Dinheiro":
+        if type(centavos) is not int:
+            raise TypeError("Centavos devem ser um inteiro.")
+        return _novo(centavos)
+
+    @classmethod
+    def de_valor(cls, valor: ValorMonetario, arredondamento: Optional[str] = None) -> "Dinheiro":
+        """Como o construtor, mas devolve o próprio objeto se `valor` já for Dinheiro."""
+        if type(valor) is Dinheiro:
+            return valor
+        return _novo(_centavos_de(valor, arredondamento))
+
+    def para_decimal(self) -> Decimal:
+        """Valor em reais com exatamente duas casas (ex.: para DTOs e para o banco)."""
+        return Decimal(self.centavos).scaleb(-2)
+
+    def multiplicar(self, fator: Union[Decimal, int, str], arredondamento: str = ROUND_HALF_UP) -> "Dinheiro":
+        """Multiplica por um fator qualquer (ex.: percentual de desconto), arredondando ao centavo."""
+        if type(fator) is int:
+            return _novo(self.centavos * fator)
+        try:
+            produto = Decimal(self.centavos) * Decimal(str(fator))
+        except InvalidOperation:
+            raise ValueError(f"Fator inválido: {fator}")
+        return _novo(int(produto.to_integral_value(rounding=arredondamento)))
+
+    def ratear(self, pesos: Union[int, Sequence[int]]) -> List["Dinheiro"]:
+        """
+        Divide o valor em partes (iguais, ou proporcionais a `pesos` inteiros) cuja soma é
+        exatamente o valor original: os centavos que sobram vão, um a um, para as primeiras
+        partes.
+        """
+        if isinstance(pesos, int):
+            pesos = [1] * pesos
+        total_pesos = sum(pesos)
+        if not pesos or total_pesos <= 0 or any(peso < 0 for peso in pesos):
+            raise ValueError("Pesos do rateio devem ser não negativos e somar um valor positivo.")
+        partes = [self.centavos * peso // total_pesos for peso in pesos]
+        sobra = self.centavos - sum(partes)
+        for indice in range(sobra):
+            partes[indice % len(partes)] += 1
+        return [_novo(parte) for parte in partes]
+
+    def __add__(self, outro: ValorMonetario) -> "Dinheiro":
+        if type(outro) is Dinheiro:
+            return _novo(self.centavos + outro.centavos)
+        centavos = _centavos_operando(outro)
+        return NotImplemented if centavos is None else _novo(self.centavos + centavos)
+
+    # Também permite sum(valores) sem valor inicial e acumuladores Decimal (total += dinheiro)
+    __radd__ = __add__
+
+    def __sub__(self, outro: ValorMonetario) -> "Dinheiro":
+        if type(outro) is Dinheiro:
+            return _novo(self.centavos - outro.centavos)
+        centavos = _centavos_operando(outro)
+        return NotImplemented if centavos is None else _novo(self.centavos - centavos)
+
+    def __rsub__(self, outro: ValorMonetario) -> "Dinheiro":
+        centavos = _centavos_operando(outro)
+        return NotImplemented if centavos is None else _novo(centavos - self.centavos)
+
+    def __mul__(self, quantidade: int) -> "Dinheiro":
+        if type(quantidade) is not int:
+            return NotImplemented # Fatores não inteiros: use multiplicar, que arredonda explicitamente
+        return _novo(self.centavos * quantidade)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Dinheiro":
+        return _novo(-self.centavos)
+
+    def __bool__(self) -> bool:
+        return self.centavos != 0
+
+    # Comparações com Decimal/int são exatas (por fração), sem arredondar nem recusar o outro lado
+    def __eq__(self, outro) -> bool:
+        if type(outro) is Dinheiro:
+            return self.centavos == outro.centavos
+        fracao = _fracao_em_centavos(outro)
+        return NotImplemented if fracao is None else self.centavos * fracao[1] == fracao[0]
+
+    def __lt__(self, outro: ValorMonetario) -> bool:
+        if type(outro) is Dinheiro:
+            return self.centavos < outro.centavos
+        fracao = _fracao_em_centavos(outro)
+        return NotImplemented if fracao is None else self.centavos * fracao[1] < fracao[0]
+
+    def __le__(self, outro: ValorMonetario) -> bool:
+        if type(outro) is Dinheiro:
+            return self.centavos <= outro.centavos
+        fracao = _fracao_em_centavos(outro)
+        return NotImplemented if fracao is None else self.centavos * fracao[1] <= fracao[0]
+
+    def __gt__(self, outro: ValorMonetario) -> bool:
+        if type(outro) is Dinheiro:
+            return self.centavos > outro.centavos
+        fracao = _fracao_em_centavos(outro)
+        return NotImplemented if fracao is None else self.centavos * fracao[1] > fracao[0]
+
+    def __ge__(self, outro: ValorMonetario) -> bool:
+        if type(outro) is Dinheiro:
+            return self.centavos >= outro.centavos
+        fracao = _fracao_em_centavos(outro)
+        return NotImplemented if fracao is None else self.centavos * fracao[1] >= fracao[0]
+
+    def __hash__(self) -> int:
+        # Igual ao hash do Decimal/int de mesmo valor, já que __eq__ os considera iguais
+        return hash(self.para_decimal())
+
+    def __setattr__(self, atributo, valor):
+        raise AttributeError("Dinheiro é imutável.")
+
+    def __reduce__(self):
+        return (Dinheiro.de_centavos, (self.centavos,))
+
+    def __str__(self) -> str:
+        sinal = "-" if self.centavos < 0 else ""
+        reais, centavos = divmod(abs(self.centavos), 100)
+        return f"{sinal}{reais}.{centavos:02d}"
+
+    def __repr__(self) -> str:
+        return f"Dinheiro('{self}')"
+
+
+# Criação sem passar pelo __init__ nem pelo __setattr__ bloqueado
+_atribuir = Dinheiro.centavos.__set__
+_criar = object.__new__
+
+
+def _novo(centavos: int) -> Dinheiro:
+    dinheiro = _criar(Dinheiro)
+    _atribuir(dinheiro, centavos)
+    return dinheiro
+
+
+def _centavos_operando(outro) -> Optional[int]:
+    """Centavos de um operando aritmético aceito (int ou Decimal); None para os demais tipos."""
+    tipo = type(outro)
+    if tipo is int:
+        return outro * 100
+    if tipo is Decimal:
+        return _centavos_de(outro, None)
+    return None
+
+
+def _fracao_em_centavos(outro) -> Optional[Tuple[int, int]]:
+    """(numerador, denominador) exatos de `outro` em centavos, para comparação; None se não comparável."""
+    tipo = type(outro)
+    if tipo is int:
+        return outro * 100, 1
+    if tipo is Decimal and outro.is_finite():
+        numerador, denominador = outro.as_integer_ratio()
+        return numerador * 100, denominador
+    return None
+
+
+def _centavos_de(valor: ValorMonetario, arredondamento: Optional[str]) -> int:
+    tipo = type(valor)
+    if tipo is Dinheiro:
+        return valor.centavos
+    if tipo is int:
+        return valor * 100
+    if tipo is bool:
+        raise ValueError("Formato de valor monetário inválido.")
+    if tipo is str:
+        # Caminho rápido para o formato usual da API ("12.90", "7", "0.5"), sem passar por Decimal
+        reais, _, fracao = valor.partition(".")
+        if reais.isdecimal() and len(fracao) <= 2 and (fracao.isdecimal() or not fracao):
+            return int(reais) * 100 + int(fracao.ljust(2, "0"))
+    try:
+        decimal = valor if tipo is Decimal else Decimal(str(valor))
+        # Fração exata: NaN e infinito são recusados aqui
+        numerador, denominador = decimal.as_integer_ratio()
+    except (InvalidOperation, ValueError, OverflowError):
+        raise ValueError(f"Formato de valor monetário inválido: {valor!r}")
+    centavos, resto = divmod(numerador * 100, denominador)
+    if resto:
+        if arredondamento is None:
+            raise ValueError(f"Valor {valor} possui frações de centavo.")
+        return int(decimal.scaleb(2).to_integral_value(rounding=arredondamento))
+    return centavos
+
+
+ZERO = Dinheiro.de_centavos(0)
@@ -1,8 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional
 
-# Futuramente, poderíamos ter um Value Object CoordenadaGeo
-# from.coordenada_geo import CoordenadaGeo
+from.coordenada_geo import CoordenadaGeo
 
 @dataclass(frozen=True) # frozen=True torna a classe imutável
 class Endereco:
@@ -15,7 +14,7 @@ class Endereco:
 
     # Atributos opcionais devem vir depois dos obrigatórios ou ter um valor padrão
     complemento: Optional[str] = None
-    # coordenadas: Optional[CoordenadaGeo] = None # Para geolocalização
+    coordenadas: Optional[CoordenadaGeo] = None # Para geolocalização
 
     def __post_init__(self):
         # Validações podem ser adicionadas aqui para garantir a integridade do objeto
@@ -32,6 +31,8 @@ class Endereco:
             raise ValueError("Estado (UF) inválido.")
         if not self.cep.strip(): # Validação de CEP poderia ser mais robusta (formato)
             raise ValueError("CEP não pode ser vazio.")
+        if self.coordenadas is not None and not isinstance(self.coordenadas, CoordenadaGeo):
+            raise TypeError("Coordenadas devem ser um objeto CoordenadaGeo válido.")
 
     def formatar_endereco_completo(self) -> str:
         """Retorna uma string formatada do endereço completo."""
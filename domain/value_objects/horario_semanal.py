@@ -0,0 +1,148 @@
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+MINUTOS_DIA = 24 * 60
+MINUTOS_SEMANA = 7 * MINUTOS_DIA
+
+# Índices como em datetime.weekday(): segunda = 0
+DIAS_SEMANA = ("seg", "ter", "qua", "qui", "sex", "sab", "dom")
+_INDICE_DIA = {dia: indice for indice, dia in enumerate(DIAS_SEMANA)}
+_INDICE_DIA["sáb"] = _INDICE_DIA["sab"]
+
+_TURNO = re.compile(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$")
+_GRUPO = re.compile(r"^(?:(\D+?)\s+)?(\d.*)$") # Dias opcionais seguidos dos turnos
+
+Intervalo = Tuple[int, int]
+
+
+def minuto_da_semana(momento: datetime) -> int:
+    """Minuto desde segunda-feira 00:00, pelo horário de parede de `momento`."""
+    return momento.weekday() * MINUTOS_DIA + momento.hour * 60 + momento.minute
+
+
+@dataclass(frozen=True)
+class HorarioSemanal:
+    """
+    Horário de funcionamento semanal, compilado em intervalos [início, fim) de minutos da
+    semana (segunda 00:00 = 0), ordenados, disjuntos e já mesclados.
+
+    Turnos que passam da meia-noite (ex.: 18:00-02:00) e turnos divididos (ex.:
+    11:00-15:00,18:00-23:00) viram intervalos comuns; o turno de domingo que passa da
+    meia-noite é dividido no fim da semana. Os horários são os do local do restaurante.
+
+    Formato textual (`de_texto`): grupos separados por ";", cada um com dias opcionais
+    ("seg-sex", "sab,dom"; sem dias vale para todos) e turnos separados por ",":
+        "08:00-22:00"
+        "seg-sex 11:00-15:00,18:00-23:00; sab,dom 18:00-02:00"
+    """
+    intervalos: Tuple[Intervalo, ...]
+
+    def __post_init__(self):
+        anterior_fim = -1
+        for inicio, fim in self.intervalos:
+            if not 0 <= inicio < fim <= MINUTOS_SEMANA or inicio <= anterior_fim:
+                raise ValueError("Intervalos do horário devem estar ordenados, disjuntos e dentro da semana.")
+            anterior_fim = fim
+
+    @classmethod
+    def de_intervalos(cls, intervalos: Iterable[Intervalo]) -> "HorarioSemanal":
+        """Normaliza intervalos de minutos da semana (fim pode passar do fim da semana)."""
+        partes: List[Intervalo] = []
+        for inicio, fim in intervalos:
+            if fim <= inicio:
+                raise ValueError("Fim do turno deve ser posterior ao início.")
+            duracao = fim - inicio
+            if duracao >= MINUTOS_SEMANA:
+                return cls(((0, MINUTOS_SEMANA),))
+            inicio %= MINUTOS_SEMANA
+            fim = inicio + duracao
+            if fim > MINUTOS_SEMANA:
+                partes.append((0, fim - MINUTOS_SEMANA))
+                fim = MINUTOS_SEMANA
+            partes.append((inicio, fim))
+        partes.sort()
+        mescladas: List[Intervalo] = []
+        for inicio, fim in partes:
+            if mescladas and inicio <= mescladas[-1][1]:
+                if fim > mescladas[-1][1]:
+                    mescladas[-1] = (mescladas[-1][0], fim)
+            else:
+                mescladas.append((inicio, fim))
+        return cls(tuple(mescladas))
+
+    @classmethod
+    def de_texto(cls, texto: str) -> "HorarioSemanal":
+        """Interpreta o formato textual; textos iguais compartilham o mesmo objeto (cache)."""
+        return _de_texto(texto.strip().lower())
+
+    @property
+    def sempre_aberto(self) -> bool:
+        return self.intervalos == ((0, MINUTOS_SEMANA),)
+
+    def aberto_no_minuto(self, minuto: int) -> bool:
+        intervalos = self.intervalos
+        posicao = bisect_right(intervalos, (minuto, MINUTOS_SEMANA + 1)) - 1
+        return posicao >= 0 and minuto < intervalos[posicao][1]
+
+    def aberto_em(self, momento: datetime) -> bool:
+        return self.aberto_no_minuto(minuto_da_semana(momento))
+
+    def __str__(self) -> str:
+        # Um turno por dia e por intervalo, cortado à meia-noite: de_texto(str(h)) == h
+        grupos = []
+        for inicio, fim in self.intervalos:
+            while inicio < fim:
+                dia, minuto = divmod(inicio, MINUTOS_DIA)
+                fim_do_dia = min(fim, (dia + 1) * MINUTOS_DIA)
+                grupos.append(f"{DIAS_SEMANA[dia]} {_hora(minuto)}-{_hora(fim_do_dia - dia * MINUTOS_DIA)}")
+                inicio = fim_do_dia
+        return "; ".join(grupos)
+
+
+def _hora(minuto: int) -> str:
+    return f"{minuto // 60:02d}:{minuto % 60:02d}"
+
+
+def _minuto(horas: str, minutos: str, permite_24h: bool) -> int:
+    valor = int(horas) * 60 + int(minutos)
+    if int(minutos) >= 60 or valor > MINUTOS_DIA or (valor == MINUTOS_DIA and not permite_24h):
+        raise ValueError(f"Hora inválida: {horas}:{minutos}")
+    return valor
+
+
+def _dias(especificacao: str) -> List[int]:
+    dias: List[int] = []
+    for parte in especificacao.split(","):
+        primeiro, _, ultimo = (dia.strip() for dia in parte.partition("-"))
+        if primeiro not in _INDICE_DIA or (ultimo and ultimo not in _INDICE_DIA):
+            raise ValueError(f"Dia da semana inválido: {parte.strip()}")
+        inicio = _INDICE_DIA[primeiro]
+        quantidade = (_INDICE_DIA[ultimo] - inicio) % 7 + 1 if ultimo else 1 # "sex-seg" atravessa o domingo
+        dias.extend((inicio + deslocamento) % 7 for deslocamento in range(quantidade))
+    return dias
+
+
+@lru_cache(maxsize=1024)
+def _de_texto(texto: str) -> HorarioSemanal:
+    intervalos: List[Intervalo] = []
+    for grupo in filter(None, (g.strip() for g in texto.split(";"))):
+        correspondencia = _GRUPO.match(grupo)
+        if correspondencia is None:
+            raise ValueError(f"Horário inválido: {grupo}")
+        especificacao, turnos = correspondencia.groups()
+        dias = _dias(especificacao) if especificacao else range(7)
+        for turno in turnos.split(","):
+            correspondencia = _TURNO.match(turno.strip())
+            if correspondencia is None:
+                raise ValueError(f"Turno inválido: {turno.strip()} (use HH:MM-HH:MM)")
+            h1, m1, h2, m2 = correspondencia.groups()
+            inicio, fim = _minuto(h1, m1, False), _minuto(h2, m2, True)
+            if fim <= inicio:
+                fim += MINUTOS_DIA # Turno que passa da meia-noite
+            for dia in dias:
+                intervalos.append((dia * MINUTOS_DIA + inicio, dia * MINUTOS_DIA + fim))
+    return HorarioSemanal.de_intervalos(intervalos)
@@ -0,0 +1,3 @@
+# delivery_api_project/infrastructure/cache/__init__.py
+from.cache_lru_ttl import CacheLRUComTTL, EstatisticasCache
+from.repositories_com_cache import ProdutoRepositoryComCache, CategoriaProdutoRepositoryComCache
@@ -0,0 +1,125 @@
+# delivery_api_project/infrastructure/cache/cache_lru_ttl.py
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Set, Tuple, TypeVar
+
+V = TypeVar("V")
+
+_AUSENTE = object()
+
+
+@dataclass
+class EstatisticasCache:
+    acertos: int = 0
+    falhas: int = 0
+    despejos: int = 0     # Entradas removidas por exceder o tamanho máximo (LRU)
+    expiracoes: int = 0   # Entradas descartadas por TTL vencido
+    invalidacoes: int = 0 # Entradas removidas por escrita no repositório
+
+    @property
+    def taxa_acerto(self) -> float:
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+
+class CacheLRUComTTL(Generic[V]):
+    """
+    Cache LRU limitado por quantidade de entradas e com tempo de vida (TTL) por entrada.
+
+    Cada chave pertence a um grupo (ex.: o restaurante_id), permitindo invalidar de uma vez
+    todas as entradas do grupo. Cada grupo tem uma geração, renovada a cada invalidação,
+    que permite descartar resultados calculados antes de uma escrita concorrente.
+    """
+
+    def __init__(self,
+                 tamanho_maximo: int = 1024,
+                 ttl_segundos: float = 60.0,
+                 relogio: Callable[[], float] = time.monotonic):
+        if tamanho_maximo <= 0:
+            raise ValueError("Tamanho máximo do cache deve ser positivo.")
+        if ttl_segundos <= 0:
+            raise ValueError("TTL do cache deve ser positivo.")
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl_segundos = ttl_segundos
+        self._relogio = relogio
+        self._entradas: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._chaves_por_grupo: Dict[Hashable, Set[Hashable]] = {}
+        self._grupo_da_chave: Dict[Hashable, Hashable] = {}
+        self._geracoes: Dict[Hashable, int] = {}
+        self._ultima_geracao = 0
+        self._geracao_minima = 0 # Geração dos grupos sem registro em _geracoes
+        self.estatisticas = EstatisticasCache()
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obter(self, chave: Hashable) -> Any:
+        """Retorna o valor da chave ou o sentinela de ausência (ver `contem_valor`)."""
+        entrada = self._entradas.get(chave)
+        if entrada is None:
+            self.estatisticas.falhas += 1
+            return _AUSENTE
+        expira_em, valor = entrada
+        if expira_em <= self._relogio():
+            self._remover(chave)
+            self.estatisticas.expiracoes += 1
+            self.estatisticas.falhas += 1
+            return _AUSENTE
+        self._entradas.move_to_end(chave)
+        self.estatisticas.acertos += 1
+        return valor
+
+    @staticmethod
+    def contem_valor(resultado: Any) -> bool:
+        return resultado is not _AUSENTE
+
+    def geracao(self, grupo: Hashable) -> int:
+        return self._geracoes.get(grupo, self._geracao_minima)
+
+    def armazenar(self, grupo: Hashable, chave: Hashable, valor: V, geracao: Optional[int] = None):
+        """Armazena o valor; se `geracao` não for mais a atual do grupo, o valor é descartado."""
+        if geracao is not None and geracao != self.geracao(grupo):
+            return
+        if chave in self._entradas:
+            self._remover(chave)
+        self._entradas[chave] = (self._relogio() + self.ttl_segundos, valor)
+        self._chaves_por_grupo.setdefault(grupo, set()).add(chave)
+        self._grupo_da_chave[chave] = grupo
+        while len(self._entradas) > self.tamanho_maximo:
+            mais_antiga = next(iter(self._entradas))
+            self._remover(mais_antiga)
+            self.estatisticas.despejos += 1
+
+    def invalidar_grupo(self, grupo: Hashable):
+        self._ultima_geracao += 1
+        self._geracoes[grupo] = self._ultima_geracao
+        for chave in self._chaves_por_grupo.pop(grupo, ()):
+            del self._entradas[chave]
+            del self._grupo_da_chave[chave]
+            self.estatisticas.invalidacoes += 1
+        if len(self._geracoes) > self.tamanho_maximo:
+            self._podar_geracoes()
+
+    def limpar(self):
+        for grupo in list(self._chaves_por_grupo):
+            self.invalidar_grupo(grupo)
+
+    def _podar_geracoes(self):
+        """
+        Esquece as gerações dos grupos sem entradas no cache (com grupos por id, cresceriam
+        sem limite). Esses grupos passam a ter a geração mínima, elevada à maior esquecida:
+        um resultado calculado antes da poda é recusado (custa uma falha a mais), nunca
+        aceito com dados anteriores a uma invalidação.
+        """
+        for grupo in [grupo for grupo in self._geracoes if grupo not in self._chaves_por_grupo]:
+            self._geracao_minima = max(self._geracao_minima, self._geracoes.pop(grupo))
+
+    def _remover(self, chave: Hashable):
+        del self._entradas[chave]
+        grupo = self._grupo_da_chave.pop(chave)
+        chaves = self._chaves_por_grupo[grupo]
+        chaves.discard(chave)
+        if not chaves:
+            del self._chaves_por_grupo[grupo]
@@ -0,0 +1,134 @@
+# delivery_api_project/infrastructure/cache/repositories_com_cache.py
+
+import uuid
+from typing import List, Optional
+
+from application.interfaces.i_categoria_produto_repository import ICategoriaProdutoRepository
+from application.interfaces.i_produto_repository import IProdutoRepository
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.produto import Produto
+from infrastructure.cache.cache_lru_ttl import CacheLRUComTTL
+
+
+class ProdutoRepositoryComCache(IProdutoRepository):
+    """
+    Decorador de IProdutoRepository que mantém em cache as listagens do cardápio.
+
+    As chaves são agrupadas por restaurante_id: qualquer `salvar` ou `deletar` de um produto
+    (ex.: após `atualizar_detalhes` ou `marcar_como_indisponivel`) invalida todas as
+    listagens em cache daquele restaurante.
+    """
+
+    def __init__(self, repositorio: IProdutoRepository, cache: Optional[CacheLRUComTTL] = None):
+        self._repositorio = repositorio
+        self.cache: CacheLRUComTTL[List[Produto]] = cache if cache is not None else CacheLRUComTTL()
+
+    async def salvar(self, produto: Produto) -> Produto:
+        # restaurante_id não muda após a criação, então basta invalidar o cardápio atual
+        produto_salvo = await self._repositorio.salvar(produto)
+        self.cache.invalidar_grupo(produto_salvo.restaurante_id)
+        return produto_salvo
+
+    async def salvar_em_lote(self, produtos: List[Produto]) -> List[Produto]:
+        produtos_salvos = await self._repositorio.salvar_em_lote(produtos)
+        for restaurante_id in {produto.restaurante_id for produto in produtos_salvos}:
+            self.cache.invalidar_grupo(restaurante_id)
+        return produtos_salvos
+
+    async def buscar_por_id(self, produto_id: uuid.UUID) -> Optional[Produto]:
+        return await self._repositorio.buscar_por_id(produto_id)
+
+    async def buscar_por_ids(self, produto_ids: List[uuid.UUID]) -> List[Produto]:
+        return await self._repositorio.buscar_por_ids(produto_ids)
+
+    async def listar_por_restaurante_id(
+        self,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Produto]:
+        chave = ("restaurante", restaurante_id, disponivel_apenas, skip, limit)
+        em_cache = self.cache.obter(chave)
+        if self.cache.contem_valor(em_cache):
+            return list(em_cache)
+
+        geracao = self.cache.geracao(restaurante_id)
+        produtos = await self._repositorio.listar_por_restaurante_id(restaurante_id, disponivel_apenas, skip, limit)
+        self.cache.armazenar(restaurante_id, chave, list(produtos), geracao)
+        return produtos
+
+    async def listar_por_categoria_id_e_restaurante_id(
+        self,
+        categoria_id: uuid.UUID,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Produto]:
+        chave = ("categoria", restaurante_id, categoria_id, disponivel_apenas, skip, limit)
+        em_cache = self.cache.obter(chave)
+        if self.cache.contem_valor(em_cache):
+            return list(em_cache)
+
+        geracao = self.cache.geracao(restaurante_id)
+        produtos = await self._repositorio.listar_por_categoria_id_e_restaurante_id(
+            categoria_id, restaurante_id, disponivel_apenas, skip, limit
+        )
+        self.cache.armazenar(restaurante_id, chave, list(produtos), geracao)
+        return produtos
+
+    async def deletar(self, produto_id: uuid.UUID) -> bool:
+        produto = await self._repositorio.buscar_por_id(produto_id)
+        deletado = await self._repositorio.deletar(produto_id)
+        if produto is not None:
+            self.cache.invalidar_grupo(produto.restaurante_id)
+        return deletado
+
+
+class CategoriaProdutoRepositoryComCache(ICategoriaProdutoRepository):
+    """Decorador de ICategoriaProdutoRepository que mantém em cache as categorias de cada restaurante."""
+
+    def __init__(self, repositorio: ICategoriaProdutoRepository, cache: Optional[CacheLRUComTTL] = None):
+        self._repositorio = repositorio
+        self.cache: CacheLRUComTTL[List[CategoriaProduto]] = cache if cache is not None else CacheLRUComTTL()
+
+    async def salvar(self, categoria: CategoriaProduto) -> CategoriaProduto:
+        categoria_salva = await self._repositorio.salvar(categoria)
+        self.cache.invalidar_grupo(categoria_salva.restaurante_id)
+        return categoria_salva
+
+    async def buscar_por_id(self, categoria_id: uuid.UUID) -> Optional[CategoriaProduto]:
+        return await self._repositorio.buscar_por_id(categoria_id)
+
+    async def buscar_por_ids(self, categoria_ids: List[uuid.UUID]) -> List[CategoriaProduto]:
+        return await self._repositorio.buscar_por_ids(categoria_ids)
+
+    async def listar_por_restaurante_id(
+        self,
+        restaurante_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[CategoriaProduto]:
+        chave = ("categorias", restaurante_id, skip, limit)
+        em_cache = self.cache.obter(chave)
+        if self.cache.contem_valor(em_cache):
+            return list(em_cache)
+
+        geracao = self.cache.geracao(restaurante_id)
+        categorias = await self._repositorio.listar_por_restaurante_id(restaurante_id, skip, limit)
+        self.cache.armazenar(restaurante_id, chave, list(categorias), geracao)
+        return categorias
+
+    async def buscar_por_nome_e_restaurante_id(
+        self,
+        nome: str,
+        restaurante_id: uuid.UUID) -> Optional[CategoriaProduto]:
+        return await self._repositorio.buscar_por_nome_e_restaurante_id(nome, restaurante_id)
+
+    async def deleter(self, categoria_id: uuid.UUID) -> bool:
+        categoria = await self._repositorio.buscar_por_id(categoria_id)
+        deletado = await self._repositorio.deleter(categoria_id)
+        if categoria is not None:
+            self.cache.invalidar_grupo(categoria.restaurante_id)
+        return deletado
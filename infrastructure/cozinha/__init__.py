@@ -0,0 +1,3 @@
+# delivery_api_project/infrastructure/cozinha/__init__.py
+from.fila_cozinha import AgendaCozinhas, FilaCozinha, PrevisaoPedido
+from.pedido_repository_com_fila_cozinha import PedidoRepositoryComFilaCozinha
@@ -0,0 +1,239 @@
+# delivery_api_project/infrastructure/cozinha/fila_cozinha.py
+
+import heapq
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+
+TEMPO_PREPARO_PADRAO_MIN = 30
+VELOCIDADE_MEDIA_ENTREGA_KMH = 20.0
+TEMPO_ENTREGA_PADRAO_MIN = 20 # Usado quando faltam as coordenadas do restaurante ou do destino
+
+
+@dataclass(frozen=True)
+class PrevisaoPedido:
+    pronto_em: datetime
+    entrega_em: datetime
+    posicao_fila: int # 0 = já em preparo; n >= 1 = n-ésimo na fila de espera
+
+
+class _ContagemPorSequencia:
+    """
+    Árvore de Fenwick sobre números de sequência crescentes: marca quais ainda estão vivos e
+    conta os vivos antes de uma sequência em O(log n). Quando uma nova sequência não cabe,
+    é reconstruída a partir da menor viva, com o dobro do espaço ocupado.
+    """
+
+    def __init__(self):
+        self._base = 0
+        self._arvore: List[int] = [0] * 17 # Posição 0 não é usada
+
+    def reconstruir(self, vivas: List[int], proxima: int):
+        self._base = min(vivas, default=proxima)
+        tamanho = max(16, 2 * (proxima + 1 - self._base))
+        arvore = [0] * (tamanho + 1)
+        for seq in vivas:
+            arvore[seq - self._base + 1] += 1
+        for i in range(1, tamanho + 1): # Construção em O(n)
+            pai = i + (i & -i)
+            if pai <= tamanho:
+                arvore[pai] += arvore[i]
+        self._arvore = arvore
+
+    def cabe(self, seq: int) -> bool:
+        return seq - self._base + 1 < len(self._arvore)
+
+    def somar(self, seq: int, delta: int):
+        arvore = self._arvore
+        i = seq - self._base + 1
+        while i < len(arvore):
+            arvore[i] += delta
+            i += i & -i
+
+    def antes_de(self, seq: int) -> int:
+        """Quantas sequências vivas são menores que `seq`."""
+        arvore = self._arvore
+        i = min(seq - self._base, len(arvore) - 1)
+        total = 0
+        while i > 0:
+            total += arvore[i]
+            i -= i & -i
+        return total
+
+
+class FilaCozinha:
+    """
+    Fila da cozinha de um restaurante: pedidos CONFIRMADO_PELO_RESTAURANTE aguardando e
+    pedidos EM_PREPARO ocupando uma das `capacidade` bocas de produção.
+
+    Os pedidos em preparo ficam num heap por término previsto (início + tempo de preparo),
+    com remoção preguiçosa; os que aguardam ficam em ordem de chegada (FIFO) com número de
+    sequência, e a posição de cada um é quantos aguardam com sequência menor (contagem em
+    árvore de Fenwick), a mesma regra de um pedido novo, que entra atrás de todos. Cada
+    transição e cada previsão custam O(log n + capacidade): com tempos de preparo iguais,
+    a k-ésima posição da fila começa quando a (k mod capacidade)-ésima boca liberar, mais
+    (k div capacidade) preparos.
+    """
+
+    def __init__(self, tempo_preparo_min: Optional[int] = TEMPO_PREPARO_PADRAO_MIN, capacidade: int = 1):
+        self._fim_preparo: Dict[uuid.UUID, datetime] = {}
+        self._heap_preparo: List[Tuple[datetime, uuid.UUID]] = []
+        self._bocas: List[datetime] = [] # Os `capacidade` menores términos, em ordem
+
+        self._seq_aguardando: Dict[uuid.UUID, int] = {}
+        self._vivos = _ContagemPorSequencia()
+        self._proxima_seq = 0
+
+        self.configurar(tempo_preparo_min, capacidade)
+
+    def __len__(self) -> int:
+        return len(self._fim_preparo) + len(self._seq_aguardando)
+
+    @property
+    def tempo_preparo(self) -> timedelta:
+        return self._tempo_preparo
+
+    @property
+    def aguardando(self) -> int:
+        return len(self._seq_aguardando)
+
+    @property
+    def em_preparo(self) -> int:
+        return len(self._fim_preparo)
+
+    def configurar(self, tempo_preparo_min: Optional[int], capacidade: int = 1):
+        if capacidade <= 0:
+            raise ValueError("Capacidade da cozinha deve ser positiva.")
+        if tempo_preparo_min is not None and tempo_preparo_min <= 0:
+            raise ValueError("Tempo médio de preparo deve ser positivo.")
+        self._tempo_preparo = timedelta(minutes=tempo_preparo_min or TEMPO_PREPARO_PADRAO_MIN)
+        self._capacidade = capacidade
+        self._atualizar_bocas()
+
+    def atualizar(self, pedido_id: uuid.UUID, status: str, momento: datetime):
+        """Aplica a transição do pedido para `status`, ocorrida em `momento`."""
+        if status == StatusPedido.CONFIRMADO_PELO_RESTAURANTE:
+            if pedido_id not in self._seq_aguardando and pedido_id not in self._fim_preparo:
+                seq = self._proxima_seq
+                self._proxima_seq += 1
+                self._seq_aguardando[pedido_id] = seq
+                if self._vivos.cabe(seq):
+                    self._vivos.somar(seq, 1)
+                else:
+                    self._vivos.reconstruir(list(self._seq_aguardando.values()), seq)
+        elif status == StatusPedido.EM_PREPARO:
+            if pedido_id not in self._fim_preparo:
+                self._remover_aguardando(pedido_id)
+                fim = momento + self._tempo_preparo
+                self._fim_preparo[pedido_id] = fim
+                heapq.heappush(self._heap_preparo, (fim, pedido_id))
+                self._atualizar_bocas()
+        else:
+            # Qualquer outro status (pronto, saiu, entregue, cancelado) tira o pedido da cozinha
+            self._remover_aguardando(pedido_id)
+            if self._fim_preparo.pop(pedido_id, None) is not None:
+                self._limpar_topo()
+                self._atualizar_bocas()
+
+    def prever_pronto(self, pedido_id: Optional[uuid.UUID] = None, agora: Optional[datetime] = None) -> Tuple[datetime, int]:
+        """
+        Retorna (horário previsto de pronto, posição na fila) de um pedido da fila ou,
+        sem `pedido_id` (ou para um pedido desconhecido), de um novo pedido no fim da fila.
+        """
+        agora = agora if agora is not None else datetime.utcnow()
+        fim = self._fim_preparo.get(pedido_id) if pedido_id is not None else None
+        if fim is not None:
+            return max(fim, agora), 0
+
+        seq = self._seq_aguardando.get(pedido_id) if pedido_id is not None else None
+        posicao = self._vivos.antes_de(seq) if seq is not None else len(self._seq_aguardando)
+        ocupadas = [max(fim_boca, agora) for fim_boca in self._bocas]
+        livres = [agora] * (self._capacidade - len(ocupadas))
+        bocas = livres + ocupadas # Ambas já ordenadas e todo livre <= ocupado
+        rodada, boca = divmod(posicao, self._capacidade)
+        inicio = bocas[boca] + rodada * self._tempo_preparo
+        return inicio + self._tempo_preparo, posicao + 1
+
+    def _remover_aguardando(self, pedido_id: uuid.UUID):
+        seq = self._seq_aguardando.pop(pedido_id, None)
+        if seq is not None:
+            self._vivos.somar(seq, -1)
+
+    def _limpar_topo(self):
+        heap = self._heap_preparo
+        while heap and self._fim_preparo.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        if len(heap) > 2 * len(self._fim_preparo) + 32:
+            # Muitas entradas obsoletas: reconstrói o heap apenas com as válidas
+            self._heap_preparo = [(fim, pid) for pid, fim in self._fim_preparo.items()]
+            heapq.heapify(self._heap_preparo)
+
+    def _atualizar_bocas(self):
+        """Recalcula os `capacidade` menores términos em preparo (O(capacidade · log n))."""
+        heap = self._heap_preparo
+        retirados = []
+        while heap and len(retirados) < self._capacidade:
+            entrada = heapq.heappop(heap)
+            if self._fim_preparo.get(entrada[1]) == entrada[0]:
+                retirados.append(entrada)
+        for entrada in retirados:
+            heapq.heappush(heap, entrada)
+        self._bocas = [fim for fim, _ in retirados]
+
+
+class AgendaCozinhas:
+    """
+    Filas de cozinha de todos os restaurantes e previsão de pronto/entrega para o checkout.
+
+    Deve receber cada transição de Pedido (ver PedidoRepositoryComFilaCozinha); o tempo
+    de preparo vem de `Restaurante.tempo_medio_preparo_min` via `configurar_restaurante`.
+    """
+
+    def __init__(self, velocidade_media_kmh: float = VELOCIDADE_MEDIA_ENTREGA_KMH):
+        if velocidade_media_kmh <= 0:
+            raise ValueError("Velocidade média de entrega deve ser positiva.")
+        self.velocidade_media_kmh = velocidade_media_kmh
+        self._filas: Dict[uuid.UUID, FilaCozinha] = {}
+        self._posicoes: Dict[uuid.UUID, CoordenadaGeo] = {}
+
+    def configurar_restaurante(self, restaurante: Restaurante, capacidade: int = 1):
+        fila = self._filas.get(restaurante.id)
+        if fila is None:
+            self._filas[restaurante.id] = FilaCozinha(restaurante.tempo_medio_preparo_min, capacidade)
+        else:
+            fila.configurar(restaurante.tempo_medio_preparo_min, capacidade)
+        if restaurante.endereco.coordenadas is not None:
+            self._posicoes[restaurante.id] = restaurante.endereco.coordenadas
+        else:
+            self._posicoes.pop(restaurante.id, None)
+
+    def fila(self, restaurante_id: uuid.UUID) -> FilaCozinha:
+        fila = self._filas.get(restaurante_id)
+        if fila is None:
+            fila = self._filas[restaurante_id] = FilaCozinha()
+        return fila
+
+    def registrar_transicao(self, pedido: Pedido):
+        self.fila(pedido.restaurante_id).atualizar(pedido.id, pedido.status_pedido, pedido.data_ultima_atualizacao)
+
+    def prever(self,
+               restaurante_id: uuid.UUID,
+               destino: Optional[CoordenadaGeo] = None,
+               pedido_id: Optional[uuid.UUID] = None,
+               agora: Optional[datetime] = None) -> PrevisaoPedido:
+        """Previsão de pronto e de entrega de um pedido existente ou de um novo pedido (checkout)."""
+        pronto_em, posicao = self.fila(restaurante_id).prever_pronto(pedido_id, agora)
+        origem = self._posicoes.get(restaurante_id)
+        if origem is not None and destino is not None:
+            deslocamento = timedelta(hours=origem.distancia_km(destino) / self.velocidade_media_kmh)
+        else:
+            deslocamento = timedelta(minutes=TEMPO_ENTREGA_PADRAO_MIN)
+        return PrevisaoPedido(pronto_em, pronto_em + deslocamento, posicao)
+
+    def prever_pedido(self, pedido: Pedido, agora: Optional[datetime] = None) -> PrevisaoPedido:
+        return self.prever(pedido.restaurante_id, pedido.endereco_entrega.coordenadas, pedido.id, agora)
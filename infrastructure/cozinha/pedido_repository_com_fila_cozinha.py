@@ -0,0 +1,22 @@
+# delivery_api_project/infrastructure/cozinha/pedido_repository_com_fila_cozinha.py
+
+from typing import Optional
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from domain.entities.pedido import Pedido
+from infrastructure.cozinha.fila_cozinha import AgendaCozinhas
+from infrastructure.repositories.pedido_repository_decorador import PedidoRepositoryDecorador
+
+
+class PedidoRepositoryComFilaCozinha(PedidoRepositoryDecorador):
+    """
+    Decorador de IPedidoRepository que repassa cada pedido gravado à AgendaCozinhas, mantendo
+    as filas das cozinhas em dia com as transições de status dos pedidos.
+    """
+
+    def __init__(self, repositorio: IPedidoRepository, agenda: Optional[AgendaCozinhas] = None):
+        super().__init__(repositorio)
+        self.agenda = agenda if agenda is not None else AgendaCozinhas()
+
+    async def _apos_salvar(self, pedido: Pedido):
+        self.agenda.registrar_transicao(pedido)
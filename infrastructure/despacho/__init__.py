@@ -0,0 +1,2 @@
+# delivery_api_project/infrastructure/despacho/__init__.py
+from.despacho_entregadores import Atribuicao, DespachoEntregadores, Entregador
@@ -0,0 +1,202 @@
+# delivery_api_project/infrastructure/despacho/despacho_entregadores.py
+
+import heapq
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.interfaces.i_restaurante_repository import IRestauranteRepository
+from application.unidade_de_trabalho.unidade_de_trabalho_pedidos import UnidadeDeTrabalhoPedidos
+from domain.entities.pedido import AcaoPedido, Pedido, StatusPedido
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from infrastructure.geo.grade_geografica import GradeGeografica
+
+
+@dataclass
+class Entregador:
+    """Estado de um entregador conhecido pelo despacho."""
+    entregador_id: uuid.UUID
+    posicao: CoordenadaGeo
+    capacidade: int = 1 # Quantos pedidos o entregador leva por viagem
+    em_rota: int = 0 # Pedidos atribuídos e ainda não entregues
+
+    @property
+    def livre(self) -> int:
+        return self.capacidade - self.em_rota
+
+
+@dataclass(frozen=True)
+class Atribuicao:
+    pedido_id: uuid.UUID
+    entregador_id: uuid.UUID
+    distancia_km: float # Do entregador até o restaurante
+
+
+class DespachoEntregadores:
+    """
+    Atribui pedidos PRONTO_PARA_COLETA aos entregadores disponíveis, em lote.
+
+    Os entregadores com capacidade livre ficam numa grade geográfica; ao lotar, saem da
+    grade e voltam quando `registrar_entrega` libera capacidade. Os pedidos são agrupados
+    por restaurante e os restaurantes atendidos na ordem do pedido mais antigo (heap), de
+    modo que cada restaurante faz uma única consulta de vizinhos para todos os seus pedidos
+    e os pedidos mais antigos escolhem entregador primeiro.
+    """
+
+    def __init__(self,
+                 pedido_repository: IPedidoRepository,
+                 restaurante_repository: IRestauranteRepository,
+                 raio_maximo_km: float = 10.0,
+                 tamanho_celula_km: float = 2.0):
+        if raio_maximo_km <= 0:
+            raise ValueError("Raio máximo de despacho deve ser positivo.")
+        self.pedido_repository = pedido_repository
+        self.restaurante_repository = restaurante_repository
+        self.raio_maximo_km = raio_maximo_km
+        self._entregadores: Dict[uuid.UUID, Entregador] = {}
+        self._disponiveis = GradeGeografica(tamanho_celula_km) # Apenas entregadores com capacidade livre
+
+    def __len__(self) -> int:
+        return len(self._entregadores)
+
+    @property
+    def disponiveis(self) -> int:
+        return len(self._disponiveis)
+
+    def atualizar_entregador(self, entregador_id: uuid.UUID, posicao: CoordenadaGeo, capacidade: int = 1):
+        """Registra o entregador ou atualiza sua posição e capacidade."""
+        if capacidade <= 0:
+            raise ValueError("Capacidade do entregador deve ser positiva.")
+        entregador = self._entregadores.get(entregador_id)
+        if entregador is None:
+            entregador = self._entregadores[entregador_id] = Entregador(entregador_id, posicao, capacidade)
+        else:
+            entregador.posicao = posicao
+            entregador.capacidade = capacidade
+        self._reposicionar(entregador)
+
+    def remover_entregador(self, entregador_id: uuid.UUID):
+        self._entregadores.pop(entregador_id, None)
+        self._disponiveis.remover(entregador_id)
+
+    def registrar_entrega(self, entregador_id: uuid.UUID, quantidade: int = 1):
+        """Libera capacidade do entregador após entregas concluídas."""
+        if entregador_id not in self._entregadores:
+            raise ValueError(f"Entregador com ID {entregador_id} não encontrado.")
+        self._liberar(entregador_id, quantidade)
+
+    def atribuir(self, pedidos: Iterable[Pedido], posicoes_restaurantes: Dict[uuid.UUID, CoordenadaGeo]) -> List[Atribuicao]:
+        """
+        Escolhe um entregador para cada pedido, sem alterar os pedidos.
+
+        Pedidos de restaurantes sem coordenadas, ou sem entregador livre dentro do raio
+        máximo, ficam de fora do resultado e voltam na próxima rodada.
+        """
+        por_restaurante: Dict[uuid.UUID, List[Pedido]] = {}
+        for pedido in pedidos:
+            if pedido.restaurante_id in posicoes_restaurantes:
+                por_restaurante.setdefault(pedido.restaurante_id, []).append(pedido)
+
+        fila: List[Tuple[datetime, uuid.UUID]] = []
+        for restaurante_id, pendentes in por_restaurante.items():
+            pendentes.sort(key=lambda p: (p.data_criacao, p.id))
+            fila.append((pendentes[0].data_criacao, restaurante_id))
+        heapq.heapify(fila)
+
+        atribuicoes: List[Atribuicao] = []
+        while fila and self._disponiveis:
+            _, restaurante_id = heapq.heappop(fila)
+            pendentes = por_restaurante[restaurante_id]
+            # Cada entregador leva ao menos um pedido, então bastam len(pendentes) vizinhos
+            vizinhos = self._disponiveis.buscar_mais_proximos(
+                posicoes_restaurantes[restaurante_id], len(pendentes), self.raio_maximo_km
+            )
+            proximo = 0
+            for entregador_id, distancia in vizinhos:
+                entregador = self._entregadores[entregador_id]
+                quantidade = min(entregador.livre, len(pendentes) - proximo)
+                for pedido in pendentes[proximo:proximo + quantidade]:
+                    atribuicoes.append(Atribuicao(pedido.id, entregador_id, distancia))
+                proximo += quantidade
+                entregador.em_rota += quantidade
+                self._reposicionar(entregador)
+                if proximo == len(pendentes):
+                    break
+        return atribuicoes
+
+    async def despachar(self, limite: int = 1000) -> List[Atribuicao]:
+        """
+        Executa uma rodada de despacho: percorre os pedidos prontos (mais antigos primeiro),
+        página a página, até atribuir `limite` pedidos, acabarem os entregadores livres ou a
+        listagem; aplica SAIR_PARA_ENTREGA aos pedidos atribuídos e os grava juntos numa
+        unidade de trabalho. A transição é revalidada pedido a pedido no momento de aplicá-la;
+        pedidos que deixaram de estar prontos devolvem a capacidade reservada. Se a gravação
+        falhar, os pedidos voltam a PRONTO_PARA_COLETA sem entregador e toda a capacidade
+        reservada é devolvida.
+        """
+        uow = UnidadeDeTrabalhoPedidos(self.pedido_repository)
+        atribuicoes: List[Atribuicao] = []
+        cursor: Optional[str] = None
+        while len(atribuicoes) < limite and self._disponiveis:
+            pagina = await self.pedido_repository.listar_por_status_cursor(
+                [StatusPedido.PRONTO_PARA_COLETA], limit=limite - len(atribuicoes), cursor=cursor
+            )
+            atribuicoes.extend(await self._despachar_pagina(uow, pagina.itens))
+            cursor = pagina.proximo_cursor
+            if cursor is None:
+                break
+        if not atribuicoes:
+            return []
+
+        try:
+            await uow.confirmar()
+        except Exception:
+            for atribuicao in atribuicoes:
+                self._liberar(atribuicao.entregador_id, 1)
+            raise
+        return atribuicoes
+
+    async def _despachar_pagina(self, uow: UnidadeDeTrabalhoPedidos, pedidos: List[Pedido]) -> List[Atribuicao]:
+        pedidos, _ = Pedido.validar_transicao_em_lote(pedidos, AcaoPedido.SAIR_PARA_ENTREGA)
+        if not pedidos or not self._disponiveis:
+            return []
+
+        # Uma única consulta para todos os restaurantes da página
+        restaurantes = await self.restaurante_repository.buscar_por_ids(
+            list(dict.fromkeys(p.restaurante_id for p in pedidos))
+        )
+        posicoes: Dict[uuid.UUID, CoordenadaGeo] = {
+            r.id: r.endereco.coordenadas for r in restaurantes if r.endereco.coordenadas is not None
+        }
+
+        atribuicoes = self.atribuir(pedidos, posicoes)
+        pedidos_por_id = {p.id: p for p in pedidos}
+        por_entregador: Dict[uuid.UUID, List[Pedido]] = {}
+        for atribuicao in atribuicoes:
+            por_entregador.setdefault(atribuicao.entregador_id, []).append(pedidos_por_id[atribuicao.pedido_id])
+
+        # O status pode ter mudado durante as consultas acima (ex.: pedido cancelado)
+        rejeitados: Set[uuid.UUID] = set()
+        for entregador_id, pedidos_do_entregador in por_entregador.items():
+            aptos, recusados = Pedido.validar_transicao_em_lote(pedidos_do_entregador, AcaoPedido.SAIR_PARA_ENTREGA)
+            for pedido in aptos:
+                uow.registrar(pedido) # Antes da transição: é o estado restaurado se a gravação falhar
+            Pedido.transicionar_em_lote(aptos, AcaoPedido.SAIR_PARA_ENTREGA, entregador_id=entregador_id)
+            if recusados:
+                self._liberar(entregador_id, len(recusados))
+                rejeitados.update(pedido.id for pedido in recusados)
+        return [a for a in atribuicoes if a.pedido_id not in rejeitados]
+
+    def _liberar(self, entregador_id: uuid.UUID, quantidade: int):
+        entregador = self._entregadores.get(entregador_id)
+        if entregador is not None: # Pode ter sido removido durante a rodada
+            entregador.em_rota = max(0, entregador.em_rota - quantidade)
+            self._reposicionar(entregador)
+
+    def _reposicionar(self, entregador: Entregador):
+        if entregador.livre > 0:
+            self._disponiveis.inserir(entregador.entregador_id, entregador.posicao)
+        else:
+            self._disponiveis.remover(entregador.entregador_id)
@@ -0,0 +1,5 @@
+# delivery_api_project/infrastructure/eventos/__init__.py
+from.barramento_eventos_pedido import (
+    BarramentoEventosPedido, ConsumidorIdempotente, EstatisticasBarramento, ManipuladorEvento
+)
+from.relay_outbox import EstatisticasRelay, RelayOutbox
@@ -0,0 +1,125 @@
+# delivery_api_project/infrastructure/eventos/barramento_eventos_pedido.py
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Tuple
+
+from domain.eventos.evento_status_pedido import EventoStatusPedido
+
+ManipuladorEvento = Callable[[EventoStatusPedido], Awaitable[None]]
+
+
+@dataclass
+class EstatisticasBarramento:
+    publicados: int = 0
+    processados: int = 0
+    falhas: int = 0
+
+
+class BarramentoEventosPedido:
+    """
+    Barramento de eventos em processo, particionado por `pedido_id`.
+
+    Cada partição é uma asyncio.Queue limitada com uma única tarefa consumidora, então os
+    eventos de um mesmo pedido são entregues aos manipuladores na ordem de publicação,
+    enquanto pedidos de partições diferentes são processados em paralelo. Com a fila da
+    partição cheia, `publicar` aguarda (contrapressão sobre quem publica, normalmente o
+    RelayOutbox).
+
+    `publicar` devolve um futuro resolvido quando todos os manipuladores terminaram o
+    evento, ou com a primeira exceção levantada; o relay usa isso para só marcar como
+    entregue o que foi de fato processado.
+    """
+
+    def __init__(self, particoes: int = 8, capacidade_particao: int = 1_000):
+        if particoes <= 0 or capacidade_particao <= 0:
+            raise ValueError("Partições e capacidade devem ser positivas.")
+        self.particoes = particoes
+        self.capacidade_particao = capacidade_particao
+        self.estatisticas = EstatisticasBarramento()
+        self._manipuladores: List[ManipuladorEvento] = []
+        self._filas: List["asyncio.Queue[Tuple[EventoStatusPedido, asyncio.Future]]"] = []
+        self._tarefas: List[asyncio.Task] = []
+
+    def inscrever(self, manipulador: ManipuladorEvento):
+        """Manipuladores devem ser idempotentes (a entrega é pelo menos uma vez); veja ConsumidorIdempotente."""
+        self._manipuladores.append(manipulador)
+
+    def particao(self, pedido_id: uuid.UUID) -> int:
+        return pedido_id.int % self.particoes
+
+    @property
+    def pendentes(self) -> int:
+        return sum(fila.qsize() for fila in self._filas)
+
+    def iniciar(self):
+        if self._tarefas:
+            return
+        loop = asyncio.get_running_loop()
+        self._filas = [asyncio.Queue(self.capacidade_particao) for _ in range(self.particoes)]
+        self._tarefas = [loop.create_task(self._consumir(fila)) for fila in self._filas]
+
+    async def encerrar(self):
+        """Processa o que já foi publicado e para as tarefas consumidoras."""
+        for fila in self._filas:
+            await fila.join()
+        for tarefa in self._tarefas:
+            tarefa.cancel()
+        await asyncio.gather(*self._tarefas, return_exceptions=True)
+        self._tarefas = []
+        self._filas = []
+
+    async def publicar(self, evento: EventoStatusPedido) -> "asyncio.Future[None]":
+        if not self._tarefas:
+            raise ValueError("Barramento de eventos não iniciado.")
+        futuro = asyncio.get_running_loop().create_future()
+        await self._filas[self.particao(evento.pedido_id)].put((evento, futuro))
+        self.estatisticas.publicados += 1
+        return futuro
+
+    async def _consumir(self, fila: "asyncio.Queue[Tuple[EventoStatusPedido, asyncio.Future]]"):
+        while True:
+            evento, futuro = await fila.get()
+            try:
+                for manipulador in self._manipuladores:
+                    await manipulador(evento)
+            except asyncio.CancelledError:
+                raise
+            except Exception as erro:
+                self.estatisticas.falhas += 1
+                if not futuro.done():
+                    futuro.set_exception(erro)
+            else:
+                self.estatisticas.processados += 1
+                if not futuro.done():
+                    futuro.set_result(None)
+            finally:
+                fila.task_done()
+
+
+class ConsumidorIdempotente:
+    """
+    Envolve um manipulador para ignorar eventos já processados (mesma `chave`: pedido e novo
+    status), tornando seguras as reentregas do outbox. Guarda as últimas `capacidade` chaves.
+    """
+
+    def __init__(self, manipulador: ManipuladorEvento, capacidade: int = 100_000):
+        if capacidade <= 0:
+            raise ValueError("Capacidade deve ser positiva.")
+        self._manipulador = manipulador
+        self.capacidade = capacidade
+        self._processados: "OrderedDict[Tuple[uuid.UUID, str], None]" = OrderedDict()
+        self.duplicados = 0
+
+    async def __call__(self, evento: EventoStatusPedido) -> None:
+        chave = evento.chave
+        if chave in self._processados:
+            self.duplicados += 1
+            return
+        await self._manipulador(evento)
+        # Só registra após o sucesso: se o manipulador falhar, a reentrega o executa de novo
+        self._processados[chave] = None
+        if len(self._processados) > self.capacidade:
+            self._processados.popitem(last=False)
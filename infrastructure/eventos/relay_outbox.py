@@ -0,0 +1,135 @@
+# delivery_api_project/infrastructure/eventos/relay_outbox.py
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from application.interfaces.i_outbox_repository import IOutboxRepository, RegistroOutbox
+from infrastructure.eventos.barramento_eventos_pedido import BarramentoEventosPedido
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EstatisticasRelay:
+    entregues: int = 0
+    reentregas_pendentes: int = 0 # Registros que ficaram no outbox por falha (ou por falha anterior do mesmo pedido)
+    lotes: int = 0
+    falhas_definitivas: int = 0 # Registros movidos para dead-letter após esgotar as tentativas
+    erros_rodada: int = 0 # Rodadas interrompidas por exceção (ex.: barramento não iniciado)
+
+
+class RelayOutbox:
+    """
+    Drena o outbox em lotes e publica os eventos no barramento, com entrega pelo menos uma vez.
+
+    Um registro só é marcado como entregue depois que os manipuladores o processaram. Se o
+    evento de um pedido falha, os eventos seguintes do mesmo pedido no lote também ficam
+    no outbox: nenhum evento é dado como entregue antes de um anterior do mesmo pedido.
+    Na reentrega, os que já tinham sido processados são ignorados pelos consumidores
+    idempotentes.
+
+    Um pedido com falha entra em espera (recuo exponencial a partir de `intervalo_segundos`,
+    limitado a `espera_maxima_segundos`) e seus eventos são ignorados na busca do próximo
+    lote, para que não ocupem a cabeça do outbox e travem os demais pedidos. Depois de
+    `max_tentativas` falhas seguidas, o evento que falha é movido para as falhas definitivas
+    do outbox (dead-letter) e os eventos seguintes do pedido voltam a ser entregues.
+    """
+
+    def __init__(self,
+                 outbox: IOutboxRepository,
+                 barramento: BarramentoEventosPedido,
+                 tamanho_lote: int = 500,
+                 intervalo_segundos: float = 0.05,
+                 max_tentativas: int = 5,
+                 espera_maxima_segundos: float = 30.0):
+        if tamanho_lote <= 0 or intervalo_segundos <= 0 or max_tentativas <= 0 or espera_maxima_segundos <= 0:
+            raise ValueError("Tamanho do lote, intervalo, tentativas e espera máxima devem ser positivos.")
+        self.outbox = outbox
+        self.barramento = barramento
+        self.tamanho_lote = tamanho_lote
+        self.intervalo_segundos = intervalo_segundos
+        self.max_tentativas = max_tentativas
+        self.espera_maxima_segundos = espera_maxima_segundos
+        self.estatisticas = EstatisticasRelay()
+        self._tentativas: Dict[uuid.UUID, int] = {} # Falhas seguidas por pedido
+        self._em_espera: Dict[uuid.UUID, float] = {} # Pedido -> instante (loop.time) da próxima tentativa
+        self._tarefa: Optional[asyncio.Task] = None
+        self._encerrando = False
+
+    def iniciar(self):
+        if self._tarefa is None or self._tarefa.done():
+            self._encerrando = False
+            self._tarefa = asyncio.get_running_loop().create_task(self._drenar_continuamente())
+
+    async def encerrar(self):
+        """Faz uma última rodada (o que estiver no outbox é publicado) e para a tarefa."""
+        self._encerrando = True
+        if self._tarefa is not None:
+            await self._tarefa
+            self._tarefa = None
+
+    async def drenar(self) -> int:
+        """Uma rodada: publica até `tamanho_lote` registros pendentes. Retorna quantos foram entregues."""
+        agora = asyncio.get_running_loop().time()
+        for pedido_id in [p for p, instante in self._em_espera.items() if instante <= agora]:
+            del self._em_espera[pedido_id]
+        registros = await self.outbox.buscar_pendentes(self.tamanho_lote, ignorar_pedidos=self._em_espera.keys())
+        if not registros:
+            return 0
+        futuros = [await self.barramento.publicar(registro.evento) for registro in registros]
+        resultados = await asyncio.gather(*futuros, return_exceptions=True)
+
+        entregues: List[int] = []
+        primeira_falha: Dict[uuid.UUID, RegistroOutbox] = {}
+        for registro, resultado in zip(registros, resultados):
+            pedido_id = registro.evento.pedido_id
+            if pedido_id in primeira_falha:
+                self.estatisticas.reentregas_pendentes += 1
+            elif isinstance(resultado, BaseException):
+                primeira_falha[pedido_id] = registro
+                self.estatisticas.reentregas_pendentes += 1
+            else:
+                entregues.append(registro.posicao)
+                self._tentativas.pop(pedido_id, None)
+        if entregues:
+            await self.outbox.marcar_entregues(entregues)
+        if primeira_falha:
+            await self._registrar_falhas(primeira_falha, agora)
+        self.estatisticas.entregues += len(entregues)
+        self.estatisticas.lotes += 1
+        return len(entregues)
+
+    async def _registrar_falhas(self, primeira_falha: Dict[uuid.UUID, RegistroOutbox], agora: float):
+        definitivas: List[int] = []
+        for pedido_id, registro in primeira_falha.items():
+            tentativas = self._tentativas.get(pedido_id, 0) + 1
+            if tentativas >= self.max_tentativas:
+                definitivas.append(registro.posicao)
+                del self._tentativas[pedido_id]
+                logger.error("Evento %r movido para falhas após %d tentativas.", registro.evento, tentativas)
+            else:
+                self._tentativas[pedido_id] = tentativas
+                espera = min(self.intervalo_segundos * 2 ** (tentativas - 1), self.espera_maxima_segundos)
+                self._em_espera[pedido_id] = agora + espera
+        if definitivas:
+            await self.outbox.mover_para_falhas(definitivas)
+            self.estatisticas.falhas_definitivas += len(definitivas)
+
+    async def _drenar_continuamente(self):
+        while True:
+            try:
+                entregues = await self.drenar()
+            except Exception:
+                # Uma rodada com erro (outbox indisponível, barramento parado) não pode matar o relay
+                logger.exception("Falha ao drenar o outbox; nova tentativa em %.3fs.", self.intervalo_segundos)
+                self.estatisticas.erros_rodada += 1
+                if self._encerrando:
+                    return
+                entregues = 0
+            if self._encerrando and entregues < self.tamanho_lote:
+                return
+            if entregues < self.tamanho_lote:
+                await asyncio.sleep(self.intervalo_segundos)
@@ -0,0 +1,6 @@
+# delivery_api_project/infrastructure/external_services/__init__.py
+from.notificacao_service_impl import (
+    EstatisticasNotificacao, Notificacao, NotificacaoServiceImpl, TipoDestinatario, TransporteEmMemoria,
+    TransporteNotificacao
+)
+from.pedido_repository_com_notificacao import PedidoRepositoryComNotificacao
@@ -0,0 +1,210 @@
+# delivery_api_project/infrastructure/external_services/notificacao_service_impl.py
+
+import asyncio
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Dict, List, Optional, Set, Tuple
+
+from application.interfaces.i_notificacao_service import INotificacaoService
+from domain.entities.pedido import Pedido, StatusPedido
+
+
+class TipoDestinatario:
+    CLIENTE = "CLIENTE"
+    RESTAURANTE = "RESTAURANTE"
+
+
+_MENSAGENS_STATUS = {
+    StatusPedido.PENDENTE: "Pedido recebido e aguardando confirmação do restaurante.",
+    StatusPedido.CONFIRMADO_PELO_RESTAURANTE: "Pedido confirmado pelo restaurante.",
+    StatusPedido.EM_PREPARO: "Pedido em preparo.",
+    StatusPedido.PRONTO_PARA_COLETA: "Pedido pronto para coleta.",
+    StatusPedido.SAIU_PARA_ENTREGA: "Pedido saiu para entrega.",
+    StatusPedido.ENTREGUE: "Pedido entregue.",
+    StatusPedido.CANCELADO_PELO_CLIENTE: "Pedido cancelado pelo cliente.",
+    StatusPedido.CANCELADO_PELO_RESTAURANTE: "Pedido cancelado pelo restaurante.",
+}
+
+
+@dataclass(frozen=True)
+class Notificacao:
+    tipo_destinatario: str
+    destinatario_id: uuid.UUID
+    pedido_id: uuid.UUID
+    status_pedido: str
+    mensagem: str
+    ocorrido_em: datetime
+    transicoes: int = 1 # Quantas mudanças de status foram agrupadas nesta mensagem
+
+
+@dataclass
+class EstatisticasNotificacao:
+    enfileiradas: int = 0
+    agrupadas: int = 0 # Absorvidas por uma notificação pendente do mesmo destinatário e pedido
+    descartadas: int = 0 # Fila cheia
+    enviadas: int = 0
+    falhas: int = 0 # Notificações cujo lote falhou em todas as tentativas
+    lotes: int = 0
+
+
+class TransporteNotificacao(ABC):
+    """Provedor que efetivamente entrega as mensagens (push, e-mail, SMS...)."""
+
+    @abstractmethod
+    async def enviar_lote(self, notificacoes: List[Notificacao]) -> None:
+        pass
+
+
+class TransporteEmMemoria(TransporteNotificacao):
+    """Transporte local, em processo: guarda as mensagens, com latência opcional para simular o provedor."""
+
+    def __init__(self, latencia_segundos: float = 0.0):
+        self.latencia_segundos = latencia_segundos
+        self.enviadas: List[Notificacao] = []
+        self.lotes: List[int] = [] # Tamanho de cada lote recebido
+
+    async def enviar_lote(self, notificacoes: List[Notificacao]) -> None:
+        if self.latencia_segundos:
+            await asyncio.sleep(self.latencia_segundos)
+        self.enviadas.extend(notificacoes)
+        self.lotes.append(len(notificacoes))
+
+
+ChaveNotificacao = Tuple[str, uuid.UUID, uuid.UUID]
+
+
+class NotificacaoServiceImpl(INotificacaoService):
+    """
+    Serviço de notificações assíncrono, em lotes.
+
+    `notificar_mudanca_status` apenas registra a mensagem num buffer limitado e retorna:
+    a mudança de status nunca espera pelo provedor. Mensagens pendentes para o mesmo
+    destinatário e pedido são agrupadas (fica o status mais recente), então transições
+    rápidas viram uma única mensagem.
+
+    Uma tarefa em segundo plano esvazia o buffer em lotes de até `tamanho_lote`, com no
+    máximo `envios_simultaneos` lotes em andamento. Quando o provedor fica lento, os
+    envios em andamento seguram a tarefa, o buffer acumula e agrupa mais, e os lotes
+    seguintes saem maiores. Se o buffer lotar, notificações novas são descartadas e
+    contadas em `estatisticas.descartadas`, em vez de bloquear quem mudou o status.
+    """
+
+    def __init__(self,
+                 transporte: Optional[TransporteNotificacao] = None,
+                 tamanho_maximo_fila: int = 10_000,
+                 tamanho_lote: int = 100,
+                 intervalo_lote_segundos: float = 0.05,
+                 envios_simultaneos: int = 4,
+                 tentativas: int = 3):
+        if tamanho_maximo_fila <= 0 or tamanho_lote <= 0 or envios_simultaneos <= 0 or tentativas <= 0:
+            raise ValueError("Parâmetros do serviço de notificação devem ser positivos.")
+        self.transporte = transporte if transporte is not None else TransporteEmMemoria()
+        self.tamanho_maximo_fila = tamanho_maximo_fila
+        self.tamanho_lote = tamanho_lote
+        self.intervalo_lote_segundos = intervalo_lote_segundos
+        self.tentativas = tentativas
+        self.estatisticas = EstatisticasNotificacao()
+
+        self._pendentes: Dict[ChaveNotificacao, Notificacao] = {} # Em ordem de chegada
+        self._ha_pendentes = asyncio.Event()
+        self._envios = asyncio.Semaphore(envios_simultaneos)
+        self._em_andamento: Set[asyncio.Task] = set()
+        self._tarefa: Optional[asyncio.Task] = None
+        self._encerrando = False
+
+    @property
+    def pendentes(self) -> int:
+        return len(self._pendentes)
+
+    def iniciar(self):
+        if self._tarefa is None or self._tarefa.done():
+            self._encerrando = False
+            self._tarefa = asyncio.get_running_loop().create_task(self._despachar_continuamente())
+
+    async def encerrar(self):
+        """
+        Envia o que estiver pendente e para a tarefa de despacho. Sem `iniciar` antes, o
+        pendente é enviado aqui mesmo, em lotes, antes de retornar.
+        """
+        self._encerrando = True
+        self._ha_pendentes.set()
+        if self._tarefa is not None:
+            await self._tarefa
+            self._tarefa = None
+        else:
+            await self._despachar_continuamente()
+        if self._em_andamento:
+            await asyncio.gather(*self._em_andamento)
+
+    async def notificar_mudanca_status(self, pedido: Pedido) -> None:
+        mensagem = _MENSAGENS_STATUS.get(pedido.status_pedido, f"Pedido com status {pedido.status_pedido}.")
+        for tipo, destinatario_id in ((TipoDestinatario.CLIENTE, pedido.cliente_id),
+                                      (TipoDestinatario.RESTAURANTE, pedido.restaurante_id)):
+            self._enfileirar(Notificacao(
+                tipo, destinatario_id, pedido.id, pedido.status_pedido, mensagem, pedido.data_ultima_atualizacao
+            ))
+
+    def _enfileirar(self, notificacao: Notificacao):
+        chave = (notificacao.tipo_destinatario, notificacao.destinatario_id, notificacao.pedido_id)
+        anterior = self._pendentes.get(chave)
+        if anterior is not None:
+            # Mantém a posição na fila e substitui pelo status mais recente
+            self._pendentes[chave] = Notificacao(
+                notificacao.tipo_destinatario, notificacao.destinatario_id, notificacao.pedido_id,
+                notificacao.status_pedido, notificacao.mensagem, notificacao.ocorrido_em,
+                anterior.transicoes + notificacao.transicoes
+            )
+            self.estatisticas.agrupadas += 1
+            return
+        if len(self._pendentes) >= self.tamanho_maximo_fila:
+            self.estatisticas.descartadas += 1
+            return
+        self._pendentes[chave] = notificacao
+        self.estatisticas.enfileiradas += 1
+        self._ha_pendentes.set()
+
+    def _retirar_lote(self) -> List[Notificacao]:
+        # O dict preserva a ordem de chegada: as primeiras chaves são as mais antigas
+        lote = [self._pendentes.pop(chave) for chave in list(islice(self._pendentes, self.tamanho_lote))]
+        if not self._pendentes:
+            self._ha_pendentes.clear()
+        return lote
+
+    async def _despachar_continuamente(self):
+        while True:
+            await self._ha_pendentes.wait()
+            if not self._encerrando and len(self._pendentes) < self.tamanho_lote:
+                # Janela curta para acumular (e agrupar) mais mensagens antes de enviar
+                await asyncio.sleep(self.intervalo_lote_segundos)
+            # Contrapressão: espera uma vaga de envio antes de retirar o lote do buffer
+            await self._envios.acquire()
+            lote = self._retirar_lote()
+            if not lote:
+                self._envios.release()
+                if self._encerrando:
+                    return
+                continue
+            tarefa = asyncio.get_running_loop().create_task(self._enviar(lote))
+            self._em_andamento.add(tarefa)
+            tarefa.add_done_callback(self._em_andamento.discard)
+            if self._encerrando and not self._pendentes:
+                return
+
+    async def _enviar(self, lote: List[Notificacao]):
+        try:
+            for tentativa in range(self.tentativas):
+                try:
+                    await self.transporte.enviar_lote(lote)
+                except Exception:
+                    if tentativa + 1 < self.tentativas:
+                        await asyncio.sleep(self.intervalo_lote_segundos * 2 ** tentativa)
+                    continue
+                self.estatisticas.enviadas += len(lote)
+                self.estatisticas.lotes += 1
+                return
+            self.estatisticas.falhas += len(lote)
+        finally:
+            self._envios.release()
@@ -0,0 +1,45 @@
+# delivery_api_project/infrastructure/external_services/pedido_repository_com_notificacao.py
+
+import uuid
+from collections import OrderedDict
+from typing import Dict
+
+from application.interfaces.i_notificacao_service import INotificacaoService
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from domain.entities.pedido import Pedido, StatusPedido
+from infrastructure.repositories.pedido_repository_decorador import PedidoRepositoryDecorador
+
+
+class PedidoRepositoryComNotificacao(PedidoRepositoryDecorador):
+    """
+    Decorador de IPedidoRepository que notifica cliente e restaurante quando um pedido é
+    gravado com status diferente do último notificado (gravar sem mudar o status não notifica).
+    Pedidos em status final saem do mapa de status e vão para um conjunto limitado aos
+    `capacidade_finalizados` mais recentes, de modo que regravá-los não notifica de novo.
+    """
+
+    def __init__(self,
+                 repositorio: IPedidoRepository,
+                 notificacao_service: INotificacaoService,
+                 capacidade_finalizados: int = 100_000):
+        if capacidade_finalizados <= 0:
+            raise ValueError("Capacidade deve ser positiva.")
+        super().__init__(repositorio)
+        self.notificacao_service = notificacao_service
+        self.capacidade_finalizados = capacidade_finalizados
+        self._status_notificado: Dict[uuid.UUID, str] = {}
+        self._finalizados: "OrderedDict[uuid.UUID, None]" = OrderedDict()
+
+    async def _apos_salvar(self, pedido: Pedido):
+        status = pedido.status_pedido
+        if pedido.id in self._finalizados or self._status_notificado.get(pedido.id) == status:
+            return
+        if status in StatusPedido.FINAIS:
+            # Não haverá novas transições: basta lembrar que o status final já foi notificado
+            self._status_notificado.pop(pedido.id, None)
+            self._finalizados[pedido.id] = None
+            if len(self._finalizados) > self.capacidade_finalizados:
+                self._finalizados.popitem(last=False)
+        else:
+            self._status_notificado[pedido.id] = status
+        await self.notificacao_service.notificar_mudanca_status(pedido)
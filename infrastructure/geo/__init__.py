@@ -0,0 +1,4 @@
+# delivery_api_project/infrastructure/geo/__init__.py
+from.distancias import distancias_km, calcular_taxas_entrega
+from.grade_geografica import GradeGeografica
+from.indice_geografico_restaurantes import IndiceGeograficoRestaurantes
@@ -0,0 +1,39 @@
+# delivery_api_project/infrastructure/geo/distancias.py
+
+from decimal import Decimal
+from typing import List, Optional, Union
+
+import numpy as np
+
+from domain.value_objects.coordenada_geo import RAIO_TERRA_KM, CoordenadaGeo
+from domain.value_objects.dinheiro import Dinheiro
+
+
+def distancias_km(origem: CoordenadaGeo, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Distâncias (haversine) de uma origem até vários pontos, calculadas de forma vetorizada."""
+    lat1 = np.radians(origem.latitude)
+    lon1 = np.radians(origem.longitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon2 = np.radians(np.asarray(longitudes, dtype=np.float64))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * RAIO_TERRA_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def calcular_taxas_entrega(distancias: np.ndarray,
+                           taxa_base: Union[Dinheiro, Decimal],
+                           taxa_por_km: Union[Dinheiro, Decimal],
+                           taxa_maxima: Optional[Union[Dinheiro, Decimal]] = None) -> List[Dinheiro]:
+    """
+    Calcula a taxa de entrega (taxa_base + taxa_por_km * distância) para vários candidatos de uma vez.
+
+    A distância é arredondada ao metro e, a partir daí, o cálculo é todo em centavos
+    inteiros (int64), com a parte por distância arredondada para cima ao centavo; o
+    resultado pode ser atribuído diretamente a `Pedido.taxa_entrega`.
+    """
+    base_centavos = Dinheiro.de_valor(taxa_base).centavos
+    por_km_centavos = Dinheiro.de_valor(taxa_por_km).centavos
+    metros = np.rint(np.asarray(distancias, dtype=np.float64) * 1000).astype(np.int64)
+    centavos = base_centavos - (-(metros * por_km_centavos) // 1000) # Divisão inteira arredondada para cima
+    if taxa_maxima is not None:
+        centavos = np.minimum(centavos, Dinheiro.de_valor(taxa_maxima).centavos)
+    return [Dinheiro.de_centavos(int(c)) for c in centavos]
@@ -0,0 +1,137 @@
+# delivery_api_project/infrastructure/geo/grade_geografica.py
+
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from infrastructure.geo.distancias import distancias_km
+
+KM_POR_GRAU_LATITUDE = 111.195
+
+Celula = Tuple[int, int]
+
+
+class GradeGeografica:
+    """
+    Índice espacial em grade (baldes de latitude/longitude) para pontos identificados por uma chave.
+
+    Uma consulta visita somente as células que intersectam o raio buscado e calcula as
+    distâncias dos candidatos de forma vetorizada. Caixas de busca que atravessam o
+    antimeridiano (±180° de longitude) continuam nas células do outro lado.
+    """
+
+    def __init__(self, tamanho_celula_km: float = 2.0):
+        if tamanho_celula_km <= 0:
+            raise ValueError("Tamanho da célula deve ser positivo.")
+        self.tamanho_celula_graus = tamanho_celula_km / KM_POR_GRAU_LATITUDE
+        self._posicoes: Dict[Hashable, Tuple[float, float]] = {}
+        self._celula_de: Dict[Hashable, Celula] = {}
+        self._celulas: Dict[Celula, Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self._posicoes)
+
+    def __contains__(self, chave: Hashable) -> bool:
+        return chave in self._posicoes
+
+    def inserir(self, chave: Hashable, coordenadas: CoordenadaGeo):
+        """Insere o ponto ou move-o para a nova posição."""
+        posicao = (coordenadas.latitude, coordenadas.longitude)
+        if self._posicoes.get(chave) == posicao:
+            return
+        self.remover(chave)
+        celula = self._celula(*posicao)
+        self._posicoes[chave] = posicao
+        self._celula_de[chave] = celula
+        self._celulas.setdefault(celula, set()).add(chave)
+
+    def remover(self, chave: Hashable):
+        celula = self._celula_de.pop(chave, None)
+        if celula is None:
+            return
+        del self._posicoes[chave]
+        grupo = self._celulas[celula]
+        grupo.discard(chave)
+        if not grupo:
+            del self._celulas[celula]
+
+    def buscar_no_raio(self, origem: CoordenadaGeo, raio_km: float) -> List[Tuple[Hashable, float]]:
+        """Pontos a até `raio_km` da origem, do mais próximo ao mais distante."""
+        ids = self._candidatos(origem, raio_km)
+        if not ids:
+            return []
+        latitudes = np.fromiter((self._posicoes[i][0] for i in ids), dtype=np.float64, count=len(ids))
+        longitudes = np.fromiter((self._posicoes[i][1] for i in ids), dtype=np.float64, count=len(ids))
+        distancias = distancias_km(origem, latitudes, longitudes)
+        dentro = np.flatnonzero(distancias <= raio_km)
+        ordem = dentro[np.argsort(distancias[dentro], kind="stable")]
+        return [(ids[posicao], float(distancias[posicao])) for posicao in ordem]
+
+    def buscar_mais_proximos(self,
+                             origem: CoordenadaGeo,
+                             k: int,
+                             raio_maximo_km: float = 50.0) -> List[Tuple[Hashable, float]]:
+        """Os `k` pontos mais próximos, sem ultrapassar `raio_maximo_km`."""
+        if k <= 0 or not self._posicoes:
+            return []
+        raio = self.tamanho_celula_graus * KM_POR_GRAU_LATITUDE
+        while True:
+            raio = min(raio, raio_maximo_km)
+            # Todos os pontos dentro do raio são conhecidos, então os k primeiros são os k mais próximos
+            encontrados = self.buscar_no_raio(origem, raio)
+            if len(encontrados) >= k or raio >= raio_maximo_km:
+                return encontrados[:k]
+            raio *= 2
+
+    def buscar_em_lote(self,
+                       origens: Iterable[CoordenadaGeo],
+                       k: Optional[int] = None,
+                       raio_km: float = 10.0) -> List[List[Tuple[Hashable, float]]]:
+        """
+        Consulta várias origens (ex.: endereços de entrega) numa só chamada, uma a uma pela
+        grade. Com `k`, retorna os k mais próximos dentro de `raio_km`; sem `k`, todos os do raio.
+        """
+        if k is None:
+            return [self.buscar_no_raio(origem, raio_km) for origem in origens]
+        return [self.buscar_mais_proximos(origem, k, raio_km) for origem in origens]
+
+    def _celula(self, latitude: float, longitude: float) -> Celula:
+        return (self._indice(latitude), self._indice(longitude))
+
+    def _indice(self, graus: float) -> int:
+        return math.floor(graus / self.tamanho_celula_graus)
+
+    def _candidatos(self, origem: CoordenadaGeo, raio_km: float) -> List[Hashable]:
+        delta_lat = raio_km / KM_POR_GRAU_LATITUDE
+        # A longitude "encolhe" com a latitude; usa a latitude mais extrema da caixa para não perder vizinhos
+        lat_extrema = min(89.0, abs(origem.latitude) + delta_lat)
+        delta_lon = min(180.0, raio_km / (KM_POR_GRAU_LATITUDE * math.cos(math.radians(lat_extrema))))
+
+        lat_min = self._indice(origem.latitude - delta_lat)
+        lat_max = self._indice(origem.latitude + delta_lat)
+        lon_inicio, lon_fim = origem.longitude - delta_lon, origem.longitude + delta_lon
+        colunas = [(self._indice(max(-180.0, lon_inicio)), self._indice(min(180.0, lon_fim)))]
+        if delta_lon < 180.0:
+            # O trecho da caixa além de ±180° corresponde às longitudes do outro lado
+            if lon_inicio < -180.0:
+                colunas.append((self._indice(lon_inicio + 360.0), self._indice(180.0)))
+            if lon_fim > 180.0:
+                colunas.append((self._indice(-180.0), self._indice(lon_fim - 360.0)))
+
+        celulas = self._celulas
+        total_celulas = (lat_max - lat_min + 1) * sum(fim - inicio + 1 for inicio, fim in colunas)
+        if total_celulas > len(celulas):
+            # Caixa maior que a grade ocupada: é mais barato filtrar as células existentes
+            return [rid for (i, j), ids in celulas.items()
+                    if lat_min <= i <= lat_max and any(inicio <= j <= fim for inicio, fim in colunas)
+                    for rid in ids]
+        visitadas = dict.fromkeys((i, j) for inicio, fim in colunas for j in range(inicio, fim + 1)
+                                  for i in range(lat_min, lat_max + 1))
+        candidatos: List[Hashable] = []
+        for celula in visitadas:
+            ids = celulas.get(celula)
+            if ids:
+                candidatos.extend(ids)
+        return candidatos
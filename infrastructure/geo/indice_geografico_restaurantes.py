@@ -0,0 +1,36 @@
+# delivery_api_project/infrastructure/geo/indice_geografico_restaurantes.py
+
+import uuid
+from typing import List, Tuple
+
+from domain.entities.restaurante import Restaurante
+from infrastructure.geo.grade_geografica import GradeGeografica
+
+
+class IndiceGeograficoRestaurantes(GradeGeografica):
+    """
+    Grade geográfica sobre `Restaurante.endereco.coordenadas`.
+
+    Apenas restaurantes ativos e com coordenadas ficam na grade. Assim como o índice de
+    busca textual, é atualizado no `salvar` do restaurante.
+    """
+
+    def indexar(self, restaurante: Restaurante):
+        coordenadas = restaurante.endereco.coordenadas
+        if not restaurante.ativo or coordenadas is None:
+            self.remover(restaurante.id)
+            return
+        self.inserir(restaurante.id, coordenadas)
+
+    def exportar_estado(self) -> List[Tuple[bytes, float, float]]:
+        """Posições indexadas em tipos primitivos (serializável com marshal), para snapshots."""
+        return [(restaurante_id.bytes, latitude, longitude) for restaurante_id, (latitude, longitude) in self._posicoes.items()]
+
+    def restaurar_estado(self, estado: List[Tuple[bytes, float, float]]):
+        self._posicoes, self._celula_de, self._celulas = {}, {}, {}
+        for restaurante_id, latitude, longitude in estado:
+            restaurante_id = uuid.UUID(bytes=restaurante_id)
+            celula = self._celula(latitude, longitude)
+            self._posicoes[restaurante_id] = (latitude, longitude)
+            self._celula_de[restaurante_id] = celula
+            self._celulas.setdefault(celula, set()).add(restaurante_id)
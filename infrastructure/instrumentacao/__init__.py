@@ -0,0 +1,3 @@
+# delivery_api_project/infrastructure/instrumentacao/__init__.py
+from.histograma import HistogramaLatencia
+from.instrumentacao import Instrumentado, MetricasMetodo, RegistroMetricas, instrumentar, registro_padrao
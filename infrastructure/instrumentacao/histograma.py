@@ -0,0 +1,99 @@
+# delivery_api_project/infrastructure/instrumentacao/histograma.py
+
+from typing import Dict, List
+
+# Buckets log-lineares no estilo HDR Histogram: valores abaixo de 2^BITS_SUB_BUCKET têm
+# bucket próprio; acima disso, cada potência de 2 é dividida em METADE_SUB_BUCKETS
+# buckets de mesma largura, o que limita o erro relativo a 1/METADE_SUB_BUCKETS (~3%).
+BITS_SUB_BUCKET = 6
+SUB_BUCKETS = 1 << BITS_SUB_BUCKET
+METADE_SUB_BUCKETS = SUB_BUCKETS >> 1
+
+PERCENTIS_PADRAO = (50.0, 90.0, 99.0, 99.9)
+
+
+def _limites(indice: int) -> tuple:
+    """(menor valor, largura) do bucket."""
+    if indice < SUB_BUCKETS:
+        return indice, 1
+    deslocamento, posicao = divmod(indice - SUB_BUCKETS, METADE_SUB_BUCKETS)
+    deslocamento += 1
+    return (posicao + METADE_SUB_BUCKETS) << deslocamento, 1 << deslocamento
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latências em nanossegundos com precisão relativa fixa (~3%).
+
+    Registrar custa um cálculo de índice e um incremento (valores negativos não são aceitos); o histograma cresce apenas
+    até o bucket do maior valor visto (cerca de 1.300 buckets para uma hora).
+    """
+
+    __slots__ = ("_contagens", "contagem", "soma_ns", "maximo_ns")
+
+    def __init__(self):
+        self._contagens: List[int] = []
+        self.contagem = 0
+        self.soma_ns = 0
+        self.maximo_ns = 0
+
+    def registrar_ns(self, valor_ns: int):
+        deslocamento = valor_ns.bit_length() - BITS_SUB_BUCKET
+        # Equivale a SUB_BUCKETS + (deslocamento - 1) * METADE + (valor >> deslocamento) - METADE
+        indice = deslocamento * METADE_SUB_BUCKETS + (valor_ns >> deslocamento) if deslocamento > 0 else valor_ns
+        try:
+            self._contagens[indice] += 1
+        except IndexError:
+            self._contagens.extend([0] * (indice + 1 - len(self._contagens)))
+            self._contagens[indice] += 1
+        if valor_ns > self.maximo_ns:
+            self.maximo_ns = valor_ns
+        self.contagem += 1
+        self.soma_ns += valor_ns
+
+    def mesclar(self, outro: "HistogramaLatencia"):
+        if not outro.contagem:
+            return
+        if len(outro._contagens) > len(self._contagens):
+            self._contagens.extend([0] * (len(outro._contagens) - len(self._contagens)))
+        for indice, quantidade in enumerate(outro._contagens):
+            self._contagens[indice] += quantidade
+        self.maximo_ns = max(self.maximo_ns, outro.maximo_ns)
+        self.contagem += outro.contagem
+        self.soma_ns += outro.soma_ns
+
+    def minimo_ns(self) -> int:
+        """Início do primeiro bucket ocupado (o mínimo exato não é guardado para baratear o registro)."""
+        for indice, quantidade in enumerate(self._contagens):
+            if quantidade:
+                return _limites(indice)[0]
+        return 0
+
+    def percentil_ns(self, percentil: float) -> float:
+        """Valor (ponto médio do bucket) abaixo do qual está `percentil`% das amostras."""
+        if not self.contagem:
+            return 0.0
+        alvo = max(1, -(-self.contagem * percentil // 100))
+        acumulado = 0
+        for indice, quantidade in enumerate(self._contagens):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                inicio, largura = _limites(indice)
+                return min(float(self.maximo_ns), inicio + (largura - 1) / 2)
+        return float(self.maximo_ns)
+
+    def resumo(self, percentis=PERCENTIS_PADRAO) -> Dict[str, float]:
+        """Resumo em milissegundos, pronto para serializar."""
+        resumo = {
+            "contagem": self.contagem,
+            "media_ms": self.soma_ns / self.contagem / 1e6 if self.contagem else 0.0,
+            "min_ms": self.minimo_ns() / 1e6,
+            "max_ms": self.maximo_ns / 1e6,
+        }
+        for percentil in percentis:
+            resumo[f"p{percentil:g}_ms"] = self.percentil_ns(percentil) / 1e6
+        return resumo
+
+    def zerar(self):
+        self._contagens.clear()
+        self.contagem = self.soma_ns = self.maximo_ns = 0
@@ -0,0 +1,97 @@
+# delivery_api_project/infrastructure/instrumentacao/instrumentacao.py
+
+import functools
+import inspect
+from time import perf_counter_ns
+from typing import Any, Dict, Optional, Tuple
+
+from infrastructure.instrumentacao.histograma import HistogramaLatencia
+
+
+class MetricasMetodo:
+    __slots__ = ("chamadas", "erros", "histograma")
+
+    def __init__(self):
+        self.chamadas = 0
+        self.erros = 0
+        self.histograma = HistogramaLatencia()
+
+    def resumo(self) -> Dict[str, Any]:
+        return {"chamadas": self.chamadas, "erros": self.erros, "latencia": self.histograma.resumo()}
+
+
+class RegistroMetricas:
+    """Métricas por (componente, método): chamadas, erros e histograma de latência."""
+
+    def __init__(self):
+        self._metricas: Dict[Tuple[str, str], MetricasMetodo] = {}
+
+    def metricas(self, componente: str, metodo: str) -> MetricasMetodo:
+        chave = (componente, metodo)
+        metricas = self._metricas.get(chave)
+        if metricas is None:
+            metricas = self._metricas[chave] = MetricasMetodo()
+        return metricas
+
+    def instantaneo(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Cópia serializável do estado atual: {componente: {método: resumo}}."""
+        resultado: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (componente, metodo), metricas in sorted(self._metricas.items()):
+            resultado.setdefault(componente, {})[metodo] = metricas.resumo()
+        return resultado
+
+    def zerar(self):
+        self._metricas.clear()
+
+
+registro_padrao = RegistroMetricas()
+
+
+class Instrumentado:
+    """
+    Proxy que mede todos os métodos assíncronos públicos do objeto decorado (ex.:
+    `salvar`, `buscar_por_id`, `listar_*` de um repositório ou `executar` de um use case),
+    sem alterar a classe original. Os demais atributos são repassados sem custo extra.
+    """
+
+    def __init__(self, alvo: Any, nome: Optional[str] = None, registro: Optional[RegistroMetricas] = None):
+        self._alvo = alvo
+        self._nome = nome or type(alvo).__name__
+        self._registro = registro if registro is not None else registro_padrao
+
+    def __getattr__(self, atributo: str):
+        valor = getattr(self._alvo, atributo)
+        if atributo.startswith("_") or not inspect.iscoroutinefunction(valor):
+            return valor
+        medido = _medir(valor, self._registro.metricas(self._nome, atributo))
+        # Guarda no próprio proxy: as próximas buscas não passam mais por __getattr__
+        self.__dict__[atributo] = medido
+        return medido
+
+    def __len__(self) -> int:
+        return len(self._alvo)
+
+    def __repr__(self) -> str:
+        return f"Instrumentado({self._alvo!r})"
+
+
+def _medir(metodo, metricas: MetricasMetodo):
+    histograma = metricas.histograma
+
+    @functools.wraps(metodo)
+    async def medido(*args, **kwargs):
+        inicio = perf_counter_ns()
+        try:
+            return await metodo(*args, **kwargs)
+        except Exception:
+            metricas.erros += 1
+            raise
+        finally:
+            metricas.chamadas += 1
+            histograma.registrar_ns(perf_counter_ns() - inicio)
+    return medido
+
+
+def instrumentar(alvo: Any, nome: Optional[str] = None, registro: Optional[RegistroMetricas] = None) -> Any:
+    """Envolve um repositório ou use case para registrar métricas de suas chamadas assíncronas."""
+    return Instrumentado(alvo, nome, registro)
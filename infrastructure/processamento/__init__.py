@@ -0,0 +1,3 @@
+# delivery_api_project/infrastructure/processamento/__init__.py
+from.comandos_pedido import ADICIONAR_ITEM, CONSULTAR, CRIAR, REMOVER_ITEM, ComandoPedido, ResultadoComando, processar_lote
+from.roteador_pedidos import EstatisticasRoteador, RoteadorPedidos
@@ -0,0 +1,132 @@
+# delivery_api_project/infrastructure/processamento/comandos_pedido.py
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.unidade_de_trabalho.unidade_de_trabalho_pedidos import UnidadeDeTrabalhoPedidos
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido
+from domain.value_objects.dinheiro import Dinheiro
+
+# Comandos além das ações da máquina de estados (AcaoPedido), que também são aceitas
+CRIAR = "CRIAR" # dados: cliente_id, endereco_entrega e, opcionalmente, taxa_entrega, metodo_pagamento, observacoes_gerais
+ADICIONAR_ITEM = "ADICIONAR_ITEM" # dados: produto_id, quantidade, preco_unitario_compra e, opcionalmente, observacoes_item
+REMOVER_ITEM = "REMOVER_ITEM" # dados: item_id
+CONSULTAR = "CONSULTAR"
+
+# Campos de `dados` convertidos para int no formato de mensagem (veja comando_para_mensagem)
+_CAMPOS_UUID = frozenset(("cliente_id", "produto_id", "item_id", "entregador_id"))
+_CAMPOS_DINHEIRO = frozenset(("taxa_entrega", "preco_unitario_compra"))
+
+
+@dataclass(frozen=True)
+class ComandoPedido:
+    """
+    Comando sobre um pedido, roteado pelo `restaurante_id` (veja RoteadorPedidos). Os dados
+    são valores simples; as entidades (Pedido, ItemPedido) são criadas por quem processa o
+    comando, que é onde as validações do domínio acontecem.
+    """
+    restaurante_id: uuid.UUID
+    pedido_id: uuid.UUID
+    acao: str # CRIAR, ADICIONAR_ITEM, REMOVER_ITEM, CONSULTAR ou uma AcaoPedido
+    dados: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ResultadoComando:
+    pedido_id: uuid.UUID
+    status_pedido: Optional[str] = None
+    valor_total: Optional[Dinheiro] = None
+    erro: Optional[str] = None
+
+    @property
+    def sucesso(self) -> bool:
+        return self.erro is None
+
+
+async def processar_lote(pedido_repository: IPedidoRepository, comandos: Sequence[ComandoPedido]) -> List[ResultadoComando]:
+    """
+    Aplica os comandos em ordem, numa única unidade de trabalho: cada pedido é carregado uma
+    vez por lote e só o que mudou é gravado, ao final. Um comando rejeitado (ex.: transição
+    inválida) não altera o pedido e não interrompe os demais.
+    """
+    resultados: List[ResultadoComando] = []
+    uow = UnidadeDeTrabalhoPedidos(pedido_repository)
+    for comando in comandos:
+        try:
+            pedido = await _aplicar(uow, comando)
+        except (ValueError, TypeError, KeyError) as erro: # Regras de domínio ou dados malformados
+            resultados.append(ResultadoComando(comando.pedido_id, erro=str(erro)))
+        else:
+            resultados.append(ResultadoComando(pedido.id, pedido.status_pedido, pedido.valor_total_pedido))
+    await uow.confirmar()
+    return resultados
+
+
+async def _aplicar(uow: UnidadeDeTrabalhoPedidos, comando: ComandoPedido) -> Pedido:
+    if comando.acao == CRIAR:
+        if await uow.buscar_por_id(comando.pedido_id) is not None:
+            raise ValueError(f"Pedido {comando.pedido_id} já existe.")
+        return uow.registrar_novo(Pedido(
+            restaurante_id=comando.restaurante_id, pedido_id=comando.pedido_id, **comando.dados
+        ))
+
+    pedido = await uow.buscar_por_id(comando.pedido_id)
+    if pedido is None or pedido.restaurante_id != comando.restaurante_id:
+        raise ValueError(f"Pedido {comando.pedido_id} não encontrado.")
+    if comando.acao == ADICIONAR_ITEM:
+        pedido.adicionar_item(ItemPedido(**comando.dados))
+    elif comando.acao == REMOVER_ITEM:
+        pedido.remover_item(comando.dados["item_id"])
+    elif comando.acao != CONSULTAR:
+        pedido.transicionar(comando.acao, **comando.dados)
+    return pedido
+
+
+# Formato de mensagem entre processos: tuplas de tipos primitivos, que o pickle serializa em C.
+# Serializar os objetos diretamente (UUID, Dinheiro, dataclasses) custa mais que processá-los.
+
+def comando_para_mensagem(comando: ComandoPedido) -> Tuple:
+    dados = comando.dados
+    if dados:
+        dados = {campo: _valor_para_mensagem(campo, valor) for campo, valor in dados.items()}
+    return comando.restaurante_id.int, comando.pedido_id.int, comando.acao, dados or None
+
+
+def comando_de_mensagem(mensagem: Tuple) -> ComandoPedido:
+    restaurante_id, pedido_id, acao, dados = mensagem
+    if dados:
+        dados = {campo: _valor_de_mensagem(campo, valor) for campo, valor in dados.items()}
+    return ComandoPedido(uuid.UUID(int=restaurante_id), uuid.UUID(int=pedido_id), acao, dados or {})
+
+
+def resultado_para_mensagem(resultado: ResultadoComando) -> Tuple:
+    """Sem o pedido_id: quem recebe já o conhece pelo comando correspondente."""
+    valor_total = resultado.valor_total
+    return resultado.status_pedido, None if valor_total is None else valor_total.centavos, resultado.erro
+
+
+def resultado_de_mensagem(comando: ComandoPedido, mensagem: Tuple) -> ResultadoComando:
+    status_pedido, centavos, erro = mensagem
+    return ResultadoComando(
+        comando.pedido_id, status_pedido, None if centavos is None else Dinheiro.de_centavos(centavos), erro
+    )
+
+
+def _valor_para_mensagem(campo: str, valor: Any) -> Any:
+    if campo in _CAMPOS_UUID and isinstance(valor, uuid.UUID):
+        return valor.int
+    if campo in _CAMPOS_DINHEIRO and type(valor) in (Dinheiro, int): # int é em reais, como em Dinheiro.de_valor
+        return Dinheiro.de_valor(valor).centavos
+    return valor
+
+
+def _valor_de_mensagem(campo: str, valor: Any) -> Any:
+    if type(valor) is int:
+        if campo in _CAMPOS_UUID:
+            return uuid.UUID(int=valor)
+        if campo in _CAMPOS_DINHEIRO:
+            return Dinheiro.de_centavos(valor)
+    return valor
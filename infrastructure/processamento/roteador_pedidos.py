@@ -0,0 +1,237 @@
+# delivery_api_project/infrastructure/processamento/roteador_pedidos.py
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from infrastructure.processamento.comandos_pedido import (
+    ComandoPedido, ResultadoComando, comando_de_mensagem, comando_para_mensagem, processar_lote, resultado_de_mensagem,
+    resultado_para_mensagem
+)
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+FabricaRepositorio = Callable[[], IPedidoRepository]
+_Aguardando = Tuple["asyncio.Future[List[ResultadoComando]]", List[ComandoPedido]]
+
+
+@dataclass
+class EstatisticasRoteador:
+    comandos: int = 0
+    lotes_enviados: int = 0
+
+    @property
+    def comandos_por_lote(self) -> float:
+        return self.comandos / self.lotes_enviados if self.lotes_enviados else 0.0
+
+
+class RoteadorPedidos:
+    """
+    Processa comandos de pedidos num conjunto de processos (partições), contornando o GIL
+    para o trabalho de CPU das regras de domínio.
+
+    Cada partição é um processo que possui, com exclusividade, os pedidos dos restaurantes
+    que lhe cabem (`restaurante_id.int % processos`) num repositório próprio. Comandos de um
+    mesmo restaurante vão sempre para a mesma partição, por um único canal, e são aplicados
+    na ordem de chegada: a ordem das transições de status por restaurante é preservada.
+
+    Os comandos enviados durante uma mesma iteração do event loop são agrupados num lote por
+    partição (enviado antes, se chegar a `tamanho_maximo_lote`), que viaja como uma única
+    mensagem de tuplas primitivas (veja `comando_para_mensagem`) e é aplicado pela partição
+    com `processar_lote`. As respostas são lidas por uma thread por partição e entregues aos
+    chamadores na ordem de envio.
+
+    `fabrica_repositorio` é chamada dentro de cada processo e, por isso, deve ser
+    serializável com pickle (ex.: uma classe ou função de módulo).
+    """
+
+    def __init__(self,
+                 processos: Optional[int] = None,
+                 fabrica_repositorio: FabricaRepositorio = PedidoRepositoryEmMemoria,
+                 tamanho_maximo_lote: int = 1_000,
+                 metodo_inicio: Optional[str] = None # "spawn", "fork"...; None usa o padrão da plataforma
+                 ):
+        processos = processos if processos is not None else os.cpu_count() or 1
+        if processos <= 0 or tamanho_maximo_lote <= 0:
+            raise ValueError("Número de processos e tamanho máximo do lote devem ser positivos.")
+        self.processos = processos
+        self.fabrica_repositorio = fabrica_repositorio
+        self.tamanho_maximo_lote = tamanho_maximo_lote
+        self.estatisticas = EstatisticasRoteador()
+        self._contexto = multiprocessing.get_context(metodo_inicio)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._particoes: List[_Particao] = []
+
+    def particao(self, restaurante_id: uuid.UUID) -> int:
+        return restaurante_id.int % self.processos
+
+    @property
+    def iniciado(self) -> bool:
+        return bool(self._particoes)
+
+    def iniciar(self):
+        """Sobe os processos das partições; deve ser chamado com o event loop em execução."""
+        if self._particoes:
+            return
+        self._loop = asyncio.get_running_loop()
+        for indice in range(self.processos):
+            conexao, conexao_processo = self._contexto.Pipe()
+            processo = self._contexto.Process(
+                target=_servir_particao, args=(conexao_processo, self.fabrica_repositorio),
+                name=f"particao-pedidos-{indice}", daemon=True,
+            )
+            processo.start()
+            conexao_processo.close()
+            particao = _Particao(processo, conexao)
+            particao.leitor = threading.Thread(
+                target=self._ler_respostas, args=(particao,), name=f"leitor-particao-{indice}", daemon=True
+            )
+            particao.leitor.start()
+            self._particoes.append(particao)
+
+    async def encerrar(self):
+        """Aguarda os comandos já enviados e encerra as partições (seus pedidos são descartados)."""
+        if not self._particoes:
+            return
+        particoes, self._particoes = self._particoes, []
+        for particao in particoes:
+            self._despachar(particao)
+        for particao in particoes:
+            while particao.em_voo:
+                await asyncio.gather(*(futuro for futuro, _ in particao.em_voo[-1]), return_exceptions=True)
+            try:
+                particao.conexao.send(None)
+            except OSError:
+                pass # Processo já terminou
+        for particao in particoes:
+            await self._loop.run_in_executor(None, particao.processo.join)
+            particao.leitor.join()
+            particao.conexao.close()
+
+    async def executar(self, comando: ComandoPedido) -> ResultadoComando:
+        return (await self._enfileirar([comando]))[0]
+
+    async def executar_lote(self, comandos: Sequence[ComandoPedido]) -> List[ResultadoComando]:
+        """Resultados na ordem dos comandos; os de partições diferentes são processados em paralelo."""
+        if not self._particoes:
+            raise ValueError("Roteador de pedidos não iniciado.")
+        grupos: Dict[int, List[int]] = {}
+        for posicao, comando in enumerate(comandos):
+            grupos.setdefault(self.particao(comando.restaurante_id), []).append(posicao)
+        futuros = [self._enfileirar([comandos[posicao] for posicao in posicoes], indice) for indice, posicoes in grupos.items()]
+
+        resultados: List[Optional[ResultadoComando]] = [None] * len(comandos)
+        for posicoes, resultados_grupo in zip(grupos.values(), await asyncio.gather(*futuros)):
+            for posicao, resultado in zip(posicoes, resultados_grupo):
+                resultados[posicao] = resultado
+        return resultados
+
+    def _enfileirar(self, comandos: List[ComandoPedido], indice: Optional[int] = None) -> "asyncio.Future[List[ResultadoComando]]":
+        """Comandos de uma mesma partição; o futuro recebe os resultados deles, na mesma ordem."""
+        if not self._particoes:
+            raise ValueError("Roteador de pedidos não iniciado.")
+        particao = self._particoes[self.particao(comandos[0].restaurante_id) if indice is None else indice]
+        futuro = self._loop.create_future()
+        if not particao.pendentes:
+            self._loop.call_soon(self._despachar, particao)
+        particao.pendentes.extend(comandos)
+        particao.aguardando.append((futuro, comandos))
+        self.estatisticas.comandos += len(comandos)
+        if len(particao.pendentes) >= self.tamanho_maximo_lote:
+            self._despachar(particao)
+        return futuro
+
+    def _despachar(self, particao: "_Particao"):
+        if not particao.pendentes:
+            return
+        # O envio acontece sempre na thread do event loop: a ordem dos lotes no canal é a de chegada
+        mensagens = list(map(comando_para_mensagem, particao.pendentes))
+        particao.em_voo.append(particao.aguardando)
+        particao.pendentes, particao.aguardando = [], []
+        self.estatisticas.lotes_enviados += 1
+        try:
+            particao.conexao.send(mensagens)
+        except (OSError, ValueError) as erro:
+            self._falhar(particao, erro)
+
+    def _ler_respostas(self, particao: "_Particao"):
+        try:
+            while True:
+                try:
+                    mensagens = particao.conexao.recv()
+                except (EOFError, OSError) as erro:
+                    self._loop.call_soon_threadsafe(self._falhar, particao, erro)
+                    return
+                if mensagens is None: # Confirmação de encerramento
+                    return
+                self._loop.call_soon_threadsafe(self._resolver, particao, mensagens)
+        except RuntimeError:
+            pass # Event loop já fechado (roteador abandonado sem encerrar): não há a quem responder
+
+    @staticmethod
+    def _resolver(particao: "_Particao", mensagens: List[Tuple]):
+        if not particao.em_voo:
+            return # Resposta que chegou depois de _falhar já ter falhado os lotes em voo
+        inicio = 0
+        for futuro, comandos in particao.em_voo.popleft():
+            fim = inicio + len(comandos)
+            if not futuro.done():
+                futuro.set_result(list(map(resultado_de_mensagem, comandos, mensagens[inicio:fim])))
+            inicio = fim
+
+    @staticmethod
+    def _falhar(particao: "_Particao", erro: BaseException):
+        """Partição morta ou canal fechado: falha tudo que aguardava resposta dela."""
+        while particao.em_voo:
+            for futuro, _ in particao.em_voo.popleft():
+                if not futuro.done():
+                    futuro.set_exception(erro)
+
+
+class _Particao:
+    __slots__ = ("processo", "conexao", "leitor", "pendentes", "aguardando", "em_voo")
+
+    def __init__(self, processo: multiprocessing.process.BaseProcess, conexao: Connection):
+        self.processo = processo
+        self.conexao = conexao
+        self.leitor: Optional[threading.Thread] = None
+        # Comandos aguardando o próximo envio e, para cada chamador, seu futuro e seus comandos
+        self.pendentes: List[ComandoPedido] = []
+        self.aguardando: List[_Aguardando] = []
+        self.em_voo: Deque[List[_Aguardando]] = deque() # Lotes enviados, na ordem de envio
+
+
+def _servir_particao(conexao: Connection, fabrica_repositorio: FabricaRepositorio):
+    """Laço do processo de uma partição: recebe lotes, aplica e responde, até receber None."""
+    repositorio = fabrica_repositorio()
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            mensagens = conexao.recv()
+            if mensagens is None:
+                conexao.send(None)
+                break
+            conexao.send(_processar_mensagens(loop, repositorio, mensagens))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        loop.close()
+        conexao.close()
+
+
+def _processar_mensagens(loop: asyncio.AbstractEventLoop, repositorio: IPedidoRepository, mensagens: List[Tuple]) -> List[Tuple]:
+    """
+    Respostas de um lote. Um erro inesperado (ex.: falha na gravação do repositório) responde
+    todos os comandos do lote com o erro, em vez de derrubar a partição e os pedidos dela.
+    """
+    try:
+        resultados = loop.run_until_complete(processar_lote(repositorio, list(map(comando_de_mensagem, mensagens))))
+        return list(map(resultado_para_mensagem, resultados))
+    except Exception as erro:
+        return [(None, None, f"Falha ao processar o lote: {erro!r}")] * len(mensagens)
@@ -0,0 +1,8 @@
+# delivery_api_project/infrastructure/repositories/__init__.py
+from.cliente_repository_em_memoria import ClienteRepositoryEmMemoria
+from.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+from.categoria_produto_repository_em_memoria import CategoriaProdutoRepositoryEmMemoria
+from.produto_repository_em_memoria import ProdutoRepositoryEmMemoria
+from.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from.pedido_repository_decorador import PedidoRepositoryDecorador
+from.outbox_em_memoria import OutboxEmMemoria
@@ -0,0 +1,99 @@
+# delivery_api_project/infrastructure/repositories/categoria_produto_repository_em_memoria.py
+
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from application.interfaces.i_categoria_produto_repository import ICategoriaProdutoRepository
+from domain.entities.categoria_produto import CategoriaProduto
+from infrastructure.repositories.indices import IndiceSecundario, uuid_de_bytes
+
+
+class CategoriaProdutoRepositoryEmMemoria(ICategoriaProdutoRepository):
+    """
+    Implementação em memória de ICategoriaProdutoRepository.
+
+    Mantém índices por restaurante_id e por (restaurante_id, nome). As listagens
+    seguem o campo `ordem` da categoria (e o nome, como desempate).
+    """
+
+    def __init__(self):
+        self._categorias: Dict[uuid.UUID, CategoriaProduto] = {}
+        self._indexado: Dict[uuid.UUID, Tuple[uuid.UUID, str]] = {}
+        self._por_restaurante: IndiceSecundario[uuid.UUID] = IndiceSecundario()
+        self._por_nome: Dict[Tuple[uuid.UUID, str], uuid.UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self._categorias)
+
+    def exportar_snapshot(self) -> Tuple[List[CategoriaProduto], List[Tuple[bytes, bytes, str]]]:
+        """(categorias, estado dos índices em tipos primitivos); veja `de_snapshot`."""
+        estado = [(categoria_id.bytes, restaurante_id.bytes, nome) for categoria_id, (restaurante_id, nome) in self._indexado.items()]
+        return list(self._categorias.values()), estado
+
+    @classmethod
+    def de_snapshot(cls,
+                    categorias: Dict[uuid.UUID, CategoriaProduto],
+                    estado_indices: List[Tuple[bytes, bytes, str]]) -> "CategoriaProdutoRepositoryEmMemoria":
+        """
+        Repositório sobre `categorias` (ex.: RegistrosPreguicosos de um snapshot), com os índices
+        reconstruídos a partir do estado exportado, sem acessar as entidades.
+        """
+        repositorio = cls()
+        repositorio._categorias = categorias
+        for categoria_id, restaurante_id, nome in estado_indices:
+            categoria_id, chave = uuid_de_bytes(categoria_id), (uuid_de_bytes(restaurante_id), nome)
+            repositorio._indexado[categoria_id] = chave
+            repositorio._por_restaurante.inserir(chave[0], categoria_id)
+            repositorio._por_nome[chave] = categoria_id
+        return repositorio
+
+    async def salvar(self, categoria: CategoriaProduto) -> CategoriaProduto:
+        novo = (categoria.restaurante_id, categoria.nome.strip().casefold())
+        dona_do_nome = self._por_nome.get(novo)
+        if dona_do_nome is not None and dona_do_nome != categoria.id:
+            raise ValueError(f"Já existe uma categoria '{categoria.nome}' neste restaurante.")
+
+        antigo = self._indexado.get(categoria.id)
+        if antigo != novo:
+            if antigo is not None:
+                self._por_restaurante.remover(antigo[0], categoria.id)
+                del self._por_nome[antigo]
+            self._por_restaurante.inserir(novo[0], categoria.id)
+            self._por_nome[novo] = categoria.id
+            self._indexado[categoria.id] = novo
+        self._categorias[categoria.id] = categoria
+        return categoria
+
+    async def buscar_por_id(self, categoria_id: uuid.UUID) -> Optional[CategoriaProduto]:
+        return self._categorias.get(categoria_id)
+
+    async def buscar_por_ids(self, categoria_ids: List[uuid.UUID]) -> List[CategoriaProduto]:
+        return [self._categorias[c] for c in dict.fromkeys(categoria_ids) if c in self._categorias]
+
+    async def listar_por_restaurante_id(
+        self,
+        restaurante_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[CategoriaProduto]:
+        categorias = sorted(
+            (self._categorias[categoria_id] for categoria_id in self._por_restaurante.ids(restaurante_id)),
+            key=lambda c: (c.ordem or 0, c.nome)
+        )
+        return categorias[skip:skip + limit]
+
+    async def buscar_por_nome_e_restaurante_id(
+        self,
+        nome: str,
+        restaurante_id: uuid.UUID) -> Optional[CategoriaProduto]:
+        categoria_id = self._por_nome.get((restaurante_id, nome.strip().casefold()))
+        return self._categorias.get(categoria_id) if categoria_id is not None else None
+
+    async def deleter(self, categoria_id: uuid.UUID) -> bool:
+        categoria = self._categorias.pop(categoria_id, None)
+        if categoria is None:
+            return False
+        restaurante_id, nome = self._indexado.pop(categoria_id)
+        self._por_restaurante.remover(restaurante_id, categoria_id)
+        del self._por_nome[(restaurante_id, nome)]
+        return True
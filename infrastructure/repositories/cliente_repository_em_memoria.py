@@ -0,0 +1,61 @@
+# delivery_api_project/infrastructure/repositories/cliente_repository_em_memoria.py
+
+import uuid
+from itertools import islice
+from typing import Dict, List, Optional
+
+from application.interfaces.i_cliente_repository import IClienteRepository
+from domain.entities.cliente import Cliente
+
+
+def _normalizar_email(email: str) -> str:
+    return email.strip().casefold()
+
+
+class ClienteRepositoryEmMemoria(IClienteRepository):
+    """
+    Implementação em memória de IClienteRepository.
+
+    Mantém um índice único por email (sem diferenciar maiúsculas/minúsculas),
+    tornando `buscar_por_email` uma consulta O(1).
+    """
+
+    def __init__(self):
+        self._clientes: Dict[uuid.UUID, Cliente] = {}
+        self._por_email: Dict[str, uuid.UUID] = {}
+        self._email_indexado: Dict[uuid.UUID, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._clientes)
+
+    async def salvar(self, cliente: Cliente) -> Cliente:
+        email = _normalizar_email(cliente.email)
+        dono_do_email = self._por_email.get(email)
+        if dono_do_email is not None and dono_do_email != cliente.id:
+            raise ValueError(f"Já existe um cliente cadastrado com o email {cliente.email}.")
+
+        email_antigo = self._email_indexado.get(cliente.id)
+        if email_antigo is not None and email_antigo != email:
+            del self._por_email[email_antigo]
+
+        self._clientes[cliente.id] = cliente
+        self._por_email[email] = cliente.id
+        self._email_indexado[cliente.id] = email
+        return cliente
+
+    async def buscar_por_id(self, cliente_id: uuid.UUID) -> Optional[Cliente]:
+        return self._clientes.get(cliente_id)
+
+    async def buscar_por_email(self, email: str) -> Optional[Cliente]:
+        cliente_id = self._por_email.get(_normalizar_email(email))
+        return self._clientes.get(cliente_id) if cliente_id is not None else None
+
+    async def listar_todos(self, skip: int = 0, limit: int = 100) -> List[Cliente]:
+        return list(islice(self._clientes.values(), skip, skip + limit))
+
+    async def deletar(self, cliente_id: uuid.UUID) -> bool:
+        cliente = self._clientes.pop(cliente_id, None)
+        if cliente is None:
+            return False
+        del self._por_email[self._email_indexado.pop(cliente_id)]
+        return True
@@ -0,0 +1,165 @@
+# delivery_api_project/infrastructure/repositories/indices.py
+
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from heapq import merge
+from itertools import islice
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# Chave de ordenação usada pelos índices temporais: (data, id) desempata
+# registros criados no mesmo instante e torna a ordem total e estável.
+ChaveTemporal = Tuple[datetime, uuid.UUID]
+
+_UUID_MIN = uuid.UUID(int=0)
+_UUID_MAX = uuid.UUID(int=(1 << 128) - 1)
+
+# Chave temporal em tipos primitivos (data ISO 8601, bytes do id), para snapshots
+ChaveTemporalPrimitiva = Tuple[str, bytes]
+
+
+_UUID = uuid.UUID
+_de_iso = datetime.fromisoformat
+
+
+def uuid_de_bytes(valor: bytes) -> uuid.UUID:
+    """UUID a partir dos 16 bytes gravados (ex.: em snapshots)."""
+    return _UUID(bytes=valor)
+
+
+def chave_para_primitiva(chave: ChaveTemporal) -> ChaveTemporalPrimitiva:
+    return chave[0].isoformat(), chave[1].bytes
+
+
+def chave_de_primitiva(chave: ChaveTemporalPrimitiva) -> ChaveTemporal:
+    return _de_iso(chave[0]), uuid_de_bytes(chave[1])
+
+
+def fatiar_valores(registros: Dict, inicio: int, fim: int) -> List:
+    """
+    Valores de `registros` nas posições [inicio, fim) da ordem de iteração. Dicionários
+    carregados de snapshot (RegistrosPreguicosos, que têm `fatia`) decodificam só a faixa.
+    """
+    fatia = getattr(registros, "fatia", None)
+    if fatia is not None:
+        return fatia(inicio, fim)
+    return list(islice(registros.values(), inicio, fim))
+
+
+class IndiceOrdenado:
+    """Lista ordenada de chaves (data, id) mantida com bisect."""
+
+    __slots__ = ("_chaves",)
+
+    def __init__(self):
+        self._chaves: List[ChaveTemporal] = []
+
+    def __len__(self) -> int:
+        return len(self._chaves)
+
+    def inserir(self, chave: ChaveTemporal):
+        insort(self._chaves, chave)
+
+    def estender(self, chaves: Iterable[ChaveTemporal]):
+        """Insere várias chaves de uma vez (carga em lote): uma ordenação em vez de um insort por chave."""
+        self._chaves.extend(chaves)
+        self._chaves.sort()
+
+    def remover(self, chave: ChaveTemporal):
+        posicao = bisect_left(self._chaves, chave)
+        if posicao < len(self._chaves) and self._chaves[posicao] == chave:
+            del self._chaves[posicao]
+
+    def intervalo(self,
+                  data_inicio: Optional[datetime] = None,
+                  data_fim: Optional[datetime] = None,
+                  apos: Optional[ChaveTemporal] = None) -> Iterator[ChaveTemporal]:
+        """
+        Itera, em ordem crescente, as chaves com data_inicio <= data <= data_fim.
+
+        Com `apos`, começa estritamente depois dessa chave (paginação por cursor/keyset).
+        """
+        inicio = bisect_left(self._chaves, (data_inicio, _UUID_MIN)) if data_inicio is not None else 0
+        if apos is not None:
+            inicio = max(inicio, bisect_right(self._chaves, apos))
+        fim = bisect_right(self._chaves, (data_fim, _UUID_MAX)) if data_fim is not None else len(self._chaves)
+        for posicao in range(inicio, fim):
+            yield self._chaves[posicao]
+
+
+class IndiceOrdenadoAgrupado(Generic[K]):
+    """Um IndiceOrdenado por valor de atributo (ex.: por cliente_id ou por status)."""
+
+    __slots__ = ("_grupos",)
+
+    def __init__(self):
+        self._grupos: Dict[K, IndiceOrdenado] = {}
+
+    def inserir(self, valor: K, chave: ChaveTemporal):
+        grupo = self._grupos.get(valor)
+        if grupo is None:
+            grupo = self._grupos[valor] = IndiceOrdenado()
+        grupo.inserir(chave)
+
+    def estender(self, grupos: Iterable[Tuple[K, Iterable[ChaveTemporal]]]):
+        """Insere, de uma vez por grupo, as chaves de cada valor (carga em lote), como `IndiceOrdenado.estender`."""
+        for valor, chaves in grupos:
+            grupo = self._grupos.get(valor)
+            if grupo is None:
+                grupo = self._grupos[valor] = IndiceOrdenado()
+            grupo.estender(chaves)
+
+    def remover(self, valor: K, chave: ChaveTemporal):
+        grupo = self._grupos.get(valor)
+        if grupo is None:
+            return
+        grupo.remover(chave)
+        if not grupo:
+            del self._grupos[valor]
+
+    def contar(self, valor: K) -> int:
+        grupo = self._grupos.get(valor)
+        return len(grupo) if grupo is not None else 0
+
+    def intervalo(self,
+                  valores: Iterable[K],
+                  data_inicio: Optional[datetime] = None,
+                  data_fim: Optional[datetime] = None,
+                  apos: Optional[ChaveTemporal] = None) -> Iterator[ChaveTemporal]:
+        """Intercala (merge) os intervalos de vários grupos mantendo a ordem global."""
+        iteradores = [
+            self._grupos[valor].intervalo(data_inicio, data_fim, apos)
+            for valor in dict.fromkeys(valores) # remove duplicados preservando a ordem
+            if valor in self._grupos
+        ]
+        if len(iteradores) == 1:
+            return iteradores[0]
+        return merge(*iteradores)
+
+
+class IndiceSecundario(Generic[K]):
+    """Mapeia um valor de atributo para o conjunto ordenado (por inserção) de IDs."""
+
+    __slots__ = ("_grupos",)
+
+    def __init__(self):
+        self._grupos: Dict[K, Dict[uuid.UUID, None]] = {}
+
+    def inserir(self, valor: K, entidade_id: uuid.UUID):
+        self._grupos.setdefault(valor, {})[entidade_id] = None
+
+    def remover(self, valor: K, entidade_id: uuid.UUID):
+        grupo = self._grupos.get(valor)
+        if grupo is None:
+            return
+        grupo.pop(entidade_id, None)
+        if not grupo:
+            del self._grupos[valor]
+
+    def ids(self, valor: K) -> Iterable[uuid.UUID]:
+        return self._grupos.get(valor, {}).keys()
+
+    def contar(self, valor: K) -> int:
+        return len(self._grupos.get(valor, ()))
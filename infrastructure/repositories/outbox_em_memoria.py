@@ -0,0 +1,49 @@
+# delivery_api_project/infrastructure/repositories/outbox_em_memoria.py
+
+import uuid
+from itertools import count, islice
+from typing import Collection, Dict, List
+
+from application.interfaces.i_outbox_repository import IOutboxRepository, RegistroOutbox
+from domain.eventos.evento_status_pedido import EventoStatusPedido
+
+
+class OutboxEmMemoria(IOutboxRepository):
+    """Outbox em memória: registros pendentes (e falhas definitivas) por posição, na ordem de gravação."""
+
+    def __init__(self):
+        self._pendentes: Dict[int, RegistroOutbox] = {}
+        self._falhas: Dict[int, RegistroOutbox] = {}
+        self._posicoes = count(1)
+
+    def __len__(self) -> int:
+        return len(self._pendentes)
+
+    async def adicionar(self, eventos: List[EventoStatusPedido]) -> None:
+        for evento in eventos:
+            posicao = next(self._posicoes)
+            self._pendentes[posicao] = RegistroOutbox(posicao, evento)
+
+    async def buscar_pendentes(self,
+                               limite: int = 500,
+                               ignorar_pedidos: Collection[uuid.UUID] = ()) -> List[RegistroOutbox]:
+        # O dict preserva a ordem de inserção, que é a ordem das posições
+        registros = self._pendentes.values()
+        if ignorar_pedidos:
+            registros = (registro for registro in registros if registro.evento.pedido_id not in ignorar_pedidos)
+        return list(islice(registros, limite))
+
+    async def marcar_entregues(self, posicoes: List[int]) -> None:
+        for posicao in posicoes:
+            self._pendentes.pop(posicao, None)
+
+    async def mover_para_falhas(self, posicoes: List[int]) -> None:
+        for posicao in posicoes:
+            registro = self._pendentes.pop(posicao, None)
+            if registro is not None:
+                self._falhas[posicao] = registro
+        # Falhas são raras: reordenar por posição aqui mantém listar_falhas simples
+        self._falhas = dict(sorted(self._falhas.items()))
+
+    async def listar_falhas(self, limite: int = 500) -> List[RegistroOutbox]:
+        return list(islice(self._falhas.values(), limite))
@@ -0,0 +1,134 @@
+# delivery_api_project/infrastructure/repositories/pedido_repository_decorador.py
+
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+from application.dtos.resumo_pedido_dto import ResumoPedidoDTO
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.interfaces.paginacao import Pagina
+from domain.entities.pedido import Pedido
+
+
+class PedidoRepositoryDecorador(IPedidoRepository):
+    """
+    Base para decoradores de IPedidoRepository: repassa tudo ao repositório decorado.
+    Subclasses que reagem a gravações sobrescrevem `_apos_salvar`, chamado para cada
+    pedido gravado, seja por `salvar` ou por `salvar_alteracoes`.
+    """
+
+    def __init__(self, repositorio: IPedidoRepository):
+        self._repositorio = repositorio
+
+    async def salvar(self, pedido: Pedido) -> Pedido:
+        pedido_salvo = await self._repositorio.salvar(pedido)
+        await self._apos_salvar(pedido_salvo)
+        return pedido_salvo
+
+    async def salvar_alteracoes(self, novos: List[Pedido], alterados: List[Pedido]) -> None:
+        await self._repositorio.salvar_alteracoes(novos, alterados)
+        for pedido in novos:
+            await self._apos_salvar(pedido)
+        for pedido in alterados:
+            await self._apos_salvar(pedido)
+
+    async def _apos_salvar(self, pedido: Pedido):
+        pass
+
+    async def buscar_por_id(self, pedido_id: uuid.UUID) -> Optional[Pedido]:
+        return await self._repositorio.buscar_por_id(pedido_id)
+
+    async def listar_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> List[Pedido]:
+        return await self._repositorio.listar_por_cliente_id(cliente_id, skip, limit, data_inicio, data_fim, status)
+
+    async def listar_por_status(
+        self,
+        status_lista: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> List[Pedido]:
+        return await self._repositorio.listar_por_status(status_lista, skip, limit, data_inicio, data_fim)
+
+    async def listar_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[Pedido]:
+        return await self._repositorio.listar_por_cliente_id_cursor(
+            cliente_id, limit, cursor, data_inicio, data_fim, status
+        )
+
+    async def listar_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[Pedido]:
+        return await self._repositorio.listar_por_status_cursor(status_lista, limit, cursor, data_inicio, data_fim)
+
+    async def buscar_resumo_por_id(self, pedido_id: uuid.UUID) -> Optional[ResumoPedidoDTO]:
+        return await self._repositorio.buscar_resumo_por_id(pedido_id)
+
+    async def listar_resumos_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> List[ResumoPedidoDTO]:
+        return await self._repositorio.listar_resumos_por_cliente_id(
+            cliente_id, skip, limit, data_inicio, data_fim, status
+        )
+
+    async def listar_resumos_por_status(
+        self,
+        status_lista: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> List[ResumoPedidoDTO]:
+        return await self._repositorio.listar_resumos_por_status(status_lista, skip, limit, data_inicio, data_fim)
+
+    async def listar_resumos_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        return await self._repositorio.listar_resumos_por_cliente_id_cursor(
+            cliente_id, limit, cursor, data_inicio, data_fim, status
+        )
+
+    async def listar_resumos_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        return await self._repositorio.listar_resumos_por_status_cursor(
+            status_lista, limit, cursor, data_inicio, data_fim
+        )
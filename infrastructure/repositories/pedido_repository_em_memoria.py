@@ -0,0 +1,312 @@
+# delivery_api_project/infrastructure/repositories/pedido_repository_em_memoria.py
+
+import uuid
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from application.dtos.resumo_pedido_dto import ResumoPedidoDTO
+from application.interfaces.i_outbox_repository import IOutboxRepository
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.interfaces.paginacao import Pagina, codificar_cursor, decodificar_cursor
+from application.mappers.pedido_mapper import pedido_para_resumo_dto
+from domain.entities.pedido import Pedido
+from infrastructure.repositories.indices import (
+    ChaveTemporal, IndiceOrdenado, IndiceOrdenadoAgrupado, chave_de_primitiva, chave_para_primitiva, uuid_de_bytes
+)
+
+T = TypeVar("T")
+
+
+class PedidoRepositoryEmMemoria(IPedidoRepository):
+    """
+    Implementação em memória de IPedidoRepository.
+
+    Mantém índices secundários por cliente_id, por status_pedido e por data_criacao,
+    todos ordenados por (data_criacao, id). As listagens retornam os pedidos em ordem
+    crescente de criação. Os índices refletem o estado do pedido no último `salvar`.
+
+    Com um `outbox`, cada `salvar` grava também os eventos de status pendentes do pedido
+    (a mesma "transação", já que nada suspende entre as duas escritas). Sem outbox, os
+    eventos são descartados ao salvar.
+    """
+
+    def __init__(self, outbox: Optional[IOutboxRepository] = None):
+        self.outbox = outbox
+        self._pedidos: Dict[uuid.UUID, Pedido] = {}
+        # Snapshot dos atributos indexados no último salvar, para reindexar em atualizações
+        self._chave_indexada: Dict[uuid.UUID, ChaveTemporal] = {}
+        self._status_indexado: Dict[uuid.UUID, str] = {}
+        self._cliente_indexado: Dict[uuid.UUID, uuid.UUID] = {}
+
+        self._por_data = IndiceOrdenado()
+        self._por_cliente: IndiceOrdenadoAgrupado[uuid.UUID] = IndiceOrdenadoAgrupado()
+        self._por_status: IndiceOrdenadoAgrupado[str] = IndiceOrdenadoAgrupado()
+
+    def __len__(self) -> int:
+        return len(self._pedidos)
+
+    def exportar_snapshot(self, status: Optional[Iterable[str]] = None) -> Tuple[List[Pedido], List[Tuple]]:
+        """
+        (pedidos, estado dos índices em tipos primitivos), opcionalmente só dos pedidos com os
+        `status` informados (ex.: os em aberto); veja `de_snapshot`.
+        """
+        filtro = None if status is None else set(status)
+        pedidos: List[Pedido] = []
+        estado: List[Tuple] = []
+        for chave in self._por_data.intervalo(): # Em ordem de chave: a ordenação na reconstrução é linear
+            pedido_id = chave[1]
+            status_pedido = self._status_indexado[pedido_id]
+            if filtro is None or status_pedido in filtro:
+                pedidos.append(self._pedidos[pedido_id])
+                estado.append((chave_para_primitiva(chave), status_pedido, self._cliente_indexado[pedido_id].bytes))
+        return pedidos, estado
+
+    @classmethod
+    def de_snapshot(cls,
+                    pedidos: Dict[uuid.UUID, Pedido],
+                    estado_indices: List[Tuple],
+                    outbox: Optional[IOutboxRepository] = None) -> "PedidoRepositoryEmMemoria":
+        """
+        Repositório sobre `pedidos` (ex.: RegistrosPreguicosos de um snapshot), com os índices
+        reconstruídos a partir do estado exportado, sem acessar as entidades.
+        """
+        repositorio = cls(outbox)
+        repositorio._pedidos = pedidos
+        # Agrupa pelos bytes (hash em C) antes de criar os UUIDs dos clientes
+        por_cliente: Dict[bytes, List[ChaveTemporal]] = {}
+        por_status: Dict[str, List[ChaveTemporal]] = {}
+        chaves: List[ChaveTemporal] = []
+        for chave, status_pedido, cliente_id in estado_indices:
+            chave = chave_de_primitiva(chave)
+            chaves.append(chave)
+            grupo = por_cliente.get(cliente_id)
+            if grupo is None:
+                grupo = por_cliente[cliente_id] = []
+            grupo.append(chave)
+            grupo = por_status.get(status_pedido)
+            if grupo is None:
+                grupo = por_status[status_pedido] = []
+            grupo.append(chave)
+            repositorio._chave_indexada[chave[1]] = chave
+            repositorio._status_indexado[chave[1]] = status_pedido
+        grupos_clientes = []
+        for cliente_id, chaves_do_cliente in por_cliente.items():
+            cliente_id = uuid_de_bytes(cliente_id)
+            grupos_clientes.append((cliente_id, chaves_do_cliente))
+            for chave in chaves_do_cliente:
+                repositorio._cliente_indexado[chave[1]] = cliente_id
+        repositorio._por_data.estender(chaves)
+        repositorio._por_cliente.estender(grupos_clientes)
+        repositorio._por_status.estender(por_status.items())
+        return repositorio
+
+    async def salvar(self, pedido: Pedido) -> Pedido:
+        self._indexar(pedido)
+        pedido.limpar_alteracoes() # Gravado por inteiro: nada fica pendente para uma próxima gravação parcial
+        eventos = pedido.retirar_eventos()
+        if eventos and self.outbox is not None:
+            await self.outbox.adicionar(eventos)
+        return pedido
+
+    async def salvar_alteracoes(self, novos: List[Pedido], alterados: List[Pedido]) -> None:
+        """
+        Indexa os pedidos novos por inteiro. Dos alterados, só o que `pedido.alteracoes`
+        indica: o índice de status apenas se o status mudou; alterações só de itens ou de
+        outros campos não tocam os índices (nem carregam os itens). Os eventos de todos vão
+        para o outbox numa única chamada.
+        """
+        eventos = []
+        for pedido in novos:
+            self._indexar(pedido)
+            eventos.extend(pedido.retirar_eventos())
+        for pedido in alterados:
+            if pedido.id not in self._chave_indexada:
+                self._indexar(pedido) # Nunca gravado aqui: não há o que aproveitar
+            else:
+                if "status_pedido" in pedido.alteracoes.campos:
+                    self._reindexar_status(pedido)
+                self._pedidos[pedido.id] = pedido
+            eventos.extend(pedido.retirar_eventos())
+        if eventos and self.outbox is not None:
+            await self.outbox.adicionar(eventos)
+
+    def _reindexar_status(self, pedido: Pedido):
+        status_antigo = self._status_indexado[pedido.id]
+        if status_antigo != pedido.status_pedido:
+            chave = self._chave_indexada[pedido.id]
+            self._por_status.remover(status_antigo, chave)
+            self._por_status.inserir(pedido.status_pedido, chave)
+            self._status_indexado[pedido.id] = pedido.status_pedido
+
+    def _indexar(self, pedido: Pedido):
+        chave_nova = (pedido.data_criacao, pedido.id)
+        chave_antiga = self._chave_indexada.get(pedido.id)
+
+        if chave_antiga is None:
+            self._por_data.inserir(chave_nova)
+            self._por_cliente.inserir(pedido.cliente_id, chave_nova)
+            self._por_status.inserir(pedido.status_pedido, chave_nova)
+        else:
+            status_antigo = self._status_indexado[pedido.id]
+            cliente_antigo = self._cliente_indexado[pedido.id]
+            if chave_antiga != chave_nova:
+                self._por_data.remover(chave_antiga)
+                self._por_data.inserir(chave_nova)
+            if chave_antiga != chave_nova or cliente_antigo != pedido.cliente_id:
+                self._por_cliente.remover(cliente_antigo, chave_antiga)
+                self._por_cliente.inserir(pedido.cliente_id, chave_nova)
+            if chave_antiga != chave_nova or status_antigo != pedido.status_pedido:
+                self._por_status.remover(status_antigo, chave_antiga)
+                self._por_status.inserir(pedido.status_pedido, chave_nova)
+
+        self._pedidos[pedido.id] = pedido
+        self._chave_indexada[pedido.id] = chave_nova
+        self._status_indexado[pedido.id] = pedido.status_pedido
+        self._cliente_indexado[pedido.id] = pedido.cliente_id
+
+    async def buscar_por_id(self, pedido_id: uuid.UUID) -> Optional[Pedido]:
+        return self._pedidos.get(pedido_id)
+
+    async def listar_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> List[Pedido]:
+        return self._paginar(self._chaves_do_cliente(cliente_id, data_inicio, data_fim, status), skip, limit)
+
+    async def listar_por_status(
+        self,
+        status_lista: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> List[Pedido]:
+        chaves = self._por_status.intervalo(status_lista, data_inicio, data_fim)
+        return self._paginar(chaves, skip, limit)
+
+    async def listar_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[Pedido]:
+        apos = decodificar_cursor(cursor) if cursor else None
+        return self._pagina(self._chaves_do_cliente(cliente_id, data_inicio, data_fim, status, apos), limit)
+
+    async def listar_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[Pedido]:
+        apos = decodificar_cursor(cursor) if cursor else None
+        return self._pagina(self._por_status.intervalo(status_lista, data_inicio, data_fim, apos), limit)
+
+    # Projeções direto das chaves dos índices para o DTO: só o cabeçalho de cada pedido é
+    # lido (o subtotal é o mantido pelo Pedido), sem montar listas intermediárias de pedidos
+    # e sem carregar os itens dos pedidos restaurados de snapshot.
+    async def buscar_resumo_por_id(self, pedido_id: uuid.UUID) -> Optional[ResumoPedidoDTO]:
+        pedido = self._pedidos.get(pedido_id)
+        return pedido_para_resumo_dto(pedido) if pedido is not None else None
+
+    async def listar_resumos_por_cliente_id(
+        self,
+        cliente_id: uuid.UUID,
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> List[ResumoPedidoDTO]:
+        chaves = self._chaves_do_cliente(cliente_id, data_inicio, data_fim, status)
+        return self._paginar(chaves, skip, limit, pedido_para_resumo_dto)
+
+    async def listar_resumos_por_status(
+        self,
+        status_lista: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> List[ResumoPedidoDTO]:
+        chaves = self._por_status.intervalo(status_lista, data_inicio, data_fim)
+        return self._paginar(chaves, skip, limit, pedido_para_resumo_dto)
+
+    async def listar_resumos_por_cliente_id_cursor(
+        self,
+        cliente_id: uuid.UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        status: Optional[List[str]] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        apos = decodificar_cursor(cursor) if cursor else None
+        chaves = self._chaves_do_cliente(cliente_id, data_inicio, data_fim, status, apos)
+        return self._pagina(chaves, limit, pedido_para_resumo_dto)
+
+    async def listar_resumos_por_status_cursor(
+        self,
+        status_lista: list[str],
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None
+    ) -> Pagina[ResumoPedidoDTO]:
+        apos = decodificar_cursor(cursor) if cursor else None
+        chaves = self._por_status.intervalo(status_lista, data_inicio, data_fim, apos)
+        return self._pagina(chaves, limit, pedido_para_resumo_dto)
+
+    async def listar_por_periodo(
+        self,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Pedido]:
+        """Lista pedidos criados no intervalo informado (limites inclusivos)."""
+        return self._paginar(self._por_data.intervalo(data_inicio, data_fim), skip, limit)
+
+    async def contar_por_status(self, status: str) -> int:
+        """Retorna a quantidade de pedidos com o status informado, sem materializá-los."""
+        return self._por_status.contar(status)
+
+    def _chaves_do_cliente(self,
+                           cliente_id: uuid.UUID,
+                           data_inicio: Optional[datetime],
+                           data_fim: Optional[datetime],
+                           status: Optional[List[str]],
+                           apos: Optional[ChaveTemporal] = None) -> Iterator[ChaveTemporal]:
+        chaves = self._por_cliente.intervalo([cliente_id], data_inicio, data_fim, apos)
+        if status is not None:
+            filtro_status = set(status)
+            chaves = (chave for chave in chaves if self._status_indexado[chave[1]] in filtro_status)
+        return chaves
+
+    def _pagina(self, chaves: Iterator[ChaveTemporal], limit: int, projetar: Optional[Callable[[Pedido], T]] = None) -> Pagina:
+        if limit <= 0:
+            raise ValueError("O limite da página deve ser positivo.")
+        # Lê um item a mais apenas para saber se existe uma próxima página
+        lote = list(islice(chaves, limit + 1))
+        proximo_cursor = codificar_cursor(*lote[limit - 1]) if len(lote) > limit else None
+        return Pagina(self._entidades(lote[:limit], projetar), proximo_cursor)
+
+    def _paginar(self, chaves: Iterator[ChaveTemporal], skip: int, limit: int, projetar: Optional[Callable[[Pedido], T]] = None) -> List:
+        return self._entidades(islice(chaves, skip, skip + limit), projetar)
+
+    def _entidades(self, chaves: Iterable[ChaveTemporal], projetar: Optional[Callable[[Pedido], T]]) -> List:
+        pedidos = self._pedidos
+        if projetar is None:
+            return [pedidos[pedido_id] for _, pedido_id in chaves]
+        return [projetar(pedidos[pedido_id]) for _, pedido_id in chaves]
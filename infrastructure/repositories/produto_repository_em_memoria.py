@@ -0,0 +1,155 @@
+# delivery_api_project/infrastructure/repositories/produto_repository_em_memoria.py
+
+import uuid
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from application.interfaces.i_produto_repository import IProdutoRepository
+from domain.entities.produto import Produto
+from infrastructure.repositories.indices import (
+    ChaveTemporal, IndiceOrdenadoAgrupado, chave_de_primitiva, chave_para_primitiva, uuid_de_bytes
+)
+
+_AtributosIndexados = Tuple[ChaveTemporal, uuid.UUID, bool, Optional[uuid.UUID]]
+
+
+class ProdutoRepositoryEmMemoria(IProdutoRepository):
+    """
+    Implementação em memória de IProdutoRepository.
+
+    Mantém índices por restaurante_id, por (restaurante_id, disponivel) e por
+    (restaurante_id, categoria_produto_id), ordenados por (data_criacao, id), de modo
+    que as listagens seguem a ordem de cadastro mesmo após mudanças de disponibilidade.
+    """
+
+    def __init__(self):
+        self._produtos: Dict[uuid.UUID, Produto] = {}
+        # Atributos indexados no último salvar: (chave, restaurante_id, disponivel, categoria_produto_id)
+        self._indexado: Dict[uuid.UUID, _AtributosIndexados] = {}
+
+        self._por_restaurante: IndiceOrdenadoAgrupado[uuid.UUID] = IndiceOrdenadoAgrupado()
+        self._disponiveis_por_restaurante: IndiceOrdenadoAgrupado[uuid.UUID] = IndiceOrdenadoAgrupado()
+        self._por_categoria: IndiceOrdenadoAgrupado[Tuple[uuid.UUID, uuid.UUID]] = IndiceOrdenadoAgrupado()
+
+    def __len__(self) -> int:
+        return len(self._produtos)
+
+    def exportar_snapshot(self) -> Tuple[List[Produto], List[Tuple]]:
+        """(produtos, estado dos índices em tipos primitivos); veja `de_snapshot`."""
+        # Em ordem de chave, para que a ordenação dos índices na reconstrução seja linear
+        estado = [
+            (chave_para_primitiva(chave), restaurante_id.bytes, disponivel, None if categoria_id is None else categoria_id.bytes)
+            for chave, restaurante_id, disponivel, categoria_id in sorted(self._indexado.values(), key=itemgetter(0))
+        ]
+        return list(self._produtos.values()), estado
+
+    @classmethod
+    def de_snapshot(cls, produtos: Dict[uuid.UUID, Produto], estado_indices: List[Tuple]) -> "ProdutoRepositoryEmMemoria":
+        """
+        Repositório sobre `produtos` (ex.: RegistrosPreguicosos de um snapshot), com os índices
+        reconstruídos a partir do estado exportado, sem acessar as entidades.
+        """
+        repositorio = cls()
+        repositorio._produtos = produtos
+        ids: Dict[Optional[bytes], Optional[uuid.UUID]] = {None: None} # Um objeto por restaurante/categoria
+        # Agrupa pelos bytes (hash em C) antes de criar os UUIDs dos grupos
+        por_restaurante: Dict[bytes, List[ChaveTemporal]] = {}
+        disponiveis: Dict[bytes, List[ChaveTemporal]] = {}
+        por_categoria: Dict[Tuple[bytes, bytes], List[ChaveTemporal]] = {}
+        for chave, restaurante_id, disponivel, categoria_id in estado_indices:
+            chave = chave_de_primitiva(chave)
+            if restaurante_id not in ids:
+                ids[restaurante_id] = uuid_de_bytes(restaurante_id)
+                por_restaurante[restaurante_id], disponiveis[restaurante_id] = [], []
+            por_restaurante[restaurante_id].append(chave)
+            if disponivel:
+                disponiveis[restaurante_id].append(chave)
+            if categoria_id is not None:
+                if categoria_id not in ids:
+                    ids[categoria_id] = uuid_de_bytes(categoria_id)
+                grupo = por_categoria.get((restaurante_id, categoria_id))
+                if grupo is None:
+                    grupo = por_categoria[restaurante_id, categoria_id] = []
+                grupo.append(chave)
+            repositorio._indexado[chave[1]] = (chave, ids[restaurante_id], disponivel, ids[categoria_id])
+        repositorio._por_restaurante.estender((ids[r], chaves) for r, chaves in por_restaurante.items())
+        repositorio._disponiveis_por_restaurante.estender((ids[r], chaves) for r, chaves in disponiveis.items() if chaves)
+        repositorio._por_categoria.estender(((ids[r], ids[c]), chaves) for (r, c), chaves in por_categoria.items())
+        return repositorio
+
+    async def salvar(self, produto: Produto) -> Produto:
+        novo = (
+            (produto.data_criacao, produto.id),
+            produto.restaurante_id,
+            bool(produto.disponivel),
+            produto.categoria_produto_id,
+        )
+        antigo = self._indexado.get(produto.id)
+        if antigo != novo:
+            if antigo is not None:
+                self._desindexar(antigo)
+            self._indexar(novo)
+            self._indexado[produto.id] = novo
+        self._produtos[produto.id] = produto
+        return produto
+
+    async def salvar_em_lote(self, produtos: List[Produto]) -> List[Produto]:
+        for produto in produtos:
+            await self.salvar(produto)
+        return list(produtos)
+
+    async def buscar_por_id(self, produto_id: uuid.UUID) -> Optional[Produto]:
+        return self._produtos.get(produto_id)
+
+    async def buscar_por_ids(self, produto_ids: List[uuid.UUID]) -> List[Produto]:
+        return [self._produtos[p] for p in dict.fromkeys(produto_ids) if p in self._produtos]
+
+    async def listar_por_restaurante_id(
+        self,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Produto]:
+        indice = self._disponiveis_por_restaurante if disponivel_apenas else self._por_restaurante
+        return self._paginar(indice.intervalo([restaurante_id]), skip, limit)
+
+    async def listar_por_categoria_id_e_restaurante_id(
+        self,
+        categoria_id: uuid.UUID,
+        restaurante_id: uuid.UUID,
+        disponivel_apenas: bool = False,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Produto]:
+        chaves = self._por_categoria.intervalo([(restaurante_id, categoria_id)])
+        if disponivel_apenas:
+            chaves = (chave for chave in chaves if self._indexado[chave[1]][2])
+        return self._paginar(chaves, skip, limit)
+
+    async def deletar(self, produto_id: uuid.UUID) -> bool:
+        produto = self._produtos.pop(produto_id, None)
+        if produto is None:
+            return False
+        self._desindexar(self._indexado.pop(produto_id))
+        return True
+
+    def _indexar(self, atributos: _AtributosIndexados):
+        chave, restaurante_id, disponivel, categoria_id = atributos
+        self._por_restaurante.inserir(restaurante_id, chave)
+        if disponivel:
+            self._disponiveis_por_restaurante.inserir(restaurante_id, chave)
+        if categoria_id is not None:
+            self._por_categoria.inserir((restaurante_id, categoria_id), chave)
+
+    def _desindexar(self, atributos: _AtributosIndexados):
+        chave, restaurante_id, disponivel, categoria_id = atributos
+        self._por_restaurante.remover(restaurante_id, chave)
+        if disponivel:
+            self._disponiveis_por_restaurante.remover(restaurante_id, chave)
+        if categoria_id is not None:
+            self._por_categoria.remover((restaurante_id, categoria_id), chave)
+
+    def _paginar(self, chaves: Iterator[ChaveTemporal], skip: int, limit: int) -> List[Produto]:
+        return [self._produtos[produto_id] for _, produto_id in islice(chaves, skip, skip + limit)]
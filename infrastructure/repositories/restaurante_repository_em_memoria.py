@@ -0,0 +1,132 @@
+# delivery_api_project/infrastructure/repositories/restaurante_repository_em_memoria.py
+
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from application.interfaces.i_restaurante_repository import IRestauranteRepository
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from infrastructure.geo.indice_geografico_restaurantes import IndiceGeograficoRestaurantes
+from infrastructure.repositories.indices import fatiar_valores
+from infrastructure.search.indice_busca_restaurantes import IndiceBuscaRestaurantes
+
+
+class RestauranteRepositoryEmMemoria(IRestauranteRepository):
+    """
+    Implementação em memória de IRestauranteRepository.
+
+    Mantém um índice único por CNPJ, tornando `buscar_por_cnpj` uma consulta O(1), e um
+    índice de busca textual (IndiceBuscaRestaurantes) usado por `listar_ativo_por_nome_ou_categoria`
+    e um índice espacial (IndiceGeograficoRestaurantes) usado por `listar_ativos_proximos[_em_lote]`.
+    Alterações feitas por `ativar`, `desativar`, `adicionar_categoria` e `remover_categoria`
+    entram no índice de busca quando o restaurante é salvo.
+    """
+
+    def __init__(self):
+        self._restaurantes: Dict[uuid.UUID, Restaurante] = {}
+        self._por_cnpj: Dict[str, uuid.UUID] = {}
+        self._cnpj_indexado: Dict[uuid.UUID, str] = {}
+        self.indice_busca = IndiceBuscaRestaurantes()
+        self.indice_geografico = IndiceGeograficoRestaurantes()
+
+    def __len__(self) -> int:
+        return len(self._restaurantes)
+
+    def exportar_snapshot(self) -> Tuple[List[Restaurante], Tuple]:
+        """(restaurantes, estado dos índices em tipos primitivos); veja `de_snapshot`."""
+        estado = (
+            [(restaurante_id.bytes, cnpj) for restaurante_id, cnpj in self._cnpj_indexado.items()],
+            self.indice_busca.exportar_estado(),
+            self.indice_geografico.exportar_estado(),
+        )
+        return list(self._restaurantes.values()), estado
+
+    @classmethod
+    def de_snapshot(cls, restaurantes: Dict[uuid.UUID, Restaurante], estado_indices: Tuple) -> "RestauranteRepositoryEmMemoria":
+        """
+        Repositório sobre `restaurantes` (ex.: RegistrosPreguicosos de um snapshot), com os
+        índices (CNPJ, busca textual, horários e geográfico) restaurados do estado exportado,
+        sem reindexar nem acessar as entidades.
+        """
+        cnpjs, estado_busca, estado_geografico = estado_indices
+        repositorio = cls()
+        repositorio._restaurantes = restaurantes
+        for restaurante_id, cnpj in cnpjs:
+            restaurante_id = uuid.UUID(bytes=restaurante_id)
+            repositorio._cnpj_indexado[restaurante_id] = cnpj
+            repositorio._por_cnpj[cnpj] = restaurante_id
+        repositorio.indice_busca.restaurar_estado(estado_busca)
+        repositorio.indice_geografico.restaurar_estado(estado_geografico)
+        return repositorio
+
+    async def salvar(self, restaurante: Restaurante) -> Restaurante:
+        cnpj = restaurante.cnpj.strip()
+        dono_do_cnpj = self._por_cnpj.get(cnpj)
+        if dono_do_cnpj is not None and dono_do_cnpj != restaurante.id:
+            raise ValueError(f"Já existe um restaurante cadastrado com o CNPJ {restaurante.cnpj}.")
+
+        cnpj_antigo = self._cnpj_indexado.get(restaurante.id)
+        if cnpj_antigo is not None and cnpj_antigo != cnpj:
+            del self._por_cnpj[cnpj_antigo]
+
+        self._restaurantes[restaurante.id] = restaurante
+        self._por_cnpj[cnpj] = restaurante.id
+        self._cnpj_indexado[restaurante.id] = cnpj
+        self.indice_busca.indexar(restaurante)
+        self.indice_geografico.indexar(restaurante)
+        return restaurante
+
+    async def buscar_por_id(self, restaurante_id: uuid.UUID) -> Optional[Restaurante]:
+        return self._restaurantes.get(restaurante_id)
+
+    async def buscar_por_ids(self, restaurante_ids: List[uuid.UUID]) -> List[Restaurante]:
+        return [self._restaurantes[r] for r in dict.fromkeys(restaurante_ids) if r in self._restaurantes]
+
+    async def buscar_por_cnpj(self, cnpj: str) -> Optional[Restaurante]:
+        restaurante_id = self._por_cnpj.get(cnpj.strip())
+        return self._restaurantes.get(restaurante_id) if restaurante_id is not None else None
+
+    async def listar_todos(self, skip: int = 0, limit: int = 100) -> List[Restaurante]:
+        return fatiar_valores(self._restaurantes, skip, skip + limit)
+
+    async def listar_ativo_por_nome_ou_categoria(
+        self,
+        termo_busca: Optional[str] = None,
+        categoria_busca: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        aberto_em: Optional[datetime] = None
+    ) -> List[Restaurante]:
+        ids = self.indice_busca.buscar(termo_busca, categoria_busca, skip, limit, aberto_em)
+        return [self._restaurantes[restaurante_id] for restaurante_id in ids]
+
+    async def listar_ativos_proximos(
+        self,
+        coordenadas: CoordenadaGeo,
+        raio_km: float = 10.0,
+        limit: int = 20
+    ) -> List[Restaurante]:
+        encontrados = self.indice_geografico.buscar_mais_proximos(coordenadas, limit, raio_km)
+        return [self._restaurantes[restaurante_id] for restaurante_id, _ in encontrados]
+
+    async def listar_ativos_proximos_em_lote(
+        self,
+        coordenadas_lista: List[CoordenadaGeo],
+        raio_km: float = 10.0,
+        limit: int = 20
+    ) -> List[List[Restaurante]]:
+        restaurantes = self._restaurantes
+        return [
+            [restaurantes[restaurante_id] for restaurante_id, _ in encontrados]
+            for encontrados in self.indice_geografico.buscar_em_lote(coordenadas_lista, limit, raio_km)
+        ]
+
+    async def deletar(self, restaurante_id: uuid.UUID) -> bool:
+        restaurante = self._restaurantes.pop(restaurante_id, None)
+        if restaurante is None:
+            return False
+        del self._por_cnpj[self._cnpj_indexado.pop(restaurante_id)]
+        self.indice_busca.remover(restaurante_id)
+        self.indice_geografico.remover(restaurante_id)
+        return True
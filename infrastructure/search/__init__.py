@@ -0,0 +1,3 @@
+# delivery_api_project/infrastructure/search/__init__.py
+from.indice_busca_restaurantes import IndiceBuscaRestaurantes, normalizar, tokenizar
+from.indice_horarios import IndiceHorarios
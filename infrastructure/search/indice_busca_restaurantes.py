@@ -0,0 +1,287 @@
+# delivery_api_project/infrastructure/search/indice_busca_restaurantes.py
+
+import re
+import unicodedata
+import uuid
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from domain.entities.restaurante import Restaurante
+from infrastructure.search.indice_horarios import IndiceHorarios
+
+# Pesos por campo: um termo no nome vale mais que o mesmo termo numa categoria
+PESO_NOME = 2.0
+PESO_CATEGORIA = 1.0
+
+# Qualidade da correspondência entre o termo buscado e o token indexado
+QUALIDADE_EXATA = 1.0
+QUALIDADE_PREFIXO = 0.8
+QUALIDADE_APROXIMADA = 0.6
+
+SIMILARIDADE_MINIMA = 0.4 # Similaridade de Jaccard mínima entre trigramas para tolerar erros de digitação
+
+_NAO_ALFANUMERICO = re.compile(r"[^0-9a-z]+")
+
+
+def normalizar(texto: str) -> str:
+    """Remove acentos, converte para minúsculas e troca pontuação por espaços."""
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return _NAO_ALFANUMERICO.sub(" ", sem_acentos.casefold()).strip()
+
+
+def tokenizar(texto: str) -> List[str]:
+    return normalizar(texto).split()
+
+
+def trigramas(token: str) -> FrozenSet[str]:
+    """Trigramas do token com preenchimento, para que tokens curtos também tenham trigramas."""
+    preenchido = f"  {token} "
+    return frozenset(preenchido[i:i + 3] for i in range(len(preenchido) - 2))
+
+
+class IndiceBuscaRestaurantes:
+    """
+    Índice invertido em memória para a descoberta de restaurantes.
+
+    Indexa os tokens normalizados (sem acento) do nome fantasia e das categorias, com
+    busca por prefixo sobre o vocabulário ordenado e, quando não há correspondência exata
+    nem por prefixo, aproximação por trigramas (tolerância a erros de digitação).
+
+    Internamente cada restaurante recebe um número de documento crescente (a ordem de
+    cadastro, usada como desempate), o que permite resolver filtros e interseções com
+    operações de conjunto de inteiros. O índice é atualizado de forma incremental:
+    `indexar` compara o restaurante com o último estado indexado e altera apenas o que
+    mudou (ex.: apenas o conjunto de ativos após `desativar`). Os horários de funcionamento
+    ficam num IndiceHorarios sobre os mesmos números de documento.
+    """
+
+    def __init__(self):
+        self._doc_do_restaurante: Dict[uuid.UUID, int] = {}
+        self._restaurante_do_doc: Dict[int, uuid.UUID] = {} # Em ordem de cadastro
+        self._proximo_doc = 0
+
+        # Estado indexado por documento: (peso de cada token, categorias normalizadas, ativo)
+        self._indexado: Dict[int, Tuple[Dict[str, float], FrozenSet[str], bool]] = {}
+
+        self._postings: Dict[str, Dict[float, Set[int]]] = {} # token -> peso -> documentos
+        self._vocabulario: List[str] = [] # Ordenado, para busca por prefixo com bisect
+        self._trigramas_do_token: Dict[str, FrozenSet[str]] = {}
+        self._tokens_por_trigrama: Dict[str, Set[str]] = {}
+
+        self._por_categoria: Dict[str, Set[int]] = {}
+        self._ativos: Set[int] = set()
+        self._horarios = IndiceHorarios()
+
+    def __len__(self) -> int:
+        return len(self._indexado)
+
+    def indexar(self, restaurante: Restaurante):
+        """Indexa ou reindexa o restaurante, aplicando apenas as diferenças."""
+        tokens: Dict[str, float] = {}
+        for categoria in restaurante.categorias:
+            for token in tokenizar(categoria):
+                tokens[token] = PESO_CATEGORIA
+        for token in tokenizar(restaurante.nome_fantasia):
+            tokens[token] = PESO_NOME
+        categorias = frozenset(filter(None, (normalizar(c) for c in restaurante.categorias)))
+        ativo = bool(restaurante.ativo)
+
+        doc = self._doc_do_restaurante.get(restaurante.id)
+        if doc is None:
+            doc = self._doc_do_restaurante[restaurante.id] = self._proximo_doc
+            self._restaurante_do_doc[doc] = restaurante.id
+            self._proximo_doc += 1
+            tokens_antigos, categorias_antigas, ativo_antigo = {}, frozenset(), False
+        else:
+            tokens_antigos, categorias_antigas, ativo_antigo = self._indexado[doc]
+
+        if tokens != tokens_antigos:
+            for token, peso in tokens_antigos.items():
+                if tokens.get(token) != peso:
+                    self._remover_posting(token, doc, peso)
+            for token, peso in tokens.items():
+                if tokens_antigos.get(token) != peso:
+                    self._adicionar_posting(token, doc, peso)
+
+        for categoria in categorias_antigas - categorias:
+            self._descartar(self._por_categoria, categoria, doc)
+        for categoria in categorias - categorias_antigas:
+            self._por_categoria.setdefault(categoria, set()).add(doc)
+
+        if ativo != ativo_antigo:
+            if ativo:
+                self._ativos.add(doc)
+            else:
+                self._ativos.discard(doc)
+
+        self._indexado[doc] = (tokens, categorias, ativo)
+        self._horarios.atualizar(doc, restaurante.horario_funcionamento)
+
+    def remover(self, restaurante_id: uuid.UUID):
+        doc = self._doc_do_restaurante.pop(restaurante_id, None)
+        if doc is None:
+            return
+        tokens, categorias, _ = self._indexado.pop(doc)
+        for token, peso in tokens.items():
+            self._remover_posting(token, doc, peso)
+        for categoria in categorias:
+            self._descartar(self._por_categoria, categoria, doc)
+        self._ativos.discard(doc)
+        self._horarios.remover(doc)
+        del self._restaurante_do_doc[doc]
+
+    def exportar_estado(self) -> Tuple:
+        """Estado completo do índice em tipos primitivos (serializável com marshal), para snapshots."""
+        return (
+            [(doc, restaurante_id.bytes) for doc, restaurante_id in self._restaurante_do_doc.items()],
+            self._proximo_doc,
+            self._indexado,
+            self._postings,
+            self._vocabulario,
+            self._trigramas_do_token,
+            self._tokens_por_trigrama,
+            self._por_categoria,
+            self._ativos,
+            self._horarios.exportar_estado(),
+        )
+
+    def restaurar_estado(self, estado: Tuple):
+        """Substitui o conteúdo do índice pelo `estado` de `exportar_estado`, sem reindexar."""
+        (docs, self._proximo_doc, self._indexado, self._postings, self._vocabulario, self._trigramas_do_token,
+         self._tokens_por_trigrama, self._por_categoria, self._ativos, horarios) = estado
+        self._restaurante_do_doc = {doc: uuid.UUID(bytes=restaurante_id) for doc, restaurante_id in docs}
+        self._doc_do_restaurante = {restaurante_id: doc for doc, restaurante_id in self._restaurante_do_doc.items()}
+        self._horarios.restaurar_estado(horarios)
+
+    def buscar(self,
+               termo_busca: Optional[str] = None,
+               categoria_busca: Optional[str] = None,
+               skip: int = 0,
+               limit: int = 100,
+               aberto_em: Optional[datetime] = None) -> List[uuid.UUID]:
+        """
+        Retorna os IDs dos restaurantes ativos que atendem à busca, do mais ao menos relevante.
+
+        Todos os termos de `termo_busca` precisam corresponder (exata, por prefixo ou
+        aproximadamente) ao nome ou às categorias; `categoria_busca` filtra por categoria exata
+        e `aberto_em` mantém apenas os restaurantes abertos naquele momento (horário local).
+        Empates são resolvidos pela ordem de cadastro.
+        """
+        permitidos = self._ativos
+        if categoria_busca and normalizar(categoria_busca):
+            permitidos = self._por_categoria.get(normalizar(categoria_busca), set()) & self._ativos
+        if aberto_em is not None:
+            permitidos = self._horarios.abertos_em(aberto_em) & permitidos
+
+        termos = list(dict.fromkeys(tokenizar(termo_busca))) if termo_busca else []
+        if not termos:
+            if permitidos is self._ativos:
+                docs = (doc for doc in self._restaurante_do_doc if doc in permitidos)
+                return [self._restaurante_do_doc[doc] for doc in islice(docs, skip, skip + limit)]
+            return [self._restaurante_do_doc[doc] for doc in sorted(permitidos)[skip:skip + limit]]
+
+        # Cada termo vira uma lista de níveis (pontuação, documentos), do maior para o menor
+        niveis_por_termo = [self._niveis(termo) for termo in termos]
+        if len(niveis_por_termo) == 1:
+            docs = self._ordenar_por_niveis(niveis_por_termo[0], permitidos, skip + limit)
+        else:
+            candidatos = permitidos
+            for niveis in niveis_por_termo:
+                candidatos = candidatos & set().union(*(docs for _, docs in niveis))
+                if not candidatos:
+                    return []
+            docs = self._ordenar_por_soma(niveis_por_termo, candidatos)
+        return [self._restaurante_do_doc[doc] for doc in docs[skip:skip + limit]]
+
+    @staticmethod
+    def _ordenar_por_niveis(niveis: List[Tuple[float, Set[int]]], candidatos: Set[int], quantidade: int) -> List[int]:
+        """Para um único termo, percorre os níveis de pontuação e para assim que tiver `quantidade` documentos."""
+        resultado: List[int] = []
+        vistos: Set[int] = set()
+        for _, docs in niveis:
+            novos = (docs & candidatos) - vistos
+            if not novos:
+                continue
+            vistos |= novos
+            resultado.extend(sorted(novos))
+            if len(resultado) >= quantidade:
+                break
+        return resultado
+
+    @staticmethod
+    def _ordenar_por_soma(niveis_por_termo: List[List[Tuple[float, Set[int]]]], candidatos: Set[int]) -> List[int]:
+        """Para vários termos, soma a melhor pontuação de cada termo (apenas sobre a interseção)."""
+        pontuacao = dict.fromkeys(candidatos, 0.0)
+        for niveis in niveis_por_termo:
+            restantes = set(candidatos)
+            for valor, docs in niveis:
+                acertos = docs & restantes
+                for doc in acertos:
+                    pontuacao[doc] += valor
+                restantes -= acertos
+                if not restantes:
+                    break
+        return sorted(pontuacao, key=lambda doc: (-pontuacao[doc], doc))
+
+    def _niveis(self, termo: str) -> List[Tuple[float, Set[int]]]:
+        grupos: Dict[float, List[Set[int]]] = {}
+        for token, qualidade in self._expandir(termo):
+            for peso, docs in self._postings[token].items():
+                grupos.setdefault(qualidade * peso, []).append(docs)
+        return sorted(
+            ((valor, set().union(*conjuntos)) for valor, conjuntos in grupos.items()),
+            key=lambda nivel: nivel[0], reverse=True
+        )
+
+    def _expandir(self, termo: str) -> Iterable[Tuple[str, float]]:
+        """Tokens do vocabulário que correspondem ao termo, com a qualidade da correspondência."""
+        expansoes: List[Tuple[str, float]] = []
+        posicao = bisect_left(self._vocabulario, termo)
+        while posicao < len(self._vocabulario) and self._vocabulario[posicao].startswith(termo):
+            token = self._vocabulario[posicao]
+            expansoes.append((token, QUALIDADE_EXATA if token == termo else QUALIDADE_PREFIXO))
+            posicao += 1
+        if expansoes:
+            return expansoes
+
+        # Sem correspondência exata ou por prefixo: tenta aproximação por trigramas
+        trigramas_termo = trigramas(termo)
+        compartilhados: Counter = Counter()
+        for trigrama in trigramas_termo:
+            compartilhados.update(self._tokens_por_trigrama.get(trigrama, ()))
+        for token, comuns in compartilhados.items():
+            similaridade = comuns / (len(trigramas_termo) + len(self._trigramas_do_token[token]) - comuns)
+            if similaridade >= SIMILARIDADE_MINIMA:
+                expansoes.append((token, QUALIDADE_APROXIMADA * similaridade))
+        return expansoes
+
+    def _adicionar_posting(self, token: str, doc: int, peso: float):
+        postings = self._postings.get(token)
+        if postings is None:
+            postings = self._postings[token] = {}
+            insort(self._vocabulario, token)
+            tri = self._trigramas_do_token[token] = trigramas(token)
+            for trigrama in tri:
+                self._tokens_por_trigrama.setdefault(trigrama, set()).add(token)
+        postings.setdefault(peso, set()).add(doc)
+
+    def _remover_posting(self, token: str, doc: int, peso: float):
+        postings = self._postings[token]
+        self._descartar(postings, peso, doc)
+        if postings:
+            return
+        del self._postings[token]
+        del self._vocabulario[bisect_left(self._vocabulario, token)]
+        for trigrama in self._trigramas_do_token.pop(token):
+            self._descartar(self._tokens_por_trigrama, trigrama, token)
+
+    @staticmethod
+    def _descartar(grupos: dict, chave, valor):
+        grupo = grupos[chave]
+        grupo.discard(valor)
+        if not grupo:
+            del grupos[chave]
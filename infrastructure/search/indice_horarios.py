@@ -0,0 +1,105 @@
+# delivery_api_project/infrastructure/search/indice_horarios.py
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from domain.value_objects.horario_semanal import HorarioSemanal, minuto_da_semana
+
+
+class IndiceHorarios:
+    """
+    Índice de "aberto no minuto T" para muitos documentos (inteiros, como os de
+    IndiceBuscaRestaurantes).
+
+    Os intervalos de todos os horários são compilados numa linha do tempo da semana:
+    `_fronteiras` (minutos em que algum restaurante abre ou fecha, ordenados) e, para cada
+    trecho entre fronteiras, um bitmap (int) dos documentos abertos. Uma consulta é um
+    bisect nas fronteiras; o conjunto de documentos de cada trecho é decodificado do bitmap
+    na primeira consulta e reaproveitado enquanto o índice não mudar, o que torna repetidas
+    consultas "aberto agora" praticamente gratuitas.
+
+    Alterações apenas marcam o índice para recompilação, feita na consulta seguinte
+    (horários mudam raramente).
+    """
+
+    def __init__(self):
+        self._horarios: Dict[int, HorarioSemanal] = {}
+        self._compilado = False
+        self._fronteiras: List[int] = []
+        self._mascaras: List[int] = []
+        self._abertos_por_trecho: Dict[int, FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._horarios)
+
+    def atualizar(self, doc: int, horario: Optional[HorarioSemanal]):
+        """Sem horário definido, o documento nunca aparece como aberto."""
+        if horario is None or not horario.intervalos:
+            if self._horarios.pop(doc, None) is not None:
+                self._compilado = False
+        elif self._horarios.get(doc) != horario:
+            self._horarios[doc] = horario
+            self._compilado = False
+
+    def remover(self, doc: int):
+        self.atualizar(doc, None)
+
+    def exportar_estado(self) -> Dict[int, Tuple[Tuple[int, int], ...]]:
+        return {doc: horario.intervalos for doc, horario in self._horarios.items()}
+
+    def restaurar_estado(self, estado: Dict[int, Tuple[Tuple[int, int], ...]]):
+        # Restaurantes costumam compartilhar horários: um HorarioSemanal por horário distinto
+        horarios: Dict[Tuple[Tuple[int, int], ...], HorarioSemanal] = {}
+        self._horarios = {}
+        for doc, intervalos in estado.items():
+            horario = horarios.get(intervalos)
+            if horario is None:
+                horario = horarios[intervalos] = HorarioSemanal(intervalos)
+            self._horarios[doc] = horario
+        self._compilado = False
+
+    def abertos_em(self, momento: datetime) -> FrozenSet[int]:
+        return self.abertos_no_minuto(minuto_da_semana(momento))
+
+    def abertos_no_minuto(self, minuto: int) -> FrozenSet[int]:
+        if not self._compilado:
+            self._compilar()
+        trecho = bisect_right(self._fronteiras, minuto) - 1
+        abertos = self._abertos_por_trecho.get(trecho)
+        if abertos is None:
+            abertos = self._abertos_por_trecho[trecho] = _decodificar(self._mascaras[trecho])
+        return abertos
+
+    def _compilar(self):
+        # Cada documento alterna seu bit ao abrir e ao fechar (intervalos já são disjuntos)
+        alternancias: Dict[int, int] = {}
+        for doc, horario in self._horarios.items():
+            bit = 1 << doc
+            for inicio, fim in horario.intervalos:
+                alternancias[inicio] = alternancias.get(inicio, 0) ^ bit
+                alternancias[fim] = alternancias.get(fim, 0) ^ bit
+        fronteiras = [0]
+        mascaras = [alternancias.pop(0, 0)]
+        for minuto, alternancia in sorted(alternancias.items()):
+            fronteiras.append(minuto)
+            mascaras.append(mascaras[-1] ^ alternancia)
+        self._fronteiras = fronteiras
+        self._mascaras = mascaras
+        self._abertos_por_trecho = {}
+        self._compilado = True
+
+
+def _decodificar(mascara: int) -> FrozenSet[int]:
+    docs = []
+    # Percorre o bitmap em blocos de 64 bits, pulando os blocos vazios
+    base = 0
+    while mascara:
+        bloco = mascara & 0xFFFFFFFFFFFFFFFF
+        while bloco:
+            menor = bloco & -bloco
+            docs.append(base + menor.bit_length() - 1)
+            bloco ^= menor
+        mascara >>= 64
+        base += 64
+    return frozenset(docs)
@@ -0,0 +1,4 @@
+# delivery_api_project/infrastructure/security/__init__.py
+from.hash_senha import gerar_hash_senha, verificar_hash_senha, precisa_novo_hash
+from.tokens import AssinadorTokens
+from.servico_seguranca import MetricasSeguranca, ServicoSeguranca
@@ -0,0 +1,59 @@
+# delivery_api_project/infrastructure/security/hash_senha.py
+"""
+Hash de senhas com PBKDF2-HMAC-SHA256 (biblioteca padrão).
+
+Formato armazenado em `Cliente.senha_hash`: "pbkdf2_sha256$<iterações>$<salt>$<hash>",
+com salt e hash em base64. As funções são de módulo (e não métodos) para poderem ser
+executadas num ProcessPoolExecutor.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+import time
+from typing import Tuple
+
+ALGORITMO = "pbkdf2_sha256"
+ITERACOES_PADRAO = 390_000
+TAMANHO_SALT = 16
+
+
+def gerar_hash_senha(senha: str, iteracoes: int = ITERACOES_PADRAO) -> str:
+    if not senha:
+        raise ValueError("Senha não pode ser vazia.")
+    salt = os.urandom(TAMANHO_SALT)
+    derivado = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), salt, iteracoes)
+    return "$".join((ALGORITMO, str(iteracoes), _b64(salt), _b64(derivado)))
+
+
+def verificar_hash_senha(senha: str, senha_hash: str) -> bool:
+    try:
+        algoritmo, iteracoes, salt, esperado = senha_hash.split("$")
+        if algoritmo != ALGORITMO:
+            return False
+        derivado = hashlib.pbkdf2_hmac("sha256", senha.encode("utf-8"), base64.b64decode(salt), int(iteracoes))
+        # Em bytes: compare_digest recusa str com caracteres fora do ASCII (hash corrompido)
+        return hmac.compare_digest(_b64(derivado).encode("ascii"), esperado.encode("utf-8"))
+    except ValueError:
+        return False
+
+
+def precisa_novo_hash(senha_hash: str, iteracoes: int = ITERACOES_PADRAO) -> bool:
+    """Indica se o hash foi gerado com outro algoritmo ou fator de trabalho (refazer após o login)."""
+    partes = senha_hash.split("$")
+    return len(partes) != 4 or partes[0] != ALGORITMO or partes[1] != str(iteracoes)
+
+
+def gerar_hash_senha_cronometrado(senha: str, iteracoes: int) -> Tuple[str, float]:
+    inicio = time.perf_counter()
+    return gerar_hash_senha(senha, iteracoes), time.perf_counter() - inicio
+
+
+def verificar_hash_senha_cronometrado(senha: str, senha_hash: str) -> Tuple[bool, float]:
+    inicio = time.perf_counter()
+    return verificar_hash_senha(senha, senha_hash), time.perf_counter() - inicio
+
+
+def _b64(dados: bytes) -> str:
+    return base64.b64encode(dados).decode("ascii")
@@ -0,0 +1,116 @@
+# delivery_api_project/infrastructure/security/servico_seguranca.py
+
+import asyncio
+import os
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Optional, Tuple
+
+from infrastructure.security.hash_senha import (
+    ITERACOES_PADRAO, gerar_hash_senha_cronometrado, precisa_novo_hash, verificar_hash_senha_cronometrado
+)
+from infrastructure.security.tokens import AssinadorTokens
+
+AMOSTRAS_LATENCIA = 1024 # Janela de latências recentes usada nos percentis
+
+
+@dataclass
+class MetricasSeguranca:
+    hashes: int = 0
+    verificacoes: int = 0
+    em_andamento: int = 0 # Operações enviadas ao pool e ainda não concluídas
+    maior_fila: int = 0 # Maior profundidade de fila observada no pool
+    tempo_calculo: Deque[float] = field(default_factory=lambda: deque(maxlen=AMOSTRAS_LATENCIA))
+    tempo_total: Deque[float] = field(default_factory=lambda: deque(maxlen=AMOSTRAS_LATENCIA))
+
+    def percentil_calculo_ms(self, percentil: float) -> float:
+        """Tempo de CPU do hash em si: é o que o número de iterações controla."""
+        return _percentil_ms(self.tempo_calculo, percentil)
+
+    def percentil_total_ms(self, percentil: float) -> float:
+        """Tempo visto por quem aguarda: cálculo + espera na fila do pool."""
+        return _percentil_ms(self.tempo_total, percentil)
+
+
+def _percentil_ms(amostras: Deque[float], percentil: float) -> float:
+    if not amostras:
+        return 0.0
+    ordenadas = sorted(amostras)
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * percentil / 100))] * 1e3
+
+
+class ServicoSeguranca:
+    """
+    Hash/verificação de senhas fora do event loop e verificação de tokens de sessão.
+
+    O PBKDF2 roda num ProcessPoolExecutor de `processos` workers (padrão: núcleos da
+    máquina), então um login nunca bloqueia as demais corrotinas. As métricas separam o
+    tempo de cálculo (ajustado por `iteracoes`) do tempo total (inclui a fila do pool),
+    para calibrar o fator de trabalho frente à vazão.
+    """
+
+    def __init__(self,
+                 chave_secreta: bytes,
+                 processos: Optional[int] = None,
+                 iteracoes: int = ITERACOES_PADRAO,
+                 validade_token_segundos: int = 3600,
+                 tamanho_cache_tokens: int = 10_000,
+                 relogio: Callable[[], float] = time.time):
+        if iteracoes <= 0:
+            raise ValueError("Número de iterações deve ser positivo.")
+        self.processos = processos or os.cpu_count() or 1
+        self.iteracoes = iteracoes
+        self.tokens = AssinadorTokens(chave_secreta, validade_token_segundos, tamanho_cache_tokens, relogio)
+        self.metricas = MetricasSeguranca()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def profundidade_fila(self) -> int:
+        """Operações aguardando um worker livre."""
+        return max(0, self.metricas.em_andamento - self.processos)
+
+    async def gerar_hash_senha(self, senha: str) -> str:
+        senha_hash = await self._executar(gerar_hash_senha_cronometrado, senha, self.iteracoes)
+        self.metricas.hashes += 1
+        return senha_hash
+
+    async def verificar_senha(self, senha: str, senha_hash: str) -> bool:
+        valida = await self._executar(verificar_hash_senha_cronometrado, senha, senha_hash)
+        self.metricas.verificacoes += 1
+        return valida
+
+    def precisa_novo_hash(self, senha_hash: str) -> bool:
+        return precisa_novo_hash(senha_hash, self.iteracoes)
+
+    def emitir_token(self, cliente_id: uuid.UUID) -> str:
+        return self.tokens.emitir(cliente_id)
+
+    def verificar_token(self, token: str) -> Optional[uuid.UUID]:
+        # HMAC de poucos bytes e cache em memória: barato demais para justificar o pool
+        return self.tokens.verificar(token)
+
+    def revogar_tokens(self, cliente_id: uuid.UUID):
+        self.tokens.revogar(cliente_id)
+
+    def encerrar(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    async def _executar(self, funcao: Callable[..., Tuple[object, float]], *args):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        metricas = self.metricas
+        metricas.em_andamento += 1
+        metricas.maior_fila = max(metricas.maior_fila, self.profundidade_fila)
+        inicio = time.perf_counter()
+        try:
+            resultado, tempo_calculo = await asyncio.get_running_loop().run_in_executor(self._pool, funcao, *args)
+        finally:
+            metricas.em_andamento -= 1
+        metricas.tempo_calculo.append(tempo_calculo)
+        metricas.tempo_total.append(time.perf_counter() - inicio)
+        return resultado
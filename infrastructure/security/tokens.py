@@ -0,0 +1,104 @@
+# delivery_api_project/infrastructure/security/tokens.py
+
+import base64
+import hashlib
+import hmac
+import time
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+from infrastructure.cache.cache_lru_ttl import CacheLRUComTTL
+
+
+def _b64url(dados: bytes) -> str:
+    return base64.urlsafe_b64encode(dados).rstrip(b"=").decode("ascii")
+
+
+def _de_b64url(texto: str) -> bytes:
+    return base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+
+
+class AssinadorTokens:
+    """
+    Emite e verifica tokens de sessão assinados com HMAC-SHA256.
+
+    Formato: base64url("<cliente_id>.<emitido_em>.<expira_em>") + "." + base64url(assinatura),
+    com os instantes em microssegundos desde a época. Tokens validados recentemente ficam num CacheLRUComTTL (agrupados por cliente), e
+    a verificação repetida do mesmo token custa um acesso ao dicionário e uma comparação
+    de validade, sem refazer o HMAC nem o parse. `revogar` invalida o grupo do cliente.
+    """
+
+    def __init__(self,
+                 chave_secreta: bytes,
+                 validade_segundos: int = 3600,
+                 tamanho_cache: int = 10_000,
+                 relogio: Callable[[], float] = time.time):
+        if len(chave_secreta) < 32:
+            raise ValueError("A chave secreta dos tokens deve ter ao menos 32 bytes.")
+        if validade_segundos <= 0:
+            raise ValueError("Validade do token deve ser positiva.")
+        self._chave = chave_secreta
+        self.validade_segundos = validade_segundos
+        self._relogio = relogio
+        # O TTL do cache nunca passa da validade do token; a expiração é conferida em cada acerto
+        self.cache: CacheLRUComTTL[Tuple[uuid.UUID, int, int]] = CacheLRUComTTL(
+            tamanho_cache, validade_segundos, relogio
+        )
+        # Instante (µs) da última revogação por cliente; inseridos em ordem cronológica
+        self._revogados_em: Dict[uuid.UUID, int] = {}
+
+    def emitir(self, cliente_id: uuid.UUID) -> str:
+        # Sempre depois da última revogação, mesmo que o relógio não tenha avançado desde ela
+        emitido_em = max(self._agora_us(), self._revogados_em.get(cliente_id, -1) + 1)
+        expira_em = emitido_em + self.validade_segundos * 1_000_000
+        conteudo = f"{cliente_id.hex}.{emitido_em}.{expira_em}".encode("ascii")
+        return f"{_b64url(conteudo)}.{_b64url(self._assinar(conteudo))}"
+
+    def verificar(self, token: str) -> Optional[uuid.UUID]:
+        """Retorna o cliente_id do token, ou None se for inválido, expirado ou revogado."""
+        agora = self._agora_us()
+        em_cache = self.cache.obter(token)
+        if self.cache.contem_valor(em_cache):
+            cliente_id, _, expira_em = em_cache
+            return cliente_id if agora < expira_em else None
+
+        dados = self._decodificar(token)
+        if dados is None:
+            return None
+        cliente_id, emitido_em, expira_em = dados
+        if agora >= expira_em or emitido_em <= self._revogados_em.get(cliente_id, -1):
+            return None
+        self.cache.armazenar(cliente_id, token, dados)
+        return cliente_id
+
+    def revogar(self, cliente_id: uuid.UUID):
+        """Invalida todos os tokens já emitidos para o cliente (ex.: troca de senha, logout geral)."""
+        agora = self._agora_us()
+        revogados = self._revogados_em
+        # Passada a validade, todo token anterior a uma revogação já expirou: o registro é esquecido
+        limite = agora - self.validade_segundos * 1_000_000
+        while revogados:
+            mais_antigo = next(iter(revogados))
+            if revogados[mais_antigo] > limite:
+                break
+            del revogados[mais_antigo]
+        revogados.pop(cliente_id, None) # Reinsere ao final, mantendo a ordem cronológica
+        revogados[cliente_id] = agora
+        self.cache.invalidar_grupo(cliente_id)
+
+    def _agora_us(self) -> int:
+        return int(self._relogio() * 1_000_000)
+
+    def _assinar(self, conteudo: bytes) -> bytes:
+        return hmac.new(self._chave, conteudo, hashlib.sha256).digest()
+
+    def _decodificar(self, token: str) -> Optional[Tuple[uuid.UUID, int, int]]:
+        try:
+            conteudo_b64, assinatura_b64 = token.split(".")
+            conteudo = _de_b64url(conteudo_b64)
+            if not hmac.compare_digest(self._assinar(conteudo), _de_b64url(assinatura_b64)):
+                return None
+            cliente_hex, emitido_em, expira_em = conteudo.decode("ascii").split(".")
+            return uuid.UUID(hex=cliente_hex), int(emitido_em), int(expira_em)
+        except (ValueError, UnicodeDecodeError):
+            return None
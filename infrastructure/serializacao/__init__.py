@@ -0,0 +1,2 @@
+# delivery_api_project/infrastructure/serializacao/__init__.py
+from.json_dtos import codificador_para, serializar, serializar_lista, serializar_em_partes, serializar_em_partes_async
@@ -0,0 +1,149 @@
+# delivery_api_project/infrastructure/serializacao/json_dtos.py
+"""
+Serialização JSON rápida para os DTOs (dataclasses) da camada de aplicação.
+
+Para cada classe de DTO é gerada, uma única vez, uma função especializada que monta o
+JSON numa única expressão de concatenação, formatando cada campo pelo tipo declarado:
+UUID e datetime viram strings (ISO 8601 no caso de datetime), Decimal e Dinheiro viram
+string (sem perda de precisão, como no DRF), e strings passam pelo escape em C do módulo json. Assim
+não há reflexão por objeto (`asdict`, `default=`) na hora de serializar.
+"""
+
+import dataclasses
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from itertools import islice
+from json.encoder import encode_basestring_ascii
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Union, get_args, get_origin, get_type_hints
+
+from domain.value_objects.dinheiro import Dinheiro
+
+Codificador = Callable[[Any], str]
+
+_codificadores: Dict[type, Codificador] = {}
+
+
+def _valor_generico(valor: Any) -> str:
+    """Caminho lento, para campos sem tipo conhecido: decide pelo tipo em tempo de execução."""
+    if valor is None:
+        return "null"
+    if dataclasses.is_dataclass(valor):
+        return codificador_para(type(valor))(valor)
+    if isinstance(valor, (uuid.UUID, Decimal, Dinheiro)):
+        return f'"{valor}"'
+    if isinstance(valor, (datetime, date)):
+        return f'"{valor.isoformat()}"'
+    if isinstance(valor, (list, tuple)):
+        return "[" + ",".join(map(_valor_generico, valor)) + "]"
+    return json.dumps(valor, ensure_ascii=True)
+
+
+def _expressao(tipo: Any, acesso: str, ambiente: Dict[str, Any]) -> str:
+    """Expressão Python que produz o JSON de `acesso` (ex.: "o.preco") segundo o `tipo`."""
+    origem = get_origin(tipo)
+    if origem is Union:
+        argumentos = [a for a in get_args(tipo) if a is not type(None)]
+        if len(argumentos) == 1 and len(get_args(tipo)) == 2: # Optional[X]
+            return f'("null" if {acesso} is None else {_expressao(argumentos[0], acesso, ambiente)})'
+        return f"_generico({acesso})"
+    if origem in (list, tuple) and get_args(tipo):
+        nome = f"_lista_{len(ambiente)}"
+        elemento = get_args(tipo)[0]
+        if dataclasses.is_dataclass(elemento):
+            ambiente[nome] = codificador_para(elemento)
+        else:
+            ambiente[nome] = _compilar_funcao(lambda v, amb: _expressao(elemento, v, amb))
+        return f'("[" + ",".join(map({nome}, {acesso})) + "]")'
+    if tipo is str:
+        return f"_texto({acesso})"
+    if tipo is bool:
+        return f'("true" if {acesso} else "false")'
+    if tipo is int:
+        return f"int.__repr__({acesso})"
+    if tipo is float:
+        return f"float.__repr__({acesso})"
+    if tipo in (uuid.UUID, Decimal, Dinheiro):
+        return f'(\'"\' + str({acesso}) + \'"\')'
+    if tipo in (datetime, date):
+        return f'(\'"\' + {acesso}.isoformat() + \'"\')'
+    if isinstance(tipo, type) and dataclasses.is_dataclass(tipo):
+        nome = f"_dto_{len(ambiente)}"
+        ambiente[nome] = codificador_para(tipo)
+        return f"{nome}({acesso})"
+    return f"_generico({acesso})"
+
+
+def _compilar_funcao(corpo: Callable[[str, Dict[str, Any]], str]) -> Codificador:
+    ambiente: Dict[str, Any] = {"_texto": encode_basestring_ascii, "_generico": _valor_generico}
+    fonte = f"def _codificar(o):\n    return {corpo('o', ambiente)}\n"
+    exec(fonte, ambiente)
+    return ambiente["_codificar"]
+
+
+def _compilar_dto(classe: type) -> Codificador:
+    tipos = get_type_hints(classe)
+
+    def corpo(_: str, ambiente: Dict[str, Any]) -> str:
+        partes = []
+        for campo in dataclasses.fields(classe):
+            chave = json.dumps(campo.name)
+            partes.append(f"{chave}:' + {_expressao(tipos.get(campo.name, Any), 'o.' + campo.name, ambiente)} + '")
+        # Ex.: '{"id":' + ('"' + str(o.id) + '"') + ',"nome":' + _texto(o.nome) + '}'
+        return "'{" + ",".join(partes) + "}'"
+
+    return _compilar_funcao(corpo)
+
+
+def codificador_para(classe: type) -> Codificador:
+    """Função especializada (compilada uma vez por classe) que serializa instâncias do DTO."""
+    codificador = _codificadores.get(classe)
+    if codificador is None:
+        if not dataclasses.is_dataclass(classe):
+            raise TypeError(f"{classe.__name__} não é um DTO (dataclass).")
+        # Registra antes de compilar para suportar DTOs que se referenciam
+        _codificadores[classe] = lambda o: _codificadores[classe](o)
+        try:
+            codificador = _codificadores[classe] = _compilar_dto(classe)
+        except Exception:
+            del _codificadores[classe]
+            raise
+    return codificador
+
+
+def serializar(dto: Any) -> str:
+    return codificador_para(type(dto))(dto)
+
+
+def serializar_lista(dtos: Iterable[Any]) -> str:
+    return "[" + ",".join(map(serializar, dtos)) + "]"
+
+
+def serializar_em_partes(dtos: Iterable[Any], itens_por_parte: int = 500) -> Iterator[str]:
+    """
+    Serializa uma lista JSON em partes de até `itens_por_parte` elementos, à medida que os
+    DTOs são produzidos (ex.: para StreamingHttpResponse), sem montar uma string única.
+    """
+    iterador = iter(dtos)
+    separador = "["
+    while True:
+        parte = list(islice(iterador, itens_por_parte))
+        if not parte:
+            break
+        yield separador + ",".join(map(serializar, parte))
+        separador = ","
+    yield "]" if separador == "," else "[]"
+
+
+async def serializar_em_partes_async(lotes: AsyncIterable[List[Any]]) -> AsyncIterator[str]:
+    """
+    Versão para fontes assíncronas que entregam lotes, como `IPedidoRepository.iterar_por_*`
+    (após mapear as entidades para DTOs): cada lote vira uma parte.
+    """
+    separador = "["
+    async for lote in lotes:
+        if lote:
+            yield separador + ",".join(map(serializar, lote))
+            separador = ","
+    yield "]" if separador == "," else "[]"
@@ -0,0 +1,4 @@
+# delivery_api_project/infrastructure/snapshots/__init__.py
+from.arquivo_snapshot import VERSAO_FORMATO, EscritorSnapshot, LeitorSnapshot, SecaoRegistros
+from.registros_preguicosos import RegistrosPreguicosos
+from.snapshot_estado import EstadoSnapshot, carregar_snapshot, salvar_snapshot
@@ -0,0 +1,269 @@
+# delivery_api_project/infrastructure/snapshots/arquivo_snapshot.py
+"""
+Formato binário dos snapshots (versão 1). Inteiros little-endian.
+
+    cabeçalho   MAGICO (8 bytes), versão do formato (u16), versão do marshal (u16),
+                CRC32 do diretório (u32), posição do diretório (u64), tamanho do diretório (u64)
+    seções      alinhadas a 8 bytes, uma após a outra
+    diretório   marshal de {"secoes": {nome: (tipo, inicio, tamanho)}, "metadados": {...}}
+
+Uma seção do tipo "registros" guarda registros endereçáveis por UUID, cada um decodificável
+isoladamente:
+
+    n (u64) | b (u64) | chaves: n x 16 bytes, na ordem dos registros | ordem das chaves:
+    n x u32, posições dos registros ordenadas pela chave | leque: (2^b + 1) x u32 |
+    deslocamentos: (n + 1) x u64, relativos ao início dos dados | dados: registros em
+    marshal, concatenados
+
+O leque (como no índice dos pacotes do git) guarda, para cada valor dos b primeiros bits
+da chave, quantas chaves ordenadas têm prefixo menor: a busca binária de uma chave fica
+restrita ao seu grupo, de 8 a 16 chaves em média (b cresce com n, até 16).
+
+Uma seção do tipo "dados" é um único valor em marshal (ex.: o estado de um índice).
+
+Os registros são tuplas de tipos primitivos serializadas com marshal: a leitura é feita em C
+e, ao contrário do pickle, um arquivo adulterado não consegue executar código. O formato do
+marshal pode mudar entre versões do Python; por isso sua versão fica no cabeçalho e um
+snapshot de outra versão é recusado (o nó então reconstrói o estado a partir da fonte da
+verdade, como faria sem snapshot).
+"""
+
+import marshal
+import mmap
+import os
+import struct
+import uuid
+import zlib
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from infrastructure.repositories.indices import uuid_de_bytes
+
+MAGICO = b"DLVSNAP\x00"
+VERSAO_FORMATO = 1
+
+_CABECALHO = struct.Struct("<8sHHIQQ")
+_U64 = struct.Struct("<Q")
+_U32 = struct.Struct("<I")
+_DOIS_U32 = struct.Struct("<II")
+_BITS_LEQUE_MAXIMO = 16
+
+TIPO_REGISTROS = "registros"
+TIPO_DADOS = "dados"
+
+
+class EscritorSnapshot:
+    """
+    Grava um snapshot num arquivo temporário ao lado do destino e só o coloca no lugar
+    (os.replace, atômico) em `concluir`: um nó nunca encontra um snapshot pela metade.
+
+        escritor = EscritorSnapshot(caminho)
+        escritor.adicionar_registros("produtos", ((p.id, tupla_do_produto(p)) for p in produtos))
+        escritor.adicionar_dados("indices_produtos", estado)
+        escritor.concluir({"marca": ...})
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._caminho_temporario = f"{caminho}.{os.getpid()}.tmp"
+        self._arquivo = open(self._caminho_temporario, "wb")
+        self._arquivo.write(bytes(_CABECALHO.size))
+        self._secoes: Dict[str, Tuple[str, int, int]] = {}
+
+    def adicionar_registros(self, nome: str, registros: Iterable[Tuple[uuid.UUID, Any]]):
+        chaves: List[bytes] = []
+        deslocamentos = [0]
+        dados: List[bytes] = []
+        for chave, valor in registros:
+            codificado = marshal.dumps(valor, marshal.version)
+            chaves.append(chave.bytes)
+            dados.append(codificado)
+            deslocamentos.append(deslocamentos[-1] + len(codificado))
+        if len(set(chaves)) != len(chaves):
+            raise ValueError(f"Chaves duplicadas na seção {nome}.")
+        ordem = sorted(range(len(chaves)), key=chaves.__getitem__)
+        bits = min(_BITS_LEQUE_MAXIMO, max(0, len(chaves).bit_length() - 4))
+        leque = [0] * (2 ** bits + 1)
+        for chave in chaves:
+            leque[(int.from_bytes(chave[:2], "big") >> (16 - bits)) + 1] += 1
+        for prefixo in range(1, len(leque)):
+            leque[prefixo] += leque[prefixo - 1]
+        inteiros_u32 = len(ordem) + len(leque)
+        partes = [
+            _U64.pack(len(chaves)),
+            _U64.pack(bits),
+            b"".join(chaves),
+            struct.pack(f"<{len(ordem)}I", *ordem),
+            struct.pack(f"<{len(leque)}I", *leque),
+            bytes(4 * (inteiros_u32 % 2)), # Alinha os deslocamentos a 8 bytes
+            struct.pack(f"<{len(deslocamentos)}Q", *deslocamentos),
+            *dados,
+        ]
+        self._adicionar_secao(nome, TIPO_REGISTROS, partes)
+
+    def adicionar_dados(self, nome: str, valor: Any):
+        self._adicionar_secao(nome, TIPO_DADOS, [marshal.dumps(valor, marshal.version)])
+
+    def concluir(self, metadados: Optional[Dict[str, Any]] = None):
+        """`metadados` (valores primitivos) ficam disponíveis no LeitorSnapshot, junto de `criado_em`."""
+        metadados = {"criado_em": datetime.now(timezone.utc).isoformat(), **(metadados or {})}
+        diretorio = marshal.dumps({"secoes": self._secoes, "metadados": metadados}, marshal.version)
+        posicao = self._arquivo.tell()
+        self._arquivo.write(diretorio)
+        self._arquivo.seek(0)
+        self._arquivo.write(_CABECALHO.pack(
+            MAGICO, VERSAO_FORMATO, marshal.version, zlib.crc32(diretorio), posicao, len(diretorio)
+        ))
+        self._arquivo.flush()
+        os.fsync(self._arquivo.fileno())
+        self._arquivo.close()
+        os.replace(self._caminho_temporario, self.caminho)
+
+    def descartar(self):
+        self._arquivo.close()
+        os.remove(self._caminho_temporario)
+
+    def __enter__(self) -> "EscritorSnapshot":
+        return self
+
+    def __exit__(self, tipo_excecao, excecao, traceback) -> bool:
+        if not self._arquivo.closed: # Erro ou saída sem `concluir`
+            self.descartar()
+        return False
+
+    def _adicionar_secao(self, nome: str, tipo: str, partes: List[bytes]):
+        if nome in self._secoes:
+            raise ValueError(f"Seção {nome} já adicionada ao snapshot.")
+        inicio = self._arquivo.tell()
+        self._arquivo.write(bytes(-inicio % 8))
+        inicio += -inicio % 8
+        for parte in partes:
+            self._arquivo.write(parte)
+        self._secoes[nome] = (tipo, inicio, self._arquivo.tell() - inicio)
+
+
+class SecaoRegistros:
+    """Registros de uma seção, lidos diretamente do arquivo mapeado e decodificados sob demanda."""
+
+    __slots__ = (
+        "_mapa", "_quantidade", "_deslocamento_prefixo", "_inicio_chaves", "_inicio_ordem", "_inicio_leque",
+        "_inicio_deslocamentos", "_inicio_dados",
+    )
+
+    def __init__(self, mapa: mmap.mmap, inicio: int):
+        self._mapa = mapa
+        quantidade = self._quantidade = _U64.unpack_from(mapa, inicio)[0]
+        bits = _U64.unpack_from(mapa, inicio + 8)[0]
+        self._deslocamento_prefixo = 16 - bits
+        self._inicio_chaves = inicio + 16
+        self._inicio_ordem = self._inicio_chaves + 16 * quantidade
+        self._inicio_leque = self._inicio_ordem + 4 * quantidade
+        inteiros_u32 = quantidade + 2 ** bits + 1
+        self._inicio_deslocamentos = self._inicio_ordem + 4 * inteiros_u32 + 4 * (inteiros_u32 % 2)
+        self._inicio_dados = self._inicio_deslocamentos + 8 * (quantidade + 1)
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def chave(self, posicao: int) -> uuid.UUID:
+        inicio = self._inicio_chaves + 16 * posicao
+        return uuid_de_bytes(self._mapa[inicio:inicio + 16])
+
+    def chaves(self) -> List[uuid.UUID]:
+        """Todas as chaves, na ordem dos registros."""
+        bloco = self._mapa[self._inicio_chaves:self._inicio_ordem]
+        return [uuid_de_bytes(bloco[inicio:inicio + 16]) for inicio in range(0, len(bloco), 16)]
+
+    def posicao(self, chave: uuid.UUID) -> Optional[int]:
+        """Posição do registro com a chave (busca binária no grupo do leque), ou None."""
+        chave_bytes = chave.bytes
+        prefixo = int.from_bytes(chave_bytes[:2], "big") >> self._deslocamento_prefixo
+        inicio, fim = _DOIS_U32.unpack_from(self._mapa, self._inicio_leque + 4 * prefixo)
+        chaves = _ChavesOrdenadas(self)
+        indice = bisect_left(chaves, chave_bytes, inicio, fim)
+        if indice < fim and chaves[indice] == chave_bytes:
+            return _U32.unpack_from(self._mapa, self._inicio_ordem + 4 * indice)[0]
+        return None
+
+    def registro(self, posicao: int) -> Any:
+        inicio, fim = struct.unpack_from("<QQ", self._mapa, self._inicio_deslocamentos + 8 * posicao)
+        return marshal.loads(self._mapa[self._inicio_dados + inicio:self._inicio_dados + fim])
+
+
+class _ChavesOrdenadas(Sequence):
+    """Visão das chaves em ordem crescente, para o bisect."""
+
+    __slots__ = ("_secao",)
+
+    def __init__(self, secao: SecaoRegistros):
+        self._secao = secao
+
+    def __len__(self) -> int:
+        return self._secao._quantidade
+
+    def __getitem__(self, indice: int) -> bytes:
+        secao = self._secao
+        posicao = _U32.unpack_from(secao._mapa, secao._inicio_ordem + 4 * indice)[0]
+        inicio = secao._inicio_chaves + 16 * posicao
+        return secao._mapa[inicio:inicio + 16]
+
+
+class LeitorSnapshot:
+    """
+    Abre um snapshot com mmap: só o cabeçalho e o diretório são lidos na abertura; as páginas
+    dos registros são trazidas do disco pelo sistema operacional conforme são acessadas.
+    Levanta ValueError se o arquivo não for um snapshot válido desta versão.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.metadados, self._secoes = self._ler_diretorio()
+        except Exception:
+            self._mapa.close()
+            raise
+        self.criado_em: datetime = datetime.fromisoformat(self.metadados["criado_em"])
+
+    def _ler_diretorio(self) -> Tuple[Dict[str, Any], Dict[str, Tuple[str, int, int]]]:
+        mapa = self._mapa
+        if len(mapa) < _CABECALHO.size:
+            raise ValueError(f"Snapshot inválido: {self.caminho}")
+        magico, versao, versao_marshal, crc, posicao, tamanho = _CABECALHO.unpack_from(mapa, 0)
+        if magico != MAGICO:
+            raise ValueError(f"Snapshot inválido: {self.caminho}")
+        if versao != VERSAO_FORMATO or versao_marshal != marshal.version:
+            raise ValueError(
+                f"Snapshot em versão incompatível (formato {versao}, marshal {versao_marshal}); "
+                f"esperado formato {VERSAO_FORMATO}, marshal {marshal.version}."
+            )
+        diretorio = mapa[posicao:posicao + tamanho]
+        if len(diretorio) != tamanho or zlib.crc32(diretorio) != crc:
+            raise ValueError(f"Snapshot corrompido ou incompleto: {self.caminho}")
+        conteudo = marshal.loads(diretorio)
+        return conteudo["metadados"], conteudo["secoes"]
+
+    @property
+    def secoes(self) -> List[str]:
+        return list(self._secoes)
+
+    def registros(self, nome: str) -> SecaoRegistros:
+        return SecaoRegistros(self._mapa, self._secao(nome, TIPO_REGISTROS)[0])
+
+    def dados(self, nome: str) -> Any:
+        inicio, tamanho = self._secao(nome, TIPO_DADOS)
+        return marshal.loads(self._mapa[inicio:inicio + tamanho])
+
+    def fechar(self):
+        """Libera o mapeamento; registros ainda não decodificados deixam de estar acessíveis."""
+        self._mapa.close()
+
+    def _secao(self, nome: str, tipo: str) -> Tuple[int, int]:
+        if nome not in self._secoes:
+            raise ValueError(f"Seção {nome} não existe no snapshot.")
+        tipo_secao, inicio, tamanho = self._secoes[nome]
+        if tipo_secao != tipo:
+            raise ValueError(f"Seção {nome} é do tipo {tipo_secao}, não {tipo}.")
+        return inicio, tamanho
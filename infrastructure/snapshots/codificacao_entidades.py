@@ -0,0 +1,185 @@
+# delivery_api_project/infrastructure/snapshots/codificacao_entidades.py
+"""
+Conversão das entidades em tuplas de tipos primitivos (serializáveis com marshal) e de volta.
+
+UUIDs viram os 16 bytes, datetimes o texto ISO 8601 (sem perda, inclusive do fuso),
+Dinheiro os centavos e o horário de funcionamento seu texto (`horario_funcionamento_texto`). A decodificação é em lote
+(`*_de_tuplas`) e usa os `from_rows` das entidades: os dados vieram de entidades já
+validadas. Os itens de cada pedido ficam como tuplas até o primeiro acesso a `Pedido.itens`;
+o subtotal é somado delas na decodificação do pedido. Alterar a ordem ou o significado dos campos exige incrementar VERSAO_FORMATO
+em arquivo_snapshot.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido
+from domain.entities.produto import Produto
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.indices import uuid_de_bytes as _de_bytes
+
+_de_iso = datetime.fromisoformat
+_de_centavos = Dinheiro.de_centavos
+
+
+class _Ids(dict):
+    """
+    UUIDs por bytes, criados uma vez por lote: referências repetidas (ex.: o restaurante_id
+    de cada produto) passam a compartilhar o mesmo objeto. `None` mapeia para None.
+    """
+
+    def __init__(self):
+        super().__init__({None: None})
+
+    def __missing__(self, valor: bytes) -> uuid.UUID:
+        resultado = self[valor] = _de_bytes(valor)
+        return resultado
+
+
+def uuid_para_bytes(valor: Optional[uuid.UUID]) -> Optional[bytes]:
+    return None if valor is None else valor.bytes
+
+
+def uuid_de_bytes(valor: Optional[bytes]) -> Optional[uuid.UUID]:
+    return None if valor is None else _de_bytes(valor)
+
+
+def data_para_texto(valor: Optional[datetime]) -> Optional[str]:
+    return None if valor is None else valor.isoformat()
+
+
+def data_de_texto(valor: Optional[str]) -> Optional[datetime]:
+    return None if valor is None else _de_iso(valor)
+
+
+def endereco_para_tupla(endereco: Endereco) -> Tuple:
+    coordenadas = endereco.coordenadas
+    return (
+        endereco.logradouro, endereco.numero, endereco.bairro, endereco.cidade, endereco.estado, endereco.cep,
+        endereco.complemento,
+        None if coordenadas is None else coordenadas.latitude,
+        None if coordenadas is None else coordenadas.longitude,
+    )
+
+
+def endereco_de_tupla(tupla: Tuple) -> Endereco:
+    logradouro, numero, bairro, cidade, estado, cep, complemento, latitude, longitude = tupla
+    coordenadas = None if latitude is None else CoordenadaGeo(latitude, longitude)
+    return Endereco(logradouro, numero, bairro, cidade, estado, cep, complemento, coordenadas)
+
+
+def restaurante_para_tupla(restaurante: Restaurante) -> Tuple:
+    return (
+        restaurante.id.bytes, restaurante.nome_fantasia, restaurante.cnpj, restaurante.email_contato,
+        endereco_para_tupla(restaurante.endereco), tuple(restaurante.categorias),
+        restaurante.horario_funcionamento_texto, restaurante.tempo_medio_preparo_min, bool(restaurante.ativo),
+        data_para_texto(restaurante.data_criacao),
+    )
+
+
+def restaurantes_de_tuplas(tuplas: Iterable[Tuple]) -> List[Restaurante]:
+    return Restaurante.from_rows(
+        {
+            "id": _de_bytes(id_), "nome_fantasia": nome_fantasia, "cnpj": cnpj, "email_contato": email_contato,
+            "endereco": endereco_de_tupla(endereco), "categorias": categorias, "horario_funcionamento": horario,
+            "tempo_medio_preparo_min": tempo_medio_preparo_min, "ativo": ativo,
+            "data_criacao": data_de_texto(data_criacao),
+        }
+        for (id_, nome_fantasia, cnpj, email_contato, endereco, categorias, horario, tempo_medio_preparo_min, ativo,
+             data_criacao) in tuplas
+    )
+
+
+def categoria_para_tupla(categoria: CategoriaProduto) -> Tuple:
+    return (
+        categoria.id.bytes, categoria.restaurante_id.bytes, categoria.nome, categoria.descricao, categoria.ordem,
+        data_para_texto(categoria.data_criacao), data_para_texto(categoria.data_atualizacao),
+    )
+
+
+def categorias_de_tuplas(tuplas: Iterable[Tuple]) -> List[CategoriaProduto]:
+    ids = _Ids()
+    return CategoriaProduto.from_rows(
+        {
+            "id": _de_bytes(id_), "restaurante_id": ids[restaurante_id], "nome": nome,
+            "descricao": descricao, "ordem": ordem, "data_criacao": data_de_texto(data_criacao),
+            "data_atualizacao": data_de_texto(data_atualizacao),
+        }
+        for id_, restaurante_id, nome, descricao, ordem, data_criacao, data_atualizacao in tuplas
+    )
+
+
+def produto_para_tupla(produto: Produto) -> Tuple:
+    return (
+        produto.id.bytes, produto.restaurante_id.bytes, produto.nome, produto.descricao, produto.preco.centavos,
+        produto.imagem_url, produto.disponivel, uuid_para_bytes(produto.categoria_produto_id),
+        produto.categoria_produto_nome, data_para_texto(produto.data_criacao), data_para_texto(produto.data_atualizacao),
+    )
+
+
+def produtos_de_tuplas(tuplas: Iterable[Tuple]) -> List[Produto]:
+    ids = _Ids()
+    return Produto.from_rows(
+        {
+            "id": _de_bytes(id_), "restaurante_id": ids[restaurante_id], "nome": nome,
+            "descricao": descricao, "preco": _de_centavos(preco), "imagem_url": imagem_url, "disponivel": disponivel,
+            "categoria_produto_id": ids[categoria_produto_id],
+            "categoria_produto_nome": categoria_produto_nome,
+            "data_criacao": data_de_texto(data_criacao), "data_atualizacao": data_de_texto(data_atualizacao),
+        }
+        for (id_, restaurante_id, nome, descricao, preco, imagem_url, disponivel, categoria_produto_id,
+             categoria_produto_nome, data_criacao, data_atualizacao) in tuplas
+    )
+
+
+def item_para_tupla(item: ItemPedido) -> Tuple:
+    return (
+        item.id.bytes, item.produto_id.bytes, item.quantidade, item.preco_unitario_compra.centavos,
+        item.observacoes_item,
+    )
+
+
+def _carregador_itens(tuplas: Tuple) -> Callable[[], List[ItemPedido]]:
+    def carregar() -> List[ItemPedido]:
+        return ItemPedido.from_rows([
+            {
+                "id": _de_bytes(item_id), "produto_id": _de_bytes(produto_id), "quantidade": quantidade,
+                "preco_unitario_compra": _de_centavos(preco), "observacoes_item": observacoes_item,
+            }
+            for item_id, produto_id, quantidade, preco, observacoes_item in tuplas
+        ])
+    return carregar
+
+
+def pedido_para_tupla(pedido: Pedido) -> Tuple:
+    return (
+        pedido.id.bytes, pedido.cliente_id.bytes, pedido.restaurante_id.bytes,
+        endereco_para_tupla(pedido.endereco_entrega), tuple(map(item_para_tupla, pedido.itens)),
+        pedido.status_pedido, pedido.taxa_entrega.centavos, pedido.metodo_pagamento, pedido.observacoes_gerais,
+        uuid_para_bytes(pedido.entregador_id), data_para_texto(pedido.data_criacao),
+        data_para_texto(pedido.data_ultima_atualizacao),
+    )
+
+
+def pedidos_de_tuplas(tuplas: Iterable[Tuple]) -> List[Pedido]:
+    ids = _Ids()
+    return Pedido.from_rows(
+        {
+            "id": _de_bytes(id_), "cliente_id": ids[cliente_id],
+            "restaurante_id": ids[restaurante_id], "endereco_entrega": endereco_de_tupla(endereco_entrega),
+            "carregar_itens": _carregador_itens(itens), "quantidade_itens": len(itens),
+            "valor_subtotal_itens": _de_centavos(sum(quantidade * preco for _, _, quantidade, preco, _ in itens)),
+            "status_pedido": status_pedido, "taxa_entrega": _de_centavos(taxa_entrega),
+            "metodo_pagamento": metodo_pagamento, "observacoes_gerais": observacoes_gerais,
+            "entregador_id": uuid_de_bytes(entregador_id), "data_criacao": data_de_texto(data_criacao),
+            "data_ultima_atualizacao": data_de_texto(data_ultima_atualizacao),
+        }
+        for (id_, cliente_id, restaurante_id, endereco_entrega, itens, status_pedido, taxa_entrega, metodo_pagamento,
+             observacoes_gerais, entregador_id, data_criacao, data_ultima_atualizacao) in tuplas
+    )
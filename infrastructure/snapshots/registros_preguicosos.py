@@ -0,0 +1,187 @@
+# delivery_api_project/infrastructure/snapshots/registros_preguicosos.py
+
+import uuid
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from infrastructure.snapshots.arquivo_snapshot import SecaoRegistros
+
+_AUSENTE = object()
+
+
+class RegistrosPreguicosos(dict):
+    """
+    Dicionário id -> entidade cujos valores ainda não acessados continuam codificados no
+    snapshot mapeado em memória. Cada registro é decodificado no primeiro acesso à sua chave
+    (`[]`, `get`, `pop`) e passa a viver no dicionário como qualquer outro valor; gravações
+    e remoções prevalecem sobre o snapshot. Entra no lugar do dicionário principal dos
+    repositórios em memória, que assim atendem leituras logo após a carga.
+
+    Operações que percorrem tudo (`values`, `items`, iteração) decodificam antes os
+    registros restantes, mantendo a ordem do snapshot (a de inserção no repositório
+    original), com as chaves gravadas depois da carga ao final. `fatia` lê uma faixa dessa
+    mesma ordem decodificando só os registros da faixa (listagens paginadas).
+    """
+
+    def __init__(self, secao: SecaoRegistros, decodificar: Callable[[List[Any]], List[Any]]):
+        """`decodificar` converte uma lista de registros na lista de entidades correspondente."""
+        super().__init__()
+        self._secao = secao
+        self._decodificar = decodificar
+        self._resolvidas: Set[int] = set() # Posições do snapshot já decodificadas, sobrescritas ou removidas
+        self._pendentes = len(secao)
+        # Só depois de materializar a ordem do dict é a do snapshot (os decodificados um a um entram na ordem de acesso)
+        self._materializado = False
+
+    @property
+    def pendentes(self) -> int:
+        """Registros do snapshot ainda não decodificados."""
+        return self._pendentes
+
+    def __missing__(self, chave):
+        valor = self._carregar(chave)
+        if valor is _AUSENTE:
+            raise KeyError(chave)
+        return valor
+
+    def get(self, chave, padrao=None):
+        valor = dict.get(self, chave, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = self._carregar(chave) if self._pendentes else _AUSENTE
+        return padrao if valor is _AUSENTE else valor
+
+    def __contains__(self, chave) -> bool:
+        return dict.__contains__(self, chave) or self._posicao_pendente(chave) is not None
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + self._pendentes
+
+    def __setitem__(self, chave, valor):
+        self._resolver(self._posicao_pendente(chave))
+        dict.__setitem__(self, chave, valor)
+
+    def __delitem__(self, chave):
+        posicao = self._posicao_pendente(chave)
+        if posicao is not None:
+            self._resolver(posicao)
+        else:
+            dict.__delitem__(self, chave)
+
+    def pop(self, chave, *padrao):
+        valor = self.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            if padrao:
+                return padrao[0]
+            raise KeyError(chave)
+        dict.__delitem__(self, chave)
+        return valor
+
+    def setdefault(self, chave, padrao=None):
+        valor = self.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            self[chave] = valor = padrao
+        return valor
+
+    def update(self, *args, **kwargs):
+        for chave, valor in dict(*args, **kwargs).items():
+            self[chave] = valor
+
+    def clear(self):
+        self._resolvidas = set(range(len(self._secao)))
+        self._pendentes = 0
+        self._materializado = True
+        dict.clear(self)
+
+    def __iter__(self) -> Iterator:
+        self.materializar()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.materializar()
+        return dict.keys(self)
+
+    def values(self):
+        self.materializar()
+        return dict.values(self)
+
+    def items(self):
+        self.materializar()
+        return dict.items(self)
+
+    def fatia(self, inicio: int, fim: int) -> List[Any]:
+        """Valores das posições [inicio, fim) na ordem de `values()`, sem materializar o restante."""
+        if self._materializado:
+            return list(islice(dict.values(self), inicio, fim))
+        secao = self._secao
+        # Posições do snapshot ainda presentes: pendentes ou já no dicionário (removidas ficam de fora)
+        na_faixa: List[Tuple[int, uuid.UUID]] = []
+        vistas = 0
+        for posicao in range(len(secao)):
+            if vistas >= fim:
+                break
+            chave = secao.chave(posicao)
+            if posicao in self._resolvidas and not dict.__contains__(self, chave):
+                continue
+            if vistas >= inicio:
+                na_faixa.append((posicao, chave))
+            vistas += 1
+        pendentes = [(posicao, chave) for posicao, chave in na_faixa if posicao not in self._resolvidas]
+        if pendentes:
+            decodificados = self._decodificar([secao.registro(posicao) for posicao, _ in pendentes])
+            for (posicao, chave), valor in zip(pendentes, decodificados):
+                self._resolver(posicao)
+                dict.__setitem__(self, chave, valor)
+        valores = [dict.__getitem__(self, chave) for _, chave in na_faixa]
+        if vistas < fim: # A faixa continua nas chaves gravadas depois da carga
+            novas = (valor for chave, valor in dict.items(self) if secao.posicao(chave) is None)
+            valores.extend(islice(novas, max(inicio - vistas, 0), fim - vistas))
+        return valores
+
+    def __repr__(self) -> str:
+        return f"RegistrosPreguicosos(carregados={dict.__len__(self)}, pendentes={self._pendentes})"
+
+    def materializar(self):
+        """Decodifica todos os registros pendentes; depois disso, equivale a um dict comum."""
+        if self._materializado:
+            return
+        secao = self._secao
+        chaves = secao.chaves()
+        pendentes = [posicao for posicao in range(len(secao)) if posicao not in self._resolvidas]
+        decodificados = dict(zip(
+            [chaves[posicao] for posicao in pendentes],
+            self._decodificar([secao.registro(posicao) for posicao in pendentes]),
+        ))
+        restantes: Dict[Any, Any] = dict(dict.items(self))
+        ordenados: Dict[Any, Any] = {}
+        for chave in chaves:
+            valor = decodificados.get(chave, _AUSENTE)
+            if valor is _AUSENTE:
+                valor = restantes.pop(chave, _AUSENTE)
+            if valor is not _AUSENTE:
+                ordenados[chave] = valor
+        ordenados.update(restantes)
+        dict.clear(self)
+        dict.update(self, ordenados)
+        self._resolvidas = set(range(len(secao)))
+        self._pendentes = 0
+        self._materializado = True
+
+    def _carregar(self, chave) -> Any:
+        posicao = self._posicao_pendente(chave)
+        if posicao is None:
+            return _AUSENTE
+        self._resolver(posicao)
+        valor = self._decodificar([self._secao.registro(posicao)])[0]
+        dict.__setitem__(self, chave, valor)
+        return valor
+
+    def _posicao_pendente(self, chave) -> Optional[int]:
+        if not self._pendentes or type(chave) is not uuid.UUID:
+            return None
+        posicao = self._secao.posicao(chave)
+        return None if posicao is None or posicao in self._resolvidas else posicao
+
+    def _resolver(self, posicao: Optional[int]):
+        if posicao is not None:
+            self._resolvidas.add(posicao)
+            self._pendentes -= 1
@@ -0,0 +1,113 @@
+# delivery_api_project/infrastructure/snapshots/snapshot_estado.py
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from application.interfaces.i_outbox_repository import IOutboxRepository
+from domain.entities.pedido import StatusPedido
+from infrastructure.repositories.categoria_produto_repository_em_memoria import CategoriaProdutoRepositoryEmMemoria
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from infrastructure.repositories.produto_repository_em_memoria import ProdutoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+from infrastructure.snapshots.arquivo_snapshot import EscritorSnapshot, LeitorSnapshot
+from infrastructure.snapshots.codificacao_entidades import (
+    categoria_para_tupla, categorias_de_tuplas, pedido_para_tupla, pedidos_de_tuplas, produto_para_tupla,
+    produtos_de_tuplas, restaurante_para_tupla, restaurantes_de_tuplas
+)
+from infrastructure.snapshots.registros_preguicosos import RegistrosPreguicosos
+
+
+@dataclass
+class EstadoSnapshot:
+    """
+    Repositórios em memória restaurados de um snapshot. Os índices já estão prontos; as
+    entidades são decodificadas do arquivo mapeado no primeiro acesso a cada uma, de modo
+    que o nó atende leituras logo após `carregar_snapshot`.
+
+    O snapshot reflete a fonte da verdade no instante `criado_em` (ou na `marca` gravada
+    nos metadados, ex.: a última posição do outbox aplicada): o nó deve então aplicar as
+    alterações posteriores com os `salvar` usuais dos repositórios, que prevalecem sobre o
+    conteúdo do snapshot.
+    """
+    restaurantes: RestauranteRepositoryEmMemoria
+    categorias: CategoriaProdutoRepositoryEmMemoria
+    produtos: ProdutoRepositoryEmMemoria
+    pedidos: PedidoRepositoryEmMemoria
+    criado_em: datetime
+    metadados: Dict[str, Any] = field(default_factory=dict)
+    leitor: Optional[LeitorSnapshot] = None
+
+    @property
+    def registros_pendentes(self) -> int:
+        """Entidades do snapshot ainda não decodificadas."""
+        return sum(registros.pendentes for registros in self._registros())
+
+    def materializar(self):
+        """Decodifica todas as entidades restantes e libera o arquivo mapeado."""
+        for registros in self._registros():
+            registros.materializar()
+        if self.leitor is not None:
+            self.leitor.fechar()
+            self.leitor = None
+
+    def _registros(self):
+        for repositorio, atributo in ((self.restaurantes, "_restaurantes"), (self.categorias, "_categorias"),
+                                      (self.produtos, "_produtos"), (self.pedidos, "_pedidos")):
+            registros = getattr(repositorio, atributo)
+            if isinstance(registros, RegistrosPreguicosos):
+                yield registros
+
+
+def salvar_snapshot(caminho: str,
+                    restaurantes: RestauranteRepositoryEmMemoria,
+                    categorias: CategoriaProdutoRepositoryEmMemoria,
+                    produtos: ProdutoRepositoryEmMemoria,
+                    pedidos: PedidoRepositoryEmMemoria,
+                    metadados: Optional[Dict[str, Any]] = None):
+    """
+    Grava restaurantes, categorias, produtos e os pedidos em aberto (com os índices de cada
+    repositório) num snapshot; a troca do arquivo anterior é atômica. `metadados` aceita
+    valores primitivos, como a marca a partir da qual o nó deve se atualizar depois da carga.
+    """
+    with EscritorSnapshot(caminho) as escritor:
+        for nome, para_tupla, (entidades, estado_indices) in (
+            ("restaurantes", restaurante_para_tupla, restaurantes.exportar_snapshot()),
+            ("categorias", categoria_para_tupla, categorias.exportar_snapshot()),
+            ("produtos", produto_para_tupla, produtos.exportar_snapshot()),
+            ("pedidos", pedido_para_tupla, pedidos.exportar_snapshot(StatusPedido.EM_ABERTO)),
+        ):
+            escritor.adicionar_registros(nome, ((entidade.id, para_tupla(entidade)) for entidade in entidades))
+            escritor.adicionar_dados(f"indices_{nome}", estado_indices)
+        escritor.concluir(metadados)
+
+
+def carregar_snapshot(caminho: str, outbox: Optional[IOutboxRepository] = None) -> EstadoSnapshot:
+    """Abre o snapshot (mmap) e restaura os repositórios; levanta ValueError se for inválido ou incompatível."""
+    leitor = LeitorSnapshot(caminho)
+    try:
+        return EstadoSnapshot(
+            restaurantes=RestauranteRepositoryEmMemoria.de_snapshot(
+                RegistrosPreguicosos(leitor.registros("restaurantes"), restaurantes_de_tuplas),
+                leitor.dados("indices_restaurantes"),
+            ),
+            categorias=CategoriaProdutoRepositoryEmMemoria.de_snapshot(
+                RegistrosPreguicosos(leitor.registros("categorias"), categorias_de_tuplas),
+                leitor.dados("indices_categorias"),
+            ),
+            produtos=ProdutoRepositoryEmMemoria.de_snapshot(
+                RegistrosPreguicosos(leitor.registros("produtos"), produtos_de_tuplas),
+                leitor.dados("indices_produtos"),
+            ),
+            pedidos=PedidoRepositoryEmMemoria.de_snapshot(
+                RegistrosPreguicosos(leitor.registros("pedidos"), pedidos_de_tuplas),
+                leitor.dados("indices_pedidos"),
+                outbox,
+            ),
+            criado_em=leitor.criado_em,
+            metadados=leitor.metadados,
+            leitor=leitor,
+        )
+    except Exception:
+        leitor.fechar()
+        raise
@@ -0,0 +1,57 @@
+import unittest
+
+from infrastructure.cache.cache_lru_ttl import CacheLRUComTTL
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+class CacheLRUComTTLTests(unittest.TestCase):
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        self.cache = CacheLRUComTTL(tamanho_maximo=4, ttl_segundos=10, relogio=self.relogio)
+
+    def test_expira_pelo_ttl(self):
+        self.cache.armazenar("g", "a", 1)
+        self.assertEqual(self.cache.obter("a"), 1)
+        self.relogio.agora = 10
+        self.assertFalse(self.cache.contem_valor(self.cache.obter("a")))
+        self.assertEqual(self.cache.estatisticas.expiracoes, 1)
+
+    def test_despeja_a_menos_usada(self):
+        for chave in "abcd":
+            self.cache.armazenar("g", chave, chave)
+        self.cache.obter("a")
+        self.cache.armazenar("g", "e", "e")
+        self.assertFalse(self.cache.contem_valor(self.cache.obter("b")))
+        self.assertEqual(self.cache.obter("a"), "a")
+
+    def test_invalidacao_descarta_resultado_calculado_antes(self):
+        geracao = self.cache.geracao("g")
+        self.cache.invalidar_grupo("g")
+        self.cache.armazenar("g", "a", "antigo", geracao)
+        self.assertFalse(self.cache.contem_valor(self.cache.obter("a")))
+
+    def test_geracoes_de_grupos_sem_entradas_sao_podadas(self):
+        self.cache.armazenar("vivo", "a", 1)
+        for grupo in range(1_000):
+            self.cache.invalidar_grupo(grupo)
+        self.assertLessEqual(len(self.cache._geracoes), self.cache.tamanho_maximo + 1)
+        self.assertEqual(self.cache.obter("a"), 1)
+
+    def test_poda_nao_aceita_resultado_anterior_a_invalidacao(self):
+        geracao = self.cache.geracao("g")
+        self.cache.invalidar_grupo("g")
+        for grupo in range(100): # Força a poda da geração de "g", que não tem entradas
+            self.cache.invalidar_grupo(grupo)
+        self.cache.armazenar("g", "a", "antigo", geracao)
+        self.assertFalse(self.cache.contem_valor(self.cache.obter("a")))
+
+
+if __name__ == "__main__":
+    unittest.main()
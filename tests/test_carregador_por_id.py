@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from application.carregadores.carregador_por_id import CarregadorPorId
+
+
+class RepositorioFalso:
+    def __init__(self):
+        self.lotes = []
+        self.versao = 1
+        self.liberar = None # asyncio.Event que segura a busca, quando definido
+
+    async def buscar_por_ids(self, ids):
+        self.lotes.append(list(ids))
+        versao = self.versao
+        if self.liberar is not None:
+            await self.liberar.wait()
+        return [SimpleNamespace(id=i, versao=versao) for i in ids if i != "inexistente"]
+
+
+class CarregadorPorIdTests(unittest.TestCase):
+    def setUp(self):
+        self.repositorio = RepositorioFalso()
+
+    async def _aguardar_busca(self):
+        while not self.repositorio.lotes:
+            await asyncio.sleep(0)
+
+    def test_agrupa_chamadas_do_mesmo_ciclo_num_lote(self):
+        async def cenario():
+            carregador = CarregadorPorId(self.repositorio.buscar_por_ids)
+            return await asyncio.gather(*(carregador.carregar(i) for i in ("a", "b", "a", "inexistente")))
+        resultados = asyncio.run(cenario())
+        self.assertEqual([r.id if r else None for r in resultados], ["a", "b", "a", None])
+        self.assertEqual(self.repositorio.lotes, [["a", "b", "inexistente"]])
+
+    def test_respeita_tamanho_maximo_do_lote(self):
+        async def cenario():
+            carregador = CarregadorPorId(self.repositorio.buscar_por_ids, tamanho_maximo_lote=2)
+            await carregador.carregar_varios(["a", "b", "c"])
+        asyncio.run(cenario())
+        self.assertEqual(self.repositorio.lotes, [["a", "b"], ["c"]])
+
+    def test_busca_cancelada_nao_deixa_chamadores_esperando(self):
+        async def cenario():
+            self.repositorio.liberar = asyncio.Event()
+            carregador = CarregadorPorId(self.repositorio.buscar_por_ids)
+            chamada = asyncio.ensure_future(carregador.carregar("a"))
+            await self._aguardar_busca()
+            (tarefa,) = carregador._tarefas
+            tarefa.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(chamada, 1)
+            self.assertEqual(carregador._tarefas, set())
+            self.repositorio.liberar = None
+            return await carregador.carregar("a") # Cancelamento não fica guardado
+        self.assertEqual(asyncio.run(cenario()).id, "a")
+
+    def test_tarefa_cancelada_antes_de_comecar_tambem_libera_os_chamadores(self):
+        async def cenario():
+            carregador = CarregadorPorId(self.repositorio.buscar_por_ids)
+            chamada = asyncio.ensure_future(carregador.carregar("a"))
+            while not carregador._tarefas:
+                await asyncio.sleep(0)
+            (tarefa,) = carregador._tarefas
+            tarefa.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(chamada, 1)
+            self.assertEqual(self.repositorio.lotes, [])
+        asyncio.run(cenario())
+
+    def test_falha_e_propagada_e_nao_fica_guardada(self):
+        async def cenario():
+            falhar = [True]
+            async def buscar(ids):
+                if falhar.pop():
+                    raise RuntimeError("indisponível")
+                return [SimpleNamespace(id=i) for i in ids]
+            carregador = CarregadorPorId(buscar)
+            with self.assertRaises(RuntimeError):
+                await carregador.carregar("a")
+            falhar.append(False)
+            return await carregador.carregar("a")
+        self.assertEqual(asyncio.run(cenario()).id, "a")
+
+    def test_limpar_descarta_busca_em_andamento(self):
+        async def cenario():
+            self.repositorio.liberar = asyncio.Event()
+            carregador = CarregadorPorId(self.repositorio.buscar_por_ids)
+            antiga = asyncio.ensure_future(carregador.carregar("a"))
+            await self._aguardar_busca()
+            self.repositorio.versao = 2 # Entidade salva enquanto a busca estava em andamento
+            carregador.limpar("a")
+            nova = asyncio.ensure_future(carregador.carregar("a"))
+            await asyncio.sleep(0)
+            self.repositorio.liberar.set()
+            return (await antiga).versao, (await nova).versao, (await carregador.carregar("a")).versao
+        self.assertEqual(asyncio.run(cenario()), (1, 2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.endereco import Endereco
+from infrastructure.despacho.despacho_entregadores import DespachoEntregadores
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+
+POSICAO_RESTAURANTE = CoordenadaGeo(-23.55, -46.63)
+
+
+class RestauranteRepositoryComAtraso(RestauranteRepositoryEmMemoria):
+    """Executa `durante_consulta` enquanto o despacho aguarda a busca dos restaurantes."""
+
+    durante_consulta = None
+
+    async def buscar_por_ids(self, restaurante_ids):
+        if self.durante_consulta is not None:
+            self.durante_consulta()
+        return await super().buscar_por_ids(restaurante_ids)
+
+
+def _pedido_pronto(restaurante_id: uuid.UUID, minutos: int) -> Pedido:
+    pedido = Pedido(
+        cliente_id=uuid.uuid4(), restaurante_id=restaurante_id,
+        endereco_entrega=Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000"),
+    )
+    pedido.data_criacao = datetime(2024, 1, 1) + timedelta(minutes=minutos)
+    pedido.confirmar_pelo_restaurante()
+    pedido.marcar_como_em_preparo()
+    pedido.marcar_como_pronto_para_coleta()
+    return pedido
+
+
+class DespachoEntregadoresTests(unittest.TestCase):
+    def setUp(self):
+        self.pedidos = PedidoRepositoryEmMemoria()
+        self.restaurantes = RestauranteRepositoryComAtraso()
+        self.restaurante = Restaurante(
+            nome_fantasia="Cantina", cnpj="00000000000001", email_contato="cantina@exemplo.com",
+            endereco=Endereco("Rua A", "1", "Centro", "São Paulo", "SP", "01000-000", None, POSICAO_RESTAURANTE),
+            categorias=["italiana"], data_criacao=datetime(2024, 1, 1),
+        )
+        asyncio.run(self.restaurantes.salvar(self.restaurante))
+        self.prontos = [_pedido_pronto(self.restaurante.id, minutos) for minutos in range(3)]
+        for pedido in self.prontos:
+            asyncio.run(self.pedidos.salvar(pedido))
+            pedido.limpar_alteracoes()
+        self.despacho = DespachoEntregadores(self.pedidos, self.restaurantes)
+        self.entregador_id = uuid.uuid4()
+        self.despacho.atualizar_entregador(self.entregador_id, CoordenadaGeo(-23.551, -46.631), capacidade=3)
+
+    def test_atribui_e_marca_saida_para_entrega(self):
+        atribuicoes = asyncio.run(self.despacho.despachar())
+        self.assertEqual([a.pedido_id for a in atribuicoes], [p.id for p in self.prontos])
+        for pedido in self.prontos:
+            self.assertEqual(pedido.status_pedido, StatusPedido.SAIU_PARA_ENTREGA)
+            self.assertEqual(pedido.entregador_id, self.entregador_id)
+            self.assertFalse(pedido.possui_alteracoes)
+        self.assertEqual(self.despacho.disponiveis, 0)
+
+    def test_pedido_alterado_durante_a_rodada_devolve_a_capacidade(self):
+        cancelado = self.prontos[1]
+        self.restaurantes.durante_consulta = cancelado.cancelar_pelo_cliente
+        atribuicoes = asyncio.run(self.despacho.despachar())
+        self.assertEqual({a.pedido_id for a in atribuicoes}, {self.prontos[0].id, self.prontos[2].id})
+        self.assertEqual(cancelado.status_pedido, StatusPedido.CANCELADO_PELO_CLIENTE)
+        self.assertIsNone(cancelado.entregador_id)
+        self.assertEqual(self.despacho._entregadores[self.entregador_id].em_rota, 2)
+        self.assertEqual(self.despacho.disponiveis, 1)
+
+    def test_falha_ao_gravar_devolve_a_capacidade(self):
+        async def falhar(novos, alterados):
+            raise RuntimeError("banco indisponível")
+        self.pedidos.salvar_alteracoes = falhar
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.despacho.despachar())
+        self.assertEqual(self.despacho._entregadores[self.entregador_id].em_rota, 0)
+        for pedido in self.prontos:
+            self.assertEqual(pedido.status_pedido, StatusPedido.PRONTO_PARA_COLETA)
+            self.assertIsNone(pedido.entregador_id)
+            self.assertFalse(pedido.possui_alteracoes)
+
+    def test_segue_o_cursor_quando_os_primeiros_pedidos_nao_tem_entregador(self):
+        sem_coordenadas = Restaurante(
+            nome_fantasia="Sem mapa", cnpj="00000000000002", email_contato="semmapa@exemplo.com",
+            endereco=Endereco("Rua C", "3", "Centro", "São Paulo", "SP", "01000-000"),
+            categorias=["lanches"], data_criacao=datetime(2024, 1, 1),
+        )
+        asyncio.run(self.restaurantes.salvar(sem_coordenadas))
+        for minutos in (-2, -1): # Mais antigos que todos os prontos do restaurante com coordenadas
+            asyncio.run(self.pedidos.salvar(_pedido_pronto(sem_coordenadas.id, minutos)))
+        atribuicoes = asyncio.run(self.despacho.despachar(limite=2))
+        self.assertEqual([a.pedido_id for a in atribuicoes], [p.id for p in self.prontos[:2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import pickle
+import unittest
+import uuid
+from decimal import ROUND_DOWN, Decimal
+
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+
+
+class ConversaoTests(unittest.TestCase):
+    def test_formatos_aceitos(self):
+        self.assertEqual(Dinheiro("12.90").centavos, 1290)
+        self.assertEqual(Dinheiro("0.5").centavos, 50)
+        self.assertEqual(Dinheiro("7").centavos, 700)
+        self.assertEqual(Dinheiro(3).centavos, 300)
+        self.assertEqual(Dinheiro(Decimal("1.10")).centavos, 110)
+        self.assertEqual(Dinheiro(Decimal("2.500")).centavos, 250) # Zeros à direita não são frações
+        self.assertEqual(Dinheiro("-4.05").centavos, -405)
+        self.assertEqual(Dinheiro(0.1).centavos, 10)
+        self.assertEqual(Dinheiro.de_centavos(199), Dinheiro("1.99"))
+        self.assertEqual(str(Dinheiro("-0.07")), "-0.07")
+
+    def test_fracoes_de_centavo_sao_recusadas_sem_arredondamento_explicito(self):
+        for valor in ("0.001", Decimal("1.005"), "10.999"):
+            with self.subTest(valor=valor), self.assertRaises(ValueError):
+                Dinheiro(valor)
+        self.assertEqual(Dinheiro("1.005", arredondamento=ROUND_DOWN).centavos, 100)
+
+    def test_formatos_invalidos(self):
+        for valor in ("abc", "", "NaN", "Infinity", True, float("nan")):
+            with self.subTest(valor=valor), self.assertRaises(ValueError):
+                Dinheiro(valor)
+        with self.assertRaises(TypeError):
+            Dinheiro.de_centavos(1.5)
+
+    def test_imutavel_e_serializavel(self):
+        valor = Dinheiro("3.33")
+        with self.assertRaises(AttributeError):
+            valor.centavos = 1
+        self.assertEqual(pickle.loads(pickle.dumps(valor)), valor)
+
+
+class OperacoesTests(unittest.TestCase):
+    def test_multiplicar_arredonda_meio_para_cima(self):
+        self.assertEqual(Dinheiro("0.05").multiplicar(Decimal("0.5")), Dinheiro("0.03"))
+        self.assertEqual(Dinheiro("-0.05").multiplicar("0.5"), Dinheiro("-0.03"))
+        self.assertEqual(Dinheiro("10.00").multiplicar("0.333"), Dinheiro("3.33"))
+        self.assertEqual(Dinheiro("0.05").multiplicar("0.5", ROUND_DOWN), Dinheiro("0.02"))
+        self.assertEqual(Dinheiro("1.25").multiplicar(3), Dinheiro("3.75"))
+        with self.assertRaises(ValueError):
+            Dinheiro("1.00").multiplicar("x")
+
+    def test_ratear_soma_exatamente_o_total(self):
+        total = Dinheiro("100.00")
+        partes = total.ratear(3)
+        self.assertEqual(partes, [Dinheiro("33.34"), Dinheiro("33.33"), Dinheiro("33.33")])
+        self.assertEqual(sum(partes), total)
+        for centavos, pesos in ((1, [1, 1, 1]), (1001, [3, 0, 7]), (99999, [5, 2, 2, 1]), (7, 9)):
+            with self.subTest(centavos=centavos, pesos=pesos):
+                self.assertEqual(sum(Dinheiro.de_centavos(centavos).ratear(pesos)).centavos, centavos)
+        for pesos in ([], [0, 0], [1, -1], 0):
+            with self.subTest(pesos=pesos), self.assertRaises(ValueError):
+                total.ratear(pesos)
+
+    def test_interopera_com_decimal_e_int(self):
+        self.assertEqual(Dinheiro("5.00"), Decimal("5.00"))
+        self.assertEqual(Decimal("5"), Dinheiro("5.00"))
+        self.assertEqual(Dinheiro("5.00"), 5)
+        self.assertNotEqual(Dinheiro("5.00"), Decimal("5.001"))
+        self.assertNotEqual(Dinheiro("5.00"), "5.00")
+        self.assertEqual(hash(Dinheiro("5.00")), hash(Decimal("5")))
+        self.assertEqual(len({Dinheiro("2.50"), Decimal("2.5")}), 1)
+        self.assertLess(Decimal("4.999"), Dinheiro("5.00"))
+        self.assertGreater(Dinheiro("0.01"), 0)
+
+        acumulado = Decimal("0")
+        acumulado += Dinheiro("1.50")
+        self.assertEqual(acumulado, Dinheiro("1.50"))
+        self.assertEqual(Dinheiro("2.00") - Decimal("0.25"), Dinheiro("1.75"))
+        self.assertEqual(10 - Dinheiro("0.01"), Dinheiro("9.99"))
+        with self.assertRaises(ValueError):
+            Dinheiro("1.00") + Decimal("0.001")
+        with self.assertRaises(TypeError):
+            Dinheiro("1.00") + 0.5
+        with self.assertRaises(TypeError):
+            Dinheiro("1.00") * Decimal("1.5")
+
+
+class TotaisPedidoTests(unittest.TestCase):
+    def _pedido(self, **kwargs) -> Pedido:
+        return Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO, **kwargs)
+
+    def test_totais_somam_itens_e_taxa(self):
+        pedido = self._pedido(taxa_entrega=Decimal("5.00"), itens=[
+            ItemPedido(produto_id=uuid.uuid4(), quantidade=3, preco_unitario_compra=Decimal("0.10")),
+            ItemPedido(produto_id=uuid.uuid4(), quantidade=2, preco_unitario_compra=Dinheiro("12.45")),
+        ])
+        self.assertEqual(pedido.valor_subtotal_itens, Dinheiro("25.20"))
+        self.assertEqual(pedido.valor_total_pedido, Dinheiro("30.20"))
+        self.assertEqual(pedido.taxa_entrega, Decimal("5.00"))
+        self.assertEqual(pedido.valor_total_pedido.para_decimal(), Decimal("30.20"))
+
+    def test_totais_acompanham_alteracoes_de_itens(self):
+        item = ItemPedido(produto_id=uuid.uuid4(), quantidade=1, preco_unitario_compra=Decimal("9.99"))
+        pedido = self._pedido(itens=[item])
+        pedido.atualizar_quantidade_item(item.id, 4)
+        self.assertEqual(pedido.valor_total_pedido, Decimal("39.96"))
+        pedido.remover_item(item.id)
+        self.assertEqual(pedido.valor_total_pedido, Dinheiro())
+
+    def test_pedido_sem_itens(self):
+        self.assertEqual(self._pedido().valor_total_pedido, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
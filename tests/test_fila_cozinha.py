@@ -0,0 +1,43 @@
+import random
+import unittest
+import uuid
+from datetime import datetime
+
+from domain.entities.pedido import StatusPedido
+from infrastructure.cozinha.fila_cozinha import FilaCozinha
+
+AGORA = datetime(2024, 1, 1, 12, 0)
+
+
+class FilaCozinhaTests(unittest.TestCase):
+    def test_posicoes_ignoram_pedidos_removidos_do_meio_da_fila(self):
+        fila = FilaCozinha(tempo_preparo_min=10)
+        pedidos = [uuid.uuid4() for _ in range(3)]
+        for pedido_id in pedidos:
+            fila.atualizar(pedido_id, StatusPedido.CONFIRMADO_PELO_RESTAURANTE, AGORA)
+        fila.atualizar(pedidos[1], StatusPedido.CANCELADO_PELO_RESTAURANTE, AGORA)
+
+        ultimo = fila.prever_pronto(pedidos[2], AGORA)
+        novo = fila.prever_pronto(agora=AGORA)
+        self.assertEqual((ultimo[1], novo[1]), (2, 3))
+        self.assertLess(ultimo[0], novo[0])
+
+    def test_posicao_e_a_ordem_entre_os_que_aguardam(self):
+        aleatorio = random.Random(3)
+        fila = FilaCozinha(tempo_preparo_min=10, capacidade=2)
+        aguardando = [] # Em ordem de chegada
+        for _ in range(2_000):
+            if aguardando and aleatorio.random() < 0.45:
+                pedido_id = aguardando.pop(aleatorio.randrange(len(aguardando)))
+                fila.atualizar(pedido_id, aleatorio.choice([StatusPedido.EM_PREPARO, StatusPedido.CANCELADO_PELO_CLIENTE]), AGORA)
+            else:
+                pedido_id = uuid.uuid4()
+                aguardando.append(pedido_id)
+                fila.atualizar(pedido_id, StatusPedido.CONFIRMADO_PELO_RESTAURANTE, AGORA)
+        for posicao, pedido_id in enumerate(aguardando, start=1):
+            self.assertEqual(fila.prever_pronto(pedido_id, AGORA)[1], posicao)
+        self.assertEqual(fila.prever_pronto(agora=AGORA)[1], len(aguardando) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
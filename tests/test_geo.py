@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime
+
+import numpy as np
+
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.geo import GradeGeografica, calcular_taxas_entrega
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+
+
+class CalcularTaxasEntregaTests(unittest.TestCase):
+    def test_calcula_em_centavos_arredondando_para_cima(self):
+        taxas = calcular_taxas_entrega(np.array([0.0, 1.0, 2.5, 0.0004, 0.0006]), Dinheiro("5.00"), Dinheiro("1.99"))
+        # 2,5 km * 199 = 497,5 centavos -> 498; 0,4 m arredonda para 0 m; 0,6 m para 1 m (0,199 -> 1 centavo)
+        self.assertEqual([t.centavos for t in taxas], [500, 699, 998, 500, 501])
+
+    def test_distancia_exata_nao_e_arredondada_para_cima(self):
+        # Em float, 0.3 * 1000 = 300.00000000000006; ao metro, a taxa não ganha um centavo a mais
+        (taxa,) = calcular_taxas_entrega(np.array([0.3]), Dinheiro("0"), Dinheiro("10.00"))
+        self.assertEqual(taxa, Dinheiro("3.00"))
+
+    def test_respeita_taxa_maxima(self):
+        taxas = calcular_taxas_entrega(np.array([1.0, 100.0]), Dinheiro("5.00"), Dinheiro("1.00"), Dinheiro("20.00"))
+        self.assertEqual(taxas, [Dinheiro("6.00"), Dinheiro("20.00")])
+
+
+class GradeGeograficaTests(unittest.TestCase):
+    def test_busca_atravessa_o_antimeridiano(self):
+        grade = GradeGeografica(tamanho_celula_km=2.0)
+        grade.inserir("leste", CoordenadaGeo(-17.0, 179.99))
+        grade.inserir("oeste", CoordenadaGeo(-17.0, -179.99))
+        grade.inserir("longe", CoordenadaGeo(-17.0, 170.0))
+        encontrados = grade.buscar_no_raio(CoordenadaGeo(-17.0, -179.995), 5.0)
+        self.assertEqual(sorted(chave for chave, _ in encontrados), ["leste", "oeste"])
+
+    def test_mais_proximos_em_ordem_de_distancia(self):
+        grade = GradeGeografica()
+        for i in range(10):
+            grade.inserir(i, CoordenadaGeo(-23.5 + i * 0.01, -46.6))
+        encontrados = grade.buscar_mais_proximos(CoordenadaGeo(-23.5, -46.6), 3)
+        self.assertEqual([chave for chave, _ in encontrados], [0, 1, 2])
+
+
+class ListarAtivosProximosEmLoteTests(unittest.TestCase):
+    def test_uma_lista_por_coordenada(self):
+        repositorio = RestauranteRepositoryEmMemoria()
+        posicoes = [(-23.55, -46.63), (-22.90, -43.20)]
+        for i, (latitude, longitude) in enumerate(posicoes):
+            asyncio.run(repositorio.salvar(Restaurante(
+                nome_fantasia=f"Restaurante {i}", cnpj=f"{i:014d}", email_contato=f"r{i}@exemplo.com",
+                endereco=Endereco("Rua A", "1", "Centro", "Cidade", "SP", "01000-000", None,
+                                  CoordenadaGeo(latitude, longitude)),
+                categorias=["pizza"], data_criacao=datetime(2024, 1, 1),
+            )))
+        resultados = asyncio.run(repositorio.listar_ativos_proximos_em_lote(
+            [CoordenadaGeo(-22.91, -43.21), CoordenadaGeo(0.0, 0.0), CoordenadaGeo(-23.56, -46.64)], raio_km=10.0
+        ))
+        self.assertEqual([[r.nome_fantasia for r in lista] for lista in resultados],
+                         [["Restaurante 1"], [], ["Restaurante 0"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
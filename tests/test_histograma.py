@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from infrastructure.instrumentacao.histograma import HistogramaLatencia
+
+
+class HistogramaLatenciaTests(unittest.TestCase):
+    def test_percentis_com_erro_relativo_limitado(self):
+        aleatorio = random.Random(7)
+        valores = sorted(int(aleatorio.lognormvariate(12, 1.5)) for _ in range(20_000))
+        histograma = HistogramaLatencia()
+        for valor in valores:
+            histograma.registrar_ns(valor)
+        for percentil in (50, 90, 99, 99.9):
+            exato = valores[int(-(-len(valores) * percentil // 100)) - 1]
+            self.assertAlmostEqual(histograma.percentil_ns(percentil) / exato, 1.0, delta=0.035)
+        self.assertEqual(histograma.maximo_ns, valores[-1])
+
+    def test_valores_pequenos_sao_exatos(self):
+        histograma = HistogramaLatencia()
+        for valor in range(64):
+            histograma.registrar_ns(valor)
+        self.assertEqual(histograma.minimo_ns(), 0)
+        self.assertEqual(histograma.percentil_ns(50), 31)
+
+    def test_mesclar_soma_as_amostras(self):
+        a, b = HistogramaLatencia(), HistogramaLatencia()
+        for valor in (10, 1_000):
+            a.registrar_ns(valor)
+        b.registrar_ns(1_000_000)
+        a.mesclar(b)
+        self.assertEqual((a.contagem, a.soma_ns, a.maximo_ns), (3, 1_001_010, 1_000_000))
+        self.assertEqual(a.percentil_ns(100), 1_000_000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import asyncio
+import unittest
+from datetime import datetime
+from decimal import Decimal
+
+from application.dtos.adicionar_produto_request_dto import AdicionarProdutoRequestDTO
+from application.use_cases.importar_cardapio_uc import ImportarCardapioUseCase
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.categoria_produto_repository_em_memoria import CategoriaProdutoRepositoryEmMemoria
+from infrastructure.repositories.produto_repository_em_memoria import ProdutoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+
+
+class ImportarCardapioTests(unittest.TestCase):
+    def test_linha_malformada_vira_erro_sem_impedir_as_demais(self):
+        restaurantes = RestauranteRepositoryEmMemoria()
+        restaurante = Restaurante(
+            nome_fantasia="Cantina", cnpj="00000000000001", email_contato="cantina@exemplo.com",
+            endereco=Endereco("Rua A", "1", "Centro", "São Paulo", "SP", "01000-000"), data_criacao=datetime(2024, 1, 1),
+        )
+        asyncio.run(restaurantes.salvar(restaurante))
+        caso_de_uso = ImportarCardapioUseCase(
+            ProdutoRepositoryEmMemoria(), restaurantes, CategoriaProdutoRepositoryEmMemoria()
+        )
+        linhas = [
+            AdicionarProdutoRequestDTO(restaurante.id, "Lasanha", "", Decimal("42.00")),
+            AdicionarProdutoRequestDTO(restaurante.id, None, "", Decimal("10.00")), # nome ausente
+            AdicionarProdutoRequestDTO(restaurante.id, "Suco", "", None), # preço ausente
+            AdicionarProdutoRequestDTO(restaurante.id, "Pudim", "", Decimal("0.001")), # fração de centavo
+        ]
+
+        resposta = asyncio.run(caso_de_uso.executar(linhas))
+        self.assertEqual([p.nome for p in resposta.produtos_criados], ["Lasanha"])
+        self.assertEqual([erro.indice for erro in resposta.erros], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
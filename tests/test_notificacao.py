@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+import uuid
+
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.value_objects.endereco import Endereco
+from infrastructure.external_services.notificacao_service_impl import NotificacaoServiceImpl, TransporteEmMemoria
+from infrastructure.external_services.pedido_repository_com_notificacao import PedidoRepositoryComNotificacao
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+
+class NotificacaoServiceRegistrador:
+    """Guarda o status de cada notificação pedida, na ordem."""
+
+    def __init__(self):
+        self.status = []
+
+    async def notificar_mudanca_status(self, pedido: Pedido) -> None:
+        self.status.append(pedido.status_pedido)
+
+
+def _pedido() -> Pedido:
+    return Pedido(
+        cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(),
+        endereco_entrega=Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000"),
+    )
+
+
+class PedidoRepositoryComNotificacaoTests(unittest.TestCase):
+    def test_regravar_pedido_em_status_final_nao_notifica_de_novo(self):
+        notificacoes = NotificacaoServiceRegistrador()
+        repositorio = PedidoRepositoryComNotificacao(PedidoRepositoryEmMemoria(), notificacoes)
+        pedido = _pedido()
+
+        async def cenario():
+            await repositorio.salvar(pedido)
+            await repositorio.salvar(pedido) # Mesmo status: não notifica
+            pedido.cancelar_pelo_cliente()
+            await repositorio.salvar(pedido)
+            await repositorio.salvar(pedido)
+            await repositorio.salvar_alteracoes([], [pedido])
+        asyncio.run(cenario())
+        self.assertEqual(notificacoes.status, [StatusPedido.PENDENTE, StatusPedido.CANCELADO_PELO_CLIENTE])
+
+
+class NotificacaoServiceImplTests(unittest.TestCase):
+    def test_encerrar_sem_iniciar_envia_o_pendente(self):
+        transporte = TransporteEmMemoria()
+        servico = NotificacaoServiceImpl(transporte, tamanho_lote=3)
+        pedidos = [_pedido() for _ in range(2)]
+
+        async def cenario():
+            for pedido in pedidos:
+                await servico.notificar_mudanca_status(pedido)
+            await servico.encerrar()
+        asyncio.run(cenario())
+        self.assertEqual(servico.pendentes, 0)
+        self.assertEqual(len(transporte.enviadas), 4) # Cliente e restaurante de cada pedido
+        self.assertEqual(transporte.lotes, [3, 1])
+        self.assertEqual(servico.estatisticas.enviadas, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
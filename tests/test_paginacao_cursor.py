@@ -0,0 +1,92 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+from application.interfaces.paginacao import codificar_cursor, decodificar_cursor
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+INICIO = datetime(2024, 3, 1, 12, 0)
+
+
+class CursorTests(unittest.TestCase):
+    def test_ida_e_volta(self):
+        data, entidade_id = datetime(2024, 1, 2, 3, 4, 5, 678901), uuid.uuid4()
+        self.assertEqual(decodificar_cursor(codificar_cursor(data, entidade_id)), (data, entidade_id))
+
+    def test_cursor_invalido(self):
+        for cursor in ("", "!!!", "bm9wZQ", codificar_cursor(INICIO, uuid.uuid4())[:-3]):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decodificar_cursor(cursor)
+
+
+class PaginacaoPorCursorTests(unittest.TestCase):
+    def setUp(self):
+        self.repositorio = PedidoRepositoryEmMemoria()
+        self.cliente_id = uuid.uuid4()
+        self.pedidos = []
+        for indice in range(23):
+            # Datas repetidas de dois em dois: o id desempata a ordem dentro da mesma data
+            pedido = Pedido(self.cliente_id, uuid.uuid4(), ENDERECO, data_criacao=INICIO + timedelta(minutes=indice // 2),
+                            status_pedido=StatusPedido.ENTREGUE if indice % 3 == 0 else StatusPedido.PENDENTE)
+            asyncio.run(self.repositorio.salvar(pedido))
+            self.pedidos.append(pedido)
+        outro_cliente = Pedido(uuid.uuid4(), uuid.uuid4(), ENDERECO, data_criacao=INICIO)
+        asyncio.run(self.repositorio.salvar(outro_cliente))
+
+    def _todas_as_paginas(self, listar, limit):
+        async def percorrer():
+            paginas, cursor = [], None
+            while True:
+                pagina = await listar(limit=limit, cursor=cursor)
+                paginas.append(pagina.itens)
+                if pagina.proximo_cursor is None:
+                    return paginas
+                cursor = pagina.proximo_cursor
+        return asyncio.run(percorrer())
+
+    def _ordenados(self, pedidos):
+        return sorted(pedidos, key=lambda p: (p.data_criacao, p.id))
+
+    def test_percorre_todos_sem_repetir_nem_pular(self):
+        for limit in (1, 5, 23, 50):
+            with self.subTest(limit=limit):
+                paginas = self._todas_as_paginas(
+                    lambda **kw: self.repositorio.listar_por_cliente_id_cursor(self.cliente_id, **kw), limit)
+                self.assertEqual([p for pagina in paginas for p in pagina], self._ordenados(self.pedidos))
+                self.assertTrue(all(len(pagina) == limit for pagina in paginas[:-1]))
+                self.assertTrue(paginas[-1])
+
+    def test_filtro_de_status_e_periodo(self):
+        data_inicio, data_fim = INICIO + timedelta(minutes=2), INICIO + timedelta(minutes=8)
+        paginas = self._todas_as_paginas(
+            lambda **kw: self.repositorio.listar_por_cliente_id_cursor(
+                self.cliente_id, data_inicio=data_inicio, data_fim=data_fim, status=[StatusPedido.PENDENTE], **kw), 3)
+        esperados = [p for p in self._ordenados(self.pedidos)
+                     if p.status_pedido == StatusPedido.PENDENTE and data_inicio <= p.data_criacao <= data_fim]
+        self.assertEqual([p for pagina in paginas for p in pagina], esperados)
+
+    def test_listagem_por_status_mescla_os_status_na_ordem(self):
+        paginas = self._todas_as_paginas(
+            lambda **kw: self.repositorio.listar_por_status_cursor([StatusPedido.ENTREGUE, StatusPedido.PENDENTE], **kw), 4)
+        todos = self.pedidos + [p for p in asyncio.run(self.repositorio.listar_por_periodo()) if p not in self.pedidos]
+        self.assertEqual([p for pagina in paginas for p in pagina], self._ordenados(todos))
+
+    def test_cursor_continua_estavel_com_insercoes_anteriores(self):
+        pagina = asyncio.run(self.repositorio.listar_por_cliente_id_cursor(self.cliente_id, limit=10))
+        antigo = Pedido(self.cliente_id, uuid.uuid4(), ENDERECO, data_criacao=INICIO - timedelta(days=1))
+        asyncio.run(self.repositorio.salvar(antigo))
+        seguinte = asyncio.run(self.repositorio.listar_por_cliente_id_cursor(
+            self.cliente_id, limit=10, cursor=pagina.proximo_cursor))
+        self.assertEqual(seguinte.itens, self._ordenados(self.pedidos)[10:20])
+
+    def test_limite_invalido(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(self.repositorio.listar_por_status_cursor([StatusPedido.PENDENTE], limit=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import uuid
+
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import MATRIZ_TRANSICOES, AcaoPedido, Pedido, StatusPedido
+from domain.value_objects.endereco import Endereco
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+
+FLUXO_FELIZ = [
+    (AcaoPedido.CONFIRMAR, {}, StatusPedido.CONFIRMADO_PELO_RESTAURANTE),
+    (AcaoPedido.INICIAR_PREPARO, {}, StatusPedido.EM_PREPARO),
+    (AcaoPedido.MARCAR_PRONTO, {}, StatusPedido.PRONTO_PARA_COLETA),
+    (AcaoPedido.SAIR_PARA_ENTREGA, {"entregador_id": uuid.uuid4()}, StatusPedido.SAIU_PARA_ENTREGA),
+    (AcaoPedido.ENTREGAR, {}, StatusPedido.ENTREGUE),
+]
+
+
+DADOS_POR_ACAO = {AcaoPedido.SAIR_PARA_ENTREGA: {"entregador_id": uuid.uuid4()},
+                  AcaoPedido.CANCELAR_PELO_RESTAURANTE: {"motivo": "sem estoque"}}
+
+
+def _pedido(status: str = StatusPedido.PENDENTE) -> Pedido:
+    return Pedido(uuid.uuid4(), uuid.uuid4(), ENDERECO, status_pedido=status)
+
+
+class TransicoesPedidoTests(unittest.TestCase):
+    def test_fluxo_completo_gera_um_evento_por_transicao(self):
+        pedido = _pedido()
+        for acao, dados, esperado in FLUXO_FELIZ:
+            pedido.transicionar(acao, **dados)
+            self.assertEqual(pedido.status_pedido, esperado)
+        eventos = pedido.retirar_eventos()
+        self.assertEqual([(e.status_anterior, e.novo_status) for e in eventos],
+                         list(zip([StatusPedido.PENDENTE] + [s for _, _, s in FLUXO_FELIZ[:-1]],
+                                  [s for _, _, s in FLUXO_FELIZ])))
+        self.assertEqual(pedido.retirar_eventos(), [])
+        self.assertEqual(pedido.entregador_id, FLUXO_FELIZ[3][1]["entregador_id"])
+
+    def test_transicoes_invalidas_nao_alteram_o_pedido(self):
+        for status in StatusPedido.TODOS_OS_STATUS:
+            for acao in AcaoPedido.TODAS_AS_ACOES:
+                pedido = _pedido(status)
+                if pedido.pode_transicionar(acao):
+                    continue
+                with self.subTest(status=status, acao=acao):
+                    with self.assertRaises(ValueError):
+                        pedido.transicionar(acao, **DADOS_POR_ACAO.get(acao, {}))
+                    self.assertEqual(pedido.status_pedido, status)
+                    self.assertFalse(pedido.eventos_pendentes)
+
+    def test_matriz_coincide_com_pode_transicionar(self):
+        for i, status in enumerate(StatusPedido.TODOS_OS_STATUS):
+            for j, acao in enumerate(AcaoPedido.TODAS_AS_ACOES):
+                self.assertEqual(MATRIZ_TRANSICOES[i][j] >= 0, _pedido(status).pode_transicionar(acao))
+
+    def test_cancelamentos(self):
+        self.assertFalse(_pedido(StatusPedido.ENTREGUE).pode_transicionar(AcaoPedido.CANCELAR_PELO_CLIENTE))
+        pedido = _pedido(StatusPedido.EM_PREPARO)
+        with self.assertRaises(ValueError):
+            pedido.cancelar_pelo_restaurante("  ")
+        self.assertEqual(pedido.status_pedido, StatusPedido.EM_PREPARO)
+        pedido.cancelar_pelo_restaurante("sem entregadores")
+        self.assertEqual(pedido.status_pedido, StatusPedido.CANCELADO_PELO_RESTAURANTE)
+        self.assertIn("sem entregadores", pedido.observacoes_gerais)
+
+    def test_saida_exige_entregador(self):
+        pedido = _pedido(StatusPedido.PRONTO_PARA_COLETA)
+        with self.assertRaises(ValueError):
+            pedido.marcar_como_saiu_para_entrega(None)
+        self.assertEqual(pedido.status_pedido, StatusPedido.PRONTO_PARA_COLETA)
+
+    def test_acao_desconhecida(self):
+        with self.assertRaises(ValueError):
+            _pedido().transicionar("TELETRANSPORTAR")
+        with self.assertRaises(ValueError):
+            Pedido.transicionar_em_lote([_pedido()], "TELETRANSPORTAR")
+
+    def test_itens_so_mudam_enquanto_pendente(self):
+        pedido = _pedido()
+        pedido.adicionar_item(ItemPedido(uuid.uuid4(), 1, "5.00"))
+        pedido.confirmar_pelo_restaurante()
+        with self.assertRaises(ValueError):
+            pedido.adicionar_item(ItemPedido(uuid.uuid4(), 1, "5.00"))
+
+    def test_transicao_em_lote_devolve_os_rejeitados_intactos(self):
+        pendentes = [_pedido() for _ in range(3)]
+        entregue = _pedido(StatusPedido.ENTREGUE)
+        rejeitados = Pedido.transicionar_em_lote(pendentes + [entregue], AcaoPedido.CONFIRMAR)
+        self.assertEqual(rejeitados, [entregue])
+        self.assertEqual({p.status_pedido for p in pendentes}, {StatusPedido.CONFIRMADO_PELO_RESTAURANTE})
+        self.assertFalse(entregue.eventos_pendentes)
+        self.assertTrue(all(p.alteracoes.campos for p in pendentes))
+
+
+if __name__ == "__main__":
+    unittest.main()
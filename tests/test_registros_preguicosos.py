@@ -0,0 +1,66 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import uuid
+
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+from infrastructure.snapshots.arquivo_snapshot import EscritorSnapshot, LeitorSnapshot
+from infrastructure.snapshots.codificacao_entidades import restaurante_para_tupla, restaurantes_de_tuplas
+from infrastructure.snapshots.registros_preguicosos import RegistrosPreguicosos
+
+ENDERECO = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+
+
+def _restaurante(indice: int) -> Restaurante:
+    return Restaurante(f"Restaurante {indice}", f"cnpj-{indice}", "contato@exemplo.com", ENDERECO)
+
+
+class FatiaRegistrosPreguicososTests(unittest.TestCase):
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        caminho = os.path.join(diretorio.name, "restaurantes.snap")
+        self.restaurantes = [_restaurante(indice) for indice in range(10)]
+        with EscritorSnapshot(caminho) as escritor:
+            escritor.adicionar_registros("restaurantes", ((r.id, restaurante_para_tupla(r)) for r in self.restaurantes))
+            escritor.concluir()
+        leitor = LeitorSnapshot(caminho)
+        self.addCleanup(leitor.fechar)
+        self.registros = RegistrosPreguicosos(leitor.registros("restaurantes"), restaurantes_de_tuplas)
+        self.addCleanup(self.registros.materializar) # Solta as referências ao mmap antes de fechá-lo
+
+    def _ids(self, valores):
+        return [r.id for r in valores]
+
+    def test_decodifica_so_a_faixa(self):
+        self.assertEqual(self._ids(self.registros.fatia(2, 5)), self._ids(self.restaurantes[2:5]))
+        self.assertEqual(self.registros.pendentes, 7)
+
+    def test_mesma_ordem_de_values_com_gravacoes_e_remocoes(self):
+        novo = _restaurante(99)
+        substituto = _restaurante(3)
+        substituto.id = self.restaurantes[3].id
+        self.registros[novo.id] = novo
+        self.registros[substituto.id] = substituto
+        del self.registros[self.restaurantes[0].id]
+        fatias = [self.registros.fatia(0, 3)]
+        self.assertEqual(self.registros.pendentes, 6) # Posições 1, 2 e 4 (a 3 foi sobrescrita e a 0 removida)
+        fatias += [self.registros.fatia(inicio, inicio + 3) for inicio in range(3, 12, 3)]
+        self.assertEqual([r for fatia in fatias for r in fatia], list(self.registros.values()))
+        self.assertIs(fatias[0][2], substituto)
+        self.assertIs(fatias[-1][-1], novo)
+
+    def test_listar_todos_pagina_sem_materializar(self):
+        repositorio = RestauranteRepositoryEmMemoria.de_snapshot(
+            self.registros, RestauranteRepositoryEmMemoria().exportar_snapshot()[1])
+        pagina = asyncio.run(repositorio.listar_todos(skip=4, limit=3))
+        self.assertEqual(self._ids(pagina), self._ids(self.restaurantes[4:7]))
+        self.assertEqual(self.registros.pendentes, 7)
+        self.assertEqual(asyncio.run(repositorio.listar_todos(skip=20)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
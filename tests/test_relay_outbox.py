@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime
+
+from domain.eventos.evento_status_pedido import EventoStatusPedido
+from infrastructure.eventos.barramento_eventos_pedido import BarramentoEventosPedido
+from infrastructure.eventos.relay_outbox import RelayOutbox
+from infrastructure.repositories.outbox_em_memoria import OutboxEmMemoria
+
+
+def _evento(pedido_id: uuid.UUID, novo_status: str) -> EventoStatusPedido:
+    return EventoStatusPedido(pedido_id, uuid.uuid4(), uuid.uuid4(), "ANTERIOR", novo_status, datetime(2024, 1, 1))
+
+
+class RelayOutboxTests(unittest.TestCase):
+    def test_pedido_com_falha_nao_trava_o_outbox(self):
+        pedido_ruim = uuid.uuid4()
+        processados = []
+
+        async def manipulador(evento):
+            if evento.pedido_id == pedido_ruim and evento.novo_status == "A":
+                raise RuntimeError("manipulador com defeito")
+            processados.append((evento.pedido_id, evento.novo_status))
+
+        async def cenario():
+            outbox = OutboxEmMemoria()
+            saudaveis = [_evento(uuid.uuid4(), "A") for _ in range(5)]
+            await outbox.adicionar([_evento(pedido_ruim, "A"), _evento(pedido_ruim, "B")] + saudaveis)
+            barramento = BarramentoEventosPedido(particoes=2)
+            barramento.inscrever(manipulador)
+            barramento.iniciar()
+            relay = RelayOutbox(outbox, barramento, tamanho_lote=2, intervalo_segundos=0.02, max_tentativas=3)
+
+            for _ in range(4): # 1ª rodada falha; as 3 seguintes (dentro da espera) drenam os saudáveis
+                await relay.drenar()
+            pendentes_com_pedido_em_espera = [r.evento.pedido_id for r in await outbox.buscar_pendentes()]
+            for _ in range(100):
+                await relay.drenar()
+                if not len(outbox):
+                    break
+                await asyncio.sleep(0.01)
+            falhas = await outbox.listar_falhas()
+            await barramento.encerrar()
+            return relay, outbox, saudaveis, pendentes_com_pedido_em_espera, falhas
+
+        relay, outbox, saudaveis, pendentes, falhas = asyncio.run(cenario())
+        # Os saudáveis passam enquanto o pedido com falha está em espera
+        self.assertEqual(pendentes, [pedido_ruim, pedido_ruim])
+        self.assertLessEqual({e.pedido_id for e in saudaveis}, {p for p, _ in processados})
+        # Esgotadas as tentativas, o evento vai para dead-letter e o seguinte do pedido é entregue
+        self.assertEqual([(r.evento.pedido_id, r.evento.novo_status) for r in falhas], [(pedido_ruim, "A")])
+        self.assertIn((pedido_ruim, "B"), processados)
+        self.assertEqual(len(outbox), 0)
+        self.assertEqual(relay.estatisticas.falhas_definitivas, 1)
+        self.assertEqual(relay.estatisticas.entregues, 6)
+
+    def test_rodada_com_erro_nao_mata_o_relay(self):
+        async def cenario():
+            outbox = OutboxEmMemoria()
+            await outbox.adicionar([_evento(uuid.uuid4(), "A")])
+            barramento = BarramentoEventosPedido(particoes=1)
+            barramento.inscrever(lambda evento: asyncio.sleep(0))
+            relay = RelayOutbox(outbox, barramento, intervalo_segundos=0.001)
+            with self.assertLogs("infrastructure.eventos.relay_outbox", "ERROR"):
+                relay.iniciar() # Barramento ainda não iniciado: publicar levanta ValueError
+                await asyncio.sleep(0.01)
+            self.assertFalse(relay._tarefa.done())
+            barramento.iniciar()
+            await relay.encerrar()
+            await barramento.encerrar()
+            return relay, outbox
+
+        relay, outbox = asyncio.run(cenario())
+        self.assertGreater(relay.estatisticas.erros_rodada, 0)
+        self.assertEqual(relay.estatisticas.entregues, 1)
+        self.assertEqual(len(outbox), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
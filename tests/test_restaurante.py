@@ -0,0 +1,63 @@
+import unittest
+from datetime import datetime
+
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.endereco import Endereco
+from domain.value_objects.horario_semanal import HorarioSemanal
+from infrastructure.snapshots.codificacao_entidades import restaurante_para_tupla, restaurantes_de_tuplas
+
+ENDERECO = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000")
+
+
+def _restaurante(**kwargs) -> Restaurante:
+    return Restaurante("Cantina", "00.000.000/0001-00", "contato@cantina.com", ENDERECO, **kwargs)
+
+
+class HorarioFuncionamentoTextoTests(unittest.TestCase):
+    def test_mantem_o_texto_informado(self):
+        restaurante = _restaurante(horario_funcionamento="seg-sex 11:00-15:00,18:00-23:00")
+        self.assertEqual(restaurante.horario_funcionamento_texto, "seg-sex 11:00-15:00,18:00-23:00")
+        self.assertIsInstance(restaurante.horario_funcionamento, HorarioSemanal)
+        self.assertEqual(_restaurante().horario_funcionamento_texto, "08:00-22:00")
+
+    def test_horario_semanal_usa_a_forma_canonica(self):
+        horario = HorarioSemanal.de_texto("seg 08:00-12:00")
+        restaurante = _restaurante(horario_funcionamento=horario)
+        self.assertEqual(restaurante.horario_funcionamento_texto, "seg 08:00-12:00")
+        self.assertIsNone(_restaurante(horario_funcionamento=None).horario_funcionamento_texto)
+
+    def test_texto_acompanha_as_alteracoes_do_horario(self):
+        restaurante = _restaurante(horario_funcionamento="10:00-14:00")
+        restaurante.atualizar_horario_funcionamento("sab,dom 18:00-02:00")
+        self.assertEqual(restaurante.horario_funcionamento_texto, "sab,dom 18:00-02:00")
+        restaurante.horario_funcionamento = HorarioSemanal.de_texto("ter 09:00-10:00")
+        self.assertEqual(restaurante.horario_funcionamento_texto, "ter 09:00-10:00")
+
+    def test_texto_sobrevive_ao_snapshot(self):
+        original = _restaurante(horario_funcionamento="seg-sex 11:00-23:00", data_criacao=datetime(2024, 1, 1))
+        (restaurado,) = restaurantes_de_tuplas([restaurante_para_tupla(original)])
+        self.assertEqual(restaurado.horario_funcionamento_texto, "seg-sex 11:00-23:00")
+        self.assertEqual(restaurado.horario_funcionamento, original.horario_funcionamento)
+        self.assertTrue(restaurado.aberto_em(datetime(2024, 1, 5, 12, 0))) # Sexta-feira
+
+    def test_texto_livre_gravado_fica_com_horario_desconhecido(self):
+        (restaurante,) = Restaurante.from_rows([{
+            "id": _restaurante().id, "nome_fantasia": "Cantina", "cnpj": "1", "email_contato": "c@c.com",
+            "endereco": ENDERECO, "horario_funcionamento": "Seg a Sex, 8h às 18h", "data_criacao": datetime(2024, 1, 1),
+        }])
+        self.assertIsNone(restaurante.horario_funcionamento)
+        self.assertEqual(restaurante.horario_funcionamento_texto, "Seg a Sex, 8h às 18h")
+        self.assertFalse(restaurante.aberto_em(datetime(2024, 1, 5, 12, 0)))
+        (restaurado,) = restaurantes_de_tuplas([restaurante_para_tupla(restaurante)])
+        self.assertEqual(restaurado.horario_funcionamento_texto, "Seg a Sex, 8h às 18h")
+
+    def test_criacao_e_atualizacao_validam_o_horario(self):
+        with self.assertRaises(ValueError):
+            _restaurante(horario_funcionamento="Seg a Sex, 8h às 18h")
+        restaurante = _restaurante()
+        with self.assertRaises(ValueError):
+            restaurante.atualizar_horario_funcionamento("todo dia")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import numpy as np
+
+from application.interfaces.i_pedido_repository import IPedidoRepository
+from application.mappers.pedido_mapper import pedido_para_resumo_dto
+from application.relatorios import STATUS_CANCELADOS, ProjecaoPedidos
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+INICIO = datetime(2024, 2, 1, 10, 0)
+
+
+def _pedido_sem_itens_carregados(cliente_id: uuid.UUID, indice: int, status: str) -> Pedido:
+    itens = [ItemPedido(uuid.uuid4(), indice % 3 + 1, Dinheiro("12.50")), ItemPedido(uuid.uuid4(), 1, Dinheiro("0.99"))]
+
+    def carregar_itens():
+        raise AssertionError("Os itens não deveriam ser carregados.")
+    (pedido,) = Pedido.from_rows([{
+        "id": uuid.uuid4(), "cliente_id": cliente_id, "restaurante_id": uuid.uuid4(), "endereco_entrega": ENDERECO,
+        "carregar_itens": carregar_itens, "quantidade_itens": len(itens),
+        "valor_subtotal_itens": sum((item.preco_total_item for item in itens), Dinheiro()),
+        "status_pedido": status, "taxa_entrega": Dinheiro("4.00"),
+        "data_criacao": INICIO + timedelta(hours=indice), "data_ultima_atualizacao": INICIO,
+    }])
+    return pedido
+
+
+class ResumosPedidoTests(unittest.TestCase):
+    def setUp(self):
+        self.repositorio = PedidoRepositoryEmMemoria()
+        self.cliente_id = uuid.uuid4()
+        status = [StatusPedido.PENDENTE, StatusPedido.ENTREGUE, StatusPedido.CANCELADO_PELO_CLIENTE]
+        self.pedidos = [_pedido_sem_itens_carregados(self.cliente_id, indice, status[indice % 3]) for indice in range(9)]
+        for pedido in self.pedidos:
+            asyncio.run(self.repositorio.salvar(pedido))
+
+    def test_resumos_coincidem_com_as_versoes_padrao_sem_carregar_itens(self):
+        repositorio = self.repositorio
+        padrao = IPedidoRepository
+
+        async def comparar():
+            pares = [
+                (await repositorio.buscar_resumo_por_id(self.pedidos[4].id),
+                 await padrao.buscar_resumo_por_id(repositorio, self.pedidos[4].id)),
+                (await repositorio.listar_resumos_por_cliente_id(self.cliente_id, 1, 4, status=[StatusPedido.ENTREGUE]),
+                 await padrao.listar_resumos_por_cliente_id(repositorio, self.cliente_id, 1, 4, status=[StatusPedido.ENTREGUE])),
+                (await repositorio.listar_resumos_por_status([StatusPedido.PENDENTE, StatusPedido.ENTREGUE], limit=5),
+                 await padrao.listar_resumos_por_status(repositorio, [StatusPedido.PENDENTE, StatusPedido.ENTREGUE], limit=5)),
+                (await repositorio.listar_resumos_por_cliente_id_cursor(self.cliente_id, 4),
+                 await padrao.listar_resumos_por_cliente_id_cursor(repositorio, self.cliente_id, 4)),
+                (await repositorio.listar_resumos_por_status_cursor([StatusPedido.PENDENTE], 2),
+                 await padrao.listar_resumos_por_status_cursor(repositorio, [StatusPedido.PENDENTE], 2)),
+            ]
+            return pares, await repositorio.buscar_resumo_por_id(uuid.uuid4())
+
+        pares, inexistente = asyncio.run(comparar())
+        for proprio, derivado in pares:
+            self.assertEqual(proprio, derivado)
+        self.assertIsNone(inexistente)
+        self.assertEqual(pares[0][0].valor_total_pedido, Decimal("29.99")) # 2 x 12.50 + 0.99 + 4.00
+        self.assertEqual(len(pares[3][0].itens), 4)
+        self.assertIsNotNone(pares[3][0].proximo_cursor)
+        self.assertFalse(any(pedido.itens_carregados for pedido in self.pedidos))
+
+    def test_projecao_usa_o_subtotal_sem_carregar_itens(self):
+        projecao = ProjecaoPedidos.de_pedidos(self.pedidos)
+        self.assertFalse(any(pedido.itens_carregados for pedido in self.pedidos))
+        self.assertEqual(projecao.receita_total(), sum(p.valor_total_pedido for p in self.pedidos))
+        validos = projecao.filtrar(excluir_status=STATUS_CANCELADOS, data_inicio=INICIO + timedelta(hours=3))
+        esperados = [p for p in self.pedidos[3:] if p.status_pedido not in STATUS_CANCELADOS]
+        self.assertEqual(len(validos), len(esperados))
+        self.assertEqual(validos.receita_total(), sum(p.valor_total_pedido for p in esperados))
+        self.assertEqual(list(validos.subtotal_centavos), [p.valor_subtotal_itens.centavos for p in esperados])
+
+    def test_projecao_com_linhas_de_itens(self):
+        pedidos = []
+        for indice, status in enumerate([StatusPedido.ENTREGUE, StatusPedido.CANCELADO_PELO_CLIENTE, StatusPedido.PENDENTE]):
+            pedido = Pedido(cliente_id=self.cliente_id, restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO)
+            for _ in range(indice + 1):
+                pedido.adicionar_item(ItemPedido(uuid.uuid4(), indice + 1, Dinheiro("3.25")))
+            pedido.status_pedido = status
+            pedidos.append(pedido)
+
+        self.assertFalse(ProjecaoPedidos.de_pedidos(pedidos).possui_itens)
+        projecao = ProjecaoPedidos.de_pedidos(pedidos, incluir_itens=True)
+        self.assertEqual(list(projecao.item_pedido_idx), [0, 1, 1, 2, 2, 2])
+        validos = projecao.filtrar(excluir_status=STATUS_CANCELADOS)
+        self.assertEqual(list(validos.item_pedido_idx), [0, 1, 1, 1])
+        self.assertEqual(list(validos.item_quantidade), [1, 3, 3, 3])
+        subtotais = np.bincount(validos.item_pedido_idx, weights=validos.item_total_centavos, minlength=len(validos))
+        self.assertEqual(list(subtotais.astype(np.int64)), list(validos.subtotal_centavos))
+
+    def test_resumo_do_mapper(self):
+        resumo = pedido_para_resumo_dto(self.pedidos[0])
+        self.assertEqual((resumo.valor_subtotal_itens, resumo.taxa_entrega), (Decimal("13.49"), Decimal("4.00")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+import uuid
+
+from domain.entities.pedido import AcaoPedido, StatusPedido
+from domain.value_objects.endereco import Endereco
+from infrastructure.processamento.comandos_pedido import ADICIONAR_ITEM, CRIAR, ComandoPedido, processar_lote
+from infrastructure.processamento.roteador_pedidos import RoteadorPedidos, _Particao
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+
+
+class RepositorioComFalhaNaGravacao(PedidoRepositoryEmMemoria):
+    """Falha a gravação dos pedidos cujo cliente é FALHA (simula o banco fora do ar)."""
+    FALHA = uuid.UUID(int=1)
+
+    async def salvar_alteracoes(self, novos, alterados):
+        if any(pedido.cliente_id == self.FALHA for pedido in novos):
+            raise RuntimeError("banco indisponível")
+        await super().salvar_alteracoes(novos, alterados)
+
+
+class RepositorioComFalhaNasAlteracoes(PedidoRepositoryEmMemoria):
+    """Falha a próxima gravação de alterações depois que `falhar` é ligado."""
+    falhar = False
+
+    async def salvar_alteracoes(self, novos, alterados):
+        if self.falhar and alterados:
+            self.falhar = False
+            raise RuntimeError("banco indisponível")
+        await super().salvar_alteracoes(novos, alterados)
+
+
+def _criar(restaurante_id: uuid.UUID, cliente_id: uuid.UUID) -> ComandoPedido:
+    return ComandoPedido(restaurante_id, uuid.uuid4(), CRIAR, {"cliente_id": cliente_id, "endereco_entrega": ENDERECO})
+
+
+class RoteadorPedidosTests(unittest.TestCase):
+    def test_falha_na_gravacao_responde_o_lote_e_a_particao_continua(self):
+        restaurante_id = uuid.uuid4()
+
+        async def cenario():
+            roteador = RoteadorPedidos(processos=1, fabrica_repositorio=RepositorioComFalhaNaGravacao)
+            roteador.iniciar()
+            try:
+                com_falha = await roteador.executar_lote([
+                    _criar(restaurante_id, uuid.uuid4()), _criar(restaurante_id, RepositorioComFalhaNaGravacao.FALHA),
+                ])
+                depois = await roteador.executar(_criar(restaurante_id, uuid.uuid4()))
+            finally:
+                await roteador.encerrar()
+            return com_falha, depois
+
+        com_falha, depois = asyncio.run(cenario())
+        self.assertTrue(all(not r.sucesso and "banco indisponível" in r.erro for r in com_falha))
+        self.assertTrue(depois.sucesso, depois.erro)
+        self.assertEqual(depois.status_pedido, "PENDENTE")
+
+    def test_falha_na_gravacao_desfaz_as_alteracoes_do_lote(self):
+        restaurante_id = uuid.uuid4()
+        criar = _criar(restaurante_id, uuid.uuid4())
+        pedido_id = criar.pedido_id
+
+        def item(quantidade):
+            return ComandoPedido(restaurante_id, pedido_id, ADICIONAR_ITEM, {
+                "produto_id": uuid.uuid4(), "quantidade": quantidade, "preco_unitario_compra": 1000,
+            })
+        confirmar = ComandoPedido(restaurante_id, pedido_id, AcaoPedido.CONFIRMAR, {})
+
+        async def cenario():
+            repositorio = RepositorioComFalhaNasAlteracoes()
+            await processar_lote(repositorio, [criar, item(1)])
+            repositorio.falhar = True
+            with self.assertRaises(RuntimeError):
+                await processar_lote(repositorio, [item(2), confirmar])
+            pedido = await repositorio.buscar_por_id(pedido_id)
+            estado = (pedido.status_pedido, pedido.possui_alteracoes, pedido.quantidade_itens,
+                      await repositorio.contar_por_status("PENDENTE"))
+            novamente = await processar_lote(repositorio, [confirmar])
+            return estado, novamente
+
+        estado, novamente = asyncio.run(cenario())
+        self.assertEqual(estado, (StatusPedido.PENDENTE, False, 1, 1))
+        self.assertIsNone(novamente[0].erro)
+        self.assertEqual(novamente[0].status_pedido, StatusPedido.CONFIRMADO_PELO_RESTAURANTE)
+
+    def test_resposta_apos_falha_da_particao_e_ignorada(self):
+        async def cenario():
+            particao = _Particao(None, None)
+            futuro = asyncio.get_running_loop().create_future()
+            particao.em_voo.append([(futuro, [_criar(uuid.uuid4(), uuid.uuid4())])])
+            RoteadorPedidos._falhar(particao, EOFError())
+            RoteadorPedidos._resolver(particao, [("PENDENTE", 0, None)]) # Não deve levantar IndexError
+            return futuro
+        futuro = asyncio.run(cenario())
+        self.assertIsInstance(futuro.exception(), EOFError)
+
+
+if __name__ == "__main__":
+    unittest.main()
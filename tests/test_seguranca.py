@@ -0,0 +1,63 @@
+import unittest
+import uuid
+
+from infrastructure.security.hash_senha import gerar_hash_senha, verificar_hash_senha
+from infrastructure.security.tokens import AssinadorTokens
+
+
+class RelogioFalso:
+    def __init__(self, agora: float = 1_700_000_000.0):
+        self.agora = agora
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+class AssinadorTokensTests(unittest.TestCase):
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        self.tokens = AssinadorTokens(b"k" * 32, validade_segundos=60, relogio=self.relogio)
+        self.cliente_id = uuid.uuid4()
+
+    def test_emite_e_verifica(self):
+        token = self.tokens.emitir(self.cliente_id)
+        self.assertEqual(self.tokens.verificar(token), self.cliente_id)
+        self.assertEqual(self.tokens.verificar(token), self.cliente_id) # Pelo cache
+
+    def test_recusa_assinatura_adulterada_e_token_expirado(self):
+        token = self.tokens.emitir(self.cliente_id)
+        self.assertIsNone(self.tokens.verificar(token[:-2] + "AA"))
+        self.relogio.agora += 60
+        self.assertIsNone(self.tokens.verificar(token))
+
+    def test_revogacao_recusa_anteriores_e_aceita_emitido_no_mesmo_instante(self):
+        anterior = self.tokens.emitir(self.cliente_id)
+        self.tokens.revogar(self.cliente_id)
+        posterior = self.tokens.emitir(self.cliente_id) # Relógio parado: mesmo instante da revogação
+        self.assertIsNone(self.tokens.verificar(anterior))
+        self.assertEqual(self.tokens.verificar(posterior), self.cliente_id)
+
+    def test_revogacoes_antigas_sao_esquecidas(self):
+        for _ in range(100):
+            self.tokens.revogar(uuid.uuid4())
+        self.relogio.agora += 61
+        self.tokens.revogar(self.cliente_id)
+        self.assertEqual(list(self.tokens._revogados_em), [self.cliente_id])
+
+
+class HashSenhaTests(unittest.TestCase):
+    def test_verifica_senha(self):
+        senha_hash = gerar_hash_senha("segredo", iteracoes=1_000)
+        self.assertTrue(verificar_hash_senha("segredo", senha_hash))
+        self.assertFalse(verificar_hash_senha("outra", senha_hash))
+
+    def test_hash_malformado_retorna_false(self):
+        senha_hash = gerar_hash_senha("segredo", iteracoes=1_000)
+        algoritmo, iteracoes, salt, _ = senha_hash.split("$")
+        for malformado in ("", "lixo", f"{algoritmo}${iteracoes}${salt}$çãé", f"{algoritmo}$x${salt}$abc",
+                           f"{algoritmo}${iteracoes}$ç${salt}"):
+            self.assertFalse(verificar_hash_senha("segredo", malformado))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from domain.entities.categoria_produto import CategoriaProduto
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.entities.produto import Produto
+from domain.entities.restaurante import Restaurante
+from domain.value_objects.coordenada_geo import CoordenadaGeo
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.categoria_produto_repository_em_memoria import CategoriaProdutoRepositoryEmMemoria
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+from infrastructure.repositories.produto_repository_em_memoria import ProdutoRepositoryEmMemoria
+from infrastructure.repositories.restaurante_repository_em_memoria import RestauranteRepositoryEmMemoria
+from infrastructure.snapshots.snapshot_estado import carregar_snapshot, salvar_snapshot
+
+INICIO = datetime(2024, 5, 1, 18, 30, tzinfo=timezone.utc)
+
+
+class SnapshotIdaEVoltaTests(unittest.TestCase):
+    def setUp(self):
+        diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(diretorio.cleanup)
+        self.caminho = os.path.join(diretorio.name, "estado.snap")
+
+        endereco = Endereco("Rua A", "10", "Centro", "São Paulo", "SP", "01000-000", "Sala 2",
+                            CoordenadaGeo(-23.55, -46.63))
+        self.restaurante = Restaurante("Cantina", "00.000.000/0001-00", "c@cantina.com", endereco,
+                                       categorias=["Italiana"], horario_funcionamento="seg-sex 11:00-23:00",
+                                       data_criacao=INICIO)
+        self.categoria = CategoriaProduto(self.restaurante.id, "Massas", data_criacao=INICIO, data_atualizacao=INICIO)
+        self.produto = Produto(self.restaurante.id, "Lasanha", "Bolonhesa", Dinheiro("42.90"),
+                               categoria_produto_id=self.categoria.id, data_criacao=INICIO)
+        self.cliente_id = uuid.uuid4()
+        self.abertos = []
+        for indice in range(6):
+            pedido = Pedido(self.cliente_id, self.restaurante.id, endereco, taxa_entrega=Dinheiro("7.50"),
+                            itens=[ItemPedido(self.produto.id, indice + 1, Dinheiro("42.90"))],
+                            data_criacao=INICIO + timedelta(minutes=indice), data_ultima_atualizacao=INICIO)
+            self.abertos.append(pedido)
+        self.abertos[1].confirmar_pelo_restaurante()
+        self.entregue = Pedido(self.cliente_id, self.restaurante.id, endereco,
+                               status_pedido=StatusPedido.ENTREGUE, data_criacao=INICIO)
+
+        self.repositorios = (RestauranteRepositoryEmMemoria(), CategoriaProdutoRepositoryEmMemoria(),
+                             ProdutoRepositoryEmMemoria(), PedidoRepositoryEmMemoria())
+        restaurantes, categorias, produtos, pedidos = self.repositorios
+
+        async def popular():
+            await restaurantes.salvar(self.restaurante)
+            await categorias.salvar(self.categoria)
+            await produtos.salvar(self.produto)
+            for pedido in self.abertos + [self.entregue]:
+                await pedidos.salvar(pedido)
+        asyncio.run(popular())
+
+    def test_restaura_entidades_e_indices(self):
+        salvar_snapshot(self.caminho, *self.repositorios, metadados={"marca": 42})
+        estado = carregar_snapshot(self.caminho)
+        self.addCleanup(estado.materializar)
+        self.assertEqual(estado.metadados["marca"], 42)
+
+        async def consultar():
+            return (
+                await estado.restaurantes.buscar_por_cnpj(self.restaurante.cnpj),
+                await estado.categorias.buscar_por_nome_e_restaurante_id("Massas", self.restaurante.id),
+                await estado.produtos.buscar_por_id(self.produto.id),
+                await estado.pedidos.listar_por_cliente_id(self.cliente_id),
+                await estado.pedidos.contar_por_status(StatusPedido.CONFIRMADO_PELO_RESTAURANTE),
+                await estado.pedidos.buscar_por_id(self.entregue.id),
+            )
+        restaurante, categoria, produto, pedidos, confirmados, entregue = asyncio.run(consultar())
+
+        self.assertEqual((restaurante.nome_fantasia, restaurante.endereco, restaurante.categorias),
+                         (self.restaurante.nome_fantasia, self.restaurante.endereco, self.restaurante.categorias))
+        self.assertEqual(restaurante.horario_funcionamento_texto, "seg-sex 11:00-23:00")
+        self.assertEqual(restaurante.data_criacao, INICIO)
+        self.assertEqual(categoria.id, self.categoria.id)
+        self.assertEqual((produto.preco, produto.categoria_produto_id), (Dinheiro("42.90"), self.categoria.id))
+        # Só os pedidos em aberto vão para o snapshot
+        self.assertIsNone(entregue)
+        self.assertEqual([p.id for p in pedidos], [p.id for p in self.abertos])
+        self.assertEqual(confirmados, 1)
+
+    def test_itens_dos_pedidos_sao_carregados_sob_demanda(self):
+        salvar_snapshot(self.caminho, *self.repositorios)
+        estado = carregar_snapshot(self.caminho)
+        self.addCleanup(estado.materializar)
+        original = self.abertos[3]
+        restaurado = asyncio.run(estado.pedidos.buscar_por_id(original.id))
+        self.assertFalse(restaurado.itens_carregados)
+        self.assertEqual((restaurado.valor_total_pedido, restaurado.quantidade_itens),
+                         (original.valor_total_pedido, 1))
+        self.assertFalse(restaurado.itens_carregados)
+        (item,) = restaurado.itens
+        self.assertEqual((item.id, item.quantidade, item.preco_unitario_compra), (original.itens[0].id, 4, Dinheiro("42.90")))
+        self.assertEqual((restaurado.taxa_entrega, restaurado.status_pedido, restaurado.data_criacao),
+                         (original.taxa_entrega, original.status_pedido, original.data_criacao))
+
+    def test_materializar_decodifica_tudo_e_fecha_o_arquivo(self):
+        salvar_snapshot(self.caminho, *self.repositorios)
+        estado = carregar_snapshot(self.caminho)
+        self.assertGreater(estado.registros_pendentes, 0)
+        estado.materializar()
+        self.assertEqual(estado.registros_pendentes, 0)
+        self.assertIsNone(estado.leitor)
+        self.assertEqual(len(estado.pedidos), len(self.abertos))
+
+    def test_arquivo_invalido(self):
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(b"nao e um snapshot")
+        with self.assertRaises(ValueError):
+            carregar_snapshot(self.caminho)
+
+
+if __name__ == "__main__":
+    unittest.main()
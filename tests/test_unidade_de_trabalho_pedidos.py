@@ -0,0 +1,113 @@
+import asyncio
+import unittest
+import uuid
+from datetime import datetime
+
+from application.unidade_de_trabalho.unidade_de_trabalho_pedidos import UnidadeDeTrabalhoPedidos
+from domain.entities.item_pedido import ItemPedido
+from domain.entities.pedido import Pedido, StatusPedido
+from domain.value_objects.dinheiro import Dinheiro
+from domain.value_objects.endereco import Endereco
+from infrastructure.repositories.outbox_em_memoria import OutboxEmMemoria
+from infrastructure.repositories.pedido_repository_em_memoria import PedidoRepositoryEmMemoria
+
+ENDERECO = Endereco("Rua B", "20", "Centro", "São Paulo", "SP", "01000-000")
+
+
+def _item(preco: str = "10.00", quantidade: int = 1) -> ItemPedido:
+    return ItemPedido(produto_id=uuid.uuid4(), quantidade=quantidade, preco_unitario_compra=Dinheiro(preco))
+
+
+def _pedido_sem_itens_carregados(itens) -> Pedido:
+    (pedido,) = Pedido.from_rows([{
+        "id": uuid.uuid4(), "cliente_id": uuid.uuid4(), "restaurante_id": uuid.uuid4(), "endereco_entrega": ENDERECO,
+        "carregar_itens": lambda: itens, "quantidade_itens": len(itens),
+        "valor_subtotal_itens": sum((item.preco_total_item for item in itens), Dinheiro()),
+        "status_pedido": StatusPedido.PENDENTE, "taxa_entrega": Dinheiro("5.00"),
+        "data_criacao": datetime(2024, 1, 1), "data_ultima_atualizacao": datetime(2024, 1, 1),
+    }])
+    return pedido
+
+
+class UnidadeDeTrabalhoPedidosTests(unittest.TestCase):
+    def setUp(self):
+        self.outbox = OutboxEmMemoria()
+        self.repositorio = PedidoRepositoryEmMemoria(self.outbox)
+
+    def _executar(self, corrotina):
+        return asyncio.run(corrotina)
+
+    def test_grava_novos_e_so_as_alteracoes_dos_existentes(self):
+        existente = Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO,
+                           itens=[_item(), _item(), _item()])
+        self._executar(self.repositorio.salvar(existente))
+        self.assertFalse(existente.possui_alteracoes)
+
+        async def cenario():
+            async with UnidadeDeTrabalhoPedidos(self.repositorio) as uow:
+                pedido = await uow.buscar_por_id(existente.id)
+                pedido.adicionar_item(_item("2.50"))
+                uow.registrar_novo(Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(),
+                                          endereco_entrega=ENDERECO, itens=[_item()]))
+            return uow.ultima_gravacao
+        estatisticas = self._executar(cenario())
+        self.assertEqual((estatisticas.pedidos_novos, estatisticas.pedidos_alterados), (1, 1))
+        self.assertEqual(estatisticas.linhas_escritas, 2 + 2) # Novo: cabeçalho + item; alterado: cabeçalho + item novo
+        self.assertEqual(estatisticas.linhas_sem_rastreamento, 2 + 5)
+        self.assertFalse(existente.possui_alteracoes)
+        self.assertEqual(len(self.repositorio), 2)
+
+    def test_pedido_salvo_sem_alteracoes_nao_e_regravado(self):
+        pedido = Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO,
+                        itens=[_item()])
+        self._executar(self.repositorio.salvar(pedido))
+
+        async def cenario():
+            async with UnidadeDeTrabalhoPedidos(self.repositorio) as uow:
+                await uow.buscar_por_id(pedido.id)
+            return uow.ultima_gravacao
+        estatisticas = self._executar(cenario())
+        self.assertEqual((estatisticas.pedidos_alterados, estatisticas.linhas_escritas), (0, 0))
+
+    def test_mudanca_de_status_reindexa_e_vai_para_o_outbox(self):
+        pedido = Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO)
+        self._executar(self.repositorio.salvar(pedido))
+
+        async def cenario():
+            async with UnidadeDeTrabalhoPedidos(self.repositorio) as uow:
+                (await uow.buscar_por_id(pedido.id)).confirmar_pelo_restaurante()
+            pendentes = await self.repositorio.listar_por_status([StatusPedido.PENDENTE])
+            confirmados = await self.repositorio.listar_por_status([StatusPedido.CONFIRMADO_PELO_RESTAURANTE])
+            return pendentes, confirmados, await self.outbox.buscar_pendentes()
+        pendentes, confirmados, eventos = self._executar(cenario())
+        self.assertEqual((pendentes, confirmados), ([], [pedido]))
+        self.assertEqual([registro.evento.novo_status for registro in eventos],
+                         [StatusPedido.CONFIRMADO_PELO_RESTAURANTE])
+
+    def test_confirmar_nao_carrega_itens_sob_demanda(self):
+        pedido = _pedido_sem_itens_carregados([_item(), _item("3.00", 2)])
+        self._executar(self.repositorio.salvar(pedido))
+
+        async def cenario():
+            async with UnidadeDeTrabalhoPedidos(self.repositorio) as uow:
+                (await uow.buscar_por_id(pedido.id)).confirmar_pelo_restaurante()
+            return uow.ultima_gravacao
+        estatisticas = self._executar(cenario())
+        self.assertFalse(pedido.itens_carregados)
+        self.assertEqual((estatisticas.linhas_escritas, estatisticas.linhas_sem_rastreamento), (1, 3))
+        self.assertEqual(pedido.valor_total_pedido, Dinheiro("21.00"))
+
+    def test_excecao_descarta_sem_gravar(self):
+        pedido = Pedido(cliente_id=uuid.uuid4(), restaurante_id=uuid.uuid4(), endereco_entrega=ENDERECO)
+
+        async def cenario():
+            async with UnidadeDeTrabalhoPedidos(self.repositorio) as uow:
+                uow.registrar_novo(pedido)
+                raise RuntimeError("falha na requisição")
+        with self.assertRaises(RuntimeError):
+            self._executar(cenario())
+        self.assertEqual(len(self.repositorio), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()